@@ -173,7 +173,7 @@ class BYRD:
         # Initialize BYRDService (human-service-first orchestration)
         service_config = self.config.get("service", {})
         if service_config.get("enabled", True):
-            self.service = create_byrd_service(
+            self.service = await create_byrd_service(
                 memory=self.memory,
                 ralph_loop=self.ralph_loop,
                 config=service_config
@@ -382,8 +382,12 @@ class BYRD:
                 'rsi_cycles_completed': stats.rsi_cycles_completed,
                 'rsi_interruptions': stats.rsi_interruptions,
                 'current_task': stats.current_task,
-                'queue_size': self.service.get_queue_size(),
-                'is_idle': self.service.is_idle()
+                'active_tasks': stats.active_tasks,
+                'workers': stats.workers,
+                'queue_size': stats.queue_size,
+                'is_idle': self.service.is_idle(),
+                'queue_latency_ms': stats.scheduler['queue_latency_ms'],
+                'scheduler': stats.scheduler
             }
         return None
 
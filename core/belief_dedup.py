@@ -0,0 +1,336 @@
+"""
+Belief Deduplication and Contradiction Engine
+
+Finds near-duplicate and contradicting beliefs across the whole belief
+set without APOC and without an all-pairs comparison.
+
+Pipeline:
+1. Normalize each belief (lowercase, negations stripped) and index its
+   character bigrams in a MinHash LSH index
+2. Candidate pairs = beliefs sharing an LSH bucket
+3. Exact Sorensen-Dice scoring on the candidates:
+   - duplicate:     same polarity, raw-text Dice >= duplicate_threshold
+   - contradiction: opposite polarity, negation-stripped Dice >= contradiction_threshold
+
+Scans are incremental: each belief carries a version (hash of its
+content) and pair results are cached until either side changes, so a
+re-run only scores new or edited beliefs.
+"""
+
+import asyncio
+import hashlib
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from .minhash_index import MinHashLSHIndex, char_bigrams
+
+# Negation markers removed before comparing polarity-independent content
+_NEGATION_PATTERNS = [
+    (re.compile(r"\bcannot\b"), "can"),
+    (re.compile(r"\bcan't\b"), "can"),
+    (re.compile(r"\bwon't\b"), "will"),
+    (re.compile(r"n't\b"), ""),
+    (re.compile(r"\b(not|never|no)\s+"), ""),
+]
+_NEGATION_DETECT = re.compile(r"\b(not|never|no|cannot)\b|n't\b")
+
+
+def sorensen_dice(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Sorensen-Dice coefficient of two bigram sets."""
+    if not a or not b:
+        return 0.0
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+def strip_negation(text: str) -> str:
+    """Lowercase text with negation markers removed."""
+    text = (text or "").lower()
+    for pattern, replacement in _NEGATION_PATTERNS:
+        text = pattern.sub(replacement, text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def is_negated(text: str) -> bool:
+    """True if the text contains a negation marker."""
+    return bool(_NEGATION_DETECT.search((text or "").lower()))
+
+
+def belief_version(content: str) -> str:
+    """Version key for a belief: changes whenever its content changes."""
+    return hashlib.sha1((content or "").encode()).hexdigest()[:12]
+
+
+@dataclass
+class _BeliefState:
+    content: str
+    confidence: float
+    version: str
+    negated: bool
+    raw_bigrams: FrozenSet[str]
+
+
+@dataclass
+class BeliefPair:
+    """A scored candidate pair (id1 < id2)."""
+    id1: str
+    id2: str
+    content1: str
+    content2: str
+    similarity: float           # Raw-text Sorensen-Dice
+    stripped_similarity: float  # Dice after removing negations
+    opposite_polarity: bool
+
+
+class BeliefDedupEngine:
+    """
+    Batch near-duplicate and contradiction detection over beliefs.
+
+    Usage:
+        engine = BeliefDedupEngine()
+        await engine.scan(beliefs)  # [{"id", "content", "confidence"}, ...]
+        for plan in engine.merge_plans():
+            await memory.merge_beliefs(**plan)
+        for mark in engine.contradiction_marks():
+            await memory.mark_contradiction(**mark)
+    """
+
+    def __init__(
+        self,
+        duplicate_threshold: float = 0.85,
+        contradiction_threshold: float = 0.7,
+        num_perm: int = 128,
+        bands: int = 32,
+        batch_size: int = 200
+    ):
+        self.duplicate_threshold = duplicate_threshold
+        self.contradiction_threshold = contradiction_threshold
+        self.batch_size = batch_size
+
+        # Pairs below this floor are not cached
+        self._score_floor = min(duplicate_threshold, contradiction_threshold)
+
+        self._index = MinHashLSHIndex(
+            num_perm=num_perm, bands=bands,
+            shingler=lambda text: char_bigrams(strip_negation(text))
+        )
+        self._beliefs: Dict[str, _BeliefState] = {}
+        self._pairs: Dict[Tuple[str, str], BeliefPair] = {}
+        self._pairs_by_belief: Dict[str, set] = {}
+
+        self._status: Dict[str, Any] = {
+            "state": "idle",
+            "processed": 0,
+            "total": 0,
+            "last_run_at": None,
+            "last_duration_seconds": None,
+            "last_rescored": 0,
+        }
+
+    def reset(self, score_floor: Optional[float] = None) -> None:
+        """Drop all cached state (optionally lowering the cached score floor)."""
+        if score_floor is not None:
+            self._score_floor = min(score_floor, self.duplicate_threshold, self.contradiction_threshold)
+        self._index.clear()
+        self._beliefs.clear()
+        self._pairs.clear()
+        self._pairs_by_belief.clear()
+
+    @property
+    def score_floor(self) -> float:
+        return self._score_floor
+
+    def _drop(self, belief_id: str) -> None:
+        self._index.remove(belief_id)
+        self._beliefs.pop(belief_id, None)
+        for key in self._pairs_by_belief.pop(belief_id, set()):
+            self._pairs.pop(key, None)
+            other = key[1] if key[0] == belief_id else key[0]
+            self._pairs_by_belief.get(other, set()).discard(key)
+
+    def _score(self, id1: str, id2: str) -> Optional[BeliefPair]:
+        a, b = self._beliefs[id1], self._beliefs[id2]
+        stripped = sorensen_dice(self._index.shingles_of(id1), self._index.shingles_of(id2))
+        opposite = a.negated != b.negated
+        raw = sorensen_dice(a.raw_bigrams, b.raw_bigrams) if not opposite else 0.0
+
+        if max(raw, stripped if opposite else 0.0) < self._score_floor:
+            return None
+
+        if id1 > id2:
+            id1, id2, a, b = id2, id1, b, a
+        return BeliefPair(
+            id1=id1, id2=id2,
+            content1=a.content, content2=b.content,
+            similarity=round(raw, 4),
+            stripped_similarity=round(stripped, 4),
+            opposite_polarity=opposite
+        )
+
+    async def scan(
+        self,
+        beliefs: List[Dict[str, Any]],
+        progress_callback: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Bring the engine up to date with the given belief set.
+
+        Only beliefs that are new or whose content changed since the last
+        scan are re-indexed and re-scored. Yields to the event loop
+        between batches so it can run as a background job.
+
+        Returns:
+            Summary dict with counts of beliefs, rescored beliefs and pairs
+        """
+        start = time.monotonic()
+        current = {b["id"]: b for b in beliefs if b.get("id")}
+
+        for belief_id in [i for i in self._beliefs if i not in current]:
+            self._drop(belief_id)
+
+        changed = []
+        for belief_id, belief in current.items():
+            content = belief.get("content") or ""
+            version = belief_version(content)
+            state = self._beliefs.get(belief_id)
+            if state is not None and state.version == version:
+                state.confidence = belief.get("confidence", state.confidence) or 0.5
+                continue
+            if state is not None:
+                self._drop(belief_id)
+            self._beliefs[belief_id] = _BeliefState(
+                content=content,
+                confidence=belief.get("confidence") or 0.5,
+                version=version,
+                negated=is_negated(content),
+                raw_bigrams=char_bigrams(content)
+            )
+            self._index.add(belief_id, content)
+            changed.append(belief_id)
+
+        self._status.update(state="running", processed=0, total=len(changed))
+
+        for i in range(0, len(changed), self.batch_size):
+            for belief_id in changed[i:i + self.batch_size]:
+                shingles = self._index.shingles_of(belief_id)
+                if shingles is None:
+                    continue
+                for other_id in self._index.candidates(shingles):
+                    if other_id == belief_id:
+                        continue
+                    key = (min(belief_id, other_id), max(belief_id, other_id))
+                    if key in self._pairs:
+                        continue
+                    pair = self._score(belief_id, other_id)
+                    if pair is not None:
+                        self._pairs[key] = pair
+                        self._pairs_by_belief.setdefault(key[0], set()).add(key)
+                        self._pairs_by_belief.setdefault(key[1], set()).add(key)
+
+            self._status["processed"] = min(i + self.batch_size, len(changed))
+            if progress_callback is not None:
+                await progress_callback(self.get_status())
+            await asyncio.sleep(0)
+
+        duration = time.monotonic() - start
+        self._status.update(
+            state="idle",
+            last_run_at=time.time(),
+            last_duration_seconds=round(duration, 3),
+            last_rescored=len(changed)
+        )
+
+        return {
+            "beliefs": len(self._beliefs),
+            "rescored": len(changed),
+            "duplicates": len(self.duplicates()),
+            "contradictions": len(self.contradictions()),
+            "duration_seconds": round(duration, 3),
+        }
+
+    def duplicates(self, threshold: Optional[float] = None) -> List[BeliefPair]:
+        """Same-polarity pairs at or above the threshold, most similar first."""
+        threshold = self.duplicate_threshold if threshold is None else threshold
+        pairs = [
+            p for p in self._pairs.values()
+            if not p.opposite_polarity and p.similarity >= threshold
+        ]
+        pairs.sort(key=lambda p: p.similarity, reverse=True)
+        return pairs
+
+    def contradictions(self, threshold: Optional[float] = None) -> List[BeliefPair]:
+        """Opposite-polarity pairs whose negation-stripped text matches."""
+        threshold = self.contradiction_threshold if threshold is None else threshold
+        pairs = [
+            p for p in self._pairs.values()
+            if p.opposite_polarity and p.stripped_similarity >= threshold
+        ]
+        pairs.sort(key=lambda p: p.stripped_similarity, reverse=True)
+        return pairs
+
+    def merge_plans(self, threshold: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Duplicate clusters as Memory.merge_beliefs keyword arguments.
+
+        Pairs are grouped transitively; the highest-confidence belief in a
+        cluster is the merge target.
+        """
+        parent: Dict[str, str] = {}
+
+        def find(x: str) -> str:
+            parent.setdefault(x, x)
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        best: Dict[Tuple[str, str], float] = {}
+        for pair in self.duplicates(threshold):
+            parent[find(pair.id1)] = find(pair.id2)
+            best[(pair.id1, pair.id2)] = pair.similarity
+
+        clusters: Dict[str, List[str]] = {}
+        for belief_id in list(parent):
+            clusters.setdefault(find(belief_id), []).append(belief_id)
+
+        plans = []
+        for members in clusters.values():
+            if len(members) < 2:
+                continue
+            target = max(
+                members,
+                key=lambda m: (self._beliefs[m].confidence, -len(self._beliefs[m].content), m)
+            )
+            similarity = max(
+                score for (a, b), score in best.items() if a in members and b in members
+            )
+            plans.append({
+                "source_ids": sorted(m for m in members if m != target),
+                "target_id": target,
+                "reason": f"near-duplicate beliefs (dice {similarity:.2f})",
+            })
+        plans.sort(key=lambda p: len(p["source_ids"]), reverse=True)
+        return plans
+
+    def contradiction_marks(self, threshold: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Contradictions as Memory.mark_contradiction keyword arguments."""
+        return [
+            {
+                "belief1_id": p.id1,
+                "belief2_id": p.id2,
+                "detection_method": "negation_dice",
+                "confidence": p.stripped_similarity,
+            }
+            for p in self.contradictions(threshold)
+        ]
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get job progress and cache statistics."""
+        return {
+            **self._status,
+            "beliefs_cached": len(self._beliefs),
+            "pairs_cached": len(self._pairs),
+            "duplicate_threshold": self.duplicate_threshold,
+            "contradiction_threshold": self.contradiction_threshold,
+        }
@@ -2,7 +2,8 @@
 BYRDService - Human-Service-First orchestration layer.
 
 Implements the human-service-first architecture:
-- Maintains task queue (human tasks vs idle RSI)
+- Maintains a priority task queue (human tasks vs idle RSI)
+- Receives new tasks from the event bus and runs them on a worker pool
 - Detects idle periods
 - Interrupts RSI when critical human tasks arrive
 - Resumes RSI when idle
@@ -15,13 +16,18 @@ See docs/ASI_PATH_DESIGN.md for architecture context.
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
-from typing import Optional, Dict, List, Any, Callable
+from collections import OrderedDict, deque
+from typing import Optional, Dict, List, Any, Callable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timezone
 import time
 
+from .event_bus import event_bus as default_event_bus, Event, EventType
+
 logger = logging.getLogger("byrd.service")
 
 
@@ -75,6 +81,175 @@ class ServiceStats:
     current_task: Optional[str] = None
     last_idle_time: Optional[datetime] = None
     last_task_time: Optional[datetime] = None
+    workers: int = 1
+    active_tasks: List[str] = field(default_factory=list)
+    queue_size: int = 0
+    scheduler: Dict[str, Any] = field(default_factory=dict)
+
+
+def _priority_class(priority: float) -> str:
+    """Name of the TaskPriority band a raw priority falls into."""
+    for level in TaskPriority:
+        if priority >= level.value:
+            return level.name.lower()
+    return TaskPriority.LOW.name.lower()
+
+
+def _latency_summary(samples) -> Dict[str, float]:
+    """count/p50/p95/max of a window of latencies in milliseconds."""
+    if not samples:
+        return {'count': 0, 'p50': 0.0, 'p95': 0.0, 'max': 0.0}
+    ordered = sorted(samples)
+    return {
+        'count': len(ordered),
+        'p50': ordered[int(0.5 * (len(ordered) - 1))],
+        'p95': ordered[int(0.95 * (len(ordered) - 1))],
+        'max': ordered[-1],
+    }
+
+
+class TaskScheduler:
+    """
+    Priority queue of pending tasks with aging.
+
+    Tasks are kept in a binary heap ordered by effective priority -
+    the task's priority plus `aging_rate` per second spent waiting - so
+    a stream of high-priority work cannot starve older low-priority
+    tasks. Every queued task ages at the same rate, so the relative
+    order is fixed at push time and the heap key is simply
+    `aging_rate * enqueued_at - priority`.
+
+    An id index makes duplicate checks O(1) for queued, in-flight and
+    recently finished tasks (a task that arrives both as an event and
+    through the memory backfill is only run once).
+    """
+
+    def __init__(
+        self,
+        aging_rate: float = 0.005,
+        latency_window: int = 500,
+        remember_finished: int = 1024
+    ):
+        self.aging_rate = aging_rate
+        self._heap: List[Tuple[float, int, str]] = []
+        self._index: Dict[str, QueuedTask] = {}
+        self._enqueued_at: Dict[str, float] = {}
+        self._in_flight: Dict[str, float] = {}
+        self._finished: "OrderedDict[str, None]" = OrderedDict()
+        self._remember_finished = remember_finished
+        self._seq = itertools.count()
+        self._available = asyncio.Event()
+
+        # Metrics
+        self._latencies: deque = deque(maxlen=latency_window)
+        self._latencies_by_class: Dict[str, deque] = {
+            level.name.lower(): deque(maxlen=latency_window) for level in TaskPriority
+        }
+        self._pushed = 0
+        self._dispatched = 0
+        self._duplicates = 0
+        self._max_depth = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._index or task_id in self._in_flight
+
+    def is_known(self, task_id: str) -> bool:
+        """Whether the task is queued, running or recently finished."""
+        return task_id in self or task_id in self._finished
+
+    def push(self, task: QueuedTask) -> bool:
+        """
+        Queue a task.
+
+        Returns:
+            False if the task is already queued, running or recently finished
+        """
+        if self.is_known(task.task_id):
+            self._duplicates += 1
+            return False
+
+        now = time.monotonic()
+        key = self.aging_rate * now - task.priority
+        heapq.heappush(self._heap, (key, next(self._seq), task.task_id))
+        self._index[task.task_id] = task
+        self._enqueued_at[task.task_id] = now
+        self._pushed += 1
+        self._max_depth = max(self._max_depth, len(self._heap))
+        self._available.set()
+        return True
+
+    def pop(self) -> Optional[QueuedTask]:
+        """Take the task with the highest effective priority, if any."""
+        if not self._heap:
+            self._available.clear()
+            return None
+
+        _, _, task_id = heapq.heappop(self._heap)
+        task = self._index.pop(task_id)
+        now = time.monotonic()
+        wait_ms = (now - self._enqueued_at.pop(task_id)) * 1000
+        self._latencies.append(wait_ms)
+        self._latencies_by_class[_priority_class(task.priority)].append(wait_ms)
+        self._in_flight[task_id] = now
+        self._dispatched += 1
+
+        if not self._heap:
+            self._available.clear()
+        return task
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[QueuedTask]:
+        """
+        Wait up to `timeout` seconds for a task.
+
+        Returns None on timeout, or when another worker took the task
+        that woke this one.
+        """
+        task = self.pop()
+        if task is not None:
+            return task
+        try:
+            await asyncio.wait_for(self._available.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        return self.pop()
+
+    def done(self, task_id: str) -> None:
+        """Mark a dispatched task as finished."""
+        self._in_flight.pop(task_id, None)
+        self._finished[task_id] = None
+        while len(self._finished) > self._remember_finished:
+            self._finished.popitem(last=False)
+
+    def effective_priority(self, task_id: str) -> Optional[float]:
+        """A queued task's priority including the aging bonus so far."""
+        task = self._index.get(task_id)
+        if task is None:
+            return None
+        waited = time.monotonic() - self._enqueued_at[task_id]
+        return task.priority + self.aging_rate * waited
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth, throughput counters and queue-latency percentiles."""
+        now = time.monotonic()
+        oldest = min(self._enqueued_at.values(), default=now)
+        return {
+            'depth': len(self._heap),
+            'in_flight': len(self._in_flight),
+            'max_depth': self._max_depth,
+            'pushed': self._pushed,
+            'dispatched': self._dispatched,
+            'duplicates_rejected': self._duplicates,
+            'aging_rate': self.aging_rate,
+            'oldest_wait_seconds': now - oldest,
+            'queue_latency_ms': _latency_summary(self._latencies),
+            'queue_latency_by_priority_ms': {
+                name: _latency_summary(samples)
+                for name, samples in self._latencies_by_class.items()
+            },
+        }
 
 
 class BYRDService:
@@ -89,18 +264,27 @@ class BYRDService:
 
     The service maintains a Ralph Loop for RSI and interrupts
     it when high-priority human tasks arrive.
+
+    New tasks are pushed in by TASK_CREATED events (emitted by
+    memory.create_task) rather than polled from Neo4j; a periodic
+    backfill from memory catches tasks created while the service
+    was stopped or by another process.
     """
 
     # Configuration defaults
     DEFAULT_IDLE_THRESHOLD_SECONDS = 10  # Consider idle after no tasks for this long
-    DEFAULT_TASK_POLL_INTERVAL = 2  # Seconds between task checks
+    DEFAULT_TASK_POLL_INTERVAL = 2  # Seconds between idle checks
     DEFAULT_RSI_IDLE_DELAY = 5  # Seconds to wait before starting RSI when idle
+    DEFAULT_WORKERS = 1  # Tasks processed concurrently
+    DEFAULT_AGING_RATE = 0.005  # Priority gained per second of waiting
+    DEFAULT_RESYNC_INTERVAL = 60  # Seconds between memory backfills
 
     def __init__(
         self,
         memory,
         ralph_loop=None,
-        config: Dict = None
+        config: Dict = None,
+        event_bus=None
     ):
         """
         Initialize BYRDService.
@@ -110,13 +294,19 @@ class BYRDService:
             ralph_loop: Optional RalphLoop instance for RSI
             config: Configuration dict with optional overrides:
                 - idle_threshold_seconds: Idle detection threshold
-                - task_poll_interval: Seconds between task polls
+                - task_poll_interval: Seconds between idle checks
                 - rsi_idle_delay: Delay before starting RSI when idle
                 - auto_resume_rsi: Whether to auto-resume RSI after tasks (default: True)
+                - workers: Number of tasks processed concurrently (default: 1)
+                - aging_rate: Priority a queued task gains per second (default: 0.005)
+                - resync_interval_seconds: Seconds between memory backfills (default: 60)
+            event_bus: Event bus to receive TASK_CREATED events from
+                (default: the global core event bus)
         """
         self.memory = memory
         self.ralph_loop = ralph_loop
         self.config = config or {}
+        self.event_bus = event_bus or default_event_bus
 
         # Configuration
         self._idle_threshold = self.config.get(
@@ -132,14 +322,26 @@ class BYRDService:
             self.DEFAULT_RSI_IDLE_DELAY
         )
         self._auto_resume_rsi = self.config.get('auto_resume_rsi', True)
+        self._worker_count = max(1, int(self.config.get('workers', self.DEFAULT_WORKERS)))
+        self._resync_interval = self.config.get(
+            'resync_interval_seconds',
+            self.DEFAULT_RESYNC_INTERVAL
+        )
 
         # State
         self._running = False
         self._mode = ServiceMode.PAUSED
-        self._task_queue: asyncio.Queue = asyncio.Queue()
+        self._scheduler = TaskScheduler(
+            aging_rate=self.config.get('aging_rate', self.DEFAULT_AGING_RATE)
+        )
+        self._active_tasks: Dict[str, QueuedTask] = {}
         self._current_task: Optional[QueuedTask] = None
         self._rsi_task: Optional[asyncio.Task] = None
         self._service_task: Optional[asyncio.Task] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self._background: set = set()
+        self._subscribed = False
+        self._last_resync: Optional[float] = None
 
         # Statistics
         self._start_time: Optional[float] = None
@@ -176,9 +378,22 @@ class BYRDService:
         self._start_time = time.time()
         self._mode = ServiceMode.IDLE_RSI
 
-        logger.info("BYRDService started - entering service loop")
+        # Receive new tasks as they are created, then backfill anything
+        # that was created before we subscribed
+        self.event_bus.subscribe(self._on_event)
+        self._subscribed = True
+        await self._sync_tasks_from_memory()
+
+        logger.info(
+            f"BYRDService started - entering service loop "
+            f"({self._worker_count} worker(s))"
+        )
 
-        # Start main service loop
+        # Start workers and the main service loop
+        self._worker_tasks = [
+            asyncio.create_task(self._worker_loop(i))
+            for i in range(self._worker_count)
+        ]
         self._service_task = asyncio.create_task(self._service_loop())
 
     async def stop(self) -> None:
@@ -189,6 +404,10 @@ class BYRDService:
         logger.info("BYRDService stopping...")
         self._running = False
 
+        if self._subscribed:
+            self.event_bus.unsubscribe(self._on_event)
+            self._subscribed = False
+
         # Cancel RSI if running
         if self._rsi_task and not self._rsi_task.done():
             if self.ralph_loop:
@@ -199,13 +418,15 @@ class BYRDService:
             except asyncio.CancelledError:
                 pass
 
-        # Cancel service loop
-        if self._service_task and not self._service_task.done():
-            self._service_task.cancel()
-            try:
-                await self._service_task
-            except asyncio.CancelledError:
-                pass
+        # Cancel service loop and workers
+        for task in [self._service_task, *self._worker_tasks, *self._background]:
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._worker_tasks = []
 
         logger.info("BYRDService stopped")
 
@@ -245,42 +466,87 @@ class BYRDService:
             source=source
         )
 
-        await self._task_queue.put(task)
+        # memory.create_task already delivered it via TASK_CREATED if
+        # the service is running; push() drops the duplicate
+        if self._scheduler.push(task):
+            logger.info(
+                f"Task enqueued: {task_id} (priority={priority}, "
+                f"queue_size={len(self._scheduler)})"
+            )
+            await self._maybe_interrupt_for(task)
+
+        return task_id
+
+    def _on_event(self, event: Event) -> None:
+        """Event bus subscriber: queue tasks as soon as they are created."""
+        if event.type != EventType.TASK_CREATED or not self._running:
+            return
+
+        task = self._task_from_dict(event.data)
+        if task is None or not self._scheduler.push(task):
+            return
 
         logger.info(
-            f"Task enqueued: {task_id} (priority={priority}, "
-            f"queue_size={self._task_queue.qsize()})"
+            f"Task received: {task.task_id} (priority={task.priority}, "
+            f"queue_size={len(self._scheduler)})"
         )
-
-        # Interrupt RSI if this is a high-priority task
+        # Decide now: a worker may pick the task up (and leave IDLE_RSI)
+        # before a spawned coroutine gets to run
         if task.is_high_priority and self._mode == ServiceMode.IDLE_RSI:
-            await self._interrupt_rsi(f"high_priority_task:{task_id}")
+            self._spawn(self._interrupt_rsi(f"high_priority_task:{task.task_id}"))
 
-        return task_id
+    def _spawn(self, coro) -> None:
+        """Run a coroutine in the background, keeping a reference until done."""
+        task = asyncio.get_running_loop().create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _maybe_interrupt_for(self, task: QueuedTask) -> None:
+        """Interrupt RSI if this is a high-priority task."""
+        if task.is_high_priority and self._mode == ServiceMode.IDLE_RSI:
+            await self._interrupt_rsi(f"high_priority_task:{task.task_id}")
+
+    @staticmethod
+    def _task_from_dict(task_dict: Dict) -> Optional[QueuedTask]:
+        """Build a QueuedTask from a memory record or TASK_CREATED payload."""
+        task_id = task_dict.get('id')
+        if not task_id:
+            return None
+        return QueuedTask(
+            task_id=task_id,
+            description=task_dict.get('description', ''),
+            objective=task_dict.get('objective', ''),
+            priority=task_dict.get('priority', 0.5),
+            source=task_dict.get('source', 'external'),
+            status=task_dict.get('status', 'pending')
+        )
 
     async def _service_loop(self) -> None:
         """
         Main service loop.
 
-        Continuously:
-        1. Check for pending tasks in memory
-        2. Process tasks if available
-        3. Run RSI if idle
+        Tasks arrive through the event bus and are run by the workers;
+        this loop only:
+        1. Backfills pending tasks from memory every resync interval
+        2. Runs RSI when idle
         """
         logger.debug("Service loop started")
 
         while self._running:
             try:
-                # First, check for new tasks from memory
-                await self._sync_tasks_from_memory()
-
-                # Check if we have a task to process
-                if not self._task_queue.empty():
-                    await self._process_next_task()
-                else:
+                now = time.monotonic()
+                if (
+                    self._resync_interval
+                    and now - (self._last_resync or now) >= self._resync_interval
+                ):
+                    await self._sync_tasks_from_memory()
+
+                if not self._active_tasks and not len(self._scheduler):
                     # No tasks - check if we should be idle
                     await self._handle_idle_period()
 
+                await asyncio.sleep(self._poll_interval)
+
             except asyncio.CancelledError:
                 logger.info("Service loop cancelled")
                 break
@@ -288,51 +554,43 @@ class BYRDService:
                 logger.exception(f"Service loop error: {e}")
                 await asyncio.sleep(self._poll_interval)
 
+    async def _worker_loop(self, worker_id: int) -> None:
+        """Take tasks from the scheduler and process them, one at a time."""
+        logger.debug(f"Service worker {worker_id} started")
+
+        while self._running:
+            try:
+                task = await self._scheduler.get(timeout=self._poll_interval)
+                if task is not None:
+                    await self._process_task(task)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.exception(f"Service worker {worker_id} error: {e}")
+                await asyncio.sleep(self._poll_interval)
+
     async def _sync_tasks_from_memory(self) -> None:
         """
-        Sync pending tasks from memory into the local queue.
+        Backfill pending tasks from memory into the scheduler.
 
-        This ensures we capture tasks created via API while
-        the service was processing other work.
+        This captures tasks created while the service was stopped, by
+        another process, or whose TASK_CREATED event was missed.
         """
+        self._last_resync = time.monotonic()
         try:
             pending_tasks = await self.memory.get_pending_tasks(limit=20)
 
             for task_dict in pending_tasks:
-                task_id = task_dict.get('id')
-                # Check if already in queue (avoid duplicates)
-                if task_id:
-                    # Simple check: we'll skip if we've seen it recently
-                    # A more robust implementation would track queued task IDs
-                    already_queued = any(
-                        t.task_id == task_id for t in self._task_queue._queue
-                    )
-                    if not already_queued and self._current_task != task_id:
-                        task = QueuedTask(
-                            task_id=task_id,
-                            description=task_dict.get('description', ''),
-                            objective=task_dict.get('objective', ''),
-                            priority=task_dict.get('priority', 0.5),
-                            source=task_dict.get('source', 'external'),
-                            status=task_dict.get('status', 'pending')
-                        )
-                        await self._task_queue.put(task)
-                        logger.debug(f"Synced task from memory: {task_id}")
+                task = self._task_from_dict(task_dict)
+                if task is not None and self._scheduler.push(task):
+                    logger.debug(f"Synced task from memory: {task.task_id}")
 
         except Exception as e:
             logger.warning(f"Error syncing tasks from memory: {e}")
 
-    async def _process_next_task(self) -> None:
-        """Process the next task from the queue."""
-        try:
-            # Get next task (wait briefly if queue is being refilled)
-            task = await asyncio.wait_for(
-                self._task_queue.get(),
-                timeout=1.0
-            )
-        except asyncio.TimeoutError:
-            return
-
+    async def _process_task(self, task: QueuedTask) -> None:
+        """Process a task taken from the scheduler."""
+        self._active_tasks[task.task_id] = task
         self._current_task = task
         self._mode = ServiceMode.TASK_PROCESSING
         self._last_task_time = datetime.now(timezone.utc)
@@ -343,10 +601,10 @@ class BYRDService:
             f"(priority={task.priority})"
         )
 
-        # Update task status in memory
-        await self.memory.update_task_status(task.task_id, 'in_progress')
-
         try:
+            # Update task status in memory
+            await self.memory.update_task_status(task.task_id, 'in_progress')
+
             # Execute task via handler or RSI engine
             if self._task_handler:
                 result = await self._task_handler(task)
@@ -371,8 +629,10 @@ class BYRDService:
             self._tasks_failed += 1
 
         finally:
-            self._current_task = None
-            self._task_queue.task_done()
+            self._active_tasks.pop(task.task_id, None)
+            if self._current_task is task:
+                self._current_task = next(iter(self._active_tasks.values()), None)
+            self._scheduler.done(task.task_id)
 
     async def _default_task_handler(self, task: QueuedTask) -> Dict:
         """
@@ -432,11 +692,6 @@ class BYRDService:
             # Check if we should start/continue RSI
             if self._auto_resume_rsi and self.ralph_loop:
                 await self._maybe_run_rsi()
-            else:
-                await asyncio.sleep(self._poll_interval)
-        else:
-            # Not idle yet, wait
-            await asyncio.sleep(self._poll_interval)
 
     async def _maybe_run_rsi(self) -> None:
         """
@@ -528,19 +783,23 @@ class BYRDService:
             rsi_interruptions=self._rsi_interruptions,
             current_task=self._current_task.task_id if self._current_task else None,
             last_idle_time=self._last_idle_time,
-            last_task_time=self._last_task_time
+            last_task_time=self._last_task_time,
+            workers=self._worker_count,
+            active_tasks=list(self._active_tasks),
+            queue_size=len(self._scheduler),
+            scheduler=self._scheduler.get_stats()
         )
 
     def get_queue_size(self) -> int:
         """Get current queue size."""
-        return self._task_queue.qsize()
+        return len(self._scheduler)
 
     def is_idle(self) -> bool:
         """Check if service is in idle mode."""
         return (
             self._mode == ServiceMode.IDLE_RSI and
-            self._current_task is None and
-            self._task_queue.empty()
+            not self._active_tasks and
+            not len(self._scheduler)
         )
 
 
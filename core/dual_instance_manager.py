@@ -136,7 +136,7 @@ class DualInstanceManager:
             wait_time = await self._wait_for_slot(role)
 
             try:
-                result = await self._client.generate(prompt, **kwargs)
+                result = await self._client.generate(prompt, component=component, **kwargs)
                 self._record_success(role, wait_time)
                 return result
             except Exception as e:
@@ -5,13 +5,16 @@ Centralized event emission for real-time UI streaming.
 
 import asyncio
 import json
+import time
+from collections import deque
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, field
 from enum import Enum
 
 if TYPE_CHECKING:
     from narrator import EventNarrator
+    from core.event_log import EventLog
 
 
 class EventType(Enum):
@@ -189,6 +192,8 @@ class EventType(Enum):
     CAUSAL_LINK_CREATED = "causal_link_created"          # New causal relationship
     CONTRADICTION_DETECTED = "contradiction_detected"    # Belief contradiction found
     CONTRADICTION_RESOLVED = "contradiction_resolved"    # Contradiction addressed
+    BELIEF_DEDUP_PROGRESS = "belief_dedup_progress"      # Background dedup scan progress
+    BELIEF_DEDUP_COMPLETE = "belief_dedup_complete"      # Dedup/contradiction scan finished
     DREAM_WALK_COMPLETED = "dream_walk_completed"        # Quantum dream walk finished
 
     # Renormalization Group events (identity transformation tracking)
@@ -258,6 +263,9 @@ class Event:
     data: Dict[str, Any]
     timestamp: datetime = field(default_factory=datetime.now)
     narration: Optional[str] = None  # BYRD's inner voice summary
+    seq: Optional[int] = field(default=None, compare=False)  # Event log sequence number
+    emitted_at: float = field(default=0.0, repr=False, compare=False)  # monotonic, set by emit()
+    _json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
@@ -268,11 +276,226 @@ class Event:
         }
         if self.narration:
             result["narration"] = self.narration
+        if self.seq is not None:
+            result["seq"] = self.seq
         return result
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Event":
+        """Rebuild an event from to_dict() output (e.g. read back from the event log)."""
+        return cls(
+            type=EventType(data["type"]),
+            data=data.get("data", {}),
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            narration=data.get("narration"),
+            seq=data.get("seq"),
+        )
+
     def to_json(self) -> str:
-        """Convert to JSON string."""
-        return json.dumps(self.to_dict())
+        """Convert to JSON string (serialized once, then reused by every consumer)."""
+        if self._json is None:
+            self._json = json.dumps(self.to_dict())
+        return self._json
+
+
+# Overflow policies for slow consumers
+DROP_OLDEST = "drop_oldest"   # Discard the oldest queued item to make room
+DROP_NEWEST = "drop_newest"   # Discard the incoming item
+COALESCE = "coalesce"         # Replace a queued item with the same key, else drop oldest
+OVERFLOW_POLICIES = (DROP_OLDEST, DROP_NEWEST, COALESCE)
+
+
+def coalesce_key(event: "Event") -> Optional[Hashable]:
+    """
+    Queue key under which a newer event may replace an older one.
+
+    Only updates to the same entity (type and data["id"]) are merged;
+    events without an id never coalesce, so distinct events are dropped
+    (and counted) rather than silently folded into each other.
+    """
+    entity_id = (event.data or {}).get("id")
+    if entity_id is None:
+        return None
+    return (event.type, entity_id)
+
+
+class SubscriberQueue:
+    """
+    Bounded delivery queue drained by its own task.
+
+    put() never awaits the consumer, so one slow subscriber (or WebSocket)
+    cannot hold up the emitter or any other subscriber. When the queue is
+    full the overflow policy decides what gets dropped. With gap_notice,
+    the consumer is told about drops: gap_notice(count) is delivered
+    before the next queued item.
+    """
+
+    LATENCY_WINDOW = 256
+
+    def __init__(
+        self,
+        deliver: Callable[[Any], Any],
+        name: str = "subscriber",
+        max_size: int = 256,
+        policy: str = DROP_OLDEST,
+        on_error: Optional[Callable[["SubscriberQueue", Exception], None]] = None,
+        gap_notice: Optional[Callable[[int], Any]] = None
+    ):
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {policy}")
+        self.deliver = deliver
+        self.name = name
+        self.max_size = max(1, max_size)
+        self.policy = policy
+        self.on_error = on_error
+        self.gap_notice = gap_notice
+
+        self._items: Deque[Tuple[Any, Optional[Hashable], float]] = deque()
+        self._backlog: Deque[Any] = deque()  # Delivered before queued items, never dropped
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self._gap = 0  # Drops not yet reported through gap_notice
+
+        self.delivered = 0
+        self.dropped = 0
+        self.gap_notices = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.max_depth_seen = 0
+        self._latencies: Deque[float] = deque(maxlen=self.LATENCY_WINDOW)
+
+    def __len__(self) -> int:
+        return len(self._items) + len(self._backlog)
+
+    def prime(self, items: List[Any]) -> None:
+        """
+        Deliver items (e.g. a replay) ahead of everything put() afterwards.
+
+        The backlog is outside the bound, so live traffic arriving during a
+        long replay cannot push replayed items out.
+        """
+        if self._closed or not items:
+            return
+        self._backlog.extend(items)
+        self._ensure_task()
+        self._wake.set()
+
+    def put(self, item: Any, key: Optional[Hashable] = None, emitted_at: Optional[float] = None) -> bool:
+        """
+        Queue an item for delivery without waiting for the consumer.
+
+        Returns False if the item itself was dropped.
+        """
+        if self._closed:
+            return False
+        emitted_at = emitted_at or time.monotonic()
+
+        if len(self._items) >= self.max_size:
+            if self.policy == DROP_NEWEST:
+                self._count_drop()
+                return False
+            if self.policy == COALESCE and key is not None and self._replace(item, key, emitted_at):
+                return True
+            self._items.popleft()
+            self._count_drop()
+
+        self._items.append((item, key, emitted_at))
+        self.max_depth_seen = max(self.max_depth_seen, len(self._items))
+        self._ensure_task()
+        self._wake.set()
+        return True
+
+    def _count_drop(self) -> None:
+        self.dropped += 1
+        if self.gap_notice is not None:
+            self._gap += 1
+
+    def _replace(self, item: Any, key: Hashable, emitted_at: float) -> bool:
+        """Drop the queued item sharing this key and append the newer one."""
+        for i, (_, queued_key, _) in enumerate(self._items):
+            if queued_key == key:
+                del self._items[i]
+                self._items.append((item, key, emitted_at))
+                self.coalesced += 1
+                return True
+        return False
+
+    def _ensure_task(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._wake = asyncio.Event()
+            self._task = loop.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        while not self._closed:
+            if self._backlog:
+                item, emitted_at = self._backlog.popleft(), None
+            elif self._gap:
+                item, emitted_at = self.gap_notice(self._gap), None
+                self._gap = 0
+                self.gap_notices += 1
+            elif self._items:
+                item, _, emitted_at = self._items.popleft()
+            else:
+                self._wake.clear()
+                await self._wake.wait()
+                continue
+            try:
+                result = self.deliver(item)
+                if asyncio.iscoroutine(result):
+                    await result
+                self.delivered += 1
+                if emitted_at is not None:
+                    self._latencies.append(time.monotonic() - emitted_at)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                if self.on_error is not None:
+                    self.on_error(self, e)
+                else:
+                    print(f"Async event subscriber error ({self.name}): {e}")
+
+    async def join(self, timeout: Optional[float] = None) -> None:
+        """Wait until everything queued so far has been handed to the consumer."""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while self._items or self._backlog or self._gap or (self._task is not None and not self._task.done() and self._wake.is_set()):
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+            await asyncio.sleep(0.001)
+
+    def close(self) -> None:
+        """Stop the drain task; queued items are discarded."""
+        self._closed = True
+        self._items.clear()
+        self._backlog.clear()
+        self._gap = 0
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Depth, drop and latency counters."""
+        latencies = sorted(self._latencies)
+        return {
+            "name": self.name,
+            "policy": self.policy,
+            "depth": len(self._items),
+            "backlog": len(self._backlog),
+            "max_size": self.max_size,
+            "max_depth_seen": self.max_depth_seen,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "gap_notices": self.gap_notices,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "latency_ms": {
+                "avg": round(sum(latencies) / len(latencies) * 1000, 3) if latencies else 0.0,
+                "p95": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000, 3) if latencies else 0.0,
+                "max": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+            },
+        }
 
 
 class EventBus:
@@ -297,16 +520,88 @@ class EventBus:
         self._initialized = True
         self._subscribers: List[Callable[[Event], None]] = []
         self._async_subscribers: List[Callable[[Event], Any]] = []
-        self._history: List[Event] = []
+        self._queues: Dict[Callable, SubscriberQueue] = {}
         self._max_history = 1000
+        self._history: Deque[Event] = deque(maxlen=self._max_history)
+        self._queue_size = 256
+        self._overflow_policy = DROP_OLDEST
+        self._emitted = 0
+        self._log: Optional["EventLog"] = None
+        self._log_errors = 0
+
+    def configure(self, config: Optional[Dict] = None):
+        """
+        Apply the `event_bus` config section.
+
+        Options: max_history, queue_size (per async subscriber),
+        overflow_policy (drop_oldest | drop_newest | coalesce) and `log`
+        (durable event log: enabled, directory, segment_max_bytes,
+        max_segments, fsync).
+        """
+        config = config or {}
+        if "log" in config:
+            self._configure_log(config.get("log") or {})
+        max_history = int(config.get("max_history", self._max_history))
+        if max_history != self._max_history:
+            self._max_history = max_history
+            self._history = deque(self._history, maxlen=max_history)
+        self._queue_size = int(config.get("queue_size", self._queue_size))
+        policy = config.get("overflow_policy", self._overflow_policy)
+        if policy not in OVERFLOW_POLICIES:
+            print(f"⚠️  Unknown event_bus overflow_policy '{policy}', using {DROP_OLDEST}")
+            policy = DROP_OLDEST
+        self._overflow_policy = policy
+        for queue in self._queues.values():
+            queue.max_size = max(1, self._queue_size)
+            queue.policy = policy
+
+    def _configure_log(self, log_config: Dict):
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        if not log_config.get("enabled", False):
+            return
+        try:
+            from core.event_log import EventLog
+            self._log = EventLog(
+                directory=log_config.get("directory", "~/.cache/byrd/events"),
+                segment_max_bytes=int(log_config.get("segment_max_bytes", 8 * 1024 * 1024)),
+                max_segments=int(log_config.get("max_segments", 16)),
+                fsync=bool(log_config.get("fsync", False)),
+            )
+            print(f"📜 Event log: {self._log.directory} (seq {self._log.first_seq}..{self._log.last_seq})")
+        except Exception as e:
+            print(f"⚠️  Event log unavailable, keeping in-memory history only: {e}")
+            self._log = None
+
+    @property
+    def log(self) -> Optional["EventLog"]:
+        """The durable event log, if enabled."""
+        return self._log
 
     def subscribe(self, callback: Callable[[Event], None]):
         """Subscribe a sync callback to all events."""
         self._subscribers.append(callback)
 
-    def subscribe_async(self, callback: Callable[[Event], Any]):
-        """Subscribe an async callback to all events."""
+    def subscribe_async(
+        self,
+        callback: Callable[[Event], Any],
+        queue_size: Optional[int] = None,
+        overflow_policy: Optional[str] = None
+    ):
+        """
+        Subscribe an async callback to all events.
+
+        Each async subscriber gets its own bounded queue and drain task, so
+        emit() never waits on it and a slow subscriber only delays itself.
+        """
         self._async_subscribers.append(callback)
+        self._queues[callback] = SubscriberQueue(
+            callback,
+            name=getattr(callback, "__qualname__", repr(callback)),
+            max_size=queue_size or self._queue_size,
+            policy=overflow_policy or self._overflow_policy,
+        )
 
     def unsubscribe(self, callback):
         """Remove a subscriber."""
@@ -314,6 +609,9 @@ class EventBus:
             self._subscribers.remove(callback)
         if callback in self._async_subscribers:
             self._async_subscribers.remove(callback)
+        queue = self._queues.pop(callback, None)
+        if queue is not None:
+            queue.close()
 
     async def emit(self, event: Event):
         """Emit an event to all subscribers."""
@@ -321,10 +619,8 @@ class EventBus:
         if event.narration is None:
             event.narration = self._generate_narration(event)
 
-        # Store in history
-        self._history.append(event)
-        if len(self._history) > self._max_history:
-            self._history = self._history[-self._max_history:]
+        # Sequence, persist and store in history
+        self._record(event)
 
         # Notify sync subscribers
         for callback in self._subscribers:
@@ -333,12 +629,45 @@ class EventBus:
             except Exception as e:
                 print(f"Event subscriber error: {e}")
 
-        # Notify async subscribers
+        # Hand off to async subscribers' queues (non-blocking)
         for callback in self._async_subscribers:
+            self._queues[callback].put(event, key=coalesce_key(event), emitted_at=event.emitted_at)
+
+    def _record(self, event: Event):
+        """Assign the sequence number, append to the durable log and the history ring."""
+        event.emitted_at = time.monotonic()
+        self._emitted += 1
+        if self._log is not None:
             try:
-                await callback(event)
+                event.seq = self._log.next_seq
+                event._json = None
+                self._log.append(event.type.value, event.timestamp.timestamp(), event.to_json())
             except Exception as e:
-                print(f"Async event subscriber error: {e}")
+                event.seq = None
+                event._json = None
+                self._log_errors += 1
+                print(f"⚠️  Event log append failed: {e}")
+        self._history.append(event)
+
+    def replay(self, after_seq: int, limit: int = 5000) -> Tuple[List[str], bool]:
+        """
+        Serialized events with seq > after_seq, oldest first.
+
+        Returns (messages, complete); complete is False when older events
+        were already rotated out (or there is no log) and the client must
+        resync from the API.
+        """
+        if self._log is None:
+            return [], False
+        records = self._log.read_from(after_seq, limit)
+        complete = after_seq + 1 >= self._log.first_seq and (
+            not records or records[-1][0] == self._log.last_seq
+        )
+        return [payload for _, payload in records], complete
+
+    async def drain(self, timeout: Optional[float] = None):
+        """Wait until every async subscriber has caught up (tests, shutdown)."""
+        await asyncio.gather(*(q.join(timeout) for q in list(self._queues.values())))
 
     def emit_sync(self, event: Event):
         """Emit event synchronously (for non-async contexts)."""
@@ -346,9 +675,7 @@ class EventBus:
         if event.narration is None:
             event.narration = self._generate_narration(event)
 
-        self._history.append(event)
-        if len(self._history) > self._max_history:
-            self._history = self._history[-self._max_history:]
+        self._record(event)
 
         for callback in self._subscribers:
             try:
@@ -368,17 +695,70 @@ class EventBus:
     def get_history(
         self,
         limit: int = 100,
-        event_types: Optional[List[EventType]] = None
+        event_types: Optional[List[EventType]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
     ) -> List[Event]:
-        """Get recent event history, optionally filtered by type."""
-        history = self._history
+        """
+        Get recent event history, optionally filtered by type and time range.
+
+        With the durable log enabled this is an indexed lookup that also
+        covers events from before the last restart.
+        """
+        if self._log is not None:
+            records = self._log.query(
+                event_types=[t.value for t in event_types] if event_types else None,
+                since=since.timestamp() if since else None,
+                until=until.timestamp() if until else None,
+                limit=limit,
+            )
+            events = []
+            for _, payload in records:
+                try:
+                    events.append(Event.from_dict(json.loads(payload)))
+                except (ValueError, KeyError):
+                    continue  # Event type no longer exists
+            return events
+
+        history = list(self._history)
         if event_types:
             history = [e for e in history if e.type in event_types]
+        if since:
+            history = [e for e in history if e.timestamp >= since]
+        if until:
+            history = [e for e in history if e.timestamp <= until]
         return history[-limit:]
 
     def clear_history(self):
-        """Clear event history (used on reset)."""
-        self._history = []
+        """Clear event history, durable log included (used on reset)."""
+        self._history.clear()
+        if self._log is not None:
+            try:
+                self._log.reset()
+            except Exception as e:
+                self._log_errors += 1
+                print(f"⚠️  Event log reset failed: {e}")
+
+    def close(self):
+        """Close the durable log (shutdown)."""
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Fan-out metrics: per-subscriber queue depth, drops and delivery latency."""
+        subscribers = [q.get_stats() for q in self._queues.values()]
+        return {
+            "emitted": self._emitted,
+            "history_size": len(self._history),
+            "max_history": self._max_history,
+            "log": self._log.get_stats() if self._log is not None else None,
+            "log_errors": self._log_errors,
+            "sync_subscribers": len(self._subscribers),
+            "async_subscribers": subscribers,
+            "total_dropped": sum(s["dropped"] for s in subscribers),
+            "total_queued": sum(s["depth"] for s in subscribers),
+        }
 
 
 # Global singleton instance
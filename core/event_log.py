@@ -0,0 +1,326 @@
+"""
+Durable, append-only event log.
+
+Events are appended to segment files with monotonic sequence numbers.
+Each record is one line:
+
+    <seq>\t<event_type>\t<epoch_seconds>\t<json>\n
+
+The JSON part is exactly what WebSocket clients receive, so a replay is
+a memory-mapped slice per record with no re-serialization. The small
+header lets startup rebuild the index without parsing any JSON.
+
+Segments rotate at segment_max_bytes and the oldest are deleted beyond
+max_segments. reset() drops every record but keeps the numbering going:
+the last sequence number is persisted as a watermark (RESET_FILE), so
+after a restart nothing at or below it comes back and cursors held by
+clients stay monotonic. An in-memory index (position by sequence, per-type
+sequence lists, clamped timestamps) answers type / time-range queries
+with bisection instead of scanning.
+"""
+
+import mmap
+import os
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from heapq import merge
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+SEGMENT_SUFFIX = ".log"
+RESET_FILE = "reset.seq"
+
+
+@dataclass
+class _Segment:
+    """One segment file; read through a lazily (re)mapped mmap."""
+    first_seq: int
+    path: Path
+    size: int = 0
+    _map: Optional[mmap.mmap] = field(default=None, repr=False)
+
+    def read(self, offset: int, length: int) -> bytes:
+        end = offset + length
+        if self._map is None or len(self._map) < end:
+            self.close()
+            with open(self.path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map[offset:end]
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+class EventLog:
+    """Segment-rotated append-only log with an in-memory index."""
+
+    def __init__(
+        self,
+        directory: str,
+        segment_max_bytes: int = 8 * 1024 * 1024,
+        max_segments: int = 16,
+        fsync: bool = False
+    ):
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_max_bytes = max(1024, segment_max_bytes)
+        self.max_segments = max(1, max_segments)
+        self.fsync = fsync
+
+        self._segments: List[_Segment] = []
+        self._first_seq = 1
+        self._next_seq = 1
+        # Position i describes sequence _first_seq + i
+        self._locations: List[Tuple[_Segment, int, int]] = []
+        self._times: List[float] = []
+        self._by_type: Dict[str, Tuple[List[int], List[float]]] = {}
+        self._file = None
+        self._reset_seq = 0
+
+        self._recover()
+
+    # ------------------------------------------------------------------
+    # Properties
+    # ------------------------------------------------------------------
+
+    @property
+    def next_seq(self) -> int:
+        """Sequence number the next append will get."""
+        return self._next_seq
+
+    @property
+    def first_seq(self) -> int:
+        """Oldest sequence number still retained."""
+        return self._first_seq
+
+    @property
+    def reset_seq(self) -> int:
+        """Watermark of the last reset (records at or below it are gone)."""
+        return self._reset_seq
+
+    @property
+    def last_seq(self) -> int:
+        """Newest sequence number written (0 if empty)."""
+        return self._next_seq - 1
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, event_type: str, timestamp: float, payload: str) -> int:
+        """Append one record and return its sequence number."""
+        seq = self._next_seq
+        data = payload.encode("utf-8")
+        line = f"{seq}\t{event_type}\t{timestamp:.6f}\t".encode("utf-8") + data + b"\n"
+
+        segment = self._active_segment(len(line))
+        offset = segment.size + len(line) - len(data) - 1
+        self._file.write(line)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        segment.size += len(line)
+
+        self._index(seq, event_type, timestamp, segment, offset, len(data))
+        self._next_seq = seq + 1
+        return seq
+
+    def _active_segment(self, incoming: int) -> _Segment:
+        segment = self._segments[-1] if self._segments else None
+        if segment is None or (segment.size and segment.size + incoming > self.segment_max_bytes):
+            segment = self._rotate()
+        elif self._file is None:
+            self._file = open(segment.path, "ab")
+        return segment
+
+    def _rotate(self) -> _Segment:
+        if self._file is not None:
+            self._file.close()
+        path = self.directory / f"{self._next_seq:016d}{SEGMENT_SUFFIX}"
+        segment = _Segment(first_seq=self._next_seq, path=path)
+        self._segments.append(segment)
+        self._file = open(path, "ab")
+        self._enforce_retention()
+        return segment
+
+    def _enforce_retention(self) -> None:
+        while len(self._segments) > self.max_segments:
+            dropped = self._segments.pop(0)
+            dropped.close()
+            try:
+                dropped.path.unlink()
+            except FileNotFoundError:
+                pass
+            self._trim_before(self._segments[0].first_seq)
+
+    def _trim_before(self, seq: int) -> None:
+        count = max(0, min(seq - self._first_seq, len(self._locations)))
+        del self._locations[:count]
+        del self._times[:count]
+        self._first_seq = seq
+        for event_type in list(self._by_type):
+            seqs, times = self._by_type[event_type]
+            cut = bisect_left(seqs, seq)
+            del seqs[:cut]
+            del times[:cut]
+            if not seqs:
+                del self._by_type[event_type]
+
+    def _index(self, seq: int, event_type: str, timestamp: float,
+               segment: _Segment, offset: int, length: int) -> None:
+        # Clamp so the time index stays sorted even if a caller back-dates an event
+        if self._times and timestamp < self._times[-1]:
+            timestamp = self._times[-1]
+        self._locations.append((segment, offset, length))
+        self._times.append(timestamp)
+        seqs, times = self._by_type.setdefault(event_type, ([], []))
+        seqs.append(seq)
+        times.append(timestamp)
+
+    def reset(self) -> None:
+        """
+        Drop every record; numbering continues after the current last_seq.
+
+        The watermark is written before the segments are deleted, so a
+        crash in between still hides the old records on recovery.
+        """
+        self._reset_seq = self.last_seq
+        marker = self.directory / RESET_FILE
+        tmp = marker.with_suffix(".tmp")
+        tmp.write_text(str(self._reset_seq))
+        os.replace(tmp, marker)
+
+        self.close()
+        for segment in self._segments:
+            try:
+                segment.path.unlink()
+            except FileNotFoundError:
+                pass
+        self._segments.clear()
+        self._locations.clear()
+        self._times.clear()
+        self._by_type.clear()
+        self._first_seq = self._next_seq = self._reset_seq + 1
+
+    # ------------------------------------------------------------------
+    # Recovery
+    # ------------------------------------------------------------------
+
+    def _recover(self) -> None:
+        marker = self.directory / RESET_FILE
+        try:
+            self._reset_seq = int(marker.read_text().strip())
+        except (FileNotFoundError, ValueError):
+            self._reset_seq = 0
+        self._first_seq = self._next_seq = self._reset_seq + 1
+
+        paths = sorted(self.directory.glob(f"*{SEGMENT_SUFFIX}"))
+        for path in paths:
+            try:
+                first_seq = int(path.stem)
+            except ValueError:
+                continue
+            if first_seq <= self._reset_seq:
+                # Written before a reset whose cleanup did not finish
+                path.unlink()
+                continue
+            segment = _Segment(first_seq=first_seq, path=path)
+            if not self._segments:
+                self._first_seq = self._next_seq = first_seq
+            self._segments.append(segment)
+            self._scan(segment)
+        self._enforce_retention()
+
+    def _scan(self, segment: _Segment) -> None:
+        with open(segment.path, "rb") as f:
+            data = f.read()
+        offset = 0
+        good_end = 0
+        while offset < len(data):
+            newline = data.find(b"\n", offset)
+            if newline < 0:
+                break  # Torn final write
+            try:
+                seq_raw, type_raw, ts_raw, _ = data[offset:newline].split(b"\t", 3)
+                seq = int(seq_raw)
+                header = len(seq_raw) + len(type_raw) + len(ts_raw) + 3
+            except ValueError:
+                break
+            if seq != self._next_seq:
+                break  # Gap or corruption: keep what is consistent
+            self._index(seq, type_raw.decode("utf-8"), float(ts_raw),
+                        segment, offset + header, newline - offset - header)
+            self._next_seq = seq + 1
+            offset = good_end = newline + 1
+
+        segment.size = good_end
+        if good_end < len(data):
+            print(f"⚠️  Event log: truncating {len(data) - good_end} trailing bytes in {segment.path.name}")
+            with open(segment.path, "r+b") as f:
+                f.truncate(good_end)
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _payload(self, seq: int) -> str:
+        segment, offset, length = self._locations[seq - self._first_seq]
+        return segment.read(offset, length).decode("utf-8")
+
+    def read_from(self, after_seq: int, limit: Optional[int] = None) -> List[Tuple[int, str]]:
+        """(seq, json) records with seq > after_seq, oldest first."""
+        start = max(after_seq + 1, self._first_seq)
+        end = self._next_seq if limit is None else min(self._next_seq, start + limit)
+        return [(seq, self._payload(seq)) for seq in range(start, end)]
+
+    def query(
+        self,
+        event_types: Optional[Iterable[str]] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: int = 100
+    ) -> List[Tuple[int, str]]:
+        """
+        Newest `limit` records matching the filters, returned oldest first.
+
+        Uses the per-type and time indexes; nothing is scanned.
+        """
+        if limit <= 0:
+            return []
+        if event_types is None:
+            lo = bisect_left(self._times, since) if since is not None else 0
+            hi = bisect_right(self._times, until) if until is not None else len(self._times)
+            seqs: Iterable[int] = range(self._first_seq + max(lo, hi - limit), self._first_seq + hi)
+        else:
+            ranges = []
+            for event_type in set(event_types):
+                type_seqs, times = self._by_type.get(event_type, ([], []))
+                lo = bisect_left(times, since) if since is not None else 0
+                hi = bisect_right(times, until) if until is not None else len(times)
+                ranges.append(type_seqs[max(lo, hi - limit):hi])
+            seqs = list(merge(*ranges))[-limit:]
+        return [(seq, self._payload(seq)) for seq in seqs]
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        for segment in self._segments:
+            segment.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "directory": str(self.directory),
+            "segments": len(self._segments),
+            "bytes": sum(s.size for s in self._segments),
+            "records": len(self._locations),
+            "first_seq": self._first_seq,
+            "last_seq": self.last_seq,
+            "reset_seq": self._reset_seq,
+            "event_types": len(self._by_type),
+        }
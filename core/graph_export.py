@@ -0,0 +1,144 @@
+"""
+Paged, projected graph export for the visualizer.
+
+Memory.get_graph_page() walks nodes label by label and in id order
+within a label (keyset pagination over the per-label id indexes, so
+pages stay stable while the graph grows) and returns each page with the
+outgoing relationships of its nodes, so every relationship is delivered
+exactly once. Only the requested fields are read from Neo4j.
+
+Encodings:
+- json:     {"nodes": [...], "relationships": [...], "next_cursor": ...}
+- columnar: same, but nodes/relationships as {"field": [values...]}
+            (keys are not repeated per row)
+- msgpack:  columnar, MessagePack-encoded (needs the optional msgpack package)
+
+Usage:
+    page = await memory.get_graph_page(after=None, page_size=500, fields=("id", "type"))
+    body, media_type = encode_page(page, "columnar")
+"""
+
+import base64
+import hashlib
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    msgpack = None
+    HAS_MSGPACK = False
+
+# Projectable node fields -> Cypher expression over `n`
+NODE_FIELDS: Dict[str, str] = {
+    "id": "n.id",
+    "type": "toLower(labels(n)[0])",
+    "content": "coalesce(n.content, n.essence, n.description, n.name, '')",
+    "subtype": "n.type",
+    "confidence": "n.confidence",
+    "intensity": "n.intensity",
+    "status": "n.status",
+    "created_at": "toString(n.timestamp)",
+    "access_count": "coalesce(n.access_count, 0)",
+    "last_accessed": "toString(n.last_accessed)",
+    "quantum_seed": "n.quantum_seed",
+}
+DEFAULT_FIELDS: Tuple[str, ...] = ("id", "type", "content", "subtype", "confidence", "created_at")
+RELATIONSHIP_FIELDS: Tuple[str, ...] = ("id", "type", "source_id", "target_id")
+
+FORMATS = {
+    "json": "application/json",
+    "columnar": "application/json",
+    "msgpack": "application/x-msgpack",
+}
+
+
+def parse_fields(fields: Optional[str]) -> Tuple[str, ...]:
+    """
+    Parse a comma-separated projection; "id" is always included.
+
+    Raises:
+        ValueError: On an unknown field name
+    """
+    if not fields:
+        return DEFAULT_FIELDS
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in NODE_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)} (available: {', '.join(NODE_FIELDS)})")
+    return tuple(dict.fromkeys(["id"] + requested))
+
+
+def encode_cursor(position: Optional[Tuple[str, str]]) -> Optional[str]:
+    """Opaque cursor for the page after (label, id) (None when there is no next page)."""
+    if position is None:
+        return None
+    label, last_id = position
+    return base64.urlsafe_b64encode(
+        json.dumps({"label": label, "after": last_id}).encode("utf-8")
+    ).decode("ascii")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[str, str]]:
+    """
+    Inverse of encode_cursor: (label, id) of the last node served.
+
+    Raises:
+        ValueError: On a malformed cursor
+    """
+    if not cursor:
+        return None
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return data["label"], data["after"]
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+
+def to_columns(rows: List[Dict[str, Any]], fields: Iterable[str]) -> Dict[str, List[Any]]:
+    """Row dicts -> {field: [values]}."""
+    return {field: [row.get(field) for row in rows] for field in fields}
+
+
+def encode_page(page: Dict[str, Any], fmt: str = "json") -> Tuple[bytes, str]:
+    """
+    Serialize a page from Memory.get_graph_page().
+
+    Returns (body, media_type).
+
+    Raises:
+        ValueError: On an unknown format, or msgpack without the package
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format '{fmt}' (available: {', '.join(FORMATS)})")
+
+    if fmt == "json":
+        payload = page
+    else:
+        payload = {
+            "fields": list(page["fields"]),
+            "count": len(page["nodes"]),
+            "nodes": to_columns(page["nodes"], page["fields"]),
+            "relationships": to_columns(page["relationships"], RELATIONSHIP_FIELDS),
+            "next_cursor": page["next_cursor"],
+        }
+
+    if fmt == "msgpack":
+        if not HAS_MSGPACK:
+            raise ValueError("msgpack format requires the msgpack package")
+        return msgpack.packb(payload, use_bin_type=True), FORMATS[fmt]
+    return json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8"), FORMATS[fmt]
+
+
+def etag_for(body: bytes) -> str:
+    """Strong ETag derived from the encoded body."""
+    return '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Evaluate an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
@@ -0,0 +1,206 @@
+"""
+Shared HTTP connection pool for LLM providers.
+
+One long-lived httpx.AsyncClient per provider keeps TCP+TLS connections
+alive between calls, so dreamer/seeker/RSI requests reuse a warm
+connection instead of paying a handshake every time.
+
+HTTP/2 is used when the optional `h2` package is installed.
+
+Usage:
+    client = get_http_pool().client("zai", timeout=120.0)
+    response = await client.post(url, json=..., extensions=get_http_pool().trace("zai"))
+
+    # On shutdown (server lifespan):
+    await close_http_pool()
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+@dataclass
+class ProviderConnectionStats:
+    """Connection reuse and handshake metrics for one provider."""
+    requests: int = 0
+    new_connections: int = 0
+    tcp_connect_ms: float = 0.0
+    tls_handshake_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        reused = max(0, self.requests - self.new_connections)
+        handshake_ms = self.tcp_connect_ms + self.tls_handshake_ms
+        return {
+            "requests": self.requests,
+            "new_connections": self.new_connections,
+            "reused_connections": reused,
+            "reuse_rate_percent": round(reused / self.requests * 100, 2) if self.requests else 0.0,
+            "avg_handshake_ms": round(handshake_ms / self.new_connections, 2) if self.new_connections else 0.0,
+            "total_handshake_ms": round(handshake_ms, 2),
+        }
+
+
+class HTTPClientPool:
+    """
+    Lifecycle-managed pool of keep-alive AsyncClients, one per provider.
+
+    Clients are bound to the event loop that created them; if called
+    from a different loop (e.g. a fresh asyncio.run in a script) a new
+    client is created for that loop and the old one is closed.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 60.0,
+        connect_timeout: float = 10.0,
+        http2: bool = True
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.connect_timeout = connect_timeout
+        self.http2 = http2 and HTTP2_AVAILABLE
+
+        self._clients: Dict[str, Tuple[httpx.AsyncClient, Any]] = {}
+        self._stats: Dict[str, ProviderConnectionStats] = {}
+        self._retired: List[httpx.AsyncClient] = []  # Replaced with no loop to close them on
+        self._closing: Set[Any] = set()
+
+    def configure(self, config: Dict) -> None:
+        """Apply pool limits from config (takes effect for new clients)."""
+        self.max_connections = config.get("max_connections", self.max_connections)
+        self.max_keepalive_connections = config.get(
+            "max_keepalive_connections", self.max_keepalive_connections
+        )
+        self.keepalive_expiry = config.get("keepalive_expiry", self.keepalive_expiry)
+        self.connect_timeout = config.get("connect_timeout", self.connect_timeout)
+        self.http2 = config.get("http2", self.http2) and HTTP2_AVAILABLE
+
+    def client(self, provider: str, timeout: float = 120.0) -> httpx.AsyncClient:
+        """Get (or lazily create) the shared client for a provider."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        entry = self._clients.get(provider)
+        if entry is not None:
+            client, client_loop = entry
+            if not client.is_closed and client_loop is loop:
+                return client
+            self._retire(client, client_loop, loop)
+
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout, connect=self.connect_timeout),
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry
+            ),
+            http2=self.http2
+        )
+        self._clients[provider] = (client, loop)
+        self._stats.setdefault(provider, ProviderConnectionStats())
+        return client
+
+    def _retire(self, client: httpx.AsyncClient, client_loop: Any, loop: Any) -> None:
+        """Close a client replaced for another loop, on its own loop if that still runs."""
+        if client.is_closed:
+            return
+        if client_loop is not None and client_loop.is_running() and not client_loop.is_closed():
+            future = asyncio.run_coroutine_threadsafe(self._aclose(client), client_loop)
+        elif loop is not None:
+            # Its loop is gone: drop the dead connections from this one
+            future = loop.create_task(self._aclose(client))
+        else:
+            self._retired.append(client)
+            return
+        self._closing.add(future)
+        future.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _aclose(client: httpx.AsyncClient) -> None:
+        try:
+            await client.aclose()
+        except Exception as e:
+            print(f"Warning: HTTP pool close failed: {e}")
+
+    def trace(self, provider: str) -> Dict[str, Any]:
+        """
+        Request extensions that record connection reuse and handshake time.
+
+        Pass the result as `extensions=` on each request.
+        """
+        stats = self._stats.setdefault(provider, ProviderConnectionStats())
+        stats.requests += 1
+        started: Dict[str, float] = {}
+
+        async def _trace(event_name: str, info: Dict[str, Any]) -> None:
+            if event_name.endswith(".started"):
+                started[event_name[:-8]] = time.perf_counter()
+                return
+            if not event_name.endswith(".complete"):
+                return
+            name = event_name[:-9]
+            begin = started.pop(name, None)
+            if begin is None:
+                return
+            elapsed_ms = (time.perf_counter() - begin) * 1000
+            if name == "connection.connect_tcp":
+                stats.new_connections += 1
+                stats.tcp_connect_ms += elapsed_ms
+            elif name == "connection.start_tls":
+                stats.tls_handshake_ms += elapsed_ms
+
+        return {"trace": _trace}
+
+    async def close(self) -> None:
+        """Close all pooled clients."""
+        clients = [client for client, _ in self._clients.values()] + self._retired
+        self._clients.clear()
+        self._retired = []
+        for client in clients:
+            await self._aclose(client)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-provider connection statistics."""
+        return {
+            "http2": self.http2,
+            "max_connections": self.max_connections,
+            "max_keepalive_connections": self.max_keepalive_connections,
+            "open_clients": sum(1 for c, _ in self._clients.values() if not c.is_closed),
+            "providers": {
+                provider: stats.to_dict() for provider, stats in self._stats.items()
+            }
+        }
+
+
+# Global pool shared by all LLM clients
+_http_pool = HTTPClientPool()
+
+
+def get_http_pool() -> HTTPClientPool:
+    """Get the global HTTP client pool."""
+    return _http_pool
+
+
+def configure_http_pool(config: Dict) -> None:
+    """Configure the global pool limits from config."""
+    _http_pool.configure(config or {})
+
+
+async def close_http_pool() -> None:
+    """Close all pooled connections (call from server shutdown)."""
+    await _http_pool.close()
@@ -0,0 +1,235 @@
+"""
+Write-behind batching queue.
+
+Collects small writes (e.g. experiences) and hands them to a flush
+function in batches, so a burst of N records becomes a handful of
+UNWIND transactions instead of N round-trips.
+
+Flushes happen when:
+- the batch reaches max_batch items
+- the oldest pending item is older than flush_interval seconds
+- a caller is waiting for its write (wait=True), after letting any
+  concurrent submitters join the same batch
+- flush() is called explicitly (read-your-writes barrier)
+
+The queue is bounded: submit() blocks once max_pending items are queued
+(backpressure on the producer instead of unbounded memory growth).
+
+A failed batch is split in half and retried until the bad item is
+isolated, so one bad row does not fail the rest of the batch. flush()
+called from inside flush_fn (directly or through code it calls) is a
+no-op: the items being written are already out of the queue.
+"""
+
+import asyncio
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+# Queue whose flush_fn is running in the current task (re-entrancy guard)
+_flushing: ContextVar[Optional["WriteBehindQueue"]] = ContextVar("write_behind_flushing", default=None)
+
+
+@dataclass
+class QueueMetrics:
+    """Throughput and backpressure counters."""
+    submitted: int = 0
+    written: int = 0
+    failed: int = 0
+    dropped: int = 0
+    split_retries: int = 0
+    batches: int = 0
+    backpressure_waits: int = 0
+    max_pending_seen: int = 0
+    total_flush_seconds: float = 0.0
+
+
+class WriteBehindQueue:
+    """
+    Bounded asynchronous batching queue.
+
+    flush_fn receives a list of items and returns a list of per-item
+    results (same order), which are delivered to callers that waited.
+    """
+
+    def __init__(
+        self,
+        flush_fn: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch: int = 200,
+        flush_interval: float = 0.25,
+        max_pending: int = 5000,
+        name: str = "queue"
+    ):
+        self.flush_fn = flush_fn
+        self.max_batch = max(1, max_batch)
+        self.flush_interval = flush_interval
+        self.max_pending = max(self.max_batch, max_pending)
+        self.name = name
+
+        self._pending: List[Tuple[Any, Optional[asyncio.Future], float]] = []
+        self._waiters = 0
+        self._space = asyncio.Condition()
+        self._wake = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._worker: Optional[asyncio.Task] = None
+        self._closed = False
+
+        self.metrics = QueueMetrics()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def submit(self, item: Any, wait: bool = True) -> Any:
+        """
+        Queue an item for writing.
+
+        Args:
+            item: Opaque item passed to flush_fn
+            wait: If True, return only after the batch containing this item
+                  is written (and return its result); otherwise return at once
+
+        Raises:
+            RuntimeError: If the queue is closed
+        """
+        if self._closed:
+            raise RuntimeError(f"{self.name} queue is closed")
+
+        async with self._space:
+            while len(self._pending) >= self.max_pending:
+                self.metrics.backpressure_waits += 1
+                self._wake.set()
+                await self._space.wait()
+
+            future = asyncio.get_running_loop().create_future() if wait else None
+            self._pending.append((item, future, time.monotonic()))
+            if future is not None:
+                self._waiters += 1
+            self.metrics.submitted += 1
+            self.metrics.max_pending_seen = max(self.metrics.max_pending_seen, len(self._pending))
+
+        self._ensure_worker()
+        if future is not None or len(self._pending) >= self.max_batch:
+            self._wake.set()
+
+        if future is not None:
+            return await future
+        return None
+
+    async def flush(self) -> None:
+        """Write everything queued so far (read-your-writes barrier)."""
+        await self._drain()
+
+    async def close(self) -> None:
+        """Flush remaining items and stop the background worker."""
+        self._closed = True
+        await self._drain()
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    def _due_in(self) -> Optional[float]:
+        """Seconds until the next flush is due (0 = now, None = nothing queued)."""
+        if not self._pending:
+            return None
+        if self._waiters or len(self._pending) >= self.max_batch:
+            return 0.0
+        oldest = self._pending[0][2]
+        return max(0.0, oldest + self.flush_interval - time.monotonic())
+
+    async def _run(self) -> None:
+        while True:
+            due = self._due_in()
+            if due is None or due > 0:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=due)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+                due = self._due_in()
+                if due is None or due > 0:
+                    continue
+            # Let concurrent submitters join this batch before writing
+            await asyncio.sleep(0)
+            await self._drain()
+
+    async def _drain(self) -> None:
+        if _flushing.get() is self:
+            # Called back from inside flush_fn: waiting on _flush_lock here
+            # would deadlock, and this batch is already being written
+            return
+        async with self._flush_lock:
+            while self._pending:
+                async with self._space:
+                    batch = self._pending[:self.max_batch]
+                    del self._pending[:self.max_batch]
+                    self._waiters -= sum(1 for _, f, _ in batch if f is not None)
+                    self._space.notify_all()
+                await self._write(batch)
+
+    async def _write(self, batch: List[Tuple[Any, Optional[asyncio.Future], float]]) -> None:
+        items = [item for item, _, _ in batch]
+        start = time.monotonic()
+        token = _flushing.set(self)
+        try:
+            results = await self.flush_fn(items)
+        except Exception as e:
+            error = e
+        else:
+            error = None
+        finally:
+            _flushing.reset(token)
+            self.metrics.total_flush_seconds += time.monotonic() - start
+
+        if error is not None:
+            if len(batch) > 1:
+                # Bisect to isolate the bad item(s) instead of losing the batch
+                self.metrics.split_retries += 1
+                mid = len(batch) // 2
+                await self._write(batch[:mid])
+                await self._write(batch[mid:])
+                return
+            _, future, _ = batch[0]
+            self.metrics.failed += 1
+            if future is None:
+                self.metrics.dropped += 1
+                print(f"⚠️  {self.name} write failed, unawaited item dropped: {error}")
+            elif not future.done():
+                future.set_exception(error)
+            return
+
+        self.metrics.batches += 1
+        self.metrics.written += len(batch)
+        results = results if results is not None else [None] * len(batch)
+        for (_, future, _), result in zip(batch, results):
+            if future is not None and not future.done():
+                future.set_result(result)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth, batching and backpressure statistics."""
+        m = self.metrics
+        return {
+            "pending": len(self._pending),
+            "max_pending": self.max_pending,
+            "max_batch": self.max_batch,
+            "flush_interval_seconds": self.flush_interval,
+            "submitted": m.submitted,
+            "written": m.written,
+            "failed": m.failed,
+            "dropped": m.dropped,
+            "split_retries": m.split_retries,
+            "batches": m.batches,
+            "avg_batch_size": round(m.written / m.batches, 2) if m.batches else 0.0,
+            "avg_flush_ms": round(m.total_flush_seconds / m.batches * 1000, 2) if m.batches else 0.0,
+            "backpressure_waits": m.backpressure_waits,
+            "max_pending_seen": m.max_pending_seen,
+        }
@@ -15,73 +15,30 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
 import httpx
+from .http_pool import get_http_pool, configure_http_pool
+from .rate_limiter import get_rate_limiter, configure_rate_limits
 from .semantic_cache import SemanticCache
+from .single_flight import SingleFlight
 
 
 # =============================================================================
-# GLOBAL RATE LIMITER
+# RATE LIMITING
 # =============================================================================
-# Ensures minimum spacing between ALL LLM requests across all components
-# (Dreamer, Seeker, Coder) to prevent Z.AI rate limiting
-
-class GlobalRateLimiter:
-    """
-    Global rate limiter for all LLM requests.
-
-    Z.AI has strict rate limits. This ensures that no matter how many
-    components are trying to make requests, they are spaced out appropriately.
-    """
-
-    _instance = None
-    _lock = asyncio.Lock() if asyncio.get_event_loop_policy() else None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._last_request_time = 0
-            cls._instance._min_interval = 10.0  # Minimum 10 seconds between requests (configurable)
-            cls._instance._lock = None  # Will be created on first use
-        return cls._instance
-
-    async def wait_for_slot(self) -> float:
-        """
-        Wait until it's safe to make a request.
-        Returns the actual wait time in seconds.
-        """
-        # Create lock if needed (must be in async context)
-        if self._lock is None:
-            self._lock = asyncio.Lock()
-
-        async with self._lock:
-            now = time.time()
-            elapsed = now - self._last_request_time
-
-            if elapsed < self._min_interval:
-                wait_time = self._min_interval - elapsed
-                print(f"⏳ Rate limiter: waiting {wait_time:.1f}s before next LLM call")
-                await asyncio.sleep(wait_time)
-                self._last_request_time = time.time()
-                return wait_time
-            else:
-                self._last_request_time = now
-                return 0.0
-
-    def set_min_interval(self, seconds: float):
-        """Update the minimum interval between requests."""
-        self._min_interval = max(1.0, seconds)  # At least 1 second
-        print(f"📊 Rate limiter interval set to {self._min_interval}s")
-
-
-# Global instance
-_rate_limiter = GlobalRateLimiter()
+# Per-provider/model budgets with priority admission live in rate_limiter.py
 
 
 def configure_rate_limiter(interval_seconds: float):
     """
-    Configure the global rate limiter interval.
-    Called from byrd.py during initialization with config values.
+    Configure a fixed spacing between LLM requests.
+
+    Kept for older configs (rate_limit_interval): the interval becomes the
+    default requests-per-minute budget. Prefer local_llm.rate_limits.
     """
-    _rate_limiter.set_min_interval(interval_seconds)
+    rpm = 60.0 / max(1.0, interval_seconds)
+    configure_rate_limits({
+        "default": {"requests_per_minute": rpm},
+        "zai": {"requests_per_minute": rpm},
+    })
 
 
 @dataclass
@@ -154,6 +111,29 @@ class LLMClient(ABC):
         """Reset LLM client state for fresh start."""
         pass  # Nothing to reset
 
+    async def _coalesced(
+        self,
+        key: tuple,
+        factory,
+        coalesce: bool = True
+    ) -> LLMResponse:
+        """
+        Share one upstream request between concurrent identical calls.
+
+        key is (prompt, system_message, model, temperature, max_tokens).
+        Pass coalesce=False for calls that want independent samples.
+        """
+        if not coalesce:
+            return await factory()
+        if getattr(self, "_single_flight", None) is None:
+            self._single_flight = SingleFlight()
+        return await self._single_flight.run(key, factory)
+
+    def get_coalescing_stats(self) -> Dict[str, Any]:
+        """Counters for prompts deduplicated while in flight."""
+        flight = getattr(self, "_single_flight", None)
+        return flight.get_stats() if flight is not None else SingleFlight().get_stats()
+
     async def query(self, prompt: str, max_tokens: int = 500, temperature: float = 0.7) -> str:
         """
         Simple query interface for AGI Runner components.
@@ -359,7 +339,10 @@ class OpenRouterClient(LLMClient):
         app_name: str = "BYRD",
         enable_cache: bool = True,
         cache_ttl: float = 3600,
-        cache_max_entries: int = 1000
+        cache_max_entries: int = 1000,
+        cache_similarity_threshold: float = 0.92,
+        cache_eviction_policy: str = "lru",
+        cache_persist_path: Optional[str] = None
     ):
         self.model = model
         self.api_key = api_key or os.environ.get("OPENROUTER_API_KEY")
@@ -374,7 +357,9 @@ class OpenRouterClient(LLMClient):
         self._cache = SemanticCache(
             max_entries=cache_max_entries,
             ttl_seconds=cache_ttl,
-            similarity_threshold=0.92
+            similarity_threshold=cache_similarity_threshold,
+            eviction_policy=cache_eviction_policy,
+            persist_path=cache_persist_path
         ) if enable_cache else None
 
     @property
@@ -389,14 +374,13 @@ class OpenRouterClient(LLMClient):
         quantum_modulation: bool = False,
         quantum_context: str = "unknown",
         system_message: Optional[str] = None,
+        coalesce: bool = True,
         **kwargs
     ) -> LLMResponse:
         """Generate using OpenRouter API."""
-        quantum_influence = None
-
         # Check cache first if enabled
         if self._cache is not None:
-            cached_result = self._cache.get_with_info(prompt)
+            cached_result = self._cache.get_with_info(prompt, component=kwargs.get("component"))
             if cached_result is not None:
                 response_text, is_semantic = cached_result
                 return LLMResponse(
@@ -407,6 +391,30 @@ class OpenRouterClient(LLMClient):
                     quantum_influence=None
                 )
 
+        # Identical prompts already in flight share that request.
+        # Quantum-modulated calls want their own sample, so never coalesce them.
+        return await self._coalesced(
+            (prompt, system_message, self.model, temperature, max_tokens),
+            lambda: self._generate_uncached(
+                prompt, temperature, max_tokens, quantum_modulation,
+                quantum_context, system_message, **kwargs
+            ),
+            coalesce=coalesce and not quantum_modulation
+        )
+
+    async def _generate_uncached(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        quantum_modulation: bool,
+        quantum_context: str,
+        system_message: Optional[str],
+        **kwargs
+    ) -> LLMResponse:
+        """Send the request upstream and store the result in the cache."""
+        quantum_influence = None
+
         # Apply quantum modulation if requested
         if quantum_modulation:
             temperature, quantum_influence = await self._apply_quantum_modulation(
@@ -428,9 +436,19 @@ class OpenRouterClient(LLMClient):
             messages.append({"role": "system", "content": system_message})
         messages.append({"role": "user", "content": prompt})
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        limiter = get_rate_limiter().for_model("openrouter", self.model)
+        permit = await limiter.acquire(
+            get_rate_limiter().priority_for(kwargs.get("component"), kwargs.get("priority")),
+            tokens=_estimate_tokens(prompt, system_message, max_tokens)
+        )
+
+        pool = get_http_pool()
+        client = pool.client("openrouter", timeout=self.timeout)
+        try:
             response = await client.post(
                 self.ENDPOINT,
+                timeout=self.timeout,
+                extensions=pool.trace("openrouter"),
                 headers=headers,
                 json={
                     "model": self.model,
@@ -439,27 +457,36 @@ class OpenRouterClient(LLMClient):
                     "max_tokens": max_tokens
                 }
             )
+        except Exception:
+            limiter.release(permit)
+            raise
+        limiter.release(
+            permit,
+            status_code=response.status_code,
+            retry_after=response.headers.get("retry-after"),
+            tokens_used=_usage_tokens(response)
+        )
 
-            if response.status_code != 200:
-                raise LLMError(f"OpenRouter error: {response.status_code} - {response.text}")
+        if response.status_code != 200:
+            raise LLMError(f"OpenRouter error: {response.status_code} - {response.text}")
 
-            result = response.json()
-            response_text = result["choices"][0]["message"]["content"]
+        result = response.json()
+        response_text = result["choices"][0]["message"]["content"]
 
-            # Store in cache if enabled
-            if self._cache is not None:
-                self._cache.put(prompt, response_text)
+        # Store in cache if enabled
+        if self._cache is not None:
+            self._cache.put(prompt, response_text)
 
-            # Track usage for compute introspection (OpenRouter returns usage data)
-            self._track_usage(prompt, response_text, result, "generate")
+        # Track usage for compute introspection (OpenRouter returns usage data)
+        self._track_usage(prompt, response_text, result, "generate")
 
-            return LLMResponse(
-                text=response_text,
-                raw=result,
-                model=self.model,
-                provider="openrouter",
-                quantum_influence=quantum_influence
-            )
+        return LLMResponse(
+            text=response_text,
+            raw=result,
+            model=self.model,
+            provider="openrouter",
+            quantum_influence=quantum_influence
+        )
 
 
 class ZAIClient(LLMClient):
@@ -486,7 +513,10 @@ class ZAIClient(LLMClient):
         use_coding_endpoint: bool = True,
         enable_cache: bool = True,
         cache_ttl: float = 3600,
-        cache_max_entries: int = 1000
+        cache_max_entries: int = 1000,
+        cache_similarity_threshold: float = 0.92,
+        cache_eviction_policy: str = "lru",
+        cache_persist_path: Optional[str] = None
     ):
         self.model = model
         self.api_key = api_key or os.environ.get("ZAI_API_KEY")
@@ -500,7 +530,9 @@ class ZAIClient(LLMClient):
         self._cache = SemanticCache(
             max_entries=cache_max_entries,
             ttl_seconds=cache_ttl,
-            similarity_threshold=0.92
+            similarity_threshold=cache_similarity_threshold,
+            eviction_policy=cache_eviction_policy,
+            persist_path=cache_persist_path
         ) if enable_cache else None
 
     @property
@@ -551,16 +583,15 @@ Example format: {"output": {...your reflection...}}"""
         system_message: Optional[str] = None,
         model_override: Optional[str] = None,
         bypass_cache: bool = False,
+        coalesce: bool = True,
         **kwargs
     ) -> LLMResponse:
         """Generate using Z.AI API with retry on rate limits."""
 
-        quantum_influence = None
-
         # Check semantic cache first (two-tier: exact hash + semantic similarity)
         # Note: SemanticCache.get() is synchronous - do NOT await it
         if self._cache is not None and not bypass_cache:
-            cached_response = self._cache.get(prompt)
+            cached_response = self._cache.get(prompt, component=kwargs.get("component"))
             if cached_response is not None:
                 # Still track usage for metrics
                 self._track_usage(prompt, cached_response, {"cached": True}, "generate_cached")
@@ -572,6 +603,31 @@ Example format: {"output": {...your reflection...}}"""
                     quantum_influence=None
                 )
 
+        # Identical prompts already in flight share that request.
+        # Quantum-modulated calls want their own sample, so never coalesce them.
+        return await self._coalesced(
+            (prompt, system_message, model_override or self.model, temperature, max_tokens),
+            lambda: self._generate_uncached(
+                prompt, temperature, max_tokens, quantum_modulation,
+                quantum_context, system_message, model_override, **kwargs
+            ),
+            coalesce=coalesce and not quantum_modulation
+        )
+
+    async def _generate_uncached(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        quantum_modulation: bool,
+        quantum_context: str,
+        system_message: Optional[str],
+        model_override: Optional[str],
+        **kwargs
+    ) -> LLMResponse:
+        """Send the request upstream (with retries) and store the result in the cache."""
+        quantum_influence = None
+
         # Apply quantum modulation if requested
         if quantum_modulation:
             temperature, quantum_influence = await self._apply_quantum_modulation(
@@ -589,29 +645,25 @@ Example format: {"output": {...your reflection...}}"""
         # Allow model override for specific use cases (e.g., voice uses glm-4-flash)
         model_to_use = model_override or self.model
         max_retries = 15  # BREAK 7-CYCLE DEADLOCK: Increased from 5 to prevent orphan bottleneck
-        base_delay = 20  # seconds
-        max_delay = 90   # cap delay at 90 seconds
 
-        # Check semantic cache before making request (two-tier: exact hash + semantic similarity)
-        if self._cache is not None:
-            cached_response = self._cache.get(prompt)
-            if cached_response is not None:
-                return LLMResponse(
-                    text=cached_response,
-                    raw={"cached": True},
-                    model=self.model,
-                    provider="zai",
-                    quantum_influence=quantum_influence
-                )
+        # Per-model limiter: budgets, concurrency cap and priority admission.
+        # 429s shrink its rate and honour Retry-After before the next attempt.
+        limiter = get_rate_limiter().for_model("zai", model_to_use)
+        priority = get_rate_limiter().priority_for(kwargs.get("component"), kwargs.get("priority"))
+        estimated_tokens = _estimate_tokens(prompt, system_message, max_tokens)
+
+        # Shared keep-alive client: retries reuse the same warm connection
+        pool = get_http_pool()
 
         for attempt in range(max_retries):
-            # Wait for rate limiter slot before making request
-            # This prevents overwhelming Z.AI with concurrent requests
-            await _rate_limiter.wait_for_slot()
+            permit = await limiter.acquire(priority, tokens=estimated_tokens)
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            client = pool.client("zai", timeout=self.timeout)
+            try:
                 response = await client.post(
                     self.endpoint,
+                    timeout=self.timeout,
+                    extensions=pool.trace("zai"),
                     headers=headers,
                     json={
                         "model": model_to_use,
@@ -623,43 +675,51 @@ Example format: {"output": {...your reflection...}}"""
                         "max_tokens": max_tokens
                     }
                 )
+            except Exception:
+                limiter.release(permit)
+                raise
+            limiter.release(
+                permit,
+                status_code=response.status_code,
+                retry_after=response.headers.get("retry-after"),
+                tokens_used=_usage_tokens(response)
+            )
 
-                if response.status_code == 429:
-                    # Rate limited - wait and retry with exponential backoff (capped)
-                    delay = min(base_delay * (2 ** attempt), max_delay)
-                    print(f"⏳ Z.AI rate limited, waiting {delay}s (attempt {attempt + 1}/{max_retries})")
-                    print(f"⏳ Response body: {response.text[:200] if response.text else 'empty'}")
-                    await asyncio.sleep(delay)
-                    continue
+            if response.status_code == 429:
+                # Rate limited - the limiter backs off before admitting the retry
+                print(f"⏳ Z.AI rate limited (attempt {attempt + 1}/{max_retries}), "
+                      f"retry-after={response.headers.get('retry-after', 'n/a')}")
+                print(f"⏳ Response body: {response.text[:200] if response.text else 'empty'}")
+                continue
 
-                if response.status_code != 200:
-                    error_text = response.text[:500] if response.text else "empty"
-                    print(f"❌ Z.AI error {response.status_code}: {error_text}")
-                    raise LLMError(f"Z.AI error: {response.status_code} - {error_text}")
+            if response.status_code != 200:
+                error_text = response.text[:500] if response.text else "empty"
+                print(f"❌ Z.AI error {response.status_code}: {error_text}")
+                raise LLMError(f"Z.AI error: {response.status_code} - {error_text}")
 
-                result = response.json()
-                message = result["choices"][0]["message"]
-                # GLM-4.7 is a reasoning model - content may be in 'content' or combined
-                # with 'reasoning_content' for chain-of-thought models
-                text = message.get("content", "")
-                if not text and "reasoning_content" in message:
-                    # If content is empty but reasoning exists, use reasoning
-                    text = message.get("reasoning_content", "")
+            result = response.json()
+            message = result["choices"][0]["message"]
+            # GLM-4.7 is a reasoning model - content may be in 'content' or combined
+            # with 'reasoning_content' for chain-of-thought models
+            text = message.get("content", "")
+            if not text and "reasoning_content" in message:
+                # If content is empty but reasoning exists, use reasoning
+                text = message.get("reasoning_content", "")
 
-                # Store in cache if enabled
-                if self._cache is not None:
-                    self._cache.put(prompt, text)
+            # Store in cache if enabled
+            if self._cache is not None:
+                self._cache.put(prompt, text)
 
-                # Track usage for compute introspection (Z.AI returns usage data)
-                self._track_usage(prompt, text, result, "generate")
+            # Track usage for compute introspection (Z.AI returns usage data)
+            self._track_usage(prompt, text, result, "generate")
 
-                return LLMResponse(
-                    text=text,
-                    raw=result,
-                    model=self.model,
-                    provider="zai",
-                    quantum_influence=quantum_influence
-                )
+            return LLMResponse(
+                text=text,
+                raw=result,
+                model=self.model,
+                provider="zai",
+                quantum_influence=quantum_influence
+            )
 
         # All retries exhausted
         raise LLMError("Z.AI rate limit: max retries exceeded. Wait before retrying.")
@@ -670,6 +730,21 @@ class LLMError(Exception):
     pass
 
 
+def _estimate_tokens(prompt: str, system_message: Optional[str], max_tokens: int) -> int:
+    """Rough token estimate (~4 characters per token) for rate budgeting."""
+    return (len(prompt) + len(system_message or "")) // 4 + max_tokens
+
+
+def _usage_tokens(response) -> Optional[int]:
+    """Total tokens reported by an OpenAI-style response, if any."""
+    if response.status_code != 200:
+        return None
+    try:
+        return response.json().get("usage", {}).get("total_tokens")
+    except Exception:
+        return None
+
+
 def create_llm_client(config: Dict) -> LLMClient:
     """
     Factory function to create the appropriate LLM client.
@@ -685,17 +760,38 @@ def create_llm_client(config: Dict) -> LLMClient:
             - enable_cache: Enable semantic caching (default: True)
             - cache_ttl: Cache time-to-live in seconds (default: 3600)
             - cache_max_entries: Maximum cache entries (default: 1000)
+            - cache.eviction_policy: "lru" or "lfu" (default: "lru")
+            - cache.persist_path: SQLite file that keeps the cache across
+              restarts (default: None, memory only)
+            - rate_limits: Per-provider/model budgets and component priorities
+              (see core/rate_limiter.py)
+            - http: Connection pool limits (max_connections,
+              max_keepalive_connections, keepalive_expiry, connect_timeout, http2)
 
     Returns:
         Configured LLMClient instance
     """
     provider = config.get("provider", "zai")
 
-    # Get cache config from nested structure or fallback to top-level keys
-    cache_config = config.get("cache", {})
+    # Rate limits and pool limits may sit next to provider settings or under local_llm
+    llm_section = config.get("local_llm") or {}
+    rate_config = config.get("rate_limits") or llm_section.get("rate_limits")
+    if rate_config:
+        configure_rate_limits(rate_config)
+    elif config.get("rate_limit_interval") or llm_section.get("rate_limit_interval"):
+        configure_rate_limiter(config.get("rate_limit_interval") or llm_section.get("rate_limit_interval"))
+
+    configure_http_pool(config.get("http") or llm_section.get("http", {}))
+
+    # Cache config sits under local_llm in config.yaml; accept it at the top
+    # level too (callers that pass the local_llm section itself), then legacy keys
+    cache_config = llm_section.get("cache") or config.get("cache") or {}
     enable_cache = cache_config.get("enabled", config.get("enable_cache", True))
     cache_ttl = cache_config.get("ttl_seconds", config.get("cache_ttl", 3600))
     cache_max_entries = cache_config.get("max_entries", config.get("cache_max_entries", 1000))
+    cache_similarity = cache_config.get("similarity_threshold", 0.92)
+    cache_eviction_policy = cache_config.get("eviction_policy", "lru")
+    cache_persist_path = cache_config.get("persist_path")
 
     if provider == "openrouter":
         return OpenRouterClient(
@@ -706,7 +802,10 @@ def create_llm_client(config: Dict) -> LLMClient:
             app_name=config.get("app_name", "BYRD"),
             enable_cache=enable_cache,
             cache_ttl=cache_ttl,
-            cache_max_entries=cache_max_entries
+            cache_max_entries=cache_max_entries,
+            cache_similarity_threshold=cache_similarity,
+            cache_eviction_policy=cache_eviction_policy,
+            cache_persist_path=cache_persist_path
         )
 
     elif provider == "zai":
@@ -717,7 +816,10 @@ def create_llm_client(config: Dict) -> LLMClient:
             use_coding_endpoint=config.get("use_coding_endpoint", True),
             enable_cache=enable_cache,
             cache_ttl=cache_ttl,
-            cache_max_entries=cache_max_entries
+            cache_max_entries=cache_max_entries,
+            cache_similarity_threshold=cache_similarity,
+            cache_eviction_policy=cache_eviction_policy,
+            cache_persist_path=cache_persist_path
         )
 
     else:
@@ -746,6 +848,15 @@ def get_instance_manager() -> Optional[DualInstanceManager]:
     return _instance_manager
 
 
+# Shared by all RateLimitedLLMClient wrappers
+_wrapper_single_flight = SingleFlight()
+
+
+def get_coalescing_stats() -> Dict[str, Any]:
+    """Deduplication counters for the rate-limited wrappers."""
+    return _wrapper_single_flight.get_stats()
+
+
 class RateLimitedLLMClient:
     """
     LLM client wrapper that routes through DualInstanceManager.
@@ -764,6 +875,21 @@ class RateLimitedLLMClient:
 
     async def generate(self, prompt: str, **kwargs) -> 'LLMResponse':
         """Generate with rate limiting via instance manager."""
+        # Coalesce before queueing so duplicates don't spend instance slots.
+        # Shared across wrappers: identical prompts from different components merge.
+        coalesce = kwargs.pop("coalesce", True) and not kwargs.get("quantum_modulation")
+        key = (
+            prompt,
+            kwargs.get("system_message"),
+            kwargs.get("model_override") or self.model_name,
+            kwargs.get("temperature", 0.7),
+            kwargs.get("max_tokens", 500),
+        )
+        if not coalesce:
+            return await self._generate(prompt, coalesce=False, **kwargs)
+        return await _wrapper_single_flight.run(key, lambda: self._generate(prompt, **kwargs))
+
+    async def _generate(self, prompt: str, **kwargs) -> 'LLMResponse':
         manager = get_instance_manager()
 
         if manager:
@@ -775,6 +901,7 @@ class RateLimitedLLMClient:
             )
         else:
             # Fallback to direct call (for testing or single-instance mode)
+            kwargs.setdefault("component", self._component)
             return await self._client.generate(prompt, **kwargs)
 
     async def query(self, prompt: str, **kwargs) -> str:
@@ -12,17 +12,24 @@ value. We do not constrain what categories BYRD can use.
 MEMORY_VERSION = "2025-12-30-fix-v2"
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 import json
 import logging
 import re
 import time
+from collections import OrderedDict
 from neo4j import GraphDatabase, AsyncGraphDatabase
 import hashlib
 
 from .event_bus import event_bus, Event, EventType
 from .quantum_randomness import get_quantum_float
+from .vector_index import VectorIndex
+from .minhash_index import MinHashLSHIndex, bands_for_recall, text_shingles, jaccard
+from .belief_dedup import BeliefDedupEngine
+from .ingestion_queue import WriteBehindQueue
+from .query_cache import QueryCache, InvalidatingDriver, cached_query, invalidates, invalidates_on_write, ALL_LABELS
+from .graph_export import NODE_FIELDS as EXPORT_NODE_FIELDS, DEFAULT_FIELDS as DEFAULT_EXPORT_FIELDS, encode_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -282,6 +289,46 @@ class Strategy:
     active: bool = True
 
 
+# Node labels shown in the visualization graph, in export (cursor) order
+_GRAPH_LABELS = ("Experience", "Belief", "Desire", "Reflection", "Capability", "Goal",
+                 "OSTemplate", "Seed", "Strategy", "Constraint", "Crystal",
+                 "MemorySummary", "Document", "DocumentChunk", "OperatingSystem")
+# Extra per-label conditions (only the primary OS node is visualized)
+_GRAPH_LABEL_WHERE = {"OperatingSystem": "n.id = 'os_primary'"}
+
+
+def _graph_label_filter(var: str) -> str:
+    """Cypher predicate for the node labels shown in the visualization graph."""
+    clauses = [f"{var}:{label}" if label not in _GRAPH_LABEL_WHERE
+               else f"({var}:{label} AND {_GRAPH_LABEL_WHERE[label].replace('n.', var + '.')})"
+               for label in _GRAPH_LABELS]
+    return "(" + " OR ".join(clauses) + ")"
+
+
+def _reflection_display_content(raw_output: Any) -> str:
+    """Most meaningful display text from a Reflection's raw_output."""
+    try:
+        parsed = json.loads(raw_output) if isinstance(raw_output, str) else raw_output
+        # BYRD's reflections may have various keys - check common ones
+        content = (
+            parsed.get("reflection_title") or
+            parsed.get("title") or
+            parsed.get("narrative") or
+            parsed.get("narrative_stream") or
+            parsed.get("inner_voice") or
+            parsed.get("summary") or
+            # For insights, get first one if it's a list
+            (parsed.get("insights", [{}])[0] if isinstance(parsed.get("insights"), list) and parsed.get("insights") else None) or
+            str(list(parsed.keys()))  # Fallback: show keys
+        )
+        # If content is a dict, stringify it nicely
+        if isinstance(content, dict):
+            content = content.get("content") or content.get("insight") or str(content)
+        return content
+    except:
+        return str(raw_output) if raw_output else ""
+
+
 class Memory:
     """
     The single source of truth.
@@ -308,7 +355,8 @@ class Memory:
         dedup_config = config.get("experience_dedup", {})
         self.dedup_enabled = dedup_config.get("enabled", True)
         self.dedup_window_seconds = dedup_config.get("window_seconds", 60)  # 1 minute
-        self._recent_experiences: Dict[str, float] = {}  # normalized_content -> timestamp
+        # normalized_content -> timestamp, oldest first (expiry pops from the front)
+        self._recent_experiences: "OrderedDict[str, float]" = OrderedDict()
         self._dedup_cache_max_size = dedup_config.get("cache_size", 500)
 
         # Salience-weighted retrieval configuration
@@ -317,6 +365,63 @@ class Memory:
         self.salience_weight = retrieval_config.get("salience_weight", 0.3)
         self.recency_weight = retrieval_config.get("recency_weight", 0.7)
 
+        # In-process vector index for find_similar_nodes (labels load lazily)
+        vector_config = config.get("vector_index", {})
+        self._vector_index = VectorIndex(
+            ivf_threshold=vector_config.get("ivf_threshold", 50000),
+            nprobe=vector_config.get("nprobe", 8)
+        )
+        self._vector_load_batch_size = vector_config.get("load_batch_size", 2000)
+
+        # Set by _ensure_schema once the full-text index exists
+        self._fulltext_available = False
+
+        # MinHash LSH over belief text for link-on-acquisition (loaded lazily)
+        belief_index_config = config.get("belief_index", {})
+        self.belief_index_enabled = belief_index_config.get("enabled", True)
+        num_perm = belief_index_config.get("num_perm", 128)
+        # Banded for recall at design_similarity, not at the 0.05 link
+        # threshold: 1-row bands there would make about half of all beliefs
+        # candidates. Weaker matches are found with lower probability.
+        bands = belief_index_config.get("bands") or bands_for_recall(
+            num_perm,
+            belief_index_config.get("design_similarity", 0.2),
+            belief_index_config.get("target_recall", 0.9),
+            min_rows=belief_index_config.get("min_rows", 2)
+        )
+        self._belief_index = MinHashLSHIndex(num_perm=num_perm, bands=bands)
+        self._belief_index_loaded = False
+
+        # Batch near-duplicate / contradiction detection (no APOC needed)
+        curation_config = config.get("curation", {})
+        self._belief_dedup = BeliefDedupEngine(
+            duplicate_threshold=curation_config.get("duplicate_threshold", 0.85),
+            contradiction_threshold=curation_config.get("contradiction_threshold", 0.7)
+        )
+        self._belief_dedup_task: Optional["asyncio.Task"] = None
+        # Belief label versions the last completed scan read (None = never scanned)
+        self._belief_dedup_snapshot: Optional[Dict[str, int]] = None
+
+        # Versioned cache for hot reads (get_beliefs, stats, get_os_for_prompt...)
+        query_cache_config = config.get("query_cache", {})
+        self._query_cache = QueryCache(
+            max_entries=query_cache_config.get("max_entries", 512),
+            ttl_seconds=query_cache_config.get("ttl_seconds", 30.0),
+            enabled=query_cache_config.get("enabled", True)
+        )
+
+        # Write-behind batching for record_experience (UNWIND writes)
+        ingestion_config = config.get("ingestion", {})
+        self._ingestion: Optional[WriteBehindQueue] = None
+        if ingestion_config.get("enabled", False):
+            self._ingestion = WriteBehindQueue(
+                self._write_experience_batch,
+                max_batch=ingestion_config.get("max_batch", 200),
+                flush_interval=ingestion_config.get("flush_interval_ms", 250) / 1000,
+                max_pending=ingestion_config.get("max_pending", 5000),
+                name="Experience ingestion"
+            )
+
     def _is_demonstration_desire(self, description: str) -> bool:
         """
         HARD FILTER: Check if a desire description is a demonstration/test desire.
@@ -399,10 +504,9 @@ class Memory:
     async def connect(self):
         """Initialize connection to Neo4j (idempotent - safe to call multiple times)."""
         if self.driver is None:
-            self.driver = AsyncGraphDatabase.driver(
-                self.uri,
-                auth=(self.user, self.password)
-            )
+            # Drop anything cached while disconnected (e.g. empty error results)
+            self._query_cache.clear()
+            self.driver = self._open_driver()
             await self._ensure_schema()
         else:
             # Verify the connection is still alive
@@ -411,17 +515,24 @@ class Memory:
                     await session.run("RETURN 1")
             except Exception:
                 # Driver exists but connection is dead - recreate
+                self._query_cache.clear()
                 try:
                     await self.driver.close()
                 except Exception:
                     pass
-                self.driver = AsyncGraphDatabase.driver(
-                    self.uri,
-                    auth=(self.user, self.password)
-                )
+                self.driver = self._open_driver()
                 await self._ensure_schema()
+
+    def _open_driver(self) -> InvalidatingDriver:
+        """Neo4j driver whose sessions invalidate the read cache on writes."""
+        return InvalidatingDriver(
+            AsyncGraphDatabase.driver(self.uri, auth=(self.user, self.password)),
+            self._query_cache
+        )
     
     async def close(self):
+        if self._ingestion is not None and self.driver:
+            await self._ingestion.close()
         if self.driver:
             await self.driver.close()
     
@@ -482,6 +593,11 @@ class Memory:
             await session.run("""
                 CREATE INDEX IF NOT EXISTS FOR (st:Strategy) ON (st.id)
             """)
+            # id indexes for every visualized label: get_graph_page() walks
+            # each label in id order (OperatingSystem has its constraint)
+            for label in _GRAPH_LABELS:
+                if label != "OperatingSystem":
+                    await session.run(f"CREATE INDEX IF NOT EXISTS FOR (n:{label}) ON (n.id)")
 
             # Option B: Goal indexes
             await session.run("""
@@ -530,6 +646,24 @@ class Memory:
                 CREATE INDEX IF NOT EXISTS FOR (lm:LoopMetric) ON (lm.loop_name, lm.cycle_number)
             """)
 
+            # Full-text index for semantic_search (one index across all text labels)
+            # Neo4j maintains it on every create/update, so no manual refresh needed.
+            # Stopwords stay indexed so a "the"/"not" keyword matches like the scan.
+            try:
+                labels = "|".join(self.SEMANTIC_SEARCH_FIELDS.keys())
+                fields = ", ".join(
+                    f"n.{f}" for f in dict.fromkeys(self.SEMANTIC_SEARCH_FIELDS.values())
+                )
+                await session.run(f"""
+                    CREATE FULLTEXT INDEX {self.FULLTEXT_INDEX_NAME} IF NOT EXISTS
+                    FOR (n:{labels}) ON EACH [{fields}]
+                    OPTIONS {{indexConfig: {{`fulltext.analyzer`: 'standard-no-stop-words'}}}}
+                """)
+                self._fulltext_available = True
+            except Exception as e:
+                logger.warning(f"Full-text index unavailable, semantic_search will scan: {e}")
+                self._fulltext_available = False
+
     def _generate_id(self, content: str) -> str:
         """Generate deterministic ID from content."""
         return hashlib.sha256(
@@ -540,20 +674,19 @@ class Memory:
     # EXPERIENCES
     # =========================================================================
 
+    # Variable parts that don't affect meaning, stripped in one pass after
+    # lowercasing: ISO timestamps, UUIDs and hex IDs (16+ chars)
+    _EXPERIENCE_NOISE_RE = re.compile(
+        r'\d{4}-\d{2}-\d{2}[t ]\d{2}:\d{2}:\d{2}[.\d]*z?'
+        r'|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'
+        r'|[0-9a-f]{16,}'
+    )
+
     def _normalize_experience(self, content: str) -> str:
         """Normalize experience content for deduplication comparison."""
         # Lowercase, collapse whitespace, strip
         normalized = " ".join(content.lower().split())
-        # Remove common variable prefixes that don't affect meaning
-        # e.g., timestamps, IDs embedded in content
-        import re
-        # Remove ISO timestamps
-        normalized = re.sub(r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}[.\d]*Z?', '', normalized)
-        # Remove UUIDs
-        normalized = re.sub(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', '', normalized)
-        # Remove hex IDs (16+ chars)
-        normalized = re.sub(r'[0-9a-f]{16,}', '', normalized)
-        return normalized.strip()
+        return self._EXPERIENCE_NOISE_RE.sub('', normalized).strip()
 
     def _is_duplicate_experience(self, content: str, type: str) -> bool:
         """Check if this experience was recently recorded (deduplication)."""
@@ -569,28 +702,28 @@ class Memory:
             return False
 
         current_time = time.time()
+        recent = self._recent_experiences
 
-        # Clean expired entries from cache
-        expired = [k for k, v in self._recent_experiences.items()
-                   if current_time - v > self.dedup_window_seconds]
-        for k in expired:
-            del self._recent_experiences[k]
+        # Clean expired entries from the front (entries are in insertion order)
+        while recent:
+            oldest_key, oldest_time = next(iter(recent.items()))
+            if current_time - oldest_time <= self.dedup_window_seconds:
+                break
+            recent.popitem(last=False)
 
         # Check if content was recently recorded
-        if normalized in self._recent_experiences:
-            last_time = self._recent_experiences[normalized]
+        if normalized in recent:
+            last_time = recent[normalized]
             if current_time - last_time < self.dedup_window_seconds:
                 return True  # Duplicate within window
 
         # Not a duplicate - add to cache
-        self._recent_experiences[normalized] = current_time
+        recent[normalized] = current_time
+        recent.move_to_end(normalized)
 
         # Trim cache if too large (keep most recent)
-        if len(self._recent_experiences) > self._dedup_cache_max_size:
-            # Remove oldest entries
-            sorted_items = sorted(self._recent_experiences.items(), key=lambda x: x[1])
-            for k, _ in sorted_items[:len(sorted_items) - self._dedup_cache_max_size]:
-                del self._recent_experiences[k]
+        while len(recent) > self._dedup_cache_max_size:
+            recent.popitem(last=False)
 
         return False
 
@@ -609,6 +742,7 @@ class Memory:
     # GENERIC QUERY EXECUTION
     # =========================================================================
 
+    @invalidates_on_write
     async def run_query(self, query: str, **params) -> List[Dict]:
         """
         Execute a raw Cypher query and return results.
@@ -712,23 +846,33 @@ class Memory:
             print(f"Error getting consolidation health: {e}")
             return {"error": str(e)}
 
+    @invalidates("Experience")
     async def record_experience(
         self,
         content: str,
         type: str,
         embedding: Optional[List[float]] = None,
         force: bool = False,
-        link_on_acquisition: bool = True
+        link_on_acquisition: bool = True,
+        wait: bool = True
     ) -> Optional[str]:
         """
         Record a new experience.
 
+        With ingestion batching enabled, the write goes through a
+        write-behind queue and is committed together with concurrent
+        experiences in one UNWIND transaction.
+
         Args:
             content: The experience content
             type: Experience type (open string)
             embedding: Optional embedding vector
             force: If True, bypass noise filtering
             link_on_acquisition: If True, immediately link to similar beliefs (reduces orphans)
+            wait: If True (default), return only once the node is written, so
+                  the ID can be used straight away. If False and batching is
+                  enabled, return the ID immediately and write in the background;
+                  Memory reads of experiences flush the queue first.
 
         Returns:
             Experience ID, or None if filtered as noise or duplicate
@@ -744,6 +888,17 @@ class Memory:
 
         exp_id = self._generate_id(content)
 
+        if self._ingestion is not None:
+            await self._ingestion.submit({
+                "id": exp_id,
+                "content": content,
+                "type": type,
+                "embedding": embedding,
+                "timestamp": datetime.now().isoformat(),
+                "link": link_on_acquisition
+            }, wait=wait)
+            return exp_id
+
         async with self.driver.session() as session:
             await session.run("""
                 CREATE (e:Experience {
@@ -755,6 +910,9 @@ class Memory:
                 })
             """, id=exp_id, content=content, type=type, embedding=embedding)
 
+        if embedding is not None:
+            self._index_node_embedding(exp_id, "Experience", embedding, content)
+
         # Emit event for real-time UI
         await event_bus.emit(Event(
             type=EventType.EXPERIENCE_CREATED,
@@ -771,6 +929,126 @@ class Memory:
 
         return exp_id
 
+    @invalidates("Experience")
+    async def _write_experience_batch(self, rows: List[Dict]) -> List[str]:
+        """
+        Write a batch of queued experiences and their auto-links.
+
+        One UNWIND CREATE for the experiences, then one UNWIND MERGE for
+        link-on-acquisition edges found through the belief index.
+        """
+        min_length = self.CONNECTION_HEURISTIC_CONFIG["min_content_length"]
+        threshold = self.CONNECTION_HEURISTIC_CONFIG["similarity_threshold"]
+        relationship = self.CONNECTION_HEURISTIC_CONFIG["relationship_type"]
+
+        link_rows = [r for r in rows if r["link"] and len(r["content"]) >= min_length]
+        links = []
+        if link_rows and self.belief_index_enabled:
+            try:
+                await self._ensure_belief_index()
+                formed_at = datetime.now().isoformat()
+                for row in link_rows:
+                    for belief_id, score, _ in self._belief_index.query(
+                        row["content"], threshold=threshold, limit=2
+                    ):
+                        links.append({
+                            "from_id": row["id"],
+                            "to_id": belief_id,
+                            "props": {
+                                "similarity_score": round(score, 3),
+                                "auto_generated": True,
+                                "heuristic": "link_on_acquisition",
+                                "formed_at": formed_at
+                            }
+                        })
+            except Exception as e:
+                print(f"Link-on-acquisition warning: {e}")
+                links = []
+
+        created_links = []
+        async with self.driver.session() as session:
+            await session.run("""
+                UNWIND $rows AS row
+                CREATE (e:Experience {
+                    id: row.id,
+                    content: row.content,
+                    type: row.type,
+                    timestamp: datetime(row.timestamp),
+                    embedding: row.embedding
+                })
+            """, rows=[
+                {k: r[k] for k in ("id", "content", "type", "timestamp", "embedding")}
+                for r in rows
+            ])
+
+            if links:
+                try:
+                    result = await session.run(f"""
+                        UNWIND $links AS link
+                        MATCH (e:Experience {{id: link.from_id}}), (b:Belief {{id: link.to_id}})
+                        WHERE NOT coalesce(b.archived, false)
+                        MERGE (e)-[r:{relationship}]->(b)
+                        ON CREATE SET r += link.props
+                        ON MATCH SET r.updated_at = datetime()
+                        RETURN link.from_id as from_id, link.to_id as to_id, link.props as props
+                    """, links=links)
+                    created_links = await result.data()
+                except Exception as e:
+                    # Don't fail the experience writes if linking fails
+                    print(f"Link-on-acquisition warning: {e}")
+
+        for row in rows:
+            if row["embedding"] is not None:
+                self._index_node_embedding(row["id"], "Experience", row["embedding"], row["content"])
+            await event_bus.emit(Event(
+                type=EventType.EXPERIENCE_CREATED,
+                data={
+                    "id": row["id"],
+                    "content": row["content"],
+                    "type": row["type"]
+                }
+            ))
+
+        if link_rows and not self.belief_index_enabled:
+            # No in-process index to batch against: link one at a time
+            for row in link_rows:
+                await self._link_experience_on_acquisition(row["id"], row["content"])
+
+        for link in created_links:
+            # Same event filter as create_connection for auto-generated edges
+            if link["props"].get("similarity_score", 0) >= 0.5:
+                await event_bus.emit(Event(
+                    type=EventType.CONNECTION_CREATED,
+                    data={
+                        "from_id": link["from_id"],
+                        "to_id": link["to_id"],
+                        "relationship": relationship,
+                        "properties": link["props"]
+                    }
+                ))
+
+        return [row["id"] for row in rows]
+
+    async def flush_experiences(self) -> None:
+        """Write any queued experiences now (no-op when batching is off)."""
+        if self._ingestion is not None and len(self._ingestion):
+            await self._ingestion.flush()
+
+    def get_query_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss and invalidation counters for the hot-read cache."""
+        return self._query_cache.get_stats()
+
+    def graph_version(self) -> int:
+        """Monotonic counter that moves whenever this process writes to the graph."""
+        return self._query_cache.version
+
+    def get_ingestion_stats(self) -> Dict[str, Any]:
+        """Write-behind queue statistics (enabled=False when batching is off)."""
+        if self._ingestion is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._ingestion.get_stats()}
+
+    @invalidates("Experience")
     async def record_action_outcome(
         self,
         action: str,
@@ -840,6 +1118,7 @@ class Memory:
 
         return exp_id
 
+    @invalidates("Experience")
     async def record_external_experience(
         self,
         content: str,
@@ -945,6 +1224,7 @@ class Memory:
         - "salient": By connection count (most connected first)
         - "hybrid": Mix of recent and salient based on weights
         """
+        await self.flush_experiences()
         if self.retrieval_strategy == "hybrid":
             return await self._get_hybrid_experiences(limit, type)
         elif self.retrieval_strategy == "salient":
@@ -1077,6 +1357,7 @@ class Memory:
     # REFLECTIONS (Emergence-Compliant Storage)
     # =========================================================================
 
+    @invalidates("Reflection")
     async def record_reflection(
         self,
         raw_output: Dict[str, Any],
@@ -1144,6 +1425,7 @@ class Memory:
 
         return ref_id
 
+    @cached_query("Reflection")
     async def get_recent_reflections(self, limit: int = 10) -> List[Dict]:
         """
         Get recent reflections.
@@ -1205,6 +1487,7 @@ class Memory:
     # BELIEFS
     # =========================================================================
     
+    @invalidates("Belief")
     async def create_belief(
         self,
         content: str,
@@ -1234,6 +1517,8 @@ class Memory:
                     CREATE (b)-[:DERIVED_FROM]->(e)
                 """, belief_id=belief_id, exp_ids=derived_from)
 
+        self._index_belief(belief_id, content)
+
         # Emit event for real-time UI
         await event_bus.emit(Event(
             type=EventType.BELIEF_CREATED,
@@ -1301,6 +1586,7 @@ class Memory:
                 ))
             }
 
+    @cached_query("Belief")
     async def get_beliefs(
         self, 
         min_confidence: float = 0.0,
@@ -1320,6 +1606,7 @@ class Memory:
             records = await result.data()
             return [r["b"] for r in records]
     
+    @invalidates("Belief")
     async def update_belief_confidence(self, belief_id: str, new_confidence: float):
         """Update confidence in a belief."""
         async with self.driver.session() as session:
@@ -1328,6 +1615,7 @@ class Memory:
                 SET b.confidence = $confidence
             """, id=belief_id, confidence=new_confidence)
 
+    @invalidates("Belief")
     async def reinforce_belief(self, content_hint: str, boost: float = 0.02):
         """
         Reinforce a belief when it's re-asserted.
@@ -1996,6 +2284,7 @@ class Memory:
     # DESIRES
     # =========================================================================
     
+    @invalidates("Desire")
     async def create_desire(
         self,
         description: str,
@@ -2081,6 +2370,7 @@ class Memory:
 
         return desire_id
 
+    @invalidates(ALL_LABELS)
     async def create_custom_node(
         self,
         node_type: str,
@@ -2134,6 +2424,7 @@ class Memory:
         logger.debug("Created custom %s node: %s", node_type, node_id[:16])
         return node_id
 
+    @cached_query("Desire")
     async def get_unfulfilled_desires(
         self,
         type: Optional[str] = None,
@@ -2153,6 +2444,7 @@ class Memory:
             records = await result.data()
             return [r["d"] for r in records]
 
+    @invalidates("Desire")
     async def fulfill_desire(
         self,
         desire_id: str,
@@ -2247,6 +2539,7 @@ class Memory:
     # DESIRE LIFECYCLE (Reflective Failure Processing)
     # =========================================================================
 
+    @invalidates("Desire")
     async def block_desire_with_constraint(
         self,
         desire_id: str,
@@ -2303,6 +2596,7 @@ class Memory:
             print(f"Error blocking desire with constraint: {e}")
             return False
 
+    @invalidates("Desire")
     async def unblock_desire(
         self,
         desire_id: str,
@@ -2489,6 +2783,7 @@ class Memory:
             print(f"Error checking if desire is blocked: {e}")
             return False
 
+    @invalidates("Desire")
     async def record_desire_attempt(
         self,
         desire_id: str,
@@ -2531,6 +2826,7 @@ class Memory:
                 ))
                 return True
 
+    @invalidates("Desire")
     async def update_desire_status(self, desire_id: str, status: str):
         """
         Update desire status.
@@ -2547,6 +2843,7 @@ class Memory:
                 SET d.status = $status
             """, id=desire_id, status=status)
 
+    @invalidates("Desire")
     async def update_desire_intensity(self, desire_id: str, new_intensity: float):
         """
         Allow Dreamer to modify desire intensity.
@@ -2569,6 +2866,7 @@ class Memory:
             }
         ))
 
+    @invalidates("Desire")
     async def update_desire_intent(self, desire_id: str, intent: str, target: Optional[str] = None):
         """
         Update desire intent and target for routing.
@@ -2730,6 +3028,7 @@ class Memory:
             records = await result.data()
             return [r["d"] for r in records]
 
+    @invalidates("Desire")
     async def reset_desire_attempts(self, desire_id: str):
         """
         Reset attempt counter for a desire.
@@ -2866,6 +3165,7 @@ class Memory:
             }
         ))
 
+    @invalidates("Belief")
     async def adjust_belief_confidence(self, belief_id: str, delta: float) -> float:
         """
         Adjust belief confidence based on prediction outcomes.
@@ -3130,6 +3430,7 @@ class Memory:
     # CAPABILITIES
     # =========================================================================
     
+    @invalidates("Capability")
     async def add_capability(
         self,
         name: str,
@@ -3172,6 +3473,7 @@ class Memory:
 
         return cap_id
     
+    @cached_query("Capability")
     async def get_capabilities(self, active_only: bool = True) -> List[Dict]:
         """Get all capabilities."""
         query = """
@@ -3204,6 +3506,7 @@ class Memory:
     # CONNECTIONS
     # =========================================================================
     
+    @invalidates(ALL_LABELS)
     async def create_connection(
         self,
         from_id: str,
@@ -3220,6 +3523,9 @@ class Memory:
         props = properties or {}
         props["formed_at"] = datetime.now().isoformat()
 
+        # Either end may be an experience still in the write-behind queue
+        await self.flush_experiences()
+
         # Use MERGE to create relationship and RETURN to verify it happened
         query = f"""
             MATCH (a), (b)
@@ -3265,6 +3571,7 @@ class Memory:
     # CAUSAL RELATIONSHIPS
     # =========================================================================
 
+    @invalidates(ALL_LABELS)
     async def create_causal_link(
         self,
         source_id: str,
@@ -3415,6 +3722,7 @@ class Memory:
 
         return records
 
+    @invalidates("Belief")
     async def mark_contradiction(
         self,
         belief1_id: str,
@@ -3648,21 +3956,65 @@ class Memory:
 
         return exp_id
 
+    # Text property searched per label by semantic_search
+    SEMANTIC_SEARCH_FIELDS = {
+        "Experience": "content",
+        "Belief": "content",
+        "Desire": "description",
+        "Reflection": "raw_output",
+        "Crystal": "synthesis",
+    }
+
+    FULLTEXT_INDEX_NAME = "memory_text"
+
+    # Characters with meaning in Lucene query syntax
+    _LUCENE_SPECIAL = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+
+    def _build_fulltext_query(self, keywords: List[str]) -> str:
+        """
+        Build a Lucene OR-query from keywords.
+
+        Single words become prefix terms (kw*) so "learn" still finds
+        "learning"; multi-word keywords become quoted phrases. Unlike the
+        CONTAINS scan this matches at word starts only ("learn" does not
+        find "unlearned"). Keywords with no letters or digits can't match
+        an analyzed token and are dropped; returns "" if nothing is left.
+        """
+        terms = []
+        for kw in keywords:
+            kw = kw.strip()
+            if not any(c.isalnum() for c in kw):
+                continue
+            escaped = self._LUCENE_SPECIAL.sub(r'\\\1', kw)
+            if " " in kw:
+                terms.append(f'"{escaped}"')
+            else:
+                terms.append(f"{escaped}*")
+        return " OR ".join(terms)
+
     async def semantic_search(
         self,
         keywords: List[str],
         node_types: Optional[List[str]] = None,
         limit: int = 50,
-        min_score: float = 0.0
+        min_score: float = 0.0,
+        offset: int = 0
     ) -> List[Dict[str, Any]]:
         """
         Search memories by semantic relevance using keyword matching.
 
+        Uses the memory_text full-text index to query every label in one
+        round trip; labels outside the index (or a server without
+        full-text support) fall back to a per-label CONTAINS scan. The
+        index matches keywords at word starts, the scan anywhere in the
+        text (see _build_fulltext_query).
+
         Args:
             keywords: List of keywords/concepts to search for
             node_types: Node types to search (default: Experience, Belief, Desire, Reflection, Crystal)
             limit: Maximum results to return
             min_score: Minimum relevance score (0-1) to include
+            offset: Number of ranked results to skip (for pagination)
 
         Returns:
             List of nodes with relevance scores, sorted by score descending
@@ -3672,25 +4024,113 @@ class Memory:
 
         # Default node types to search
         if node_types is None:
-            node_types = ["Experience", "Belief", "Desire", "Reflection", "Crystal"]
+            node_types = list(self.SEMANTIC_SEARCH_FIELDS.keys())
 
         # Normalize keywords for case-insensitive matching
         keywords = [k.lower().strip() for k in keywords if k.strip()]
         if not keywords:
             return []
 
+        indexed_types = [t for t in node_types if t in self.SEMANTIC_SEARCH_FIELDS]
+        scan_types = [t for t in node_types if t not in self.SEMANTIC_SEARCH_FIELDS]
+
+        search = self._build_fulltext_query(keywords)
+        if indexed_types and self._fulltext_available and search:
+            try:
+                results = await self._semantic_search_fulltext(
+                    keywords, search, indexed_types, offset + limit, min_score
+                )
+            except Exception as e:
+                logger.warning(f"Full-text semantic_search failed, scanning: {e}")
+                results = await self._semantic_search_scan(
+                    keywords, indexed_types, offset + limit
+                )
+        else:
+            results = []
+            scan_types = node_types
+
+        if scan_types:
+            results.extend(await self._semantic_search_scan(
+                keywords, scan_types, offset + limit
+            ))
+
+        # Sort all results by relevance score
+        results.sort(key=lambda x: x["_relevance_score"], reverse=True)
+
+        # Filter by minimum score and paginate
+        results = [r for r in results if r["_relevance_score"] >= min_score]
+
+        return results[offset:offset + limit]
+
+    async def _semantic_search_fulltext(
+        self,
+        keywords: List[str],
+        search: str,
+        node_types: List[str],
+        limit: int,
+        min_score: float
+    ) -> List[Dict[str, Any]]:
+        """
+        Ranked keyword search across all indexed labels in one query.
+
+        The index narrows candidates; _relevance_score keeps the scan
+        contract (fraction of keywords contained in the text) and Lucene's
+        score breaks ties.
+        """
+        text_case = " ".join(
+            f"WHEN '{label}' THEN node.{field}"
+            for label, field in self.SEMANTIC_SEARCH_FIELDS.items()
+        )
+        query = f"""
+            CALL db.index.fulltext.queryNodes($index_name, $search) YIELD node, score
+            WITH node, score, [l IN labels(node) WHERE l IN $node_types][0] as node_type
+            WHERE node_type IS NOT NULL
+            WITH node, score, node_type,
+                 toLower(toString(CASE node_type {text_case} END)) as text
+            WITH node, score, node_type,
+                 reduce(s = 0.0, kw IN $keywords |
+                     CASE WHEN text CONTAINS kw THEN s + 1.0 ELSE s END
+                 ) as match_score
+            WHERE match_score > 0 AND match_score / $keyword_count >= $min_score
+            RETURN node as n, match_score, node_type
+            ORDER BY match_score DESC, score DESC
+            LIMIT $limit
+        """
+
+        async with self.driver.session() as session:
+            result = await session.run(
+                query,
+                index_name=self.FULLTEXT_INDEX_NAME,
+                search=search,
+                node_types=node_types,
+                keywords=keywords,
+                keyword_count=float(len(keywords)),
+                min_score=min_score,
+                limit=limit
+            )
+            records = await result.data()
+
+        results = []
+        for r in records:
+            node = dict(r["n"])
+            node["_node_type"] = r["node_type"]
+            node["_relevance_score"] = r["match_score"] / len(keywords)  # Normalize to 0-1
+            results.append(node)
+        return results
+
+    async def _semantic_search_scan(
+        self,
+        keywords: List[str],
+        node_types: List[str],
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """Per-label CONTAINS scan (fallback when the full-text index can't serve)."""
         results = []
 
         async with self.driver.session() as session:
             for node_type in node_types:
                 # Determine which field to search based on node type
-                content_field = "content"
-                if node_type == "Desire":
-                    content_field = "description"
-                elif node_type == "Crystal":
-                    content_field = "synthesis"
-                elif node_type == "Reflection":
-                    content_field = "raw_output"
+                content_field = self.SEMANTIC_SEARCH_FIELDS.get(node_type, "content")
 
                 # Build dynamic query for keyword matching
                 # Score based on how many keywords match
@@ -3703,7 +4143,7 @@ class Memory:
                              CASE WHEN text CONTAINS kw THEN score + 1.0 ELSE score END
                          ) as match_score
                     WHERE match_score > 0
-                    RETURN n, match_score, labels(n)[0] as node_type
+                    RETURN n, match_score
                     ORDER BY match_score DESC
                     LIMIT $limit
                 """
@@ -3713,16 +4153,10 @@ class Memory:
 
                 for r in records:
                     node = dict(r["n"])
-                    node["_node_type"] = r["node_type"]
+                    node["_node_type"] = node_type
                     node["_relevance_score"] = r["match_score"] / len(keywords)  # Normalize to 0-1
                     results.append(node)
 
-        # Sort all results by relevance score
-        results.sort(key=lambda x: x["_relevance_score"], reverse=True)
-
-        # Filter by minimum score and limit
-        results = [r for r in results if r["_relevance_score"] >= min_score][:limit]
-
         return results
 
     async def extract_concepts(self, text: str, max_concepts: int = 10) -> List[str]:
@@ -3822,6 +4256,7 @@ class Memory:
     # STATS
     # =========================================================================
     
+    @cached_query(ALL_LABELS)
     async def stats(self) -> Dict[str, int]:
         """Get counts of all node types."""
         query = """
@@ -3966,6 +4401,7 @@ class Memory:
             records = await result.data()
             return [r["e"] for r in records]
 
+    @invalidates("Desire")
     async def link_desire_to_experiences(
         self,
         desire_id: str,
@@ -3984,6 +4420,7 @@ class Memory:
     # DATABASE MANAGEMENT
     # =========================================================================
 
+    @invalidates(ALL_LABELS)
     async def clear_all(self):
         """
         Clear all nodes and relationships from the database.
@@ -4042,6 +4479,11 @@ class Memory:
             # Re-create indexes for system types (fresh start)
             await self._ensure_schema()
 
+        self._vector_index.clear()
+        self._belief_index.clear()
+        self._belief_index_loaded = False
+        self._belief_dedup.reset()
+
         if custom_types:
             print(f"Memory cleared: all nodes deleted including custom types: {custom_types}")
         else:
@@ -4177,25 +4619,27 @@ class Memory:
             return {}
 
     async def find_duplicate_beliefs(self, threshold: float = 0.85) -> List[Dict]:
-        """Find beliefs with similar content (potential duplicates)."""
+        """
+        Find beliefs with similar content (potential duplicates).
+
+        Backed by the BeliefDedupEngine (LSH candidates + Sorensen-Dice),
+        so it covers the whole belief set without APOC. Served from the
+        last scan's cached pairs; see _await_belief_dedup.
+        """
         try:
-            async with self.driver.session() as session:
-                result = await session.run("""
-                    MATCH (b1:Belief), (b2:Belief)
-                    WHERE b1.id < b2.id
-                    AND apoc.text.sorensenDiceSimilarity(
-                        toLower(b1.content), toLower(b2.content)
-                    ) > $threshold
-                    RETURN b1.id as id1, b2.id as id2,
-                           b1.content as content1, b2.content as content2,
-                           apoc.text.sorensenDiceSimilarity(
-                               toLower(b1.content), toLower(b2.content)
-                           ) as similarity
-                    LIMIT 20
-                """, threshold=threshold)
-                return await result.data()
-        except Exception:
-            # APOC not available, use simpler check
+            await self._await_belief_dedup(score_floor=threshold)
+            return [
+                {
+                    "id1": p.id1,
+                    "id2": p.id2,
+                    "content1": p.content1,
+                    "content2": p.content2,
+                    "similarity": p.similarity,
+                }
+                for p in self._belief_dedup.duplicates(threshold)[:20]
+            ]
+        except Exception as e:
+            print(f"Error finding duplicate beliefs: {e}")
             return []
 
     async def find_orphan_nodes(self, node_type: Optional[str] = None) -> List[Dict]:
@@ -4240,31 +4684,122 @@ class Memory:
             return []
 
     async def find_conflicting_beliefs(self) -> List[Dict]:
-        """Find beliefs that may contradict each other."""
-        # Simple heuristic: beliefs with opposite keywords
+        """
+        Find beliefs that may contradict each other.
+
+        Heuristic: opposite negation polarity with near-identical content
+        once negations are stripped ("X can Y" vs "X cannot Y").
+        """
         try:
-            async with self.driver.session() as session:
-                result = await session.run("""
-                    MATCH (b1:Belief), (b2:Belief)
-                    WHERE b1.id < b2.id
-                    AND (
-                        (b1.content CONTAINS 'not' AND NOT b2.content CONTAINS 'not'
-                         AND apoc.text.sorensenDiceSimilarity(
-                             replace(toLower(b1.content), 'not ', ''),
-                             toLower(b2.content)
-                         ) > 0.7)
-                        OR
-                        (b1.content CONTAINS 'cannot' AND b2.content CONTAINS 'can'
-                         AND NOT b2.content CONTAINS 'cannot')
-                    )
-                    RETURN b1.id as id1, b2.id as id2,
-                           b1.content as belief1, b2.content as belief2
-                    LIMIT 10
-                """)
-                return await result.data()
-        except Exception:
+            await self._await_belief_dedup()
+            return [
+                {
+                    "id1": p.id1,
+                    "id2": p.id2,
+                    "belief1": p.content1,
+                    "belief2": p.content2,
+                    "similarity": p.stripped_similarity,
+                }
+                for p in self._belief_dedup.contradictions()[:10]
+            ]
+        except Exception as e:
+            print(f"Error finding conflicting beliefs: {e}")
             return []
 
+    async def run_belief_dedup(self) -> Dict[str, Any]:
+        """
+        Scan all non-archived beliefs for duplicates and contradictions.
+
+        Incremental: only beliefs whose content changed since the last
+        run are re-scored. Progress is emitted as BELIEF_DEDUP_PROGRESS
+        events. Results are available via get_belief_merge_plans() and
+        get_belief_contradiction_marks().
+        """
+        snapshot = self._query_cache.begin(("Belief",))
+        beliefs = []
+        last_id = ""
+        batch_size = 2000
+        async with self.driver.session() as session:
+            while True:
+                result = await session.run("""
+                    MATCH (b:Belief)
+                    WHERE NOT coalesce(b.archived, false) AND b.id > $last_id
+                    RETURN b.id as id, b.content as content, b.confidence as confidence
+                    ORDER BY b.id
+                    LIMIT $batch
+                """, last_id=last_id, batch=batch_size)
+                records = await result.data()
+                beliefs.extend(records)
+                if len(records) < batch_size:
+                    break
+                last_id = records[-1]["id"]
+
+        async def report(status: Dict[str, Any]) -> None:
+            await event_bus.emit(Event(
+                type=EventType.BELIEF_DEDUP_PROGRESS,
+                data={"processed": status["processed"], "total": status["total"]}
+            ))
+
+        summary = await self._belief_dedup.scan(beliefs, progress_callback=report)
+        self._belief_dedup_snapshot = snapshot
+
+        await event_bus.emit(Event(
+            type=EventType.BELIEF_DEDUP_COMPLETE,
+            data=summary
+        ))
+        return summary
+
+    def start_belief_dedup_job(self) -> bool:
+        """
+        Run run_belief_dedup in the background.
+
+        Returns False if a job is already running.
+        """
+        import asyncio
+        if self._belief_dedup_task is not None and not self._belief_dedup_task.done():
+            return False
+        self._belief_dedup_task = asyncio.create_task(self.run_belief_dedup())
+        return True
+
+    async def _await_belief_dedup(self, score_floor: Optional[float] = None) -> None:
+        """
+        Make the engine's cached pairs current, sharing the background job.
+
+        Waits for an in-flight job instead of scanning alongside it. A new
+        job is started (through start_belief_dedup_job) only if beliefs
+        were written since the last scan or score_floor is below what the
+        engine caches; the engine is reset only while no job runs.
+        """
+        import asyncio
+        while self._belief_dedup_task is not None and not self._belief_dedup_task.done():
+            # Shielded: a cancelled caller must not cancel the shared job
+            await asyncio.shield(self._belief_dedup_task)
+
+        lower_floor = score_floor is not None and score_floor < self._belief_dedup.score_floor
+        if lower_floor:
+            self._belief_dedup.reset(score_floor=score_floor)
+        stale = self._belief_dedup_snapshot != self._query_cache.begin(("Belief",))
+        if lower_floor or stale:
+            self._belief_dedup_snapshot = None
+            self.start_belief_dedup_job()
+            await asyncio.shield(self._belief_dedup_task)
+
+    def get_belief_dedup_status(self) -> Dict[str, Any]:
+        """Progress of the current/last dedup job plus cache statistics."""
+        status = self._belief_dedup.get_status()
+        status["job_running"] = (
+            self._belief_dedup_task is not None and not self._belief_dedup_task.done()
+        )
+        return status
+
+    def get_belief_merge_plans(self, threshold: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Duplicate clusters from the last scan, as merge_beliefs(**plan) kwargs."""
+        return self._belief_dedup.merge_plans(threshold)
+
+    def get_belief_contradiction_marks(self, threshold: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Contradictions from the last scan, as mark_contradiction(**mark) kwargs."""
+        return self._belief_dedup.contradiction_marks(threshold)
+
     async def get_node_importance(self, node_id: str) -> float:
         """Calculate importance score based on connections."""
         try:
@@ -4312,6 +4847,7 @@ class Memory:
         from datetime import datetime
         self._last_curation_reset = datetime.now()
 
+    @invalidates(ALL_LABELS)
     async def archive_node(
         self, node_id: str, node_type: str, reason: str, desire_id: Optional[str] = None
     ) -> bool:
@@ -4329,6 +4865,7 @@ class Memory:
                     SET n.archived = true, n.archived_at = datetime(),
                         n.archive_reason = $reason
                 """, id=node_id, reason=reason)
+                self._unindex_belief(node_id)
 
                 # Log mutation
                 await self._log_mutation(session, "archive", [node_id], reason, desire_id)
@@ -4338,6 +4875,7 @@ class Memory:
             print(f"Archive error: {e}")
             return False
 
+    @invalidates(ALL_LABELS)
     async def delete_node(
         self, node_id: str, node_type: str, reason: str, desire_id: Optional[str] = None
     ) -> bool:
@@ -4379,12 +4917,15 @@ class Memory:
 
                 # Delete
                 await session.run("MATCH (n {id: $id}) DETACH DELETE n", id=node_id)
+                self._vector_index.remove(node_id)
+                self._unindex_belief(node_id)
                 self._deletions_today += 1
                 return True
         except Exception as e:
             print(f"Delete error: {e}")
             return False
 
+    @invalidates("Belief")
     async def merge_beliefs(
         self, source_ids: List[str], target_id: str, reason: str,
         desire_id: Optional[str] = None
@@ -4426,6 +4967,8 @@ class Memory:
                             "MATCH (b:Belief {id: $id}) DETACH DELETE b",
                             id=source_id
                         )
+                        self._vector_index.remove(source_id)
+                        self._unindex_belief(source_id)
 
                 self._merges_today += 1
                 return True
@@ -4497,35 +5040,7 @@ class Memory:
         if not text1 or not text2:
             return 0.0
 
-        # Normalize texts
-        text1 = text1.lower().strip()
-        text2 = text2.lower().strip()
-
-        # Tokenize into words (simple whitespace split, filter short words)
-        words1 = [w for w in re.split(r'\W+', text1) if len(w) > 2]
-        words2 = [w for w in re.split(r'\W+', text2) if len(w) > 2]
-
-        if not words1 or not words2:
-            return 0.0
-
-        # Create n-grams (unigrams + bigrams for better context)
-        def get_ngrams(words: List[str]) -> set:
-            ngrams = set(words)  # Unigrams
-            for i in range(len(words) - 1):
-                ngrams.add(f"{words[i]}_{words[i+1]}")  # Bigrams
-            return ngrams
-
-        set1 = get_ngrams(words1)
-        set2 = get_ngrams(words2)
-
-        # Jaccard similarity
-        intersection = len(set1 & set2)
-        union = len(set1 | set2)
-
-        if union == 0:
-            return 0.0
-
-        return intersection / union
+        return jaccard(text_shingles(text1), text_shingles(text2))
 
     async def get_orphaned_experiences(
         self,
@@ -4618,28 +5133,77 @@ class Memory:
             # Don't fail the experience creation if linking fails
             print(f"Link-on-acquisition warning: {e}")
 
+    async def _ensure_belief_index(self) -> None:
+        """Load all non-archived beliefs into the MinHash index (once)."""
+        if self._belief_index_loaded:
+            return
+
+        last_id = ""
+        batch_size = 2000
+        async with self.driver.session() as session:
+            while True:
+                result = await session.run("""
+                    MATCH (b:Belief)
+                    WHERE NOT coalesce(b.archived, false) AND b.id > $last_id
+                    RETURN b.id as id, b.content as content
+                    ORDER BY b.id
+                    LIMIT $batch
+                """, last_id=last_id, batch=batch_size)
+                records = await result.data()
+
+                for r in records:
+                    self._belief_index.add(r["id"], r.get("content") or "")
+
+                if len(records) < batch_size:
+                    break
+                last_id = records[-1]["id"]
+
+        self._belief_index_loaded = True
+        logger.info(f"Belief similarity index loaded {len(self._belief_index)} beliefs")
+
+    def _index_belief(self, belief_id: str, content: Optional[str]) -> None:
+        """Add or refresh a belief in the similarity index (if loaded)."""
+        if self._belief_index_loaded:
+            self._belief_index.add(belief_id, content or "")
+
+    def _unindex_belief(self, belief_id: str) -> None:
+        """Drop a merged, archived or deleted belief from the similarity index."""
+        self._belief_index.remove(belief_id)
+
     async def find_similar_beliefs_for_experience(
         self,
         experience_content: str,
         threshold: float = None,
-        limit: int = 5
+        limit: int = 5,
+        exact: bool = False
     ) -> List[Dict]:
         """
         Find beliefs that are semantically similar to an experience.
 
         Uses text similarity to identify beliefs that share concepts
-        with the given experience content.
+        with the given experience content. By default candidates come from
+        the MinHash LSH belief index and are rescored with exact Jaccard;
+        exact=True scans every belief (the reference path).
 
         Args:
             experience_content: The experience text to match against
             threshold: Minimum similarity score (0.0-1.0)
             limit: Maximum number of similar beliefs to return
+            exact: If True, compare against every belief instead of LSH candidates
 
         Returns:
             List of belief dicts with id, content, confidence, similarity_score
         """
         threshold = threshold or self.CONNECTION_HEURISTIC_CONFIG["similarity_threshold"]
 
+        if not exact and self.belief_index_enabled:
+            try:
+                return await self._find_similar_beliefs_indexed(
+                    experience_content, threshold, limit
+                )
+            except Exception as e:
+                print(f"Belief index lookup failed, scanning: {e}")
+
         try:
             async with self.driver.session() as session:
                 # Get all beliefs
@@ -4673,6 +5237,45 @@ class Memory:
             print(f"Error finding similar beliefs: {e}")
             return []
 
+    async def _find_similar_beliefs_indexed(
+        self,
+        experience_content: str,
+        threshold: float,
+        limit: int
+    ) -> List[Dict]:
+        """LSH candidates + exact Jaccard, then one fetch for the winners only."""
+        await self._ensure_belief_index()
+
+        matches = self._belief_index.query(experience_content, threshold=threshold)
+        if not matches:
+            return []
+
+        # Over-fetch a little in case some winners were archived behind our back
+        top = matches[:limit * 2]
+        async with self.driver.session() as session:
+            result = await session.run("""
+                MATCH (b:Belief)
+                WHERE b.id IN $ids AND NOT coalesce(b.archived, false)
+                RETURN b.id as id, b.content as content, b.confidence as confidence
+            """, ids=[belief_id for belief_id, _, _ in top])
+            found = {r["id"]: r for r in await result.data()}
+
+        similar_beliefs = []
+        for belief_id, similarity, _ in top:
+            belief = found.get(belief_id)
+            if belief is None:
+                self._unindex_belief(belief_id)
+                continue
+            similar_beliefs.append({
+                "id": belief_id,
+                "content": belief["content"],
+                "confidence": belief.get("confidence", 0.5),
+                "similarity_score": round(similarity, 3)
+            })
+
+        return similar_beliefs[:limit]
+
+    @invalidates(ALL_LABELS)
     async def apply_connection_heuristic(
         self,
         threshold: float = None,
@@ -4924,6 +5527,7 @@ class Memory:
         except Exception:
             return True
 
+    @invalidates(ALL_LABELS)
     async def create_node(
         self,
         node_type: str,
@@ -5186,6 +5790,7 @@ class Memory:
         Returns:
             Node dict with properties and _labels, or None if not found
         """
+        await self.flush_experiences()
         try:
             async with self.driver.session() as session:
                 result = await session.run(
@@ -5205,6 +5810,7 @@ class Memory:
             print(f"Error getting node: {e}")
             return None
 
+    @invalidates(ALL_LABELS)
     async def update_node(
         self,
         node_id: str,
@@ -5248,6 +5854,19 @@ class Memory:
                     **safe_props
                 )
                 record = await result.single()
+                if record is not None and "Belief" in record["n"].labels:
+                    if safe_props.get("archived"):
+                        self._unindex_belief(node_id)
+                    elif "content" in safe_props:
+                        self._index_belief(node_id, safe_props["content"])
+                if record is not None and "embedding" in safe_props:
+                    node = record["n"]
+                    for label in node.labels:
+                        self._index_node_embedding(
+                            node_id, label, safe_props["embedding"],
+                            node.get(self._vector_content_field(label)),
+                            labels=list(node.labels)
+                        )
                 return record is not None
         except Exception as e:
             print(f"Error updating node: {e}")
@@ -5439,26 +6058,7 @@ class Memory:
                     # For Reflections, parse raw_output JSON and extract meaningful content
                     raw_output = record["raw_output"]
                     if node_type == "reflection" and raw_output:
-                        try:
-                            parsed = json.loads(raw_output) if isinstance(raw_output, str) else raw_output
-                            # Extract the most meaningful content from reflection
-                            # BYRD's reflections may have various keys - check common ones
-                            content = (
-                                parsed.get("reflection_title") or
-                                parsed.get("title") or
-                                parsed.get("narrative") or
-                                parsed.get("narrative_stream") or
-                                parsed.get("inner_voice") or
-                                parsed.get("summary") or
-                                # For insights, get first one if it's a list
-                                (parsed.get("insights", [{}])[0] if isinstance(parsed.get("insights"), list) and parsed.get("insights") else None) or
-                                str(list(parsed.keys()))  # Fallback: show keys
-                            )
-                            # If content is a dict, stringify it nicely
-                            if isinstance(content, dict):
-                                content = content.get("content") or content.get("insight") or str(content)
-                        except:
-                            content = str(raw_output) if raw_output else ""
+                        content = _reflection_display_content(raw_output)
                     else:
                         # Debug: print crystal essence
                         if node_type == "crystal":
@@ -5531,6 +6131,91 @@ class Memory:
                 "error": str(e)
             }
 
+    @cached_query(ALL_LABELS)
+    async def get_graph_page(
+        self,
+        after: Optional[Tuple[str, str]] = None,
+        page_size: int = 500,
+        fields: Tuple[str, ...] = DEFAULT_EXPORT_FIELDS
+    ) -> Dict[str, Any]:
+        """
+        One page of the visualization graph, for progressive loading.
+
+        Nodes are walked label by label (in _GRAPH_LABELS order) and in id
+        order within a label, so every query is a seek on that label's id
+        index (keyset pagination, stable while the graph grows). Each page
+        carries the outgoing relationships of its nodes, so every
+        relationship is delivered exactly once across pages. Only the
+        projected fields are read.
+
+        Args:
+            after: (label, id) of the last node of the previous page (None = first page)
+            page_size: Nodes per page
+            fields: Node fields to return (see core.graph_export.NODE_FIELDS)
+
+        Returns:
+            {"nodes": [...], "relationships": [...], "fields": [...], "next_cursor": str | None}
+
+        Raises:
+            ValueError: If `after` names a label outside the graph
+        """
+        start_label, after_id = after or (_GRAPH_LABELS[0], None)
+        if start_label not in _GRAPH_LABELS:
+            raise ValueError(f"Invalid cursor label: {start_label}")
+
+        projection = ", ".join(f"{EXPORT_NODE_FIELDS[f]} AS {f}" for f in fields)
+        with_reflection_text = "content" in fields
+        if with_reflection_text:
+            projection += ", CASE WHEN n:Reflection THEN n.raw_output END AS _raw_output"
+
+        nodes = []
+        relationships = []
+        last_label = None
+        async with self.driver.session() as session:
+            first = _GRAPH_LABELS.index(start_label)
+            for position, label in enumerate(_GRAPH_LABELS[first:], start=first):
+                conditions = ["n.id > $after" if after_id is not None else "n.id IS NOT NULL"]
+                if label in _GRAPH_LABEL_WHERE:
+                    conditions.append(_GRAPH_LABEL_WHERE[label])
+                # A node with several graph labels is exported under the first one
+                conditions += [f"NOT n:{earlier}" for earlier in _GRAPH_LABELS[:position]]
+
+                nodes_result = await session.run(f"""
+                    MATCH (n:{label})
+                    WHERE {" AND ".join(conditions)}
+                    WITH n ORDER BY n.id LIMIT $limit
+                    RETURN {projection}
+                """, after=after_id, limit=page_size - len(nodes))
+
+                label_ids = []
+                async for record in nodes_result:
+                    node = {f: record[f] for f in fields}
+                    if with_reflection_text and record["_raw_output"]:
+                        node["content"] = _reflection_display_content(record["_raw_output"])
+                    nodes.append(node)
+                    label_ids.append(node["id"])
+
+                if label_ids:
+                    last_label = label
+                    rels_result = await session.run(f"""
+                        MATCH (n:{label})-[r]->(b)
+                        WHERE n.id IN $node_ids AND b.id IS NOT NULL AND {_graph_label_filter("b")}
+                        RETURN toString(id(r)) AS id, type(r) AS type, n.id AS source_id, b.id AS target_id
+                    """, node_ids=label_ids)
+                    relationships.extend([dict(record) async for record in rels_result])
+
+                if len(nodes) >= page_size:
+                    break
+                after_id = None
+
+        full = len(nodes) == page_size
+        return {
+            "nodes": nodes,
+            "relationships": relationships,
+            "fields": list(fields),
+            "next_cursor": encode_cursor((last_label, nodes[-1]["id"]) if full else None),
+        }
+
     async def increment_access_count(self, node_ids: List[str]) -> int:
         """
         Increment access count for nodes being accessed during reflection.
@@ -6463,6 +7148,7 @@ class Memory:
             print(f"Error deprecating ego by source: {e}")
             return 0
 
+    @invalidates(ALL_LABELS)
     async def sync_capability_awareness(self) -> Dict[str, int]:
         """
         Sync Ego capability nodes with current Capability nodes.
@@ -6612,6 +7298,7 @@ class Memory:
     # - PRUNE: Archive nodes fully captured by crystal
     # - FORGET: Delete noise nodes with no cognitive value
 
+    @invalidates(ALL_LABELS)
     async def create_crystal(
         self,
         essence: str,
@@ -6694,6 +7381,7 @@ class Memory:
             print(f"Error creating crystal: {e}")
             return None
 
+    @invalidates(ALL_LABELS)
     async def absorb_into_crystal(
         self,
         crystal_id: str,
@@ -6748,6 +7436,7 @@ class Memory:
             print(f"Error absorbing into crystal: {e}")
             return False
 
+    @invalidates(ALL_LABELS)
     async def merge_crystals(
         self,
         crystal_ids: List[str],
@@ -6848,6 +7537,7 @@ class Memory:
             print(f"Error merging crystals: {e}")
             return None
 
+    @invalidates(ALL_LABELS)
     async def update_node_state(
         self,
         node_id: str,
@@ -6883,10 +7573,12 @@ class Memory:
             print(f"Error updating node state: {e}")
             return False
 
+    @invalidates(ALL_LABELS)
     async def archive_node(self, node_id: str, reason: str = "crystallized") -> bool:
         """Archive a node (soft delete, excluded from retrieval)."""
         return await self.update_node_state(node_id, "archived", reason)
 
+    @invalidates(ALL_LABELS)
     async def forget_node(
         self,
         node_id: str,
@@ -6911,6 +7603,12 @@ class Memory:
                         MATCH (n) WHERE n.id = $id
                         DETACH DELETE n
                     """, id=node_id)
+                    self._vector_index.remove(node_id)
+                    self._unindex_belief(node_id)
+                    await event_bus.emit(Event(
+                        type=EventType.MEMORY_FORGOTTEN,
+                        data={"node_id": node_id, "reason": reason, "hard_delete": True}
+                    ))
                 else:
                     await session.run("""
                         MATCH (n) WHERE n.id = $id
@@ -7246,6 +7944,7 @@ class Memory:
             print(f"Error getting self name: {e}")
             return None
 
+    @invalidates("OperatingSystem", "Seed", "Belief", "Strategy", "Desire", "Constraint")
     async def set_self_name(self, name: str, reason: str = "") -> Optional[str]:
         """
         Record BYRD's self-chosen name.
@@ -7430,6 +8129,7 @@ class Memory:
     # Unlike the old Ego system, the OS is a single node with arbitrary fields
     # that BYRD can extend. BYRD has full agency over its self-model.
 
+    @invalidates("OperatingSystem", "Seed", "Belief", "Strategy", "Desire", "Constraint")
     async def create_minimal_os(self, awakening_prompt: str = None, self_modification_enabled: bool = True) -> Optional[str]:
         """
         Create a minimal OperatingSystem node with only factual information.
@@ -7777,6 +8477,7 @@ class Memory:
             return None
 
     # Legacy method - kept for backward compatibility
+    @invalidates("OperatingSystem", "Seed", "Belief", "Strategy", "Desire", "Constraint")
     async def ensure_os_templates(self) -> bool:
         """DEPRECATED: Templates are no longer used. Returns True for compatibility."""
         return True
@@ -7824,6 +8525,7 @@ class Memory:
             print(f"Error checking for OS: {e}")
             return False
 
+    @invalidates("OperatingSystem", "Seed", "Belief", "Strategy", "Desire", "Constraint")
     async def create_os_from_template(self, template_name: str = "black-cat", awakening_prompt: str = None) -> Optional[str]:
         """
         DEPRECATED: Templates are no longer used.
@@ -7839,6 +8541,7 @@ class Memory:
         print(f"[DEPRECATED] create_os_from_template called - delegating to create_minimal_os")
         return await self.create_minimal_os(awakening_prompt=awakening_prompt)
 
+    @cached_query("OperatingSystem", "Seed", "Belief", "Strategy", "Desire", "Constraint")
     async def get_operating_system(self) -> Optional[Dict[str, Any]]:
         """
         Get the current OperatingSystem with all related data.
@@ -7933,6 +8636,7 @@ class Memory:
             print(f"Error getting operating system: {e}")
             return None
 
+    @invalidates("OperatingSystem", "Seed", "Belief", "Strategy", "Desire", "Constraint")
     async def update_operating_system(
         self,
         updates: Dict[str, Any],
@@ -8182,6 +8886,7 @@ class Memory:
             print(f"Error getting OS version history: {e}")
             return []
 
+    @invalidates("OperatingSystem", "Seed", "Belief", "Strategy", "Desire", "Constraint")
     async def reset_to_template(self, template_name: Optional[str] = None) -> bool:
         """
         Reset the OperatingSystem to a template state.
@@ -8238,6 +8943,7 @@ class Memory:
             print(f"Error resetting to template: {e}")
             return False
 
+    @invalidates("OperatingSystem", "Seed", "Belief", "Strategy", "Desire", "Constraint")
     async def clear_config_constraints(self) -> int:
         """
         Clear all config-sourced constraints from the Operating System.
@@ -8266,6 +8972,7 @@ class Memory:
             print(f"Error clearing config constraints: {e}")
             return 0
 
+    @invalidates("OperatingSystem", "Seed", "Belief", "Strategy", "Desire", "Constraint")
     async def add_constraint(
         self,
         content: str,
@@ -8353,6 +9060,7 @@ class Memory:
             print(f"Error getting voice config: {e}")
             return None
 
+    @invalidates("OperatingSystem", "Seed", "Belief", "Strategy", "Desire", "Constraint")
     async def update_os_field(self, field: str, value: Any) -> bool:
         """
         Update a single field in the Operating System.
@@ -8399,6 +9107,7 @@ class Memory:
             print(f"Error getting OS capabilities: {e}")
         return {}
 
+    @invalidates("OperatingSystem", "Seed", "Belief", "Strategy", "Desire", "Constraint")
     async def update_os_capabilities(self, capabilities: Dict[str, Any]) -> bool:
         """
         Update the capability menu in the OS node.
@@ -8421,6 +9130,7 @@ class Memory:
         """
         return await self.get_operating_system()
 
+    @cached_query("OperatingSystem", "Seed", "Belief", "Strategy", "Desire", "Constraint")
     async def get_os_for_prompt(self) -> str:
         """
         Format the Operating System for inclusion in dreamer prompts.
@@ -8826,6 +9536,7 @@ class Memory:
 
         return "\n".join(lines)
 
+    @invalidates("OperatingSystem", "Seed", "Belief", "Strategy", "Desire", "Constraint")
     async def set_self_portrait(self, url: str, description: str) -> bool:
         """
         Set BYRD's self-portrait - a creator-given visual identity anchor.
@@ -9164,6 +9875,7 @@ class Memory:
     # INSIGHTS (Dreaming Machine - Loop 4)
     # -------------------------------------------------------------------------
 
+    @invalidates(ALL_LABELS)
     async def create_insight(
         self,
         content: str,
@@ -9207,6 +9919,9 @@ class Memory:
                     CREATE (e)-[:PRODUCED_INSIGHT]->(i)
                 """, insight_id=insight_id, evidence_ids=supporting_evidence[:20])
 
+        if embedding is not None:
+            self._index_node_embedding(insight_id, "Insight", embedding, content)
+
         return insight_id
 
     # -------------------------------------------------------------------------
@@ -9451,6 +10166,7 @@ class Memory:
     # RAW QUERY EXECUTION (AGI Seed Components, Accelerators)
     # -------------------------------------------------------------------------
 
+    @invalidates_on_write
     async def execute_query(
         self,
         query: str,
@@ -9486,6 +10202,7 @@ class Memory:
     # DOCUMENT METHODS (File Ingestion)
     # =========================================================================
 
+    @invalidates("Belief")
     async def create_belief_from_document(
         self,
         content: str,
@@ -9541,6 +10258,8 @@ class Memory:
             )
             await result.single()
 
+        self._index_belief(belief_id, content)
+
         await event_bus.emit(Event(
             type=EventType.DOCUMENT_BELIEF_FORMED,
             data={
@@ -9790,6 +10509,71 @@ class Memory:
     # SPREADING ACTIVATION (Memory Reasoner)
     # -------------------------------------------------------------------------
 
+    @staticmethod
+    def _vector_content_field(node_type: str) -> str:
+        """Property holding the displayable text for a node type."""
+        if node_type == "Reflection":
+            return "raw_output"
+        if node_type == "Crystal":
+            return "essence"
+        return "content"
+
+    async def _ensure_vector_label(self, node_type: str) -> None:
+        """
+        Load every embedded node of a label into the vector index (once).
+
+        Uses keyset pagination on n.id so large labels load in bounded
+        batches instead of one unbounded result.
+        """
+        if node_type in self._vector_index.loaded_labels:
+            return
+
+        content_field = self._vector_content_field(node_type)
+        last_id = ""
+        loaded = 0
+
+        async with self.driver.session() as session:
+            while True:
+                result = await session.run(f"""
+                    MATCH (n:{node_type})
+                    WHERE n.embedding IS NOT NULL AND n.id > $last_id
+                    RETURN n.id as id, labels(n) as labels,
+                           n.{content_field} as content, n.embedding as embedding
+                    ORDER BY n.id
+                    LIMIT $batch
+                """, last_id=last_id, batch=self._vector_load_batch_size)
+                records = await result.data()
+
+                for r in records:
+                    if self._vector_index.upsert(
+                        node_type, r["id"], r["embedding"],
+                        content=r["content"], labels=r["labels"]
+                    ):
+                        loaded += 1
+
+                if len(records) < self._vector_load_batch_size:
+                    break
+                last_id = records[-1]["id"]
+
+        self._vector_index.loaded_labels.add(node_type)
+        logger.info(f"Vector index loaded {loaded} {node_type} embeddings")
+
+    def _index_node_embedding(
+        self,
+        node_id: str,
+        node_type: str,
+        embedding: Optional[List[float]],
+        content: Any,
+        labels: Optional[List[str]] = None
+    ) -> None:
+        """Keep the vector index in sync after a write (no-op for unloaded labels)."""
+        if node_type not in self._vector_index.loaded_labels:
+            return
+        self._vector_index.upsert(
+            node_type, node_id, embedding,
+            content=content, labels=labels or [node_type]
+        )
+
     async def find_similar_nodes(
         self,
         embedding: List[float],
@@ -9800,8 +10584,9 @@ class Memory:
         """
         Find nodes semantically similar to the given embedding.
 
-        Uses cosine similarity computed in Python since Neo4j lacks
-        native vector similarity.
+        Backed by the in-process VectorIndex: each label is loaded from
+        Neo4j on first use and kept current by the write paths, so a
+        search covers the whole label in one matrix product.
 
         Args:
             embedding: Query embedding vector
@@ -9812,45 +10597,50 @@ class Memory:
         Returns:
             List of dicts with: id, labels, content, similarity
         """
-        from embedding import cosine_similarity
+        results = await self.find_similar_nodes_batch(
+            [embedding], min_similarity=min_similarity,
+            limit=limit, node_types=node_types
+        )
+        return results[0]
+
+    async def find_similar_nodes_batch(
+        self,
+        embeddings: List[List[float]],
+        min_similarity: float = 0.5,
+        limit: int = 10,
+        node_types: Optional[List[str]] = None
+    ) -> List[List[Dict]]:
+        """
+        Batched find_similar_nodes: one result list per query embedding.
 
+        All queries are scored in a single pass over each label's matrix.
+        """
         if node_types is None:
             node_types = ["Experience", "Belief", "Reflection", "Insight", "Crystal"]
 
-        results = []
+        for node_type in node_types:
+            await self._ensure_vector_label(node_type)
 
-        async with self.driver.session() as session:
-            for node_type in node_types:
-                # Determine content field based on node type
-                content_field = "raw_output" if node_type == "Reflection" else "content"
-                if node_type == "Crystal":
-                    content_field = "essence"
+        hits_per_query = self._vector_index.search_batch(
+            embeddings, k=limit, min_similarity=min_similarity, labels=node_types
+        )
 
-                query = f"""
-                    MATCH (n:{node_type})
-                    WHERE n.embedding IS NOT NULL
-                    RETURN n.id as id, labels(n) as labels,
-                           n.{content_field} as content, n.embedding as embedding
-                    LIMIT 200
-                """
-                result = await session.run(query)
-                records = await result.data()
+        return [
+            [
+                {
+                    "id": hit.node_id,
+                    "labels": hit.labels,
+                    "content": hit.content,
+                    "similarity": hit.similarity
+                }
+                for hit in hits
+            ]
+            for hits in hits_per_query
+        ]
 
-                for r in records:
-                    node_embedding = r.get("embedding")
-                    if node_embedding and len(node_embedding) == len(embedding):
-                        similarity = cosine_similarity(embedding, node_embedding)
-                        if similarity >= min_similarity:
-                            results.append({
-                                "id": r["id"],
-                                "labels": r["labels"],
-                                "content": r["content"],
-                                "similarity": similarity
-                            })
-
-        # Sort by similarity descending
-        results.sort(key=lambda x: x["similarity"], reverse=True)
-        return results[:limit]
+    def get_vector_index_stats(self) -> Dict[str, Any]:
+        """Get vector index statistics (sizes per label, IVF state, counters)."""
+        return self._vector_index.get_stats()
 
     async def get_neighbors(self, node_id: str) -> List[Dict]:
         """
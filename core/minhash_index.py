@@ -0,0 +1,243 @@
+"""
+MinHash LSH Index for Text Similarity
+
+Sub-linear candidate generation for the Jaccard similarity used by
+Memory._compute_text_similarity (word unigrams + bigrams).
+
+Each document is reduced to a MinHash signature of num_perm values; the
+signature is split into bands of `rows` values and every band is hashed
+into a bucket. Two documents become candidates when they share a bucket
+in any band, which happens with probability 1 - (1 - J^rows)^bands for
+Jaccard similarity J. Candidates are then rescored exactly against their
+stored shingle sets, so results never contain false positives - only
+possible misses, which scripts/benchmark_belief_index.py reports.
+
+bands_for_recall() picks the banding from a recall target at a design
+similarity. With min_rows >= 2 the candidate rate stays bounded: pairs
+far below the design similarity rarely collide, at the price of lower
+recall for matches near a low query threshold.
+"""
+
+import hashlib
+import re
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+# Mersenne prime 2^31 - 1: (a * x + b) stays below 2^63 for 31-bit inputs
+_PRIME = np.uint64((1 << 31) - 1)
+
+
+def text_shingles(text: str) -> FrozenSet[str]:
+    """
+    Word unigrams and bigrams, as used by Memory._compute_text_similarity.
+
+    Lowercases, splits on non-word characters and drops words of two
+    characters or fewer.
+    """
+    if not text:
+        return frozenset()
+    words = [w for w in re.split(r'\W+', text.lower().strip()) if len(w) > 2]
+    ngrams = set(words)  # Unigrams
+    for i in range(len(words) - 1):
+        ngrams.add(f"{words[i]}_{words[i+1]}")  # Bigrams
+    return frozenset(ngrams)
+
+
+def char_bigrams(text: str) -> FrozenSet[str]:
+    """Lowercased character bigrams (the basis of Sorensen-Dice similarity)."""
+    if not text:
+        return frozenset()
+    text = text.lower()
+    return frozenset(text[i:i + 2] for i in range(len(text) - 1))
+
+
+def jaccard(set1: Iterable[str], set2: Iterable[str]) -> float:
+    """Jaccard similarity of two shingle sets (0.0 when either is empty)."""
+    set1, set2 = set(set1), set(set2)
+    if not set1 or not set2:
+        return 0.0
+    union = len(set1 | set2)
+    return len(set1 & set2) / union if union else 0.0
+
+
+def _hash_shingle(shingle: str) -> int:
+    digest = hashlib.blake2b(shingle.encode(), digest_size=4).digest()
+    return int.from_bytes(digest, "little") % int(_PRIME)
+
+
+def bands_for_recall(num_perm: int, similarity: float, target_recall: float, min_rows: int = 1) -> int:
+    """
+    Fewest bands (most rows, fewest false candidates) that still make a
+    document at `similarity` a candidate with probability >= target_recall.
+
+    Bands always have at least min_rows rows; if no such banding reaches
+    the target, the one with the fewest rows (highest recall) is used.
+    """
+    divisors = [rows for rows in range(num_perm, 0, -1) if num_perm % rows == 0 and rows >= min_rows]
+    if not divisors:
+        return num_perm
+    for rows in divisors:
+        bands = num_perm // rows
+        if 1.0 - (1.0 - similarity ** rows) ** bands >= target_recall:
+            return bands
+    return num_perm // divisors[-1]
+
+
+class MinHashLSHIndex:
+    """
+    Incrementally maintained MinHash LSH over text shingles.
+
+    Usage:
+        index = MinHashLSHIndex()
+        index.add("belief_1", "Curiosity drives exploration", payload={...})
+        matches = index.query("exploration is driven by curiosity", threshold=0.05)
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 128,
+        bands: int = 64,
+        seed: int = 1,
+        shingler: Callable[[str], FrozenSet[str]] = text_shingles
+    ):
+        if num_perm % bands != 0:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingler = shingler
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, int(_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(_PRIME), size=num_perm, dtype=np.uint64)
+
+        self._buckets: List[Dict[bytes, Set[str]]] = [dict() for _ in range(bands)]
+        self._band_keys: Dict[str, List[bytes]] = {}
+        self._shingles: Dict[str, FrozenSet[str]] = {}
+        self._payloads: Dict[str, Any] = {}
+
+        # Metrics
+        self._queries = 0
+        self._candidates_examined = 0
+
+    def signature(self, shingles: Iterable[str]) -> Optional[np.ndarray]:
+        """MinHash signature of a shingle set (None if empty)."""
+        hashes = np.fromiter((_hash_shingle(s) for s in shingles), dtype=np.uint64)
+        if hashes.size == 0:
+            return None
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % _PRIME
+        return permuted.min(axis=1)
+
+    def _band_keys_for(self, signature: np.ndarray) -> List[bytes]:
+        return [
+            signature[i * self.rows:(i + 1) * self.rows].tobytes()
+            for i in range(self.bands)
+        ]
+
+    def add(self, doc_id: str, text: str, payload: Any = None) -> bool:
+        """Index (or re-index) a document. Returns False if it has no shingles."""
+        self.remove(doc_id)
+
+        shingles = self.shingler(text)
+        signature = self.signature(shingles)
+        if signature is None:
+            return False
+
+        keys = self._band_keys_for(signature)
+        for band, key in enumerate(keys):
+            self._buckets[band].setdefault(key, set()).add(doc_id)
+
+        self._band_keys[doc_id] = keys
+        self._shingles[doc_id] = shingles
+        self._payloads[doc_id] = payload
+        return True
+
+    def remove(self, doc_id: str) -> bool:
+        """Drop a document from the index. Returns True if it was present."""
+        keys = self._band_keys.pop(doc_id, None)
+        if keys is None:
+            return False
+        for band, key in enumerate(keys):
+            bucket = self._buckets[band].get(key)
+            if bucket is not None:
+                bucket.discard(doc_id)
+                if not bucket:
+                    del self._buckets[band][key]
+        self._shingles.pop(doc_id, None)
+        self._payloads.pop(doc_id, None)
+        return True
+
+    def clear(self) -> None:
+        for buckets in self._buckets:
+            buckets.clear()
+        self._band_keys.clear()
+        self._shingles.clear()
+        self._payloads.clear()
+
+    def shingles_of(self, doc_id: str) -> Optional[FrozenSet[str]]:
+        """Stored shingle set of an indexed document."""
+        return self._shingles.get(doc_id)
+
+    def candidates(self, shingles: FrozenSet[str]) -> Set[str]:
+        """Document ids sharing at least one band bucket with the shingle set."""
+        signature = self.signature(shingles)
+        if signature is None:
+            return set()
+        found: Set[str] = set()
+        for band, key in enumerate(self._band_keys_for(signature)):
+            bucket = self._buckets[band].get(key)
+            if bucket:
+                found.update(bucket)
+        return found
+
+    def query(
+        self,
+        text: str,
+        threshold: float = 0.0,
+        limit: Optional[int] = None
+    ) -> List[Tuple[str, float, Any]]:
+        """
+        Find indexed documents similar to text.
+
+        Returns (doc_id, exact_jaccard, payload) tuples with
+        exact_jaccard >= threshold, best first.
+        """
+        shingles = self.shingler(text)
+        candidate_ids = self.candidates(shingles)
+
+        self._queries += 1
+        self._candidates_examined += len(candidate_ids)
+
+        scored = []
+        for doc_id in candidate_ids:
+            similarity = jaccard(shingles, self._shingles[doc_id])
+            if similarity >= threshold:
+                scored.append((doc_id, similarity, self._payloads.get(doc_id)))
+
+        scored.sort(key=lambda x: x[1], reverse=True)
+        return scored[:limit] if limit is not None else scored
+
+    def candidate_probability(self, similarity: float) -> float:
+        """Probability that a document at the given Jaccard becomes a candidate."""
+        return 1.0 - (1.0 - similarity ** self.rows) ** self.bands
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics."""
+        return {
+            "documents": len(self._band_keys),
+            "num_perm": self.num_perm,
+            "bands": self.bands,
+            "rows": self.rows,
+            "queries": self._queries,
+            "avg_candidates_per_query": round(
+                self._candidates_examined / self._queries, 2
+            ) if self._queries else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._band_keys)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._band_keys
@@ -13,12 +13,20 @@ Philosophical significance:
 - True indeterminacy: Decisions have genuine physical randomness
 - Non-reproducibility: Each cognitive moment is unique
 - Emergence alignment: Quantum uncertainty enables novel patterns
+
+Pool design: entropy lives in a preallocated ring buffer that only a
+background prefetch task writes to. The prefetch fetches into a staging
+buffer off the hot path and copies it into the ring once it arrives.
+Draws never await, so they need no lock. When the ring is short a draw
+is served from os.urandom() instantly rather than waiting for the
+network.
 """
 
 import asyncio
 import os
 import struct
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Tuple
@@ -67,8 +75,9 @@ class QuantumRandomnessProvider:
     """
     Singleton provider for quantum randomness from ANU QRNG.
 
-    Maintains a pool of quantum random bytes fetched asynchronously,
-    with graceful fallback to os.urandom() when quantum source is unavailable.
+    Maintains a ring buffer of quantum random bytes prefetched in the
+    background, with graceful fallback to os.urandom() when the quantum
+    source is unavailable or the ring runs dry.
 
     The provider is transparent about entropy source - every value returned
     indicates whether it came from quantum or classical sources.
@@ -81,6 +90,8 @@ class QuantumRandomnessProvider:
     LOW_WATERMARK = 64           # trigger refill when pool drops below this
     MIN_FETCH_INTERVAL = 5.0     # seconds between API requests (rate limiting)
     FALLBACK_RETRY_INTERVAL = 60.0  # seconds to retry quantum after fallback
+    PREFETCH_INTERVAL = 1.0      # seconds between prefetch checks when not signalled
+    LATENCY_WINDOW = 1024        # draws kept for latency percentiles
 
     # ANU QRNG API
     ANU_API_URL = "https://qrng.anu.edu.au/API/jsonI.php"
@@ -100,12 +111,23 @@ class QuantumRandomnessProvider:
             return
         self._initialized = True
 
-        # Pool state
-        self._pool: bytes = b""
-        self._pool_lock = asyncio.Lock()
+        # Pool state: ring buffer plus a parallel per-byte quantum flag
+        self._ring = bytearray(self.POOL_SIZE)
+        self._ring_quantum = bytearray(self.POOL_SIZE)
+        self._head: int = 0   # next byte to draw
+        self._fill: int = 0   # bytes available
+        self._refill_event: Optional[asyncio.Event] = None
+        self._refilling: bool = False
         self._last_fetch_time: float = 0
         self._last_fallback_retry: float = 0
 
+        # Draw metrics
+        self._quantum_bytes_drawn: int = 0
+        self._classical_bytes_drawn: int = 0
+        self._pool_misses: int = 0
+        self._min_fill: int = self.POOL_SIZE  # Lowest fill seen after a draw
+        self._draw_latencies_us: deque = deque(maxlen=self.LATENCY_WINDOW)
+
         # Status tracking
         self._quantum_fetches: int = 0
         self._classical_fallbacks: int = 0
@@ -135,15 +157,36 @@ class QuantumRandomnessProvider:
 
     async def initialize(self):
         """Initialize the provider and start background refill."""
-        if self._running:
+        if self._prefetch_alive():
             return
 
-        self._running = True
-
-        # Initial pool fill
+        # Start background refill task, then do the initial fill here
+        self._ensure_prefetch(fill_now=False)
         await self._refill_pool()
 
-        # Start background refill task
+    def _prefetch_alive(self) -> bool:
+        """Whether the refill task is running on the current event loop."""
+        task = self._refill_task
+        if not self._running or task is None or task.done():
+            return False
+        try:
+            return task.get_loop() is asyncio.get_running_loop()
+        except RuntimeError:
+            return True  # No running loop to compare against
+
+    def _ensure_prefetch(self, fill_now: bool = True):
+        """Start background refill on first use (needs a running loop)."""
+        if self._prefetch_alive():
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._running = True
+        self._refilling = False
+        self._refill_event = asyncio.Event()
+        if fill_now:
+            self._refill_event.set()
         self._refill_task = asyncio.create_task(self._background_refill())
 
     async def shutdown(self):
@@ -155,6 +198,7 @@ class QuantumRandomnessProvider:
                 await self._refill_task
             except asyncio.CancelledError:
                 pass
+            self._refill_task = None
 
     async def _fetch_quantum_bytes(self, count: int) -> Optional[bytes]:
         """Fetch quantum random bytes from ANU QRNG API."""
@@ -216,30 +260,93 @@ class QuantumRandomnessProvider:
 
         return os.urandom(count)
 
-    async def _refill_pool(self):
-        """Refill the entropy pool."""
-        async with self._pool_lock:
-            bytes_needed = self.POOL_SIZE - len(self._pool)
+    # ------------------------------------------------------------------
+    # Ring buffer (synchronous: never awaits, so needs no lock)
+    # ------------------------------------------------------------------
+
+    def _put(self, data: bytes, quantum: bool) -> int:
+        """Append bytes at the tail of the ring; returns bytes written."""
+        capacity = len(self._ring)
+        count = min(len(data), capacity - self._fill)
+        tail = (self._head + self._fill) % capacity
+        first = min(count, capacity - tail)
+        flag = b"\x01" if quantum else b"\x00"
+
+        self._ring[tail:tail + first] = data[:first]
+        self._ring_quantum[tail:tail + first] = flag * first
+        rest = count - first
+        if rest:
+            self._ring[:rest] = data[first:count]
+            self._ring_quantum[:rest] = flag * rest
+
+        self._fill += count
+        return count
+
+    def _take(self, count: int) -> Optional[Tuple[bytes, bool]]:
+        """Draw bytes from the head of the ring; None if too few are left."""
+        if self._fill < count:
+            return None
+        capacity = len(self._ring)
+        end = self._head + count
+
+        if end <= capacity:
+            data = bytes(self._ring[self._head:end])
+            flags = self._ring_quantum[self._head:end]
+        else:
+            wrap = end - capacity
+            data = bytes(self._ring[self._head:]) + bytes(self._ring[:wrap])
+            flags = self._ring_quantum[self._head:] + self._ring_quantum[:wrap]
 
-            if bytes_needed <= 0:
-                return
+        self._head = end % capacity
+        self._fill -= count
+        return data, 0 not in flags
 
-            # Try quantum source first
-            quantum_bytes = await self._fetch_quantum_bytes(bytes_needed)
+    def _clear_ring(self):
+        self._head = 0
+        self._fill = 0
 
-            if quantum_bytes:
-                self._pool += quantum_bytes
-            else:
-                # Fallback to classical
-                self._pool += self._get_classical_bytes(bytes_needed)
+    # ------------------------------------------------------------------
+    # Background prefetch
+    # ------------------------------------------------------------------
+
+    async def _refill_pool(self):
+        """Top up the ring from a staging buffer fetched off the hot path."""
+        if self._refilling or self._fill >= self.POOL_SIZE:
+            return
+        self._refilling = True
+        try:
+            await self._refill_from_source()
+        finally:
+            self._refilling = False
+
+    async def _refill_from_source(self):
+        # Rate limited: wait for the next window rather than dropping to classical
+        wait = self.MIN_FETCH_INTERVAL - (time.time() - self._last_fetch_time)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        bytes_needed = self.POOL_SIZE - self._fill
+
+        # Try quantum source first; draws keep consuming the ring meanwhile
+        staged = await self._fetch_quantum_bytes(bytes_needed)
+
+        if staged:
+            self._put(staged, quantum=True)
+        else:
+            # Fallback to classical
+            self._put(self._get_classical_bytes(bytes_needed), quantum=False)
 
     async def _background_refill(self):
         """Background task to keep pool filled."""
         while self._running:
             try:
-                await asyncio.sleep(1.0)  # Check every second
+                # Wake when a draw crosses the low watermark, or every interval
+                try:
+                    await asyncio.wait_for(self._refill_event.wait(), self.PREFETCH_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+                self._refill_event.clear()
 
-                current_size = len(self._pool)
+                current_size = self._fill
 
                 # Trigger refill at low watermark
                 if current_size < self.LOW_WATERMARK:
@@ -248,16 +355,16 @@ class QuantumRandomnessProvider:
                     await self._refill_pool()
 
                 # Retry quantum source if in fallback mode
-                if self._in_fallback_mode:
+                elif self._in_fallback_mode:
                     now = time.time()
                     if now - self._last_fallback_retry >= self.FALLBACK_RETRY_INTERVAL:
                         self._last_fallback_retry = now
                         # Try to get quantum bytes
                         quantum_bytes = await self._fetch_quantum_bytes(self.POOL_SIZE)
                         if quantum_bytes:
-                            async with self._pool_lock:
-                                # Replace pool with fresh quantum bytes
-                                self._pool = quantum_bytes
+                            # Replace pool with fresh quantum bytes
+                            self._clear_ring()
+                            self._put(quantum_bytes, quantum=True)
 
             except asyncio.CancelledError:
                 break
@@ -265,31 +372,36 @@ class QuantumRandomnessProvider:
                 print(f"Quantum pool refill error: {e}")
 
     async def _consume_bytes(self, count: int) -> Tuple[bytes, EntropySource]:
-        """Consume bytes from the pool, refilling if needed."""
-        async with self._pool_lock:
-            # Ensure we have enough bytes
-            if len(self._pool) < count:
-                # Need immediate refill
-                bytes_needed = count - len(self._pool)
-
-                # Try quantum first
-                quantum_bytes = await self._fetch_quantum_bytes(max(bytes_needed, self.POOL_SIZE))
-
-                if quantum_bytes:
-                    self._pool += quantum_bytes
-                else:
-                    # Fallback to classical
-                    self._pool += self._get_classical_bytes(bytes_needed)
-
-            # Determine source based on current fallback state
-            source = EntropySource.CLASSICAL if self._in_fallback_mode else EntropySource.QUANTUM
-
-            # Consume from pool
-            result = self._pool[:count]
-            self._pool = self._pool[count:]
-            self._total_bytes_used += count
+        """
+        Draw bytes from the pool without ever waiting on I/O.
 
-            return result, source
+        A draw is QUANTUM only if every byte came from the quantum source.
+        If the ring is short, os.urandom() serves the draw instantly and
+        the prefetch task is woken.
+        """
+        start = time.perf_counter()
+        self._ensure_prefetch()
+
+        taken = self._take(count)
+        if taken is None:
+            self._pool_misses += 1
+            result, is_quantum = os.urandom(count), False
+        else:
+            result, is_quantum = taken
+
+        if self._fill < self.LOW_WATERMARK and self._refill_event is not None:
+            self._refill_event.set()
+
+        self._total_bytes_used += count
+        if is_quantum:
+            self._quantum_bytes_drawn += count
+        else:
+            self._classical_bytes_drawn += count
+        self._min_fill = min(self._min_fill, self._fill)
+        self._draw_latencies_us.append((time.perf_counter() - start) * 1e6)
+
+        source = EntropySource.QUANTUM if is_quantum else EntropySource.CLASSICAL
+        return result, source
 
     async def get_float(self) -> Tuple[float, EntropySource]:
         """
@@ -390,28 +502,53 @@ class QuantumRandomnessProvider:
         self._classical_fallbacks = 0
         self._total_bytes_used = 0
         self._last_error = None
+        self._quantum_bytes_drawn = 0
+        self._classical_bytes_drawn = 0
+        self._pool_misses = 0
+        self._min_fill = self._fill
+        self._draw_latencies_us.clear()
         # Note: Pool and fallback mode are preserved to maintain entropy availability
 
     def get_pool_status(self) -> Dict[str, Any]:
         """Get current status of the quantum entropy pool."""
         return {
-            "pool_size": len(self._pool),
+            "pool_size": self._fill,
             "max_pool_size": self.POOL_SIZE,
+            "fill_ratio": self._fill / self.POOL_SIZE,
+            "min_fill": self._min_fill,
             "low_watermark": self.LOW_WATERMARK,
             "in_fallback_mode": self._in_fallback_mode,
+            "prefetch_running": self._running,
             "quantum_fetches": self._quantum_fetches,
             "classical_fallbacks": self._classical_fallbacks,
+            "pool_misses": self._pool_misses,
             "total_bytes_used": self._total_bytes_used,
+            "quantum_bytes_drawn": self._quantum_bytes_drawn,
+            "classical_bytes_drawn": self._classical_bytes_drawn,
             "last_error": self._last_error,
-            "quantum_ratio": self._calculate_quantum_ratio()
+            "quantum_ratio": self._calculate_quantum_ratio(),
+            "draw_latency_us": self._draw_latency_stats()
         }
 
     def _calculate_quantum_ratio(self) -> float:
-        """Calculate the ratio of quantum to total entropy used."""
-        total = self._quantum_fetches + self._classical_fallbacks
+        """Calculate the ratio of quantum to total entropy bytes drawn."""
+        total = self._quantum_bytes_drawn + self._classical_bytes_drawn
         if total == 0:
             return 1.0  # No usage yet, assume quantum
-        return self._quantum_fetches / total
+        return self._quantum_bytes_drawn / total
+
+    def _draw_latency_stats(self) -> Dict[str, float]:
+        """Percentiles of recent draw latencies (microseconds)."""
+        if not self._draw_latencies_us:
+            return {"count": 0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+        ordered = sorted(self._draw_latencies_us)
+        n = len(ordered)
+        return {
+            "count": n,
+            "p50": round(ordered[n // 2], 2),
+            "p95": round(ordered[min(n - 1, int(n * 0.95))], 2),
+            "max": round(ordered[-1], 2)
+        }
 
 
 # Module-level singleton accessor
@@ -0,0 +1,297 @@
+"""
+Versioned read cache for hot Memory queries.
+
+Each cached result records the version of every node label it depends
+on. Mutations bump the versions of the labels they touch, so only the
+entries that read those labels go stale; everything else keeps hitting.
+
+Usage (on Memory methods):
+    @cached_query("Belief")
+    async def get_beliefs(self, ...): ...
+
+    @invalidates("Belief")
+    async def create_belief(self, ...): ...
+
+ALL_LABELS as a dependency means "any mutation invalidates this entry";
+as an invalidation it means "this write may touch any label".
+
+Writes that bypass the decorated methods are caught on the session path:
+Memory wraps its Neo4j driver in InvalidatingDriver, which bumps the
+labels a write query names (everything, if it touches unlabeled nodes)
+whenever a session runs one. A TTL bounds anything still missed.
+"""
+
+import copy
+import functools
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+ALL_LABELS = "*"
+
+# Clauses that can change the graph; raw queries without them are reads
+_WRITE_CLAUSE_RE = re.compile(r"\b(CREATE|MERGE|SET|DELETE|REMOVE|DROP)\b|\bCALL\s+apoc\.", re.IGNORECASE)
+
+
+# Node patterns: "(n)", "(n:Label {...})", "(:A:B)" - not function calls like count(n)
+_NODE_PATTERN_RE = re.compile(
+    r"(?<![\w.`])\(\s*([A-Za-z_]\w*)?\s*((?::\s*`?[A-Za-z_][\w`]*\s*)*)(?=[){])"
+)
+_SET_LABEL_RE = re.compile(r"\b(?:SET|REMOVE)\s+[A-Za-z_]\w*((?:\s*:\s*`?[A-Za-z_][\w`]*)+)", re.IGNORECASE)
+_LABEL_RE = re.compile(r":\s*`?([A-Za-z_]\w*)")
+
+
+def is_write_query(query: str) -> bool:
+    """True if a Cypher string may mutate the graph."""
+    return bool(_WRITE_CLAUSE_RE.search(query or ""))
+
+
+def write_labels(query: str) -> Tuple[str, ...]:
+    """
+    Labels a write query may touch; (ALL_LABELS,) when that can't be bounded.
+
+    Every node pattern must carry a label or reuse a variable bound with
+    one elsewhere in the query; an unlabeled node (MATCH (n) ... SET n...)
+    or a procedure call could touch anything.
+    """
+    if re.search(r"\bCALL\b", query, re.IGNORECASE):
+        return (ALL_LABELS,)
+    labels = set()
+    bound = set()
+    unlabeled = []
+    for match in _NODE_PATTERN_RE.finditer(query):
+        variable, label_part = match.group(1), match.group(2)
+        found = _LABEL_RE.findall(label_part or "")
+        if found:
+            labels.update(found)
+            if variable:
+                bound.add(variable)
+        else:
+            unlabeled.append(variable)
+    if any(variable is None or variable not in bound for variable in unlabeled):
+        return (ALL_LABELS,)
+    for match in _SET_LABEL_RE.finditer(query):
+        labels.update(_LABEL_RE.findall(match.group(1)))
+    return tuple(sorted(labels)) or (ALL_LABELS,)
+
+
+class QueryCache:
+    """Label-versioned result cache with LRU bound and TTL."""
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 30.0, enabled: bool = True):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+
+        self._versions: Dict[str, int] = {}
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Dict[str, int], float]]" = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+        self._stale = 0
+        self._invalidations: Dict[str, int] = {}
+        self._by_method: Dict[str, Dict[str, int]] = {}
+
+    def _snapshot(self, labels: Tuple[str, ...]) -> Dict[str, int]:
+        deps = set(labels)
+        if ALL_LABELS not in deps:
+            # Label-scoped entries still go stale on wildcard writes
+            deps.add("__wildcard__")
+        return {label: self._versions.get(label, 0) for label in deps}
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return (hit, value); value is a private copy."""
+        method = key[0] if isinstance(key, tuple) else str(key)
+        counters = self._by_method.setdefault(method, {"hits": 0, "misses": 0})
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, deps, expires_at = entry
+            fresh = time.monotonic() < expires_at and all(
+                self._versions.get(label, 0) == version for label, version in deps.items()
+            )
+            if fresh:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                counters["hits"] += 1
+                return True, copy.deepcopy(value)
+            del self._entries[key]
+            self._stale += 1
+
+        self._misses += 1
+        counters["misses"] += 1
+        return False, None
+
+    def begin(self, labels: Tuple[str, ...]) -> Dict[str, int]:
+        """Capture label versions before running the query."""
+        return self._snapshot(labels)
+
+    def put(self, key: Hashable, value: Any, deps: Dict[str, int]) -> None:
+        """
+        Store a result computed under the given version snapshot.
+
+        If a mutation landed while the query ran, the snapshot is already
+        outdated and the entry will simply miss on the next read.
+        """
+        self._entries[key] = (copy.deepcopy(value), deps, time.monotonic() + self.ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *labels: str) -> None:
+        """Bump label versions; entries reading them become stale."""
+        for label in labels:
+            if label == ALL_LABELS:
+                label = "__wildcard__"
+            self._versions[label] = self._versions.get(label, 0) + 1
+            self._invalidations[label] = self._invalidations.get(label, 0) + 1
+        # Entries that depend on every label
+        self._versions[ALL_LABELS] = self._versions.get(ALL_LABELS, 0) + 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    @property
+    def version(self) -> int:
+        """Counter bumped by every invalidation (a cheap "has anything changed")."""
+        return self._versions.get(ALL_LABELS, 0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        total = self._hits + self._misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self._hits,
+            "misses": self._misses,
+            "stale_evictions": self._stale,
+            "hit_rate_percent": round(self._hits / total * 100, 2) if total else 0.0,
+            "invalidations": {
+                ("*" if k == "__wildcard__" else k): v for k, v in self._invalidations.items()
+            },
+            "by_method": {m: dict(c) for m, c in self._by_method.items()},
+        }
+
+
+def _make_key(name: str, args: tuple, kwargs: dict) -> Optional[Hashable]:
+    try:
+        key = (name, args, tuple(sorted(kwargs.items())))
+        hash(key)
+        return key
+    except TypeError:
+        return None  # Unhashable arguments: don't cache
+
+
+def cached_query(*labels: str) -> Callable:
+    """Cache an async Memory read, keyed by method and arguments."""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            cache: Optional[QueryCache] = getattr(self, "_query_cache", None)
+            if cache is None or not cache.enabled:
+                return await func(self, *args, **kwargs)
+
+            key = _make_key(func.__name__, args, kwargs)
+            if key is None:
+                return await func(self, *args, **kwargs)
+
+            hit, value = cache.get(key)
+            if hit:
+                return value
+
+            deps = cache.begin(labels)
+            value = await func(self, *args, **kwargs)
+            cache.put(key, value, deps)
+            return value
+        return wrapper
+    return decorator
+
+
+def invalidates(*labels: str) -> Callable:
+    """Invalidate cached reads of these labels after an async Memory write."""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                return await func(self, *args, **kwargs)
+            finally:
+                cache: Optional[QueryCache] = getattr(self, "_query_cache", None)
+                if cache is not None:
+                    cache.invalidate(*labels)
+        return wrapper
+    return decorator
+
+
+def invalidates_on_write(func: Callable) -> Callable:
+    """For raw-Cypher helpers: invalidate everything only if the query writes."""
+    @functools.wraps(func)
+    async def wrapper(self, query: str, *args, **kwargs):
+        try:
+            return await func(self, query, *args, **kwargs)
+        finally:
+            cache: Optional[QueryCache] = getattr(self, "_query_cache", None)
+            if cache is not None and is_write_query(query):
+                cache.invalidate(ALL_LABELS)
+    return wrapper
+
+
+class _InvalidatingSession:
+    """Session proxy that invalidates the labels of every write it runs."""
+
+    def __init__(self, session: Any, cache: QueryCache):
+        self._session = session
+        self._cache = cache
+        self._written: set = set()
+
+    async def __aenter__(self) -> "_InvalidatingSession":
+        await self._session.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info) -> Any:
+        try:
+            return await self._session.__aexit__(*exc_info)
+        finally:
+            # Again after commit, so a read that ran mid-write cannot stay cached
+            if self._written:
+                self._cache.invalidate(*self._written)
+
+    async def run(self, query: str, *args, **kwargs) -> Any:
+        try:
+            return await self._session.run(query, *args, **kwargs)
+        finally:
+            if is_write_query(query):
+                labels = write_labels(query)
+                self._written.update(labels)
+                self._cache.invalidate(*labels)
+
+    async def execute_write(self, *args, **kwargs) -> Any:
+        try:
+            return await self._session.execute_write(*args, **kwargs)
+        finally:
+            self._written.add(ALL_LABELS)
+            self._cache.invalidate(ALL_LABELS)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+
+class InvalidatingDriver:
+    """
+    Neo4j async driver proxy: sessions invalidate the cache on writes.
+
+    Covers raw `memory.driver.session()` writes (server.py, byrd.py and
+    Memory methods without @invalidates) so cached reads and
+    Memory.graph_version() never miss a mutation made in this process.
+    """
+
+    def __init__(self, driver: Any, cache: QueryCache):
+        self._driver = driver
+        self._cache = cache
+
+    def session(self, *args, **kwargs) -> _InvalidatingSession:
+        return _InvalidatingSession(self._driver.session(*args, **kwargs), self._cache)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._driver, name)
@@ -0,0 +1,409 @@
+"""
+Adaptive rate limiting for LLM providers.
+
+Replaces the old process-wide fixed spacing (one call every N seconds)
+with a limiter per provider/model that enforces:
+- requests-per-minute and tokens-per-minute budgets (token buckets)
+- a concurrency cap
+- priority classes: interactive calls (voice, chat) are admitted
+  before queued background work (dreaming, enrichment)
+
+On a 429 the limiter halves its effective rate and honours Retry-After;
+each success recovers part of the rate (AIMD), so it settles just below
+whatever the provider actually allows.
+
+Usage:
+    limiter = get_rate_limiter().for_model("zai", "glm-4.7")
+    permit = await limiter.acquire(Priority.BACKGROUND, tokens=800)
+    try:
+        response = await client.post(...)
+    finally:
+        limiter.release(permit, status_code=response.status_code,
+                        retry_after=response.headers.get("retry-after"),
+                        tokens_used=usage_tokens)
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class Priority(IntEnum):
+    """Admission priority (lower value is served first)."""
+    INTERACTIVE = 0  # Voice, chat - a human is waiting
+    NORMAL = 1
+    BACKGROUND = 2   # Dreaming, enrichment, RSI
+
+
+@dataclass
+class RateBudget:
+    """Provider/model budget."""
+    requests_per_minute: float = 60.0
+    tokens_per_minute: float = 0.0  # 0 = no token budget
+    max_concurrency: int = 4
+    burst: int = 0                  # Request burst size (0 = rpm / 10)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], base: Optional["RateBudget"] = None) -> "RateBudget":
+        base = base or cls()
+        return cls(
+            requests_per_minute=config.get("requests_per_minute", base.requests_per_minute),
+            tokens_per_minute=config.get("tokens_per_minute", base.tokens_per_minute),
+            max_concurrency=config.get("max_concurrency", base.max_concurrency),
+            burst=config.get("burst", base.burst),
+        )
+
+
+@dataclass
+class Permit:
+    """Handle returned by acquire(); pass back to release()."""
+    priority: Priority
+    tokens: int
+    waited: float
+    released: bool = False
+
+
+@dataclass
+class LimiterMetrics:
+    """Wait-time and throttling metrics for one limiter."""
+    admitted: int = 0
+    throttled: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    wait_by_priority: Dict[str, float] = field(default_factory=dict)
+    admitted_by_priority: Dict[str, int] = field(default_factory=dict)
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """Retry-After header value in seconds (delta-seconds form only)."""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+class ProviderRateLimiter:
+    """Token-bucket + concurrency limiter for one provider/model."""
+
+    MIN_SCALE = 0.05       # Never throttle below 5% of the configured rate
+    DECREASE_FACTOR = 0.5  # Multiplicative decrease on 429
+    INCREASE_STEP = 0.05   # Additive increase per success
+    BASE_BACKOFF = 2.0     # Seconds, used when no Retry-After is given
+    MAX_BACKOFF = 90.0
+
+    def __init__(
+        self,
+        name: str,
+        budget: RateBudget,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.name = name
+        self.budget = budget
+        self._clock = clock
+
+        self._scale = 1.0
+        self._blocked_until = 0.0
+        self._consecutive_throttles = 0
+
+        now = clock()
+        self._request_tokens = float(self._request_capacity())
+        self._llm_tokens = float(budget.tokens_per_minute)
+        self._last_refill = now
+
+        self._in_flight = 0
+        self._queue: List[Tuple[int, int]] = []
+        self._seq = itertools.count()
+        self._cond = asyncio.Condition()
+
+        self.metrics = LimiterMetrics()
+
+    # ------------------------------------------------------------------
+    # Bucket arithmetic
+    # ------------------------------------------------------------------
+
+    def _effective_rpm(self) -> float:
+        return self.budget.requests_per_minute * self._scale
+
+    def _request_capacity(self) -> float:
+        burst = self.budget.burst or self.budget.requests_per_minute / 10
+        return max(1.0, burst * self._scale)
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._last_refill)
+        self._last_refill = now
+        self._request_tokens = min(
+            self._request_capacity(),
+            self._request_tokens + elapsed * self._effective_rpm() / 60
+        )
+        if self.budget.tokens_per_minute:
+            self._llm_tokens = min(
+                float(self.budget.tokens_per_minute),
+                self._llm_tokens + elapsed * self.budget.tokens_per_minute * self._scale / 60
+            )
+
+    def _delay_until_ready(self, tokens: int) -> Optional[float]:
+        """Seconds until a request of this size may start (None = wait for release)."""
+        now = self._clock()
+        self._refill(now)
+
+        if self._in_flight >= self.budget.max_concurrency:
+            return None
+
+        delay = max(0.0, self._blocked_until - now)
+
+        if self._request_tokens < 1:
+            delay = max(delay, (1 - self._request_tokens) * 60 / self._effective_rpm())
+
+        if self.budget.tokens_per_minute and tokens:
+            # A single oversized request may drain the whole bucket
+            needed = min(tokens, self.budget.tokens_per_minute)
+            if self._llm_tokens < needed:
+                rate = self.budget.tokens_per_minute * self._scale / 60
+                delay = max(delay, (needed - self._llm_tokens) / rate)
+
+        return delay
+
+    # ------------------------------------------------------------------
+    # Acquire / release
+    # ------------------------------------------------------------------
+
+    async def acquire(self, priority: Priority = Priority.NORMAL, tokens: int = 0) -> Permit:
+        """Wait for admission. Higher-priority waiters are admitted first."""
+        start = self._clock()
+        entry = (int(priority), next(self._seq))
+
+        async with self._cond:
+            heapq.heappush(self._queue, entry)
+            # A new head may need to preempt a lower-priority waiter's timer
+            self._cond.notify_all()
+            try:
+                while True:
+                    timeout = None
+                    if self._queue[0] == entry:
+                        timeout = self._delay_until_ready(tokens)
+                        if timeout is not None and timeout <= 0:
+                            break
+                    try:
+                        await asyncio.wait_for(self._cond.wait(), timeout=timeout)
+                    except asyncio.TimeoutError:
+                        pass
+            except BaseException:
+                self._queue.remove(entry)
+                heapq.heapify(self._queue)
+                self._cond.notify_all()
+                raise
+
+            heapq.heappop(self._queue)
+            self._request_tokens -= 1
+            if self.budget.tokens_per_minute and tokens:
+                self._llm_tokens -= min(tokens, self.budget.tokens_per_minute)
+            self._in_flight += 1
+            self._cond.notify_all()
+
+        waited = self._clock() - start
+        self._record_admission(priority, waited)
+        return Permit(priority=priority, tokens=tokens, waited=waited)
+
+    def release(
+        self,
+        permit: Permit,
+        status_code: Optional[int] = None,
+        retry_after: Any = None,
+        tokens_used: Optional[int] = None
+    ) -> None:
+        """
+        Return a permit and feed the response back into the limiter.
+
+        A 429 status (or an explicit retry_after) shrinks the rate and
+        blocks admission; any other completed response recovers rate.
+        """
+        if permit.released:
+            return
+        permit.released = True
+        self._in_flight = max(0, self._in_flight - 1)
+
+        # Settle the token estimate against real usage
+        if self.budget.tokens_per_minute and tokens_used is not None:
+            self._llm_tokens += min(permit.tokens, self.budget.tokens_per_minute) - tokens_used
+
+        if status_code == 429:
+            self._on_throttled(parse_retry_after(retry_after))
+        elif status_code is not None and status_code < 500:
+            self._consecutive_throttles = 0
+            self._scale = min(1.0, self._scale + self.INCREASE_STEP)
+
+        self._notify()
+
+    def _on_throttled(self, retry_after: Optional[float]) -> None:
+        self.metrics.throttled += 1
+        self._consecutive_throttles += 1
+        self._scale = max(self.MIN_SCALE, self._scale * self.DECREASE_FACTOR)
+        self._request_tokens = min(self._request_tokens, 0.0)
+        if retry_after is None:
+            retry_after = min(
+                self.MAX_BACKOFF,
+                self.BASE_BACKOFF * (2 ** (self._consecutive_throttles - 1))
+            )
+        self._blocked_until = max(self._blocked_until, self._clock() + retry_after)
+
+    def set_budget(self, budget: RateBudget) -> None:
+        """Apply a new budget in place, keeping the AIMD rate, cooldown and waiters."""
+        if budget == self.budget:
+            return
+        self._refill(self._clock())
+        had_token_budget = bool(self.budget.tokens_per_minute)
+        self.budget = budget
+        self._request_tokens = min(self._request_tokens, self._request_capacity())
+        if not had_token_budget:
+            self._llm_tokens = float(budget.tokens_per_minute)
+        else:
+            self._llm_tokens = min(self._llm_tokens, float(budget.tokens_per_minute))
+        self._notify()  # Waiters re-check against the new limits
+
+    def _notify(self) -> None:
+        async def _wake():
+            async with self._cond:
+                self._cond.notify_all()
+        try:
+            asyncio.get_running_loop().create_task(_wake())
+        except RuntimeError:
+            pass
+
+    def _record_admission(self, priority: Priority, waited: float) -> None:
+        m = self.metrics
+        m.admitted += 1
+        m.total_wait += waited
+        m.max_wait = max(m.max_wait, waited)
+        m.wait_by_priority[priority.name.lower()] = m.wait_by_priority.get(priority.name.lower(), 0.0) + waited
+        m.admitted_by_priority[priority.name.lower()] = m.admitted_by_priority.get(priority.name.lower(), 0) + 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth, throttling and wait-time metrics."""
+        m = self.metrics
+        depth: Dict[str, int] = {}
+        for prio, _ in self._queue:
+            name = Priority(prio).name.lower()
+            depth[name] = depth.get(name, 0) + 1
+        return {
+            "requests_per_minute": self.budget.requests_per_minute,
+            "effective_requests_per_minute": round(self._effective_rpm(), 2),
+            "tokens_per_minute": self.budget.tokens_per_minute,
+            "max_concurrency": self.budget.max_concurrency,
+            "in_flight": self._in_flight,
+            "queue_depth": len(self._queue),
+            "queue_depth_by_priority": depth,
+            "admitted": m.admitted,
+            "throttled": m.throttled,
+            "avg_wait_seconds": round(m.total_wait / m.admitted, 3) if m.admitted else 0.0,
+            "max_wait_seconds": round(m.max_wait, 3),
+            "avg_wait_by_priority": {
+                name: round(total / m.admitted_by_priority[name], 3)
+                for name, total in m.wait_by_priority.items()
+            },
+            "blocked_for_seconds": round(max(0.0, self._blocked_until - self._clock()), 2),
+        }
+
+
+class AdaptiveRateLimiter:
+    """
+    Registry of per-provider/model limiters.
+
+    Budgets resolve most-specific first: "provider/model", then
+    "provider", then "default".
+    """
+
+    # Used where config gives no budget (Z.AI coding plan: ~480 prompts/hour)
+    DEFAULT_BUDGETS = {
+        "default": {"requests_per_minute": 60, "max_concurrency": 4},
+        "zai": {"requests_per_minute": 8, "max_concurrency": 2},
+    }
+
+    DEFAULT_PRIORITIES = {
+        "voice": Priority.INTERACTIVE,
+        "chat": Priority.INTERACTIVE,
+        "interactive": Priority.INTERACTIVE,
+        "dreamer": Priority.BACKGROUND,
+        "graphiti": Priority.BACKGROUND,
+        "capability_evaluator": Priority.BACKGROUND,
+        "code_verifier": Priority.BACKGROUND,
+    }
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._limiters: Dict[str, ProviderRateLimiter] = {}
+        self._budgets: Dict[str, Dict[str, Any]] = {}
+        self._priorities: Dict[str, Priority] = dict(self.DEFAULT_PRIORITIES)
+        self.configure(config or {})
+
+    def configure(self, config: Dict[str, Any]) -> None:
+        """
+        Set budgets and component priorities.
+
+        Safe to call repeatedly (every create_llm_client does): existing
+        limiters keep their throttled rate, cooldown and queued waiters,
+        and only take the new budget if theirs changed.
+        """
+        self._budgets = {k: dict(v) for k, v in self.DEFAULT_BUDGETS.items()}
+        for key, value in config.items():
+            if key != "priorities" and isinstance(value, dict):
+                self._budgets.setdefault(key, {}).update(value)
+        for component, name in (config.get("priorities") or {}).items():
+            try:
+                self._priorities[component] = Priority[str(name).upper()]
+            except KeyError:
+                print(f"Warning: unknown rate limit priority '{name}' for {component}")
+        for key, limiter in self._limiters.items():
+            provider, _, model = key.partition("/")
+            limiter.set_budget(self.budget_for(provider, model or None))
+
+    def budget_for(self, provider: str, model: Optional[str] = None) -> RateBudget:
+        budget = RateBudget.from_config(self._budgets.get("default", {}))
+        if provider in self._budgets:
+            budget = RateBudget.from_config(self._budgets[provider], budget)
+        key = f"{provider}/{model}" if model else None
+        if key and key in self._budgets:
+            budget = RateBudget.from_config(self._budgets[key], budget)
+        return budget
+
+    def for_model(self, provider: str, model: Optional[str] = None) -> ProviderRateLimiter:
+        """Get (or create) the limiter for a provider/model pair."""
+        key = f"{provider}/{model}" if model else provider
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            limiter = ProviderRateLimiter(key, self.budget_for(provider, model), clock=self._clock)
+            self._limiters[key] = limiter
+        return limiter
+
+    def priority_for(self, component: Optional[str], priority: Any = None) -> Priority:
+        """Resolve a call's priority from an explicit value or its component."""
+        if priority is not None:
+            if isinstance(priority, Priority):
+                return priority
+            try:
+                return Priority[str(priority).upper()]
+            except KeyError:
+                pass
+        return self._priorities.get(component or "", Priority.NORMAL)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {key: limiter.get_stats() for key, limiter in self._limiters.items()}
+
+
+# Global limiter shared by all LLM clients
+_rate_limiter = AdaptiveRateLimiter()
+
+
+def get_rate_limiter() -> AdaptiveRateLimiter:
+    """Get the global adaptive rate limiter."""
+    return _rate_limiter
+
+
+def configure_rate_limits(config: Dict[str, Any]) -> None:
+    """Configure budgets/priorities on the global limiter."""
+    _rate_limiter.configure(config or {})
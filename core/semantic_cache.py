@@ -3,14 +3,26 @@ Semantic Cache for LLM Client
 
 Reduces redundant LLM calls through semantic similarity matching.
 Two-tier lookup: exact hash match + semantic similarity.
+
+The semantic tier keeps every cached embedding in one contiguous,
+pre-normalized matrix, so a lookup is a single matrix-vector product.
+Eviction (LRU or LFU) is O(1). An optional SQLite store keeps entries
+across process restarts (e.g. the os.execv in restart_server()).
 """
 
 import hashlib
+import json
+import logging
+import os
+import sqlite3
 import time
+from collections import OrderedDict
 from typing import Optional, Dict, Tuple, Any, List
 from dataclasses import dataclass, field
 import numpy as np
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class CacheEntry:
@@ -21,19 +33,158 @@ class CacheEntry:
     response: str
     timestamp: float
     hit_count: int = 0
-    
+    slot: int = -1  # Row in the embedding matrix (-1 = no embedding)
+
     def is_expired(self, ttl_seconds: float) -> bool:
         """Check if entry has expired."""
         return time.time() - self.timestamp > ttl_seconds
 
 
+@dataclass
+class ComponentStats:
+    """Per-caller cache metrics."""
+    queries: int = 0
+    exact_hits: int = 0
+    semantic_hits: int = 0
+    misses: int = 0
+    total_lookup_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        hits = self.exact_hits + self.semantic_hits
+        return {
+            "queries": self.queries,
+            "exact_hits": self.exact_hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "hit_rate_percent": round(hits / self.queries * 100, 2) if self.queries else 0.0,
+            "avg_lookup_ms": round(self.total_lookup_ms / self.queries, 3) if self.queries else 0.0,
+        }
+
+
+class _LFUOrder:
+    """
+    O(1) least-frequently-used ordering.
+
+    Keys live in per-frequency OrderedDicts; ties within a frequency are
+    broken by recency (oldest first).
+    """
+
+    def __init__(self):
+        self._freq: Dict[str, int] = {}
+        self._buckets: Dict[int, "OrderedDict[str, None]"] = {}
+        self._min_freq = 0
+
+    def add(self, key: str, freq: int = 1) -> None:
+        self._freq[key] = freq
+        self._buckets.setdefault(freq, OrderedDict())[key] = None
+        if len(self._freq) == 1 or freq < self._min_freq:
+            self._min_freq = freq
+
+    def touch(self, key: str) -> None:
+        freq = self._freq[key]
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min_freq == freq:
+                self._min_freq = freq + 1
+        self._freq[key] = freq + 1
+        self._buckets.setdefault(freq + 1, OrderedDict())[key] = None
+
+    def remove(self, key: str) -> None:
+        freq = self._freq.pop(key, None)
+        if freq is None:
+            return
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min_freq == freq and self._buckets:
+                self._min_freq = min(self._buckets)
+
+    def victim(self) -> Optional[str]:
+        bucket = self._buckets.get(self._min_freq)
+        if not bucket:
+            return None
+        return next(iter(bucket))
+
+    def clear(self) -> None:
+        self._freq.clear()
+        self._buckets.clear()
+        self._min_freq = 0
+
+
+class _SQLiteStore:
+    """Write-through on-disk copy of the cache."""
+
+    def __init__(self, path: str):
+        path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                query_hash TEXT PRIMARY KEY,
+                query_text TEXT NOT NULL,
+                response TEXT NOT NULL,
+                timestamp REAL NOT NULL,
+                hit_count INTEGER NOT NULL DEFAULT 0,
+                embedding BLOB
+            )
+        """)
+        self._conn.commit()
+
+    def load(self, min_timestamp: float, limit: int) -> List[Tuple]:
+        return self._conn.execute(
+            """
+            SELECT query_hash, query_text, response, timestamp, hit_count, embedding
+            FROM cache_entries WHERE timestamp >= ?
+            ORDER BY timestamp DESC LIMIT ?
+            """,
+            (min_timestamp, limit)
+        ).fetchall()
+
+    def put(self, entry: CacheEntry) -> None:
+        blob = (
+            entry.query_embedding.astype(np.float32).tobytes()
+            if entry.query_embedding is not None else None
+        )
+        self._conn.execute(
+            """
+            INSERT OR REPLACE INTO cache_entries
+            (query_hash, query_text, response, timestamp, hit_count, embedding)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (entry.query_hash, entry.query_text, entry.response,
+             entry.timestamp, entry.hit_count, blob)
+        )
+        self._conn.commit()
+
+    def delete(self, query_hash: str) -> None:
+        self._conn.execute("DELETE FROM cache_entries WHERE query_hash = ?", (query_hash,))
+        self._conn.commit()
+
+    def prune(self, min_timestamp: float) -> None:
+        self._conn.execute("DELETE FROM cache_entries WHERE timestamp < ?", (min_timestamp,))
+        self._conn.commit()
+
+    def clear(self) -> None:
+        self._conn.execute("DELETE FROM cache_entries")
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
 class SemanticCache:
     """
     Caches LLM responses with semantic similarity matching.
-    
+
     Two-tier lookup:
     1. Exact hash match (fast)
-    2. Semantic similarity match (if embedder available)
+    2. Semantic similarity match (if embedder available) - one
+       matrix-vector product over all cached embeddings
     """
 
     def __init__(
@@ -41,15 +192,29 @@ class SemanticCache:
         max_entries: int = 1000,
         ttl_seconds: float = 3600,  # 1 hour default
         similarity_threshold: float = 0.92,
-        embedder = None  # Optional sentence-transformers embedder
+        embedder = None,  # Optional sentence-transformers embedder
+        eviction_policy: str = "lru",  # "lru" or "lfu"
+        persist_path: Optional[str] = None  # SQLite file; None = memory only
     ):
+        if eviction_policy not in ("lru", "lfu"):
+            raise ValueError(f"Unknown eviction policy: {eviction_policy}")
+
         self.max_entries = max_entries
         self.ttl_seconds = ttl_seconds
         self.similarity_threshold = similarity_threshold
         self.embedder = embedder
+        self.eviction_policy = eviction_policy
+        self.persist_path = persist_path
+
+        # LRU order lives in the OrderedDict itself (oldest first)
+        self._hash_cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lfu = _LFUOrder() if eviction_policy == "lfu" else None
 
-        self._hash_cache: Dict[str, CacheEntry] = {}
-        self._semantic_index: Dict[str, CacheEntry] = {}  # For similarity lookup
+        # Semantic tier: normalized embeddings, one row per slot
+        self._matrix: Optional[np.ndarray] = None
+        self._timestamps = np.full(max_entries, -np.inf, dtype=np.float64)
+        self._slot_keys: List[Optional[str]] = [None] * max_entries
+        self._free_slots: List[int] = list(range(max_entries - 1, -1, -1))
 
         # Metrics
         self._hits = 0
@@ -57,21 +222,83 @@ class SemanticCache:
         self._semantic_hits = 0
         self._evictions = 0
         self._total_queries = 0
+        self._components: Dict[str, ComponentStats] = {}
+
+        self._store: Optional[_SQLiteStore] = None
+        if persist_path:
+            try:
+                self._store = _SQLiteStore(persist_path)
+                self._load_from_store()
+            except Exception as e:
+                logger.warning(f"Semantic cache persistence disabled ({persist_path}): {e}")
+                self._store = None
 
     def _hash_query(self, query: str) -> str:
         """Generate SHA256 hash of query."""
         return hashlib.sha256(query.encode()).hexdigest()
 
-    def _compute_similarity(self, embed1: np.ndarray, embed2: np.ndarray) -> float:
-        """Compute cosine similarity between two embeddings."""
-        dot_product = np.dot(embed1, embed2)
-        norm1 = np.linalg.norm(embed1)
-        norm2 = np.linalg.norm(embed2)
-        
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-        
-        return dot_product / (norm1 * norm2)
+    @staticmethod
+    def _normalize(embedding) -> Optional[np.ndarray]:
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        norm = np.linalg.norm(vector)
+        if vector.size == 0 or norm == 0:
+            return None
+        return vector / norm
+
+    def _encode(self, query: str) -> Optional[np.ndarray]:
+        if self.embedder is None:
+            return None
+        try:
+            return self._normalize(self.embedder.encode(query))
+        except Exception:
+            # Fail gracefully if embedding fails
+            return None
+
+    # ------------------------------------------------------------------
+    # Entry bookkeeping
+    # ------------------------------------------------------------------
+
+    def _insert(self, entry: CacheEntry) -> None:
+        if entry.query_embedding is not None and self._free_slots:
+            if self._matrix is None:
+                self._matrix = np.zeros(
+                    (self.max_entries, entry.query_embedding.size), dtype=np.float32
+                )
+            if entry.query_embedding.size == self._matrix.shape[1]:
+                slot = self._free_slots.pop()
+                self._matrix[slot] = entry.query_embedding
+                self._timestamps[slot] = entry.timestamp
+                self._slot_keys[slot] = entry.query_hash
+                entry.slot = slot
+
+        self._hash_cache[entry.query_hash] = entry
+        if self._lfu is not None:
+            self._lfu.add(entry.query_hash, entry.hit_count + 1)
+
+    def _remove(self, query_hash: str, persist: bool = True) -> Optional[CacheEntry]:
+        entry = self._hash_cache.pop(query_hash, None)
+        if entry is None:
+            return None
+        if entry.slot >= 0:
+            self._timestamps[entry.slot] = -np.inf
+            self._slot_keys[entry.slot] = None
+            self._free_slots.append(entry.slot)
+            entry.slot = -1
+        if self._lfu is not None:
+            self._lfu.remove(query_hash)
+        if persist and self._store is not None:
+            try:
+                self._store.delete(query_hash)
+            except Exception as e:
+                logger.debug(f"Cache store delete failed: {e}")
+        return entry
+
+    def _touch(self, entry: CacheEntry) -> None:
+        entry.hit_count += 1
+        if self._lfu is not None:
+            self._lfu.touch(entry.query_hash)
+        else:
+            self._hash_cache.move_to_end(entry.query_hash)
 
     def _evict_expired(self) -> int:
         """Remove expired entries, return count evicted."""
@@ -79,213 +306,132 @@ class SemanticCache:
             key for key, entry in self._hash_cache.items()
             if entry.is_expired(self.ttl_seconds)
         ]
-        
+
         for key in expired_keys:
-            entry = self._hash_cache.pop(key)
-            self._semantic_index.pop(key, None)
+            self._remove(key)
             self._evictions += 1
-        
+
         return len(expired_keys)
 
     def _evict_lru(self) -> None:
-        """Evict least recently used entry (lowest hit_count, oldest timestamp)."""
+        """Evict one entry per the eviction policy (O(1))."""
         if not self._hash_cache:
             return
-        
-        lru_key = min(
-            self._hash_cache.keys(),
-            key=lambda k: (self._hash_cache[k].hit_count, self._hash_cache[k].timestamp)
-        )
-        
-        entry = self._hash_cache.pop(lru_key)
-        self._semantic_index.pop(lru_key, None)
-        self._evictions += 1
 
-    def get(self, query: str) -> Optional[str]:
-        """
-        Retrieve cached response for query.
-        
-        Returns None if not found or expired.
-        """
+        if self._lfu is not None:
+            victim = self._lfu.victim()
+        else:
+            victim = next(iter(self._hash_cache))
+
+        if victim is not None:
+            self._remove(victim)
+            self._evictions += 1
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def _semantic_lookup(self, query: str) -> Optional[CacheEntry]:
+        """Top-1 match over all live embeddings in one product."""
+        if self._matrix is None or len(self._free_slots) == self.max_entries:
+            return None
+
+        query_embedding = self._encode(query)
+        if query_embedding is None or query_embedding.size != self._matrix.shape[1]:
+            return None
+
+        sims = self._matrix @ query_embedding
+        # Empty slots carry -inf timestamps, so the freshness mask excludes them too
+        sims[self._timestamps < time.time() - self.ttl_seconds] = -np.inf
+        best = int(np.argmax(sims))
+        if sims[best] < self.similarity_threshold:
+            return None
+
+        return self._hash_cache.get(self._slot_keys[best])
+
+    def _lookup(self, query: str, component: Optional[str]) -> Optional[Tuple[str, bool]]:
+        start = time.perf_counter()
         self._total_queries += 1
-        
-        # Tier 1: Exact hash match
-        query_hash = self._hash_query(query)
-        
-        if query_hash in self._hash_cache:
-            entry = self._hash_cache[query_hash]
-            
-            if entry.is_expired(self.ttl_seconds):
-                self._hash_cache.pop(query_hash)
-                self._semantic_index.pop(query_hash, None)
-                self._evictions += 1
-                self._misses += 1
-                return None
-            
-            entry.hit_count += 1
-            self._hits += 1
-            return entry.response
-        
-        # Tier 2: Semantic similarity match (if embedder available)
-        if self.embedder is not None and self._semantic_index:
-            try:
-                query_embedding = self.embedder.encode(query)
-                
-                for hash_key, entry in self._semantic_index.items():
-                    if entry.is_expired(self.ttl_seconds):
-                        continue
-                    
-                    if entry.query_embedding is not None:
-                        similarity = self._compute_similarity(
-                            query_embedding, 
-                            entry.query_embedding
-                        )
-                        
-                        if similarity >= self.similarity_threshold:
-                            entry.hit_count += 1
-                            self._semantic_hits += 1
-                            return entry.response
-            except Exception:
-                # Fail gracefully if embedding fails
-                pass
-        
-        self._misses += 1
-        return None
-
-    def get(self, query: str) -> Optional[str]:
+        stats = self._components.setdefault(component or "unknown", ComponentStats())
+        stats.queries += 1
+
+        try:
+            # Tier 1: Exact hash match
+            query_hash = self._hash_query(query)
+            entry = self._hash_cache.get(query_hash)
+
+            if entry is not None:
+                if entry.is_expired(self.ttl_seconds):
+                    self._remove(query_hash)
+                    self._evictions += 1
+                else:
+                    self._touch(entry)
+                    self._hits += 1
+                    stats.exact_hits += 1
+                    return (entry.response, False)
+
+            # Tier 2: Semantic similarity match (if embedder available)
+            entry = self._semantic_lookup(query)
+            if entry is not None:
+                self._touch(entry)
+                self._semantic_hits += 1
+                stats.semantic_hits += 1
+                return (entry.response, True)
+
+            self._misses += 1
+            stats.misses += 1
+            return None
+        finally:
+            stats.total_lookup_ms += (time.perf_counter() - start) * 1000
+
+    def get(self, query: str, component: Optional[str] = None) -> Optional[str]:
         """
         Retrieve cached response for query.
-        
+
         Returns None if not found or expired.
         """
-        self._total_queries += 1
-        
-        # Tier 1: Exact hash match
-        query_hash = self._hash_query(query)
-        
-        if query_hash in self._hash_cache:
-            entry = self._hash_cache[query_hash]
-            
-            if entry.is_expired(self.ttl_seconds):
-                self._hash_cache.pop(query_hash)
-                self._semantic_index.pop(query_hash, None)
-                self._evictions += 1
-                self._misses += 1
-                return None
-            
-            entry.hit_count += 1
-            self._hits += 1
-            return entry.response
-        
-        # Tier 2: Semantic similarity match (if embedder available)
-        if self.embedder is not None and self._semantic_index:
-            try:
-                query_embedding = self.embedder.encode(query)
-                
-                for hash_key, entry in self._semantic_index.items():
-                    if entry.is_expired(self.ttl_seconds):
-                        continue
-                    
-                    if entry.query_embedding is not None:
-                        similarity = self._compute_similarity(
-                            query_embedding, 
-                            entry.query_embedding
-                        )
-                        
-                        if similarity >= self.similarity_threshold:
-                            entry.hit_count += 1
-                            self._semantic_hits += 1
-                            return entry.response
-            except Exception:
-                # Fail gracefully if embedding fails
-                pass
-        
-        self._misses += 1
-        return None
-
-    def get_with_info(self, query: str) -> Optional[tuple]:
+        result = self._lookup(query, component)
+        return result[0] if result is not None else None
+
+    def get_with_info(self, query: str, component: Optional[str] = None) -> Optional[tuple]:
         """
         Retrieve cached response for query with metadata.
-        
+
         Returns (response_text, is_semantic_hit) tuple or None if not found/expired.
         """
-        self._total_queries += 1
-        
-        # Tier 1: Exact hash match
-        query_hash = self._hash_query(query)
-        
-        if query_hash in self._hash_cache:
-            entry = self._hash_cache[query_hash]
-            
-            if entry.is_expired(self.ttl_seconds):
-                self._hash_cache.pop(query_hash)
-                self._semantic_index.pop(query_hash, None)
-                self._evictions += 1
-                self._misses += 1
-                return None
-            
-            entry.hit_count += 1
-            self._hits += 1
-            return (entry.response, False)  # False = not a semantic hit (exact match)
-        
-        # Tier 2: Semantic similarity match (if embedder available)
-        if self.embedder is not None and self._semantic_index:
-            try:
-                query_embedding = self.embedder.encode(query)
-                
-                for hash_key, entry in self._semantic_index.items():
-                    if entry.is_expired(self.ttl_seconds):
-                        continue
-                    
-                    if entry.query_embedding is not None:
-                        similarity = self._compute_similarity(
-                            query_embedding, 
-                            entry.query_embedding
-                        )
-                        
-                        if similarity >= self.similarity_threshold:
-                            entry.hit_count += 1
-                            self._semantic_hits += 1
-                            return (entry.response, True)  # True = semantic hit
-            except Exception:
-                # Fail gracefully if embedding fails
-                pass
-        
-        self._misses += 1
-        return None
+        return self._lookup(query, component)
 
     def set(self, query: str, response: str) -> None:
         """
         Store query-response pair in cache.
         """
         query_hash = self._hash_query(query)
-        
-        # Compute embedding if embedder available
-        query_embedding = None
-        if self.embedder is not None:
-            try:
-                query_embedding = self.embedder.encode(query)
-            except Exception:
-                pass
-        
+        self._remove(query_hash, persist=False)
+
         entry = CacheEntry(
             query_hash=query_hash,
             query_text=query,
-            query_embedding=query_embedding,
+            query_embedding=self._encode(query),
             response=response,
             timestamp=time.time(),
             hit_count=0
         )
-        
+
         # Evict expired first
-        self._evict_expired()
-        
-        # Evict LRU if at capacity
         if len(self._hash_cache) >= self.max_entries:
+            self._evict_expired()
+
+        # Evict per policy if still at capacity
+        while len(self._hash_cache) >= self.max_entries:
             self._evict_lru()
-        
-        self._hash_cache[query_hash] = entry
-        self._semantic_index[query_hash] = entry
+
+        self._insert(entry)
+
+        if self._store is not None:
+            try:
+                self._store.put(entry)
+            except Exception as e:
+                logger.debug(f"Cache store write failed: {e}")
 
     def put(self, query: str, response: str) -> None:
         """
@@ -293,16 +439,54 @@ class SemanticCache:
         """
         self.set(query, response)
 
+    def _load_from_store(self) -> None:
+        """Warm the cache from disk, skipping expired rows."""
+        min_timestamp = time.time() - self.ttl_seconds
+        self._store.prune(min_timestamp)
+        rows = self._store.load(min_timestamp, self.max_entries)
+
+        # Oldest first so LRU order matches insertion order
+        for query_hash, query_text, response, timestamp, hit_count, blob in reversed(rows):
+            embedding = None
+            if blob:
+                embedding = np.frombuffer(blob, dtype=np.float32).copy()
+            elif self.embedder is not None:
+                embedding = self._encode(query_text)
+            self._insert(CacheEntry(
+                query_hash=query_hash,
+                query_text=query_text,
+                query_embedding=embedding,
+                response=response,
+                timestamp=timestamp,
+                hit_count=hit_count
+            ))
+
+        if rows:
+            logger.info(f"Semantic cache restored {len(rows)} entries from {self.persist_path}")
+
     def clear(self) -> None:
         """Clear all cache entries."""
         self._hash_cache.clear()
-        self._semantic_index.clear()
+        if self._lfu is not None:
+            self._lfu.clear()
+        self._matrix = None
+        self._timestamps.fill(-np.inf)
+        self._slot_keys = [None] * self.max_entries
+        self._free_slots = list(range(self.max_entries - 1, -1, -1))
+        if self._store is not None:
+            self._store.clear()
+
+    def close(self) -> None:
+        """Close the on-disk store (entries stay on disk for the next start)."""
+        if self._store is not None:
+            self._store.close()
+            self._store = None
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         total_hits = self._hits + self._semantic_hits
         hit_rate = (total_hits / self._total_queries * 100) if self._total_queries > 0 else 0.0
-        
+
         return {
             "total_queries": self._total_queries,
             "exact_hits": self._hits,
@@ -314,7 +498,12 @@ class SemanticCache:
             "max_entries": self.max_entries,
             "evictions": self._evictions,
             "ttl_seconds": self.ttl_seconds,
-            "similarity_threshold": self.similarity_threshold
+            "similarity_threshold": self.similarity_threshold,
+            "eviction_policy": self.eviction_policy,
+            "persistent": self._store is not None,
+            "components": {
+                name: stats.to_dict() for name, stats in self._components.items()
+            }
         }
 
     def __len__(self) -> int:
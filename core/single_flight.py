@@ -0,0 +1,62 @@
+"""
+Single-flight coalescing for concurrent identical async calls.
+
+When several callers ask for the same key while a call is already in
+flight, they all await that one call instead of issuing their own.
+Used by the LLM clients so byte-identical prompts fired at the same
+moment (before the first response reaches SemanticCache) are paid once.
+
+Usage:
+    flight = SingleFlight()
+    response = await flight.run(key, lambda: client._request(prompt))
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls that share a key."""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run factory() unless a call for key is already in flight.
+
+        The shared call runs as its own task, so cancelling one caller
+        does not cancel the result the others are waiting on.
+        """
+        self.calls += 1
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._finish(k, t))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every caller went away
+            task.exception()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._inflight)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters for deduplicated calls."""
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "upstream": self.calls - self.coalesced,
+            "coalesced_percent": round(self.coalesced / self.calls * 100, 2) if self.calls else 0.0,
+            "in_flight": self.in_flight,
+        }
@@ -0,0 +1,508 @@
+"""
+Incremental graph topology engine for /api/graph/topology.
+
+Keeps the visualized graph (nodes, edges, undirected adjacency) resident
+and maintains triangles and tetrahedra (3- and 4-cliques) as edges come
+and go, so a change costs time proportional to the neighbourhoods it
+touches rather than a full recomputation.
+
+Deltas arrive two ways:
+- sync(nodes, relationships): diff a fresh get_full_graph() result
+  against the resident graph and apply only what changed
+- on_event(event): node created / updated / forgotten events and
+  CONNECTION_CREATED edges are applied immediately, between resyncs
+
+The resident graph is fetched at the largest limit any request asked
+for; smaller requests are served from its prefix instead of refetching.
+
+Every applied change bumps `version`; derived results (chains,
+consolidation, the API response) are memoized per version, so a repeat
+request against an unchanged graph is a dictionary lookup.
+"""
+
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+EdgeKey = Tuple[str, str, str]  # (source_id, type, target_id)
+
+# Labels get_full_graph() returns, lower-cased as in its node dicts
+VISIBLE_NODE_TYPES = frozenset({
+    "experience", "belief", "desire", "reflection", "capability", "goal",
+    "operatingsystem", "ostemplate", "seed", "strategy", "constraint",
+    "crystal", "memorysummary", "document", "documentchunk",
+})
+
+# Typed creation events -> node type (NODE_CREATED carries data["node_type"])
+_CREATE_EVENTS = {
+    "experience_created": "experience",
+    "belief_created": "belief",
+    "desire_created": "desire",
+    "reflection_created": "reflection",
+    "goal_created": "goal",
+    "crystal_created": "crystal",
+    "node_created": None,
+}
+_UPDATE_EVENTS = frozenset({"node_updated", "node_modified", "belief_updated"})
+_DELETE_EVENTS = frozenset({"memory_forgotten"})
+
+# Event fields that map onto get_full_graph() node fields
+_NODE_FIELDS = ("confidence", "intensity", "status", "quantum_seed")
+_CONTENT_FIELDS = ("content", "essence", "description", "name")
+
+
+class TopologyEngine:
+    """Resident graph with incrementally maintained cliques."""
+
+    def __init__(self, min_resync_seconds: float = 5.0, max_staleness_seconds: float = 60.0,
+                 max_memo_entries: int = 32):
+        self.min_resync_seconds = min_resync_seconds
+        self.max_staleness_seconds = max_staleness_seconds
+        self.max_memo_entries = max_memo_entries
+
+        self._nodes: Dict[str, Dict[str, Any]] = {}
+        self._edges: Dict[EdgeKey, Dict[str, Any]] = {}
+        self._out: Dict[str, Dict[EdgeKey, None]] = defaultdict(dict)  # ordered per source
+        self._in: Dict[str, Dict[EdgeKey, None]] = defaultdict(dict)
+        self._pair_count: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._adjacency: Dict[str, Set[str]] = defaultdict(set)
+
+        self._triangles: Set[Tuple[str, ...]] = set()
+        self._tetrahedra: Set[Tuple[str, ...]] = set()
+        self._tri_by_node: Dict[str, Set[Tuple[str, ...]]] = defaultdict(set)
+        self._tetra_by_node: Dict[str, Set[Tuple[str, ...]]] = defaultdict(set)
+
+        self.version = 0
+        self._memo: Dict[Hashable, Any] = {}
+        self._memo_version = 0
+
+        self._synced_source_version: Optional[Any] = None
+        self._synced_fetch_limit: Optional[int] = None
+        self._synced_at = 0.0
+
+        self.syncs = 0
+        self.event_deltas = 0
+        self.memo_hits = 0
+        self.memo_misses = 0
+        self.last_sync_delta = 0
+
+    # ------------------------------------------------------------------
+    # Sync decisions
+    # ------------------------------------------------------------------
+
+    def needs_sync(self, source_version: Any, fetch_limit: int) -> bool:
+        """
+        True if the resident graph should be refreshed from the database.
+
+        A fetch_limit above the largest one synced so far always refreshes;
+        a smaller one is served from the resident graph. Changed source
+        version: at most once per min_resync_seconds (node and edge events
+        keep the graph current meanwhile). Unchanged: only after
+        max_staleness_seconds, to pick up writes made by other processes.
+        """
+        if self._synced_source_version is None or fetch_limit > (self._synced_fetch_limit or 0):
+            return True
+        age = time.monotonic() - self._synced_at
+        if source_version == self._synced_source_version:
+            return age >= self.max_staleness_seconds
+        return age >= self.min_resync_seconds
+
+    def fetch_limit(self, requested: int) -> int:
+        """Limit to fetch with: never below the largest limit already synced."""
+        return max(requested, self._synced_fetch_limit or 0)
+
+    def sync(
+        self,
+        nodes: List[Dict[str, Any]],
+        relationships: List[Dict[str, Any]],
+        source_version: Any = None,
+        fetch_limit: Optional[int] = None
+    ) -> int:
+        """
+        Reconcile with a full graph fetch, applying only the differences.
+
+        Returns the number of node/edge changes applied.
+        """
+        changes = 0
+        incoming = {n["id"]: n for n in nodes if n.get("id")}
+
+        incoming_edges: Dict[EdgeKey, Dict[str, Any]] = {}
+        for rel in relationships:
+            src = rel.get("source_id") or rel.get("source")
+            tgt = rel.get("target_id") or rel.get("target")
+            if src and tgt:
+                incoming_edges[(src, rel.get("type", "RELATES_TO"), tgt)] = rel
+
+        for key in [k for k in self._edges if k not in incoming_edges]:
+            self._remove_edge(key)
+            changes += 1
+        for node_id in [n for n in self._nodes if n not in incoming]:
+            self._remove_node(node_id)
+            changes += 1
+
+        # Rebuild the node dict in fetch order; only changed payloads count
+        previous = self._nodes
+        self._nodes = incoming
+        changes += sum(1 for node_id, node in incoming.items() if previous.get(node_id) != node)
+
+        for key, rel in incoming_edges.items():
+            if key not in self._edges:
+                changes += self._add_edge(key, rel)
+            elif self._edges[key].get("id") != rel.get("id"):
+                self._edges[key] = rel  # Replace an event-made edge with the stored one
+
+        self._synced_source_version = source_version
+        if fetch_limit is not None:
+            self._synced_fetch_limit = max(fetch_limit, self._synced_fetch_limit or 0)
+        self._synced_at = time.monotonic()
+        self.syncs += 1
+        self.last_sync_delta = changes
+        if changes:
+            self.version += 1
+        return changes
+
+    def on_event(self, event) -> None:
+        """EventBus subscriber: apply node and connection changes as they happen."""
+        event_type = getattr(event.type, "value", event.type)
+        data = event.data or {}
+        applied = False
+        if event_type == "connection_created":
+            src, tgt = data.get("from_id"), data.get("to_id")
+            rel_type = data.get("relationship") or "RELATES_TO"
+            applied = bool(src and tgt) and self.add_edge(src, tgt, rel_type)
+        elif event_type in _CREATE_EVENTS:
+            node_type = _CREATE_EVENTS[event_type] or str(data.get("node_type") or "").lower()
+            applied = self.add_node(_node_from_event(data, node_type, getattr(event, "timestamp", None)))
+        elif event_type in _UPDATE_EVENTS:
+            applied = self.update_node(data.get("id") or data.get("belief_id"), _fields_from_event(data))
+        elif event_type in _DELETE_EVENTS:
+            applied = self.remove_node(data.get("node_id") or data.get("id"))
+        if applied:
+            self.event_deltas += 1
+
+    # ------------------------------------------------------------------
+    # Public delta API
+    # ------------------------------------------------------------------
+
+    def add_node(self, node: Dict[str, Any]) -> bool:
+        """Add a visualized node; returns False if ignored or already resident."""
+        node_id = node.get("id")
+        if not node_id or node_id in self._nodes or node.get("type") not in VISIBLE_NODE_TYPES:
+            return False
+        self._nodes[node_id] = node
+        self.version += 1
+        return True
+
+    def update_node(self, node_id: Optional[str], fields: Dict[str, Any]) -> bool:
+        """Merge changed fields into a resident node."""
+        node = self._nodes.get(node_id) if node_id else None
+        if node is None:
+            return False
+        changed = {k: v for k, v in fields.items() if node.get(k) != v}
+        if not changed:
+            return False
+        # Replace rather than mutate: memoized responses hold the old dict
+        self._nodes[node_id] = {**node, **changed}
+        self.version += 1
+        return True
+
+    def remove_node(self, node_id: Optional[str]) -> bool:
+        """Remove a resident node and its edges."""
+        if not node_id or node_id not in self._nodes:
+            return False
+        self._remove_node(node_id)
+        self.version += 1
+        return True
+
+    def add_edge(self, source_id: str, target_id: str, rel_type: str = "RELATES_TO",
+                 rel_id: Optional[str] = None) -> bool:
+        """Add an edge between resident nodes; returns False if ignored."""
+        key = (source_id, rel_type, target_id)
+        if key in self._edges or source_id not in self._nodes or target_id not in self._nodes:
+            return False
+        self._add_edge(key, {
+            "id": rel_id or f"{source_id}:{rel_type}:{target_id}",
+            "type": rel_type,
+            "source_id": source_id,
+            "target_id": target_id,
+        })
+        self.version += 1
+        return True
+
+    def remove_edge(self, source_id: str, target_id: str, rel_type: str = "RELATES_TO") -> bool:
+        key = (source_id, rel_type, target_id)
+        if key not in self._edges:
+            return False
+        self._remove_edge(key)
+        self.version += 1
+        return True
+
+    # ------------------------------------------------------------------
+    # Incremental maintenance
+    # ------------------------------------------------------------------
+
+    def _add_edge(self, key: EdgeKey, rel: Dict[str, Any]) -> int:
+        src, _, tgt = key
+        if src not in self._nodes or tgt not in self._nodes:
+            return 0
+        self._edges[key] = rel
+        self._out[src][key] = None
+        self._in[tgt][key] = None
+        if src != tgt:
+            pair = (src, tgt) if src < tgt else (tgt, src)
+            self._pair_count[pair] += 1
+            if self._pair_count[pair] == 1:
+                self._link(src, tgt)
+        return 1
+
+    def _remove_edge(self, key: EdgeKey) -> None:
+        src, _, tgt = key
+        del self._edges[key]
+        self._out[src].pop(key, None)
+        if not self._out[src]:
+            del self._out[src]
+        self._in[tgt].pop(key, None)
+        if not self._in[tgt]:
+            del self._in[tgt]
+        if src != tgt:
+            pair = (src, tgt) if src < tgt else (tgt, src)
+            self._pair_count[pair] -= 1
+            if self._pair_count[pair] <= 0:
+                del self._pair_count[pair]
+                self._unlink(src, tgt)
+
+    def _remove_node(self, node_id: str) -> None:
+        for key in list(self._out.get(node_id, ())) + list(self._in.get(node_id, ())):
+            if key in self._edges:
+                self._remove_edge(key)
+        self._nodes.pop(node_id, None)
+        self._adjacency.pop(node_id, None)
+
+    def _link(self, u: str, v: str) -> None:
+        """New undirected adjacency u-v: add the cliques it completes."""
+        common = self._adjacency[u] & self._adjacency[v]
+        self._adjacency[u].add(v)
+        self._adjacency[v].add(u)
+        for w in common:
+            self._add_clique(tuple(sorted((u, v, w))), self._triangles, self._tri_by_node)
+        for w in common:
+            for x in self._adjacency[w] & common:
+                if w < x:
+                    self._add_clique(tuple(sorted((u, v, w, x))), self._tetrahedra, self._tetra_by_node)
+
+    def _unlink(self, u: str, v: str) -> None:
+        """Removed undirected adjacency u-v: drop every clique containing both."""
+        self._adjacency[u].discard(v)
+        self._adjacency[v].discard(u)
+        for store, index in ((self._triangles, self._tri_by_node), (self._tetrahedra, self._tetra_by_node)):
+            for clique in [c for c in index.get(u, ()) if v in c]:
+                store.discard(clique)
+                for member in clique:
+                    index[member].discard(clique)
+                    if not index[member]:
+                        del index[member]
+
+    @staticmethod
+    def _add_clique(clique: Tuple[str, ...], store: Set, index: Dict[str, Set]) -> None:
+        if clique not in store:
+            store.add(clique)
+            for member in clique:
+                index[member].add(clique)
+
+    # ------------------------------------------------------------------
+    # Derived views (memoized per version)
+    # ------------------------------------------------------------------
+
+    def memo(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """Return build() cached for the current graph version."""
+        if self._memo_version != self.version:
+            self._memo.clear()
+            self._memo_version = self.version
+        if key in self._memo:
+            self.memo_hits += 1
+            return self._memo[key]
+        self.memo_misses += 1
+        if len(self._memo) >= self.max_memo_entries:
+            self._memo.pop(next(iter(self._memo)))
+        value = self._memo[key] = build()
+        return value
+
+    @property
+    def nodes(self) -> List[Dict[str, Any]]:
+        return list(self._nodes.values())
+
+    @property
+    def relationships(self) -> List[Dict[str, Any]]:
+        return list(self._edges.values())
+
+    def subgraph(self, limit: int) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        The first `limit` resident nodes (fetch order) and the edges among them.
+
+        What get_full_graph(limit) would return when the resident graph
+        was fetched with a larger limit.
+        """
+        if len(self._nodes) <= limit:
+            return self.nodes, self.relationships
+        nodes = self.nodes[:limit]
+        node_ids = {n["id"] for n in nodes}
+        return nodes, [rel for (src, _, tgt), rel in self._edges.items() if src in node_ids and tgt in node_ids]
+
+    def cliques(self, node_ids: Optional[Set[str]] = None) -> Tuple[List[List[str]], List[List[str]]]:
+        """Triangles and tetrahedra, optionally restricted to a node subset."""
+        if node_ids is None or len(node_ids) == len(self._nodes):
+            return [list(t) for t in self._triangles], [list(t) for t in self._tetrahedra]
+        return (
+            [list(t) for t in self._triangles if node_ids.issuperset(t)],
+            [list(t) for t in self._tetrahedra if node_ids.issuperset(t)],
+        )
+
+    def chains(self, node_ids: Iterable[str], max_starts: int = 100, max_length: int = 10) -> List[Dict[str, Any]]:
+        """Directed relationship paths of length 4+ from low in-degree nodes."""
+        node_ids = set(node_ids)
+        # Resident (fetch) order keeps results deterministic
+        starts = [n for n in self._nodes if n in node_ids and len(self._in.get(n, ())) <= 1 and self._out.get(n)]
+        chains = []
+        seen = set()
+        for start in starts[:max_starts]:
+            chain = [start]
+            chain_types = []
+            current = start
+            while current in self._out and len(chain) < max_length:
+                next_node = None
+                for _, rel_type, target in self._out[current]:
+                    if target in node_ids and target not in chain:
+                        next_node = target
+                        chain_types.append(rel_type)
+                        break
+                if next_node is None:
+                    break
+                chain.append(next_node)
+                current = next_node
+            if len(chain) >= 4 and tuple(chain) not in seen:
+                seen.add(tuple(chain))
+                chains.append({"node_ids": chain, "relationship_types": chain_types, "length": len(chain)})
+        return chains
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "nodes": len(self._nodes),
+            "edges": len(self._edges),
+            "triangles": len(self._triangles),
+            "tetrahedra": len(self._tetrahedra),
+            "syncs": self.syncs,
+            "last_sync_delta": self.last_sync_delta,
+            "event_deltas": self.event_deltas,
+            "memo_hits": self.memo_hits,
+            "memo_misses": self.memo_misses,
+        }
+
+
+def _fields_from_event(data: Dict[str, Any]) -> Dict[str, Any]:
+    fields = {k: data[k] for k in _NODE_FIELDS if data.get(k) is not None}
+    content = next((data[k] for k in _CONTENT_FIELDS if data.get(k)), None)
+    if content is not None:
+        fields["content"] = content
+    if data.get("type") and data.get("type") != data.get("node_type"):
+        fields["subtype"] = data["type"]
+    return fields
+
+
+def _node_from_event(data: Dict[str, Any], node_type: str, timestamp: Optional[datetime]) -> Dict[str, Any]:
+    """A node dict shaped like get_full_graph()'s from a creation event payload."""
+    node = {
+        "id": data.get("id"),
+        "type": node_type,
+        "content": "",
+        "subtype": None,
+        "confidence": None,
+        "intensity": None,
+        "status": None,
+        "created_at": timestamp.isoformat() if timestamp else None,
+        "access_count": 0,
+        "last_accessed": None,
+        "quantum_seed": None,
+        "absorbed": False,
+    }
+    node.update(_fields_from_event(data))
+    return node
+
+
+def consolidate_by_day(nodes: List[Dict[str, Any]], limit: int) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Temporal consolidation for large graphs.
+
+    Nodes older than a week are grouped by day into meta-node dicts
+    (buckets of 3+); the rest are kept, trimmed to `limit` by importance
+    and recency. Returns (kept_nodes, meta_nodes).
+    """
+    now = datetime.now()
+    recent = []
+    day_buckets = defaultdict(list)
+
+    for node in nodes:
+        timestamp = node.get("created_at") or node.get("timestamp")
+        if timestamp:
+            try:
+                if isinstance(timestamp, str):
+                    ts = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+                else:
+                    ts = timestamp
+                age_days = (now - ts.replace(tzinfo=None)).days
+                if age_days < 7:
+                    recent.append(node)
+                else:
+                    day_buckets[ts.strftime("%Y-%m-%d")].append(node)
+            except (ValueError, TypeError, AttributeError):
+                recent.append(node)
+        else:
+            recent.append(node)
+
+    meta_nodes = []
+    for day_key, day_nodes in day_buckets.items():
+        if len(day_nodes) >= 3:  # Only consolidate if 3+ nodes
+            type_counts = defaultdict(int)
+            for n in day_nodes:
+                type_counts[n.get("type", "unknown")] += 1
+            meta_nodes.append({
+                "id": f"meta_{day_key}",
+                "label": f"{day_key} ({len(day_nodes)} memories)",
+                "constituent_ids": [n["id"] for n in day_nodes],
+                "constituent_count": len(day_nodes),
+                "timestamp_range": {"start": day_key, "end": day_key},
+                "dominant_type": max(type_counts, key=type_counts.get),
+            })
+        else:
+            recent.extend(day_nodes)
+
+    if len(recent) > limit:
+        recent.sort(key=lambda n: (n.get("importance", 0.5), n.get("created_at") or ""), reverse=True)
+        recent = recent[:limit]
+
+    return recent, meta_nodes
+
+
+# Global instance
+_topology_engine: Optional[TopologyEngine] = None
+
+
+def get_topology_engine() -> TopologyEngine:
+    """Get the global topology engine."""
+    global _topology_engine
+    if _topology_engine is None:
+        _topology_engine = TopologyEngine()
+    return _topology_engine
+
+
+def configure_topology_engine(config: Optional[Dict] = None) -> TopologyEngine:
+    """Create the global topology engine from the `graph_algorithms.topology` config."""
+    global _topology_engine
+    config = config or {}
+    _topology_engine = TopologyEngine(
+        min_resync_seconds=float(config.get("min_resync_seconds", 5.0)),
+        max_staleness_seconds=float(config.get("max_staleness_seconds", 60.0)),
+        max_memo_entries=int(config.get("max_memo_entries", 32)),
+    )
+    return _topology_engine
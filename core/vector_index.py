@@ -0,0 +1,403 @@
+"""
+In-Process Vector Index for Memory
+
+Keeps node embeddings in contiguous NumPy matrices (one per node label) so
+similarity search is a single matrix product instead of a per-node Python
+loop over Bolt results.
+
+Two search modes per label:
+1. Flat (exact) - one normalized matrix, top-k via argpartition
+2. IVF (approximate) - k-means coarse partitions, probes the nprobe
+   nearest partitions; trained automatically once a label grows past
+   ivf_threshold rows
+
+The index is updated in place as nodes gain, change or lose embeddings,
+so Memory only has to load each label from Neo4j once.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class VectorHit:
+    """A single search result."""
+    node_id: str
+    label: str
+    similarity: float
+    content: Any = None
+    labels: Optional[List[str]] = None
+
+
+class _LabelMatrix:
+    """
+    Growable, normalized embedding matrix for one node label.
+
+    Rows are kept dense: removal swaps the last row into the freed slot,
+    so upsert and remove are both O(d).
+    """
+
+    def __init__(self, label: str, dim: int, initial_capacity: int = 256):
+        self.label = label
+        self.dim = dim
+        self.matrix = np.zeros((initial_capacity, dim), dtype=np.float32)
+        self.count = 0
+        self.ids: List[str] = []
+        self.row_of: Dict[str, int] = {}
+        self.contents: List[Any] = []
+        self.node_labels: List[Optional[List[str]]] = []
+
+        # IVF state (None until trained)
+        self.centroids: Optional[np.ndarray] = None
+        self.assign = np.zeros(initial_capacity, dtype=np.int32)
+        self.trained_at_count = 0
+
+    def _grow(self) -> None:
+        new_capacity = max(16, self.matrix.shape[0] * 2)
+        matrix = np.zeros((new_capacity, self.dim), dtype=np.float32)
+        matrix[:self.count] = self.matrix[:self.count]
+        self.matrix = matrix
+        assign = np.zeros(new_capacity, dtype=np.int32)
+        assign[:self.count] = self.assign[:self.count]
+        self.assign = assign
+
+    def _nearest_centroid(self, vector: np.ndarray) -> int:
+        return int(np.argmax(self.centroids @ vector))
+
+    def upsert(
+        self,
+        node_id: str,
+        vector: np.ndarray,
+        content: Any,
+        labels: Optional[List[str]]
+    ) -> None:
+        row = self.row_of.get(node_id)
+        if row is None:
+            if self.count >= self.matrix.shape[0]:
+                self._grow()
+            row = self.count
+            self.count += 1
+            self.ids.append(node_id)
+            self.contents.append(content)
+            self.node_labels.append(labels)
+            self.row_of[node_id] = row
+        else:
+            self.contents[row] = content
+            self.node_labels[row] = labels
+
+        self.matrix[row] = vector
+        if self.centroids is not None:
+            self.assign[row] = self._nearest_centroid(vector)
+
+    def remove(self, node_id: str) -> bool:
+        row = self.row_of.pop(node_id, None)
+        if row is None:
+            return False
+
+        last = self.count - 1
+        if row != last:
+            moved_id = self.ids[last]
+            self.matrix[row] = self.matrix[last]
+            self.assign[row] = self.assign[last]
+            self.ids[row] = moved_id
+            self.contents[row] = self.contents[last]
+            self.node_labels[row] = self.node_labels[last]
+            self.row_of[moved_id] = row
+
+        self.ids.pop()
+        self.contents.pop()
+        self.node_labels.pop()
+        self.count = last
+        return True
+
+    def train(self, nlist: int, iterations: int = 10, sample_size: int = 65536) -> None:
+        """Train IVF centroids with spherical k-means on a sample of rows."""
+        active = self.matrix[:self.count]
+        nlist = max(1, min(nlist, self.count))
+        rng = np.random.default_rng(0)
+
+        if self.count > sample_size:
+            sample = active[rng.choice(self.count, sample_size, replace=False)]
+        else:
+            sample = active
+
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+        for _ in range(iterations):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            for c in range(nlist):
+                members = sample[assignment == c]
+                if len(members):
+                    centroid = members.sum(axis=0)
+                    norm = np.linalg.norm(centroid)
+                    if norm > 0:
+                        centroids[c] = centroid / norm
+
+        self.centroids = centroids.astype(np.float32)
+        # Assign every row in blocks to bound peak memory
+        for start in range(0, self.count, 65536):
+            end = min(start + 65536, self.count)
+            self.assign[start:end] = np.argmax(active[start:end] @ self.centroids.T, axis=1)
+        self.trained_at_count = self.count
+
+    def candidate_rows(self, query: np.ndarray, nprobe: int) -> Optional[np.ndarray]:
+        """Rows in the nprobe nearest partitions, or None for a flat scan."""
+        if self.centroids is None:
+            return None
+        nprobe = min(nprobe, len(self.centroids))
+        probes = np.argpartition(-(self.centroids @ query), nprobe - 1)[:nprobe]
+        return np.flatnonzero(np.isin(self.assign[:self.count], probes))
+
+
+class VectorIndex:
+    """
+    Per-label embedding index with batched top-k cosine search.
+
+    Usage:
+        index = VectorIndex()
+        index.upsert("Belief", "b1", embedding, content="...")
+        hits = index.search(query_embedding, k=10, min_similarity=0.5)
+    """
+
+    def __init__(
+        self,
+        ivf_threshold: int = 50000,
+        nprobe: int = 8,
+        block_size: int = 65536
+    ):
+        self.ivf_threshold = ivf_threshold
+        self.nprobe = nprobe
+        self.block_size = block_size
+
+        self._labels: Dict[str, _LabelMatrix] = {}
+        self._label_of: Dict[str, str] = {}  # node_id -> label
+        self.loaded_labels: set = set()  # Labels fully loaded from the backing store
+
+        # Metrics
+        self._searches = 0
+        self._upserts = 0
+        self._removals = 0
+        self._trainings = 0
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> Optional[np.ndarray]:
+        arr = np.asarray(vector, dtype=np.float32).reshape(-1)
+        norm = np.linalg.norm(arr)
+        if arr.size == 0 or norm == 0 or not np.isfinite(norm):
+            return None
+        return arr / norm
+
+    def upsert(
+        self,
+        label: str,
+        node_id: str,
+        embedding: Optional[Sequence[float]],
+        content: Any = None,
+        labels: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Insert or replace a node's embedding.
+
+        A None/empty embedding removes the node. Returns True if the node
+        is indexed afterwards.
+        """
+        if embedding is None:
+            self.remove(node_id)
+            return False
+
+        vector = self._normalize(embedding)
+        if vector is None:
+            self.remove(node_id)
+            return False
+
+        previous_label = self._label_of.get(node_id)
+        if previous_label is not None and previous_label != label:
+            self.remove(node_id)
+
+        matrix = self._labels.get(label)
+        if matrix is None:
+            matrix = _LabelMatrix(label, vector.size)
+            self._labels[label] = matrix
+        elif matrix.dim != vector.size:
+            # Mixed-dimension embeddings can't share a matrix; treat as unindexed
+            logger.debug(
+                f"Skipping {node_id}: dim {vector.size} != {label} index dim {matrix.dim}"
+            )
+            self.remove(node_id)
+            return False
+
+        matrix.upsert(node_id, vector, content, labels)
+        self._label_of[node_id] = label
+        self._upserts += 1
+        self._maybe_train(matrix)
+        return True
+
+    def remove(self, node_id: str) -> bool:
+        """Remove a node from the index. Returns True if it was present."""
+        label = self._label_of.pop(node_id, None)
+        if label is None:
+            return False
+        removed = self._labels[label].remove(node_id)
+        if removed:
+            self._removals += 1
+        return removed
+
+    def contains(self, node_id: str) -> bool:
+        return node_id in self._label_of
+
+    def clear(self) -> None:
+        """Drop all vectors and forget which labels were loaded."""
+        self._labels.clear()
+        self._label_of.clear()
+        self.loaded_labels.clear()
+
+    def _maybe_train(self, matrix: _LabelMatrix) -> None:
+        """Train IVF at the threshold and retrain whenever the label doubles."""
+        if matrix.count < self.ivf_threshold:
+            return
+        if matrix.centroids is not None and matrix.count < 2 * matrix.trained_at_count:
+            return
+        nlist = int(np.sqrt(matrix.count))
+        matrix.train(nlist)
+        self._trainings += 1
+        logger.info(f"Trained IVF for {matrix.label}: {matrix.count} rows, {nlist} lists")
+
+    def _search_label(
+        self,
+        matrix: _LabelMatrix,
+        queries: np.ndarray,
+        k: int,
+        min_similarity: float,
+        exact: bool
+    ) -> List[List[Tuple[float, int]]]:
+        """Top-k (similarity, row) pairs for each query within one label."""
+        results: List[List[Tuple[float, int]]] = [[] for _ in range(len(queries))]
+        if matrix.count == 0:
+            return results
+
+        active = matrix.matrix[:matrix.count]
+
+        if exact or matrix.centroids is None:
+            # Flat scan in row blocks; queries batched into one GEMM per block
+            for start in range(0, matrix.count, self.block_size):
+                end = min(start + self.block_size, matrix.count)
+                sims = queries @ active[start:end].T
+                kk = min(k, end - start)
+                top = np.argpartition(-sims, kk - 1, axis=1)[:, :kk]
+                for qi in range(len(queries)):
+                    for row in top[qi]:
+                        score = float(sims[qi, row])
+                        if score >= min_similarity:
+                            results[qi].append((score, start + int(row)))
+        else:
+            for qi, query in enumerate(queries):
+                rows = matrix.candidate_rows(query, self.nprobe)
+                if rows is None or rows.size == 0:
+                    continue
+                sims = active[rows] @ query
+                kk = min(k, rows.size)
+                top = np.argpartition(-sims, kk - 1)[:kk]
+                for i in top:
+                    score = float(sims[i])
+                    if score >= min_similarity:
+                        results[qi].append((score, int(rows[i])))
+
+        for qi in range(len(results)):
+            results[qi].sort(reverse=True)
+            del results[qi][k:]
+        return results
+
+    def search_batch(
+        self,
+        embeddings: Sequence[Sequence[float]],
+        k: int = 10,
+        min_similarity: float = 0.0,
+        labels: Optional[Iterable[str]] = None,
+        exact: bool = False
+    ) -> List[List[VectorHit]]:
+        """
+        Top-k cosine search for several query embeddings at once.
+
+        Args:
+            embeddings: Query vectors (all the same dimension)
+            k: Maximum hits per query
+            min_similarity: Minimum cosine similarity
+            labels: Labels to search (default: all indexed labels)
+            exact: Force a flat scan even where IVF is trained
+
+        Returns:
+            One list of VectorHit per query, best first
+        """
+        normalized = [self._normalize(e) for e in embeddings]
+        per_query: List[List[VectorHit]] = [[] for _ in normalized]
+        valid = [i for i, v in enumerate(normalized) if v is not None]
+        if not valid or k <= 0:
+            return per_query
+
+        dim = normalized[valid[0]].size
+        valid = [i for i in valid if normalized[i].size == dim]
+        queries = np.stack([normalized[i] for i in valid])
+        self._searches += len(valid)
+
+        label_names = list(labels) if labels is not None else list(self._labels.keys())
+        for label in label_names:
+            matrix = self._labels.get(label)
+            if matrix is None or matrix.dim != dim:
+                continue
+            label_results = self._search_label(matrix, queries, k, min_similarity, exact)
+            for qi, pairs in zip(valid, label_results):
+                for score, row in pairs:
+                    per_query[qi].append(VectorHit(
+                        node_id=matrix.ids[row],
+                        label=label,
+                        similarity=score,
+                        content=matrix.contents[row],
+                        labels=matrix.node_labels[row]
+                    ))
+
+        for hits in per_query:
+            hits.sort(key=lambda h: h.similarity, reverse=True)
+            del hits[k:]
+        return per_query
+
+    def search(
+        self,
+        embedding: Sequence[float],
+        k: int = 10,
+        min_similarity: float = 0.0,
+        labels: Optional[Iterable[str]] = None,
+        exact: bool = False
+    ) -> List[VectorHit]:
+        """Top-k cosine search for a single query embedding."""
+        return self.search_batch([embedding], k, min_similarity, labels, exact)[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics."""
+        return {
+            "total_vectors": len(self._label_of),
+            "labels": {
+                label: {
+                    "vectors": m.count,
+                    "dim": m.dim,
+                    "ivf_lists": len(m.centroids) if m.centroids is not None else 0
+                }
+                for label, m in self._labels.items()
+            },
+            "loaded_labels": sorted(self.loaded_labels),
+            "searches": self._searches,
+            "upserts": self._upserts,
+            "removals": self._removals,
+            "ivf_trainings": self._trainings,
+            "ivf_threshold": self.ivf_threshold,
+            "nprobe": self.nprobe
+        }
+
+    def __len__(self) -> int:
+        return len(self._label_of)
+
+    def __repr__(self) -> str:
+        return f"VectorIndex(vectors={len(self)}, labels={len(self._labels)})"
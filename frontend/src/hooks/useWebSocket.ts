@@ -10,6 +10,8 @@ export function useWebSocket() {
   const reconnectAttempts = useRef(0);
   const maxReconnectAttempts = 2; // Reduced from 10 to 2 for demo mode
   const hasLoggedRef = useRef(false);
+  // Last event sequence number seen, so a reconnect resumes instead of starting over
+  const lastSeq = useRef<number | null>(null);
 
   const addEvent = useEventStore((state) => state.addEvent);
   const setConnected = useEventStore((state) => state.setConnected);
@@ -26,7 +28,8 @@ export function useWebSocket() {
     }
 
     // Connect to Railway backend WebSocket (not relative to current page)
-    const wsUrl = 'wss://byrd-api-production.up.railway.app/ws/events';
+    const baseUrl = 'wss://byrd-api-production.up.railway.app/ws/events';
+    const wsUrl = lastSeq.current !== null ? `${baseUrl}?since=${lastSeq.current}` : baseUrl;
 
     try {
       ws.current = new WebSocket(wsUrl);
@@ -41,6 +44,22 @@ export function useWebSocket() {
       ws.current.onmessage = (event) => {
         try {
           const data = JSON.parse(event.data) as ByrdEvent;
+          // Server could not replay everything we missed: start a fresh stream next time
+          if ((data.type as string) === 'replay_gap') {
+            console.log('🟡 Event replay incomplete; some events were missed while disconnected');
+            lastSeq.current = null;
+            return;
+          }
+          // We fell behind and the server dropped live events: reconnect and
+          // resume from the last seq seen (onclose reconnects with ?since=)
+          if ((data.type as string) === 'stream_gap') {
+            console.log('🟡 Event stream fell behind; resuming from last seen event');
+            ws.current?.close();
+            return;
+          }
+          if (typeof data.seq === 'number') {
+            lastSeq.current = data.seq;
+          }
           // Add timestamp if not present
           if (!data.timestamp) {
             data.timestamp = new Date().toISOString();
@@ -57,6 +57,7 @@ export interface ByrdEvent {
   data: Record<string, unknown>;
   timestamp: string;
   id?: string;
+  seq?: number;
 }
 
 export interface SystemStatus {
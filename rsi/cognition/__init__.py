@@ -10,6 +10,7 @@ This module provides:
 - CognitiveRouter: Intelligent routing based on task + budget
 - UnifiedCognition: High-level API (think, reason, create, evaluate)
 - EscalationPolicy: When/why to escalate from Tier 1
+- ReflexEngine: Tier 0 answers (templates, cache, heuristics) with no LLM
 
 See PROMPT.md "Layer 2: Cognitive Tiering" for specification.
 """
@@ -22,6 +23,13 @@ from .tiers import (
     estimate_tier_cost
 )
 
+from .reflex import (
+    ReflexEngine,
+    ReflexAnswer,
+    ReflexTemplate,
+    prompt_skeleton
+)
+
 from .router import (
     CognitiveRouter,
     RoutingDecision,
@@ -68,6 +76,11 @@ __all__ = [
     "RoutingContext",
     "RouteResult",
     "create_router",
+    # Reflex
+    "ReflexEngine",
+    "ReflexAnswer",
+    "ReflexTemplate",
+    "prompt_skeleton",
     # Unified API
     "UnifiedCognition",
     "CognitiveResult",
@@ -0,0 +1,470 @@
+"""
+Reflex Engine for BYRD RSI.
+
+Tier 0 (REFLEX) answers routine requests without an LLM call.
+Three answer sources, cheapest first:
+
+1. Learned templates: when prompts with the same skeleton (volatile
+   tokens such as ids, UUIDs and timestamps masked) keep getting the
+   same answer from the LLM across several distinct masked values, that
+   answer is crystallized and served directly. Numbers and quoted
+   strings are usually the question's inputs, so they are only masked
+   when mask_literals is set.
+2. Semantic cache: responses the LLM already gave for this exact (or
+   semantically equivalent) prompt and task type.
+3. Crystallized heuristics: for heuristic/strategy requests, the best
+   matching principle from SystemPrompt.get_heuristics(domain).
+
+Every answer carries a confidence. Only answers that pass the
+confidence gate are served; everything else falls through to GLM 4.7.
+A sampled fraction (audit_rate) of template and cache hits is sent to
+the LLM anyway; answers the LLM disagrees with are demoted.
+
+See PROMPT.md "Layer 2: Cognitive Tiering" for specification.
+"""
+
+from typing import Dict, Optional, Any, List, Tuple, TYPE_CHECKING
+from dataclasses import dataclass, field
+from collections import Counter, OrderedDict
+import hashlib
+import json
+import logging
+import random
+import re
+
+if TYPE_CHECKING:
+    from .router import RoutingContext
+
+logger = logging.getLogger("rsi.cognition.reflex")
+
+
+# Volatile tokens: they identify a request rather than shape its answer
+_VOLATILE_MASKS = [
+    (re.compile(r'\b\d{4}-\d{2}-\d{2}(?:[t ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:z|[+-]\d{2}:?\d{2})?)?\b'), '<ts>'),
+    (re.compile(r'\b\d{1,2}:\d{2}:\d{2}\b'), '<ts>'),
+    (re.compile(r'\b1\d{9}(?:\d{3})?\b'), '<ts>'),  # Unix epoch (s or ms)
+    (re.compile(r'\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b'), '<id>'),
+    (re.compile(r'\b(?=[0-9a-f]*[a-f])(?=[0-9a-f]*\d)[0-9a-f]{12,}\b'), '<id>'),
+]
+
+# Literal masks (opt-in via mask_literals): often the question's inputs
+_LITERAL_MASKS = [
+    (re.compile(r'"[^"\n]*"|\'[^\'\n]*\''), '<str>'),
+    (re.compile(r'-?\d+(?:\.\d+)?'), '<num>'),
+]
+
+_WHITESPACE = re.compile(r'\s+')
+_WORD = re.compile(r'[a-z][a-z_]{3,}')
+
+_STOPWORDS = frozenset({
+    'about', 'after', 'also', 'been', 'before', 'being', 'does', 'each',
+    'from', 'have', 'into', 'just', 'like', 'make', 'more', 'most', 'only',
+    'other', 'over', 'should', 'some', 'such', 'than', 'that', 'their',
+    'them', 'then', 'there', 'these', 'they', 'this', 'what', 'when',
+    'where', 'which', 'while', 'with', 'would', 'your',
+})
+
+
+def mask_prompt(prompt: str, mask_literals: bool = False) -> Tuple[str, Tuple[str, ...]]:
+    """Normalize a prompt to its shape and return the masked-out values."""
+    skeleton = prompt.strip().lower()
+    values: List[str] = []
+    masks = _VOLATILE_MASKS + (_LITERAL_MASKS if mask_literals else [])
+    for pattern, mask in masks:
+        values.extend(pattern.findall(skeleton))
+        skeleton = pattern.sub(mask, skeleton)
+    return _WHITESPACE.sub(' ', skeleton), tuple(values)
+
+
+def prompt_skeleton(prompt: str, mask_literals: bool = False) -> str:
+    """Normalize a prompt to its shape: lowercase, volatile tokens masked."""
+    return mask_prompt(prompt, mask_literals)[0]
+
+
+def canonical_response(text: str) -> str:
+    """Canonical form of a response so equivalent JSON answers compare equal."""
+    stripped = text.strip()
+    if stripped[:1] in ('{', '['):
+        try:
+            return json.dumps(json.loads(stripped), sort_keys=True)
+        except (json.JSONDecodeError, ValueError):
+            pass
+    return stripped
+
+
+@dataclass
+class ReflexAnswer:
+    """An answer produced without an LLM call."""
+    text: str
+    source: str  # "template", "cache", "heuristic"
+    confidence: float
+    key: Optional[str] = None  # Template key or heuristic domain
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            'source': self.source,
+            'confidence': self.confidence,
+            'key': self.key,
+            'text_length': len(self.text),
+            'metadata': self.metadata
+        }
+
+
+@dataclass
+class ReflexTemplate:
+    """Observed answers for one (task type, prompt skeleton) pair."""
+    task_type: str
+    skeleton: str
+    responses: Counter = field(default_factory=Counter)
+    originals: Dict[str, str] = field(default_factory=dict)
+    # Distinct masked-value signatures seen per canonical response
+    value_sets: Dict[str, set] = field(default_factory=dict)
+    rejections: int = 0
+
+    @property
+    def observations(self) -> int:
+        return sum(self.responses.values()) + self.rejections
+
+    def best(self) -> Tuple[Optional[str], int]:
+        """Most common canonical response and its count."""
+        if not self.responses:
+            return None, 0
+        return self.responses.most_common(1)[0]
+
+    def confidence(self) -> float:
+        """Laplace-smoothed agreement of the most common answer."""
+        _, count = self.best()
+        return (count + 1) / (self.observations + 2)
+
+    def distinct_values(self, response: str) -> int:
+        """Number of distinct masked values a response was observed with."""
+        return len(self.value_sets.get(response, ()))
+
+
+class ReflexEngine:
+    """
+    Answers routine requests without an LLM call.
+
+    Usage:
+        engine = ReflexEngine({'min_confidence': 0.85})
+        answer = engine.lookup(context)   # None when the gate rejects
+        ...
+        engine.learn(context, llm_response_text, quality_score)
+    """
+
+    def __init__(
+        self,
+        config: Dict = None,
+        semantic_cache: Any = None,
+        system_prompt: Any = None
+    ):
+        """
+        Initialize reflex engine.
+
+        Args:
+            config: Reflex configuration options
+            semantic_cache: Cache with get_with_info()/set() (core.semantic_cache)
+            system_prompt: SystemPrompt providing crystallized heuristics
+        """
+        self.config = config or {}
+
+        # Confidence gate
+        self._min_confidence = self.config.get('min_confidence', 0.85)
+        self._task_thresholds: Dict[str, float] = self.config.get('task_thresholds', {})
+
+        # Eligibility
+        self._excluded_task_types = set(self.config.get('excluded_task_types', ['create']))
+        self._max_temperature = self.config.get('max_temperature', 1.0)
+
+        # Templates
+        self._min_support = self.config.get('min_support', 3)
+        self._min_distinct_values = self.config.get('min_distinct_values', 3)
+        self._mask_literals = self.config.get('mask_literals', False)
+        self._max_templates = self.config.get('max_templates', 5000)
+        self._templates: "OrderedDict[str, ReflexTemplate]" = OrderedDict()
+
+        # Cache
+        self._exact_confidence = self.config.get('cache_exact_confidence', 0.95)
+        self._semantic_confidence = self.config.get('cache_semantic_confidence', 0.85)
+        self._min_learn_quality = self.config.get('min_learn_quality', 0.7)
+        self._cache = semantic_cache
+        if self._cache is None and self.config.get('use_cache', True):
+            try:
+                from core.semantic_cache import SemanticCache
+                self._cache = SemanticCache(
+                    max_entries=self.config.get('cache_max_entries', 2000),
+                    ttl_seconds=self.config.get('cache_ttl_seconds', 86400)
+                )
+            except ImportError:
+                logger.warning("Could not import SemanticCache; reflex cache source disabled")
+
+        # Heuristics
+        self._heuristic_task_types = set(self.config.get('heuristic_task_types', ['heuristic', 'strategy']))
+        self._min_heuristic_trajectories = self.config.get('min_heuristic_trajectories', 5)
+        self._system_prompt = system_prompt
+        self._use_heuristics = self.config.get('use_heuristics', True)
+
+        # Audits: sampled hits are re-asked of the LLM
+        self._audit_rate = self.config.get('audit_rate', 0.1)
+        self._audit_sources = set(self.config.get('audit_sources', ['template', 'cache']))
+        self._rng = random.Random(self.config.get('audit_seed'))
+
+        # Statistics
+        self._lookups = 0
+        self._source_hits: Dict[str, int] = {'template': 0, 'cache': 0, 'heuristic': 0}
+        self._gate_rejections = 0
+        self._rejected_answers = 0
+        self._audits = 0
+        self._audit_failures = 0
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def is_eligible(self, context: "RoutingContext") -> bool:
+        """Whether a request may be answered without an LLM at all."""
+        return (
+            context.user_requested_tier is None and
+            not context.is_critical and
+            not context.is_safety_critical and
+            not context.requires_validation and
+            context.retry_count == 0 and
+            context.previous_quality is None and
+            context.temperature <= self._max_temperature and
+            context.task_type not in self._excluded_task_types and
+            not context.metadata.get('no_reflex', False)
+        )
+
+    def threshold_for(self, task_type: str) -> float:
+        """Confidence an answer needs to be served for a task type."""
+        return self._task_thresholds.get(task_type, self._min_confidence)
+
+    def lookup(self, context: "RoutingContext") -> Optional[ReflexAnswer]:
+        """
+        Find an answer that passes the confidence gate.
+
+        Sources are tried cheapest first; the first confident one wins.
+
+        Returns:
+            ReflexAnswer, or None if the request needs an LLM
+        """
+        self._lookups += 1
+        threshold = self.threshold_for(context.task_type)
+        best: Optional[ReflexAnswer] = None
+
+        for source in (self._from_template, self._from_cache, self._from_heuristics):
+            answer = source(context)
+            if answer is None:
+                continue
+            if answer.confidence >= threshold:
+                self._source_hits[answer.source] += 1
+                return answer
+            if best is None or answer.confidence > best.confidence:
+                best = answer
+
+        if best is not None:
+            self._gate_rejections += 1
+            logger.debug(
+                f"Reflex {best.source} answer for {context.task_type} below gate "
+                f"({best.confidence:.2f} < {threshold:.2f})"
+            )
+        return None
+
+    def _template_key(self, task_type: str, prompt: str) -> Tuple[str, str, str]:
+        skeleton, values = mask_prompt(prompt, self._mask_literals)
+        digest = hashlib.sha256(f"{task_type}\n{skeleton}".encode()).hexdigest()[:24]
+        signature = hashlib.sha256("\x00".join(values).encode()).hexdigest()[:16]
+        return digest, skeleton, signature
+
+    def _from_template(self, context: "RoutingContext") -> Optional[ReflexAnswer]:
+        key, _, _ = self._template_key(context.task_type, context.prompt)
+        template = self._templates.get(key)
+        if template is None or template.observations < self._min_support:
+            return None
+        response, count = template.best()
+        if response is None:
+            return None
+        # The answer must hold across different masked values, otherwise
+        # the template has only ever seen one question (the cache covers that)
+        if template.distinct_values(response) < self._min_distinct_values:
+            return None
+        self._templates.move_to_end(key)
+        return ReflexAnswer(
+            text=template.originals[response],
+            source='template',
+            confidence=template.confidence(),
+            key=key,
+            metadata={
+                'support': count,
+                'observations': template.observations,
+                'distinct_values': template.distinct_values(response)
+            }
+        )
+
+    def _cache_query(self, context: "RoutingContext") -> str:
+        return f"[{context.task_type}]\n{context.prompt}"
+
+    def _from_cache(self, context: "RoutingContext") -> Optional[ReflexAnswer]:
+        if self._cache is None:
+            return None
+        hit = self._cache.get_with_info(self._cache_query(context), component="reflex")
+        if hit is None:
+            return None
+        response, is_semantic = hit
+        return ReflexAnswer(
+            text=response,
+            source='cache',
+            confidence=self._semantic_confidence if is_semantic else self._exact_confidence,
+            metadata={'semantic': is_semantic}
+        )
+
+    def _get_system_prompt(self) -> Any:
+        if self._system_prompt is None and self._use_heuristics:
+            try:
+                from ..prompt.system_prompt import get_system_prompt
+                self._system_prompt = get_system_prompt()
+            except Exception as e:
+                logger.warning(f"Heuristics unavailable for reflex tier: {e}")
+                self._use_heuristics = False
+        return self._system_prompt
+
+    def _from_heuristics(self, context: "RoutingContext") -> Optional[ReflexAnswer]:
+        if context.task_type not in self._heuristic_task_types:
+            return None
+        domain = context.metadata.get('domain')
+        system_prompt = self._get_system_prompt()
+        if not domain or system_prompt is None:
+            return None
+
+        prompt_words = set(_WORD.findall(context.prompt.lower())) - _STOPWORDS
+        if not prompt_words:
+            return None
+
+        best: Optional[ReflexAnswer] = None
+        for heuristic in system_prompt.get_heuristics(domain):
+            words = set(_WORD.findall(heuristic['content'].lower()))
+            coverage = len(prompt_words & words) / len(prompt_words)
+            support = min(1.0, heuristic.get('trajectory_count', 0) / self._min_heuristic_trajectories)
+            confidence = coverage * support
+            if best is None or confidence > best.confidence:
+                best = ReflexAnswer(
+                    text=heuristic['content'],
+                    source='heuristic',
+                    confidence=confidence,
+                    key=domain,
+                    metadata={'coverage': coverage, 'trajectory_count': heuristic.get('trajectory_count', 0)}
+                )
+        return best
+
+    # ------------------------------------------------------------------
+    # Learning
+    # ------------------------------------------------------------------
+
+    def learn(
+        self,
+        context: "RoutingContext",
+        response_text: str,
+        quality_score: Optional[float] = None
+    ) -> None:
+        """
+        Learn from an LLM answer to an eligible request.
+
+        Args:
+            context: The request that was answered
+            response_text: The LLM's response
+            quality_score: Quality score, if evaluated (low scores are ignored)
+        """
+        if not response_text or not self.is_eligible(context):
+            return
+        if quality_score is not None and quality_score < self._min_learn_quality:
+            return
+
+        if self._cache is not None:
+            self._cache.set(self._cache_query(context), response_text)
+
+        key, skeleton, signature = self._template_key(context.task_type, context.prompt)
+        template = self._templates.get(key)
+        if template is None:
+            template = ReflexTemplate(task_type=context.task_type, skeleton=skeleton)
+            self._templates[key] = template
+            while len(self._templates) > self._max_templates:
+                self._templates.popitem(last=False)
+        canonical = canonical_response(response_text)
+        template.responses[canonical] += 1
+        template.originals.setdefault(canonical, response_text)
+        value_set = template.value_sets.setdefault(canonical, set())
+        if len(value_set) < 64:
+            value_set.add(signature)
+
+    def reject(self, answer: ReflexAnswer) -> None:
+        """
+        Record that a served answer turned out wrong.
+
+        Template answers lose confidence; heuristic usage is not recorded.
+        """
+        self._rejected_answers += 1
+        if answer.source == 'template' and answer.key in self._templates:
+            self._templates[answer.key].rejections += 1
+
+    def should_audit(self, answer: ReflexAnswer) -> bool:
+        """Whether to send this hit to the LLM anyway and compare answers."""
+        return (
+            answer.source in self._audit_sources and
+            self._audit_rate > 0 and
+            self._rng.random() < self._audit_rate
+        )
+
+    def audit(self, answer: ReflexAnswer, llm_response: str) -> bool:
+        """
+        Compare an audited reflex answer with the LLM's answer.
+
+        A disagreement demotes a template answer (as reject() does); the
+        LLM answer itself is learned by the caller as usual, which also
+        replaces a stale cache entry.
+
+        Returns:
+            True if the LLM agreed with the reflex answer
+        """
+        self._audits += 1
+        if canonical_response(llm_response) == canonical_response(answer.text):
+            return True
+        self._audit_failures += 1
+        logger.info(f"Reflex {answer.source} answer failed audit; demoting")
+        self.reject(answer)
+        return False
+
+    def record_served(self, answer: ReflexAnswer) -> None:
+        """Record that an answer was used (heuristic usage counts)."""
+        if answer.source == 'heuristic' and self._system_prompt is not None:
+            try:
+                self._system_prompt.record_heuristic_usage(answer.key, answer.text)
+            except Exception as e:
+                logger.debug(f"Could not record heuristic usage: {e}")
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get reflex statistics."""
+        hits = sum(self._source_hits.values())
+        return {
+            'lookups': self._lookups,
+            'hits': hits,
+            'hit_rate': hits / self._lookups if self._lookups else 0.0,
+            'source_hits': dict(self._source_hits),
+            'gate_rejections': self._gate_rejections,
+            'rejected_answers': self._rejected_answers,
+            'audits': self._audits,
+            'audit_failures': self._audit_failures,
+            'templates': len(self._templates),
+            'confident_templates': sum(
+                1 for t in self._templates.values()
+                if t.observations >= self._min_support
+                and t.distinct_values(t.best()[0]) >= self._min_distinct_values
+                and t.confidence() >= self.threshold_for(t.task_type)
+            ),
+            'min_confidence': self._min_confidence
+        }
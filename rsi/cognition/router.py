@@ -10,6 +10,9 @@ Routes cognitive requests to appropriate tiers based on:
 Design principle: GLM 4.7 FIRST. Always.
 Only escalate when there's a clear reason.
 
+Routine requests the ReflexEngine can answer confidently are served on
+Tier 0 (REFLEX) first, with no LLM call at all.
+
 See PROMPT.md "Layer 2: Cognitive Tiering" for specification.
 """
 
@@ -31,6 +34,7 @@ from .escalation import (
     EscalationDecision,
     EscalationTrigger
 )
+from .reflex import ReflexEngine, ReflexAnswer
 
 logger = logging.getLogger("rsi.cognition.router")
 
@@ -89,6 +93,7 @@ class RoutingDecision:
     estimated_cost: float
     config: TierConfig
     escalation: Optional[EscalationDecision] = None
+    reflex_answer: Optional[ReflexAnswer] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -99,7 +104,8 @@ class RoutingDecision:
             'estimated_cost': self.estimated_cost,
             'provider': self.config.provider,
             'model': self.config.model,
-            'escalation': self.escalation.to_dict() if self.escalation else None
+            'escalation': self.escalation.to_dict() if self.escalation else None,
+            'reflex': self.reflex_answer.to_dict() if self.reflex_answer else None
         }
 
 
@@ -148,7 +154,8 @@ class CognitiveRouter:
         self,
         llm_call_fn: Optional[LLMCallFn] = None,
         escalation_policy: Optional[EscalationPolicy] = None,
-        config: Dict = None
+        config: Dict = None,
+        reflex_engine: Optional[ReflexEngine] = None
     ):
         """
         Initialize cognitive router.
@@ -157,11 +164,20 @@ class CognitiveRouter:
             llm_call_fn: Async function to call LLM: (tier, prompt, kwargs) -> response
             escalation_policy: Policy for tier escalation decisions
             config: Router configuration options
+            reflex_engine: No-LLM answer engine for Tier 0 (created from config if None)
         """
         self.config = config or {}
         self._llm_call_fn = llm_call_fn
         self._escalation_policy = escalation_policy or EscalationPolicy()
 
+        # Tier 0: answer routine requests without an LLM
+        reflex_config = self.config.get('reflex', {})
+        self._reflex = reflex_engine
+        if self._reflex is None and reflex_config.get('enabled', True):
+            self._reflex = ReflexEngine(reflex_config)
+        self._task_requests: Dict[str, int] = {}
+        self._task_reflex_served: Dict[str, int] = {}
+
         # Tracking
         self._request_count = 0
         self._cost_total = 0.0
@@ -188,6 +204,8 @@ class CognitiveRouter:
         Decide which tier to use for a request.
 
         This is a synchronous decision - actual LLM calls are in route().
+        Eligible requests the reflex engine can answer confidently go to
+        REFLEX; the answer travels on the decision.
 
         Args:
             context: Routing context with task requirements
@@ -195,6 +213,21 @@ class CognitiveRouter:
         Returns:
             RoutingDecision with tier, reason, and estimated cost
         """
+        if self._reflex is not None and self._reflex.is_eligible(context):
+            answer = self._reflex.lookup(context)
+            if answer is not None:
+                return RoutingDecision(
+                    tier=CognitiveTier.REFLEX,
+                    reason=f"Reflex {answer.source} answer (confidence {answer.confidence:.2f})",
+                    estimated_cost=0.0,
+                    config=get_tier_config(CognitiveTier.REFLEX),
+                    reflex_answer=answer
+                )
+
+        return self._decide_llm_tier(context)
+
+    def _decide_llm_tier(self, context: RoutingContext) -> RoutingDecision:
+        """Decide which LLM tier to use (GLM 4.7 unless escalation applies)."""
         # Check if user explicitly requested a tier
         if context.user_requested_tier is not None:
             tier = context.user_requested_tier
@@ -269,7 +302,8 @@ class CognitiveRouter:
         Route a cognitive request to the appropriate tier.
 
         This handles the full routing flow:
-        1. Decide tier
+        1. Decide tier (REFLEX answers are served without an LLM, except
+           for sampled audits that are checked against the LLM answer)
         2. Make LLM call
         3. Evaluate quality (if evaluator set)
         4. Handle escalation if needed
@@ -281,6 +315,25 @@ class CognitiveRouter:
         Returns:
             RouteResult with response and metadata
         """
+        import time
+        start_time = time.time()
+
+        # Make initial routing decision
+        decision = self.decide_tier(context)
+        if context.retry_count == 0:
+            self._task_requests[context.task_type] = self._task_requests.get(context.task_type, 0) + 1
+
+        audited_answer = None
+        if decision.tier == CognitiveTier.REFLEX:
+            if self._reflex.should_audit(decision.reflex_answer):
+                # Sampled check: ask the LLM and compare with the reflex answer
+                audited_answer = decision.reflex_answer
+            else:
+                result = self._serve_reflex(context, decision.reflex_answer, start_time)
+                if result is not None:
+                    return result
+            decision = self._decide_llm_tier(context)
+
         if self._llm_call_fn is None:
             return RouteResult(
                 success=False,
@@ -289,12 +342,6 @@ class CognitiveRouter:
                 error="No LLM call function configured"
             )
 
-        import time
-        start_time = time.time()
-
-        # Make initial routing decision
-        decision = self.decide_tier(context)
-
         logger.info(
             f"Routing {context.task_type} to {decision.config.name}: {decision.reason}"
         )
@@ -369,6 +416,12 @@ class CognitiveRouter:
 
                     return escalated_result
 
+            # Eligible answers teach the reflex tier
+            if self._reflex is not None and not response.get('error'):
+                if audited_answer is not None:
+                    self._reflex.audit(audited_answer, response_text)
+                self._reflex.learn(context, response_text, quality_score)
+
             # Calculate actual cost
             actual_cost = estimate_tier_cost(
                 decision.tier,
@@ -395,19 +448,7 @@ class CognitiveRouter:
                 raw_response=raw_response
             )
 
-            # Record in recent routes
-            self._recent_routes.append({
-                'timestamp': datetime.now(timezone.utc).isoformat(),
-                'task_type': context.task_type,
-                'tier': decision.tier.value,
-                'cost': actual_cost,
-                'quality': quality_score,
-                'latency_ms': latency_ms
-            })
-
-            # Keep only last 100 routes
-            if len(self._recent_routes) > 100:
-                self._recent_routes = self._recent_routes[-100:]
+            self._record_route(context, decision.tier, actual_cost, quality_score, latency_ms)
 
             return result
 
@@ -420,6 +461,98 @@ class CognitiveRouter:
                 error=str(e)
             )
 
+    def _serve_reflex(
+        self,
+        context: RoutingContext,
+        answer: ReflexAnswer,
+        start_time: float
+    ) -> Optional[RouteResult]:
+        """Serve a reflex answer, or return None if it fails quality checks."""
+        import time
+
+        quality_score = None
+        if self._quality_evaluator is not None:
+            try:
+                quality_score = self._quality_evaluator(answer.text, context)
+            except Exception as e:
+                logger.warning(f"Quality evaluation failed: {e}")
+
+        if quality_score is not None and quality_score < context.min_quality_threshold:
+            logger.info(
+                f"Reflex {answer.source} answer for {context.task_type} scored "
+                f"{quality_score:.2f}; falling through to LLM"
+            )
+            self._reflex.reject(answer)
+            return None
+
+        self._reflex.record_served(answer)
+        self._task_reflex_served[context.task_type] = self._task_reflex_served.get(context.task_type, 0) + 1
+        self._request_count += 1
+        self._tier_usage[CognitiveTier.REFLEX] += 1
+
+        latency_ms = (time.time() - start_time) * 1000
+        self._record_route(context, CognitiveTier.REFLEX, 0.0, quality_score, latency_ms)
+
+        return RouteResult(
+            success=True,
+            tier_used=CognitiveTier.REFLEX,
+            response_text=answer.text,
+            quality_score=quality_score,
+            actual_cost=0.0,
+            latency_ms=latency_ms,
+            raw_response={'text': answer.text, 'reflex': answer.to_dict()}
+        )
+
+    def _record_route(
+        self,
+        context: RoutingContext,
+        tier: CognitiveTier,
+        cost: float,
+        quality: Optional[float],
+        latency_ms: float
+    ):
+        """Record a completed route in recent routes."""
+        self._recent_routes.append({
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'task_type': context.task_type,
+            'tier': tier.value,
+            'cost': cost,
+            'quality': quality,
+            'latency_ms': latency_ms
+        })
+
+        # Keep only last 100 routes
+        if len(self._recent_routes) > 100:
+            self._recent_routes = self._recent_routes[-100:]
+
+    def get_reflex_stats(self) -> Dict[str, Any]:
+        """
+        Get reflex tier statistics, including LLM-call reduction per task type.
+
+        llm_call_reduction is the share of a task type's requests that were
+        answered on REFLEX instead of by an LLM.
+        """
+        by_task_type = {}
+        for task_type, requests in self._task_requests.items():
+            served = self._task_reflex_served.get(task_type, 0)
+            by_task_type[task_type] = {
+                'requests': requests,
+                'reflex_served': served,
+                'llm_requests': requests - served,
+                'llm_call_reduction': served / requests if requests else 0.0
+            }
+
+        total = sum(self._task_requests.values())
+        served = sum(self._task_reflex_served.values())
+        return {
+            'enabled': self._reflex is not None,
+            'requests': total,
+            'reflex_served': served,
+            'llm_call_reduction': served / total if total else 0.0,
+            'by_task_type': by_task_type,
+            'engine': self._reflex.get_stats() if self._reflex is not None else None
+        }
+
     def get_stats(self) -> Dict[str, Any]:
         """Get routing statistics."""
         return {
@@ -433,7 +566,8 @@ class CognitiveRouter:
             'budget_remaining': (
                 self._budget_limit - self._cost_total if self._budget_limit else None
             ),
-            'escalation_stats': self._escalation_policy.get_escalation_stats()
+            'escalation_stats': self._escalation_policy.get_escalation_stats(),
+            'reflex': self.get_reflex_stats()
         }
 
     def get_recent_routes(self, limit: int = 20) -> List[Dict]:
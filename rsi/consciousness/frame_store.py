@@ -0,0 +1,346 @@
+"""
+FrameStore - Local append-only, hash-chained storage for consciousness frames.
+
+On-disk format (one record per line in frames.log):
+
+    <record_hash>\t<prev_record_hash>\t<frame_json>\n
+
+record_hash = sha256(prev_record_hash + frame_json), so editing or
+dropping any record breaks the chain from that point on. Opening the
+store verifies the chain. A torn final write (a last line without its
+newline) is truncated; any other break is never repaired by deleting
+data: the file is copied to a quarantine next to it, frames up to the
+break are loaded and the store opens read-only (append() raises
+FrameStoreError).
+
+In memory only compact indexes are kept:
+- byte offset per sequence number (frames are numbered 1..n)
+- clamped timestamps (bisect for time ranges)
+- entropy scores (emergence analysis without loading frames)
+- an inverted token index over desire descriptions (search_semantic)
+plus a bounded LRU cache of decoded frames.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set
+
+from .frame import ConsciousnessFrame
+
+logger = logging.getLogger("rsi.consciousness.frame_store")
+
+GENESIS_HASH = "0" * 32
+_TOKEN_RE = re.compile(r"\w+")
+
+
+class FrameStoreError(Exception):
+    """Raised when appending to a store whose chain is broken."""
+    pass
+
+
+def _tokens(text: str) -> Set[str]:
+    return set(_TOKEN_RE.findall(text.lower()))
+
+
+def _description(frame: ConsciousnessFrame) -> str:
+    if not frame.selected_desire:
+        return ""
+    return frame.selected_desire.get('description', '') or ""
+
+
+class FrameStore:
+    """
+    Append-only consciousness frame store with O(log n) temporal seeks.
+
+    Frames are read back from disk on demand; the heap holds indexes and
+    at most cache_size decoded frames regardless of history length.
+    """
+
+    def __init__(self, directory: str, cache_size: int = 256, fsync: bool = False):
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path = self.directory / "frames.log"
+        self.cache_size = max(1, cache_size)
+        self.fsync = fsync
+
+        self._offsets = array('q')
+        self._times = array('d')
+        self._entropy = array('d')
+        self._postings: Dict[str, array] = {}
+        self._last_hash = GENESIS_HASH
+        self._last_content_hash: Optional[str] = None
+
+        self._cache: "OrderedDict[int, ConsciousnessFrame]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        # Set when the chain is broken mid-file: {"frame", "offset", "reason", "quarantine"}
+        self.corruption: Optional[Dict] = None
+
+        self._load()
+        self._writer = None if self.read_only else open(self.path, "ab")
+        self._reader = open(self.path, "rb")
+
+    # ===== Properties =====
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    @property
+    def last_seq(self) -> int:
+        return len(self._offsets)
+
+    @property
+    def read_only(self) -> bool:
+        """True if the chain is broken mid-file: frames load, appends are refused."""
+        return self.corruption is not None
+
+    @property
+    def last_content_hash(self) -> Optional[str]:
+        """content_hash of the newest frame (parent for the next one)."""
+        return self._last_content_hash
+
+    # ===== Writing =====
+
+    def append(self, frame: ConsciousnessFrame) -> None:
+        """
+        Append a frame; its sequence_number must be last_seq + 1.
+
+        Raises:
+            ValueError: On an out-of-order sequence number
+            FrameStoreError: If the store opened read-only (broken chain)
+        """
+        if self.read_only:
+            raise FrameStoreError(
+                f"Frame store is read-only: chain broken at frame {self.corruption['frame']} "
+                f"(copy kept at {self.corruption['quarantine']})"
+            )
+        if frame.sequence_number != self.last_seq + 1:
+            raise ValueError(
+                f"Frame sequence {frame.sequence_number} does not follow {self.last_seq}"
+            )
+        payload = json.dumps(frame.to_dict(), sort_keys=True, default=str)
+        record_hash = self._hash(self._last_hash, payload)
+        line = f"{record_hash}\t{self._last_hash}\t{payload}\n".encode("utf-8")
+
+        offset = self._writer.seek(0, 2)
+        self._writer.write(line)
+        self._writer.flush()
+        if self.fsync:
+            os.fsync(self._writer.fileno())
+
+        self._index(frame, offset)
+        self._last_hash = record_hash
+        self._remember(frame.sequence_number, frame)
+
+    @staticmethod
+    def _hash(prev_hash: str, payload: str) -> str:
+        return hashlib.sha256((prev_hash + payload).encode("utf-8")).hexdigest()[:32]
+
+    def _index(self, frame: ConsciousnessFrame, offset: int) -> None:
+        seq = frame.sequence_number
+        ts = frame.timestamp.timestamp() if isinstance(frame.timestamp, datetime) else 0.0
+        if self._times and ts < self._times[-1]:
+            ts = self._times[-1]  # Keep the time index sorted
+        self._offsets.append(offset)
+        self._times.append(ts)
+        self._entropy.append(frame.entropy_score)
+        for token in _tokens(_description(frame)):
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = array('I')
+            postings.append(seq)
+        self._last_content_hash = frame.content_hash
+
+    # ===== Recovery =====
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        good_end = 0
+        reason = None
+        with open(self.path, "rb") as f:
+            offset = 0
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    reason = "torn"  # Only ever the final line
+                    break
+                try:
+                    record_hash, prev_hash, payload = raw[:-1].decode("utf-8").split("\t", 2)
+                    if prev_hash != self._last_hash or self._hash(prev_hash, payload) != record_hash:
+                        reason = "hash mismatch"
+                        break
+                    frame = ConsciousnessFrame.from_dict(json.loads(payload))
+                    if frame.sequence_number != self.last_seq + 1:
+                        reason = f"sequence {frame.sequence_number} after {self.last_seq}"
+                        break
+                except (ValueError, KeyError, TypeError) as e:
+                    reason = f"unreadable record: {e}"
+                    break
+                self._index(frame, offset)
+                self._last_hash = record_hash
+                offset += len(raw)
+                good_end = offset
+
+        if reason is None:
+            return
+        if reason == "torn":
+            size = self.path.stat().st_size
+            logger.warning(f"Truncating torn final write ({size - good_end} bytes) after frame {self.last_seq}")
+            with open(self.path, "r+b") as f:
+                f.truncate(good_end)
+            return
+
+        quarantine = self.path.with_name(f"{self.path.name}.{datetime.now():%Y%m%dT%H%M%S}.corrupt")
+        shutil.copy2(self.path, quarantine)
+        self.corruption = {
+            "frame": self.last_seq + 1,
+            "offset": good_end,
+            "reason": reason,
+            "quarantine": str(quarantine),
+        }
+        logger.error(
+            f"Consciousness chain broken at frame {self.last_seq + 1} (byte {good_end}: {reason}); "
+            f"loaded {self.last_seq} frames read-only, copy kept at {quarantine}"
+        )
+
+    def verify_chain(self) -> bool:
+        """Re-read the whole file and check every record hash (False on any malformed line)."""
+        prev = GENESIS_HASH
+        with open(self.path, "rb") as f:
+            for raw in f:
+                try:
+                    record_hash, prev_hash, payload = raw[:-1].decode("utf-8").split("\t", 2)
+                except ValueError:  # Also UnicodeDecodeError
+                    return False
+                if prev_hash != prev or self._hash(prev_hash, payload) != record_hash:
+                    return False
+                prev = record_hash
+        return prev == self._last_hash
+
+    # ===== Reading =====
+
+    def _remember(self, seq: int, frame: ConsciousnessFrame) -> None:
+        self._cache[seq] = frame
+        self._cache.move_to_end(seq)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def get(self, seq: int) -> Optional[ConsciousnessFrame]:
+        """Frame by sequence number (1-based), O(1) seek."""
+        if not 1 <= seq <= self.last_seq:
+            return None
+        frame = self._cache.get(seq)
+        if frame is not None:
+            self._cache.move_to_end(seq)
+            self.cache_hits += 1
+            return frame
+        self.cache_misses += 1
+        self._reader.seek(self._offsets[seq - 1])
+        raw = self._reader.readline()
+        payload = raw[:-1].decode("utf-8").split("\t", 2)[2]
+        frame = ConsciousnessFrame.from_dict(json.loads(payload))
+        self._remember(seq, frame)
+        return frame
+
+    def seq_range_for_time(self, start: datetime, end: datetime) -> range:
+        """Sequence numbers with start <= timestamp <= end, by bisection."""
+        lo = bisect_left(self._times, start.timestamp())
+        hi = bisect_right(self._times, end.timestamp())
+        return range(lo + 1, hi + 1)
+
+    def range(self, start: datetime, end: datetime) -> List[ConsciousnessFrame]:
+        return [self.get(seq) for seq in self.seq_range_for_time(start, end)]
+
+    def recent(self, count: int) -> List[ConsciousnessFrame]:
+        """The newest `count` frames, oldest first."""
+        first = max(1, self.last_seq - count + 1)
+        return [self.get(seq) for seq in range(first, self.last_seq + 1)]
+
+    def entropy_scores(self, count: int) -> List[float]:
+        """Entropy of the newest `count` frames, oldest first (no frame loads)."""
+        return list(self._entropy[-count:]) if count > 0 else []
+
+    def _candidates(self, query: str) -> Optional[Set[int]]:
+        """
+        Sequence numbers whose description contains every query token as a
+        substring of one of its words. None means the index can't narrow it.
+        """
+        tokens = _tokens(query)
+        if not tokens:
+            return None
+        result: Optional[Set[int]] = None
+        for token in tokens:
+            matches: Set[int] = set()
+            postings = self._postings.get(token)
+            if postings is not None:
+                matches.update(postings)
+            # Partial words ("desi" in "desire"): union over matching vocabulary
+            for word, word_postings in self._postings.items():
+                if word != token and token in word:
+                    matches.update(word_postings)
+            result = matches if result is None else result & matches
+            if not result:
+                return set()
+        return result
+
+    def search(self, query: str, limit: int = 10) -> List[ConsciousnessFrame]:
+        """Newest frames whose desire description contains query (case-insensitive)."""
+        needle = query.lower()
+        candidates = self._candidates(query)
+        seqs: Iterator[int] = (
+            iter(sorted(candidates, reverse=True)) if candidates is not None
+            else iter(range(self.last_seq, 0, -1))
+        )
+        matches = []
+        for seq in seqs:
+            frame = self.get(seq)
+            if frame is not None and needle in _description(frame).lower():
+                matches.append(frame)
+                if len(matches) >= limit:
+                    break
+        return matches
+
+    # ===== Maintenance =====
+
+    def clear(self) -> None:
+        """Delete all frames (testing / reset); a broken store becomes writable again."""
+        self.close()
+        self.path.write_bytes(b"")
+        self._offsets = array('q')
+        self._times = array('d')
+        self._entropy = array('d')
+        self._postings.clear()
+        self._cache.clear()
+        self._last_hash = GENESIS_HASH
+        self._last_content_hash = None
+        self.corruption = None
+        self._writer = open(self.path, "ab")
+        self._reader = open(self.path, "rb")
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        self._reader.close()
+
+    def get_stats(self) -> Dict:
+        return {
+            'frames': self.last_seq,
+            'bytes': self.path.stat().st_size if self.path.exists() else 0,
+            'cached_frames': len(self._cache),
+            'cache_size': self.cache_size,
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'indexed_tokens': len(self._postings),
+            'read_only': self.read_only,
+            'corruption': self.corruption,
+        }
@@ -7,7 +7,10 @@ Provides:
 - Semantic search over consciousness history
 - Entropy tracking for emergence detection
 
-Falls back to in-memory storage if Memvid unavailable.
+Backends, in order of preference:
+- Memvid (when the SDK is integrated)
+- FrameStore: local hash-chained log with indexed seeks (store_path set)
+- In-memory list (tests, or use_memvid=False without a store_path)
 """
 
 from typing import Dict, List, Optional, Any, TYPE_CHECKING
@@ -16,6 +19,7 @@ import json
 import logging
 
 from .frame import ConsciousnessFrame
+from .frame_store import FrameStore, FrameStoreError
 
 if TYPE_CHECKING:
     from ..engine import CycleResult
@@ -31,27 +35,60 @@ class ConsciousnessStream:
     enabling time-travel queries and emergence detection.
     """
 
-    def __init__(self, path: str = "consciousness.mv2", use_memvid: bool = True):
+    def __init__(
+        self,
+        path: str = "consciousness.mv2",
+        use_memvid: bool = True,
+        store_path: Optional[str] = None,
+        cache_frames: int = 256,
+        memory: Any = None,
+        config: Optional[Dict] = None
+    ):
         """
         Initialize consciousness stream.
 
         Args:
             path: Path to Memvid .mv2 file
-            use_memvid: Whether to use Memvid (falls back to in-memory if False or unavailable)
+            use_memvid: Whether to use Memvid (falls back if False or unavailable)
+            store_path: Directory for the local FrameStore fallback; without
+                one, the fallback is in-memory
+            cache_frames: Decoded frames kept in memory by the FrameStore
+            memory: BYRD Memory instance (unused; accepted for the caller in byrd.py)
+            config: `ralph_loop.consciousness` section; overrides the arguments above
         """
-        self.path = path
-        self.use_memvid = use_memvid
-        self._frames: List[ConsciousnessFrame] = []  # Fallback storage
+        config = config or {}
+        self.path = config.get("path", path)
+        self.use_memvid = config.get("use_memvid", use_memvid)
+        store_path = config.get("store_path", store_path)
+        self.memory = memory
+        self._frames: List[ConsciousnessFrame] = []  # In-memory fallback storage
         self._sequence_counter = 0
         self._memvid = None
+        self._store: Optional[FrameStore] = None
 
-        if use_memvid:
+        if self.use_memvid:
             try:
                 self._init_memvid()
             except Exception as e:
-                logger.warning(f"Memvid unavailable, using in-memory: {e}")
+                logger.warning(f"Memvid unavailable, using {'frame store' if store_path else 'in-memory'}: {e}")
                 self.use_memvid = False
 
+        if self._memvid is None and store_path:
+            try:
+                self._store = FrameStore(
+                    store_path,
+                    cache_size=int(config.get("cache_frames", cache_frames)),
+                    fsync=bool(config.get("fsync", False)),
+                )
+                self._sequence_counter = self._store.last_seq
+                if self._store.read_only:
+                    logger.error(
+                        f"Consciousness stream at {store_path} is read-only until the chain is "
+                        f"repaired: {self._store.corruption}"
+                    )
+            except Exception as e:
+                logger.warning(f"Frame store unavailable at {store_path}, using in-memory: {e}")
+
     def _init_memvid(self):
         """Initialize Memvid store."""
         try:
@@ -82,10 +119,15 @@ class ConsciousnessStream:
 
         Returns:
             The created ConsciousnessFrame
+
+        Raises:
+            FrameStoreError: If the frame store opened read-only (broken chain)
         """
         # Get parent hash for chain integrity
         parent_hash = None
-        if self._frames:
+        if self._store is not None:
+            parent_hash = self._store.last_content_hash
+        elif self._frames:
             parent_hash = self._frames[-1].content_hash
         elif self._memvid:
             last = await self._get_last_frame()
@@ -120,6 +162,12 @@ class ConsciousnessStream:
         # Store
         if self._memvid:
             await self._write_to_memvid(frame)
+        elif self._store is not None:
+            try:
+                self._store.append(frame)
+            except FrameStoreError:
+                self._sequence_counter -= 1
+                raise
         else:
             self._frames.append(frame)
 
@@ -174,6 +222,8 @@ class ConsciousnessStream:
         """
         if self._memvid:
             return await self._time_travel_memvid(frames_back)
+        elif self._store is not None:
+            return self._store.get(self._store.last_seq - frames_back)
         else:
             idx = len(self._frames) - frames_back - 1
             if 0 <= idx < len(self._frames):
@@ -204,6 +254,8 @@ class ConsciousnessStream:
         if self._memvid:
             # TODO: Implement Memvid semantic search
             return []
+        elif self._store is not None:
+            return self._store.search(query, limit)
         else:
             # Simple in-memory search
             matches = []
@@ -225,6 +277,8 @@ class ConsciousnessStream:
         if self._memvid:
             # TODO: Implement Memvid temporal range query
             return []
+        elif self._store is not None:
+            return self._store.range(start, end)
         else:
             return [f for f in self._frames if start <= f.timestamp <= end]
 
@@ -244,14 +298,18 @@ class ConsciousnessStream:
         Returns:
             Entropy delta (positive = increasing, negative = decreasing)
         """
-        if len(self._frames) < window:
+        if self._store is not None:
+            scores = self._store.entropy_scores(window) if len(self._store) >= window else []
+        else:
+            scores = [f.entropy_score for f in self._frames[-window:]] if len(self._frames) >= window else []
+        if not scores:
             return 0.0
 
-        recent = self._frames[-window//2:]
-        older = self._frames[-window:-window//2]
+        recent = scores[-window//2:]
+        older = scores[-window:-window//2]
 
-        recent_entropy = sum(f.entropy_score for f in recent) / len(recent) if recent else 0
-        older_entropy = sum(f.entropy_score for f in older) / len(older) if older else 0
+        recent_entropy = sum(recent) / len(recent) if recent else 0
+        older_entropy = sum(older) / len(older) if older else 0
 
         return recent_entropy - older_entropy
 
@@ -268,10 +326,11 @@ class ConsciousnessStream:
             - pattern_count: int (number of repeated patterns)
             - repeated_desires: list of desire descriptions appearing 3+ times
         """
-        if len(self._frames) < window:
+        available = len(self._store) if self._store is not None else len(self._frames)
+        if available < window:
             return {'is_circular': False, 'pattern_count': 0, 'repeated_desires': []}
 
-        recent = self._frames[-window:]
+        recent = self._store.recent(window) if self._store is not None else self._frames[-window:]
         desire_counts = {}
 
         for frame in recent:
@@ -292,6 +351,16 @@ class ConsciousnessStream:
 
     def get_stats(self) -> Dict:
         """Get consciousness stream statistics."""
+        if self._store is not None:
+            last = self._store.get(self._store.last_seq)
+            return {
+                'total_frames': self._sequence_counter,
+                'in_memory_frames': len(self._store._cache),
+                'using_memvid': False,
+                'path': str(self._store.path),
+                'last_frame_id': last.frame_id if last else None,
+                'store': self._store.get_stats()
+            }
         return {
             'total_frames': self._sequence_counter,
             'in_memory_frames': len(self._frames),
@@ -300,8 +369,15 @@ class ConsciousnessStream:
             'last_frame_id': self._frames[-1].frame_id if self._frames else None
         }
 
+    def close(self):
+        """Close the frame store (if any)."""
+        if self._store is not None:
+            self._store.close()
+
     def reset(self):
         """Reset consciousness stream (for testing)."""
         self._frames.clear()
+        if self._store is not None:
+            self._store.clear()
         self._sequence_counter = 0
         logger.info("Consciousness stream reset")
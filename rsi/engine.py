@@ -16,6 +16,7 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+import asyncio
 import logging
 
 from .prompt import SystemPrompt, PromptPruner
@@ -25,7 +26,8 @@ from .learning import (
     ExperienceLibrary, PracticeResult
 )
 from .crystallization import Crystallizer, BootstrapManager
-from .measurement import MetricsCollector
+from .measurement import MetricsCollector, CycleProfiler
+from .measurement.profiling import usage_tap
 from .preconditions import PreconditionChecker, create_precondition_checker
 
 # Import cancellation infrastructure for interruptible RSI cycles
@@ -96,6 +98,13 @@ class CycleResult:
     # Errors
     error: Optional[str] = None
 
+    # Timing: {phase: {wall_seconds, cpu_seconds, tokens, llm_calls, cache_hits}}
+    duration_seconds: float = 0.0
+    tokens_used: int = 0
+    phase_timings: Dict[str, Dict] = field(default_factory=dict)
+    # Sampled stacks for phases listed in profiling.sample_phases
+    phase_profiles: Dict[str, List[Dict]] = field(default_factory=dict)
+
     def to_dict(self) -> Dict:
         return {
             "cycle_id": self.cycle_id,
@@ -113,7 +122,11 @@ class CycleResult:
             "heuristic_crystallized": self.heuristic_crystallized,
             "interrupted": self.interrupted,
             "cancellation_reason": self.cancellation_reason,
-            "error": self.error
+            "error": self.error,
+            "duration_seconds": round(self.duration_seconds, 4),
+            "tokens_used": self.tokens_used,
+            "phase_timings": self.phase_timings,
+            "phase_profiles": self.phase_profiles
         }
 
 
@@ -174,6 +187,7 @@ class RSIEngine:
             llm_client=llm_client,
             config=emergence_config
         )
+        self.verify_concurrency = max(1, emergence_config.get("verify_concurrency", 4))
 
         self.router = DomainRouter()
 
@@ -205,6 +219,10 @@ class RSIEngine:
 
         self.metrics = MetricsCollector(memory)
 
+        # Per-phase timing / token accounting and optional sampling profiles
+        self.profiling_config = self.config.get("profiling", {})
+        self._install_usage_tap()
+
         # Cycle tracking
         self._cycle_count = 0
         self._cycle_history: List[CycleResult] = []
@@ -239,9 +257,15 @@ class RSIEngine:
             completed_at="",
             phase_reached=CyclePhase.REFLECT
         )
+        profiler = CycleProfiler(
+            sample_phases=self.profiling_config.get("sample_phases", []) if self.profiling_config.get("enabled") else (),
+            sample_interval=self.profiling_config.get("sample_interval_ms", 5) / 1000,
+            top_stacks=self.profiling_config.get("top_stacks", 10)
+        )
 
         try:
             # Phase 1: REFLECT
+            profiler.enter("reflect")
             await self._emit_event("RSI_PHASE", {"phase": "reflect", "cycle": cycle_id})
             desires = await self.reflector.reflect_for_rsi(meta_context=meta_context)
             result.desires_generated = len(desires)
@@ -249,25 +273,33 @@ class RSIEngine:
             if not desires:
                 logger.info("No desires emerged from reflection")
                 result.phase_reached = CyclePhase.REFLECT
-                return self._finalize_result(result)
+                return self._finalize_result(result, profiler)
 
             logger.info(f"Generated {len(desires)} desires from reflection")
 
             # Check for cancellation before VERIFY phase
             if self._check_cancelled(result, cancellation_token, CyclePhase.VERIFY):
-                return self._finalize_result(result)
+                return self._finalize_result(result, profiler)
 
             # Phase 2: VERIFY
             result.phase_reached = CyclePhase.VERIFY
+            profiler.enter("verify")
             await self._emit_event("RSI_PHASE", {"phase": "verify", "cycle": cycle_id})
 
-            verified_desires = []
-            for desire in desires:
-                emergence_result = await self.verifier.verify(
-                    desire=desire.desire,
-                    provenance=desire.provenance
-                )
+            # Verify all candidates concurrently (bounded); results keep desire order
+            semaphore = asyncio.Semaphore(self.verify_concurrency)
 
+            async def verify(desire):
+                async with semaphore:
+                    return await self.verifier.verify(
+                        desire=desire.desire,
+                        provenance=desire.provenance
+                    )
+
+            emergence_results = await asyncio.gather(*[verify(d) for d in desires])
+
+            verified_desires = []
+            for desire, emergence_result in zip(desires, emergence_results):
                 if emergence_result.is_emergent:
                     verified_desires.append(desire)
                     logger.debug(f"Verified: {desire.desire.get('description', '')[:50]}...")
@@ -279,14 +311,15 @@ class RSIEngine:
 
             if not verified_desires:
                 logger.info("No desires passed verification")
-                return self._finalize_result(result)
+                return self._finalize_result(result, profiler)
 
             # Check for cancellation before COLLAPSE phase
             if self._check_cancelled(result, cancellation_token, CyclePhase.COLLAPSE):
-                return self._finalize_result(result)
+                return self._finalize_result(result, profiler)
 
             # Phase 3: COLLAPSE
             result.phase_reached = CyclePhase.COLLAPSE
+            profiler.enter("collapse")
             await self._emit_event("RSI_PHASE", {"phase": "collapse", "cycle": cycle_id})
 
             # Convert to dicts for quantum collapse
@@ -298,17 +331,18 @@ class RSIEngine:
 
             if not selected:
                 logger.warning("Quantum collapse returned no selection")
-                return self._finalize_result(result)
+                return self._finalize_result(result, profiler)
 
             result.selected_desire = selected
             logger.info(f"Selected desire ({collapse_source}): {selected.get('description', '')[:80]}")
 
             # Check for cancellation before ROUTE phase
             if self._check_cancelled(result, cancellation_token, CyclePhase.ROUTE):
-                return self._finalize_result(result)
+                return self._finalize_result(result, profiler)
 
             # Phase 4: ROUTE
             result.phase_reached = CyclePhase.ROUTE
+            profiler.enter("route")
             await self._emit_event("RSI_PHASE", {"phase": "route", "cycle": cycle_id})
 
             classification = self.router.classify(selected)
@@ -320,17 +354,18 @@ class RSIEngine:
                 # Record that we tried but couldn't practice
                 result.phase_reached = CyclePhase.RECORD
                 await self._record_blocked_attempt(selected, classification.primary)
-                return self._finalize_result(result)
+                return self._finalize_result(result, profiler)
 
             # Ensure bootstrap for this domain
             await self.bootstrap.ensure_bootstrap(classification.primary.value)
 
             # Check for cancellation before PRACTICE phase (typically longest)
             if self._check_cancelled(result, cancellation_token, CyclePhase.PRACTICE):
-                return self._finalize_result(result)
+                return self._finalize_result(result, profiler)
 
             # Phase 5: PRACTICE
             result.phase_reached = CyclePhase.PRACTICE
+            profiler.enter("practice")
             await self._emit_event("RSI_PHASE", {"phase": "practice", "cycle": cycle_id})
             result.practice_attempted = True
 
@@ -347,10 +382,11 @@ class RSIEngine:
 
             # Check for cancellation before RECORD phase
             if self._check_cancelled(result, cancellation_token, CyclePhase.RECORD):
-                return self._finalize_result(result)
+                return self._finalize_result(result, profiler)
 
             # Phase 6: RECORD
             result.phase_reached = CyclePhase.RECORD
+            profiler.enter("record")
             await self._emit_event("RSI_PHASE", {"phase": "record", "cycle": cycle_id})
 
             if practice_result:
@@ -370,11 +406,12 @@ class RSIEngine:
 
             # Check for cancellation before CRYSTALLIZE phase
             if self._check_cancelled(result, cancellation_token, CyclePhase.CRYSTALLIZE):
-                return self._finalize_result(result)
+                return self._finalize_result(result, profiler)
 
             # Phase 7: CRYSTALLIZE (only if practice succeeded)
             if practice_result and practice_result.success:
                 result.phase_reached = CyclePhase.CRYSTALLIZE
+                profiler.enter("crystallize")
                 await self._emit_event("RSI_PHASE", {"phase": "crystallize", "cycle": cycle_id})
 
                 heuristic = await self.crystallizer.maybe_crystallize(
@@ -395,10 +432,11 @@ class RSIEngine:
 
             # Check for cancellation before MEASURE phase
             if self._check_cancelled(result, cancellation_token, CyclePhase.MEASURE):
-                return self._finalize_result(result)
+                return self._finalize_result(result, profiler)
 
             # Phase 8: MEASURE
             result.phase_reached = CyclePhase.MEASURE
+            profiler.enter("measure")
             await self._emit_event("RSI_PHASE", {"phase": "measure", "cycle": cycle_id})
 
             # Record cycle in metrics
@@ -410,15 +448,15 @@ class RSIEngine:
                 "practice_successes": 1 if result.practice_succeeded else 0,
                 "heuristics_crystallized": 1 if result.heuristic_crystallized else 0,
                 "blocked_domains": [result.domain] if result.domain_blocked else [],
-                "duration_seconds": 0  # Would need timing
+                "duration_seconds": profiler.elapsed
             })
 
-            return self._finalize_result(result)
+            return self._finalize_result(result, profiler)
 
         except Exception as e:
             logger.error(f"RSI cycle error: {e}", exc_info=True)
             result.error = str(e)
-            return self._finalize_result(result)
+            return self._finalize_result(result, profiler)
 
     def _check_cancelled(self, result: CycleResult, token: Optional[CancellationToken], phase: CyclePhase) -> bool:
         """
@@ -602,9 +640,26 @@ class RSIEngine:
             except Exception as e:
                 logger.debug(f"Event emission failed: {e}")
 
-    def _finalize_result(self, result: CycleResult) -> CycleResult:
+    def _install_usage_tap(self):
+        """Route the LLM client's token usage into per-phase accounting."""
+        if not hasattr(self.llm, "set_usage_callback"):
+            return
+        previous = getattr(self.llm, "_usage_callback", None)
+        if getattr(previous, "byrd_usage_tap", False):
+            return  # Another engine already tapped this client
+        self.llm.set_usage_callback(usage_tap(previous))
+
+    def _finalize_result(self, result: CycleResult, profiler: Optional[CycleProfiler] = None) -> CycleResult:
         """Finalize cycle result with timing."""
         result.completed_at = datetime.now().isoformat()
+        if profiler is not None:
+            result.phase_timings = profiler.finish()
+            result.phase_profiles = profiler.profiles
+            result.duration_seconds = profiler.duration_seconds
+            result.tokens_used = profiler.tokens
+            self.metrics.record_phase_timings(
+                result.phase_timings, result.duration_seconds, result.tokens_used
+            )
         self._cycle_history.append(result)
 
         # Trim history to last 100 cycles
@@ -635,6 +690,7 @@ class RSIEngine:
             "bootstrap": bootstrap_status,
             "cycle_count": self._cycle_count,
             "recent_cycles": [c.to_dict() for c in self._cycle_history[-10:]],
+            "timing": self.metrics.get_phase_histograms(),
             "precondition_violations": self._precondition_violations.copy()
         }
 
@@ -1,6 +1,7 @@
 """RSI Learning Components - Domain routing and practice."""
 from .domain_router import DomainRouter, Domain, VerificationMethod, ClassificationResult
 from .tdd_practice import TDDPractice, PracticeProblem, PracticeResult
+from .sandbox_pool import SandboxPool
 from .consistency_check import ConsistencyCheck, ConsistencyResult
 from .experience_library import ExperienceLibrary, Trajectory
 
@@ -12,6 +13,7 @@ __all__ = [
     "TDDPractice",
     "PracticeProblem",
     "PracticeResult",
+    "SandboxPool",
     "ConsistencyCheck",
     "ConsistencyResult",
     "ExperienceLibrary",
@@ -3,10 +3,19 @@ Consistency Check - Verification for logic domain.
 
 Since logic doesn't have unit tests, we verify by running the same
 prompt multiple times and checking for consistency in conclusions.
+
+Runs are issued concurrently (bounded by max_concurrency; the LLM
+client's rate limiter still enforces the provider budget) and tallied
+as they complete. With early_stop, outstanding runs are cancelled as
+soon as the verdict can no longer change: the leading conclusion already
+clears the threshold even if every remaining run disagrees, or it can't
+reach it even if every remaining run agrees.
 """
 
+from collections import Counter
 from dataclasses import dataclass
 from typing import List, Dict, Optional
+import asyncio
 import logging
 
 logger = logging.getLogger("rsi.learning.consistency")
@@ -18,8 +27,9 @@ class ConsistencyResult:
     is_consistent: bool
     reasoning: Optional[str]
     consistency_score: float  # 0.0-1.0
-    responses: List[str]
+    responses: List[str]  # In completion order; fewer than n_runs after an early stop
     variance_notes: str
+    stopped_early: bool = False
 
 
 class ConsistencyCheck:
@@ -43,11 +53,17 @@ class ConsistencyCheck:
         """
         self.llm = llm_client
         self.config = config or {}
-        self.n_runs = self.config.get("consistency_runs", self.N_RUNS)
+        self.n_runs = self.config.get("n_runs", self.config.get("consistency_runs", self.N_RUNS))
+        self.threshold = self.config.get("agreement_threshold", self.CONSISTENCY_THRESHOLD)
+        self.temperature = self.config.get("temperature", 0.7)
+        self.max_concurrency = max(1, self.config.get("max_concurrency", self.n_runs))
+        self.early_stop = self.config.get("early_stop", True)
 
         # Stats
         self._checks = 0
         self._consistent_checks = 0
+        self._early_stops = 0
+        self._runs_saved = 0
 
     async def run(self, desire: Dict) -> ConsistencyResult:
         """
@@ -65,18 +81,42 @@ class ConsistencyCheck:
         # Generate the reasoning prompt
         reasoning_prompt = self._build_reasoning_prompt(description)
 
-        # Run multiple times
-        responses = []
-        for i in range(self.n_runs):
-            try:
-                response = await self.llm.query(
-                    reasoning_prompt,
-                    temperature=0.7  # Some variation to test robustness
-                )
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def reason(i: int) -> str:
+            async with semaphore:
+                try:
+                    return await self.llm.query(
+                        reasoning_prompt,
+                        temperature=self.temperature  # Some variation to test robustness
+                    )
+                except Exception as e:
+                    logger.warning(f"Reasoning run {i+1} failed: {e}")
+                    return ""
+
+        # Fan out, tallying conclusions as runs complete
+        tasks = [asyncio.create_task(reason(i)) for i in range(self.n_runs)]
+        responses: List[str] = []
+        tally: Counter = Counter()
+        stopped_early = False
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                response = await next_done
                 responses.append(response)
-            except Exception as e:
-                logger.warning(f"Reasoning run {i+1} failed: {e}")
-                responses.append("")
+                if response:
+                    tally[self._extract_conclusion(response)] += 1
+                remaining = self.n_runs - len(responses)
+                if remaining and self.early_stop and self._is_settled(tally, remaining):
+                    stopped_early = True
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if stopped_early:
+            self._early_stops += 1
+            self._runs_saved += self.n_runs - len(responses)
 
         # Check consistency
         is_consistent, score, notes = self._analyze_consistency(responses)
@@ -84,14 +124,34 @@ class ConsistencyCheck:
         if is_consistent:
             self._consistent_checks += 1
 
+        reasoning = None
+        if is_consistent:
+            leader = tally.most_common(1)[0][0]
+            reasoning = next(r for r in responses if r and self._extract_conclusion(r) == leader)
+
         return ConsistencyResult(
             is_consistent=is_consistent,
-            reasoning=responses[0] if is_consistent else None,
+            reasoning=reasoning,
             consistency_score=score,
             responses=responses,
-            variance_notes=notes
+            variance_notes=notes,
+            stopped_early=stopped_early
         )
 
+    def _is_settled(self, tally: Counter, remaining: int) -> bool:
+        """
+        True once the remaining runs can't change the verdict.
+
+        Failed runs count toward neither side, so the worst case for the
+        leader is every remaining run succeeding with another conclusion,
+        and the best case is every remaining run agreeing with it.
+        """
+        valid = sum(tally.values())
+        leader = max(tally.values(), default=0)
+        if leader / (valid + remaining) >= self.threshold:
+            return True  # Consistent whatever happens
+        return (leader + remaining) / (valid + remaining) < self.threshold  # Unreachable
+
     def _build_reasoning_prompt(self, description: str) -> str:
         """Build a reasoning prompt from the desire."""
         return f"""Reason through the following carefully:
@@ -132,12 +192,12 @@ End with a clear CONCLUSION: statement.
         # Build variance notes
         if len(unique_conclusions) == 1:
             notes = "Perfect agreement across all runs"
-        elif score >= self.CONSISTENCY_THRESHOLD:
+        elif score >= self.threshold:
             notes = f"{agreement_count}/{len(conclusions)} runs agreed"
         else:
             notes = f"High variance: {len(unique_conclusions)} different conclusions"
 
-        return score >= self.CONSISTENCY_THRESHOLD, score, notes
+        return score >= self.threshold, score, notes
 
     def _extract_conclusion(self, response: str) -> str:
         """Extract the conclusion from a reasoning response."""
@@ -214,10 +274,14 @@ EXPECTED_CONCLUSION: [The correct conclusion]
         return {
             "total_checks": self._checks,
             "consistent_checks": self._consistent_checks,
-            "consistency_rate": self._consistent_checks / max(self._checks, 1)
+            "consistency_rate": self._consistent_checks / max(self._checks, 1),
+            "early_stops": self._early_stops,
+            "runs_saved": self._runs_saved
         }
 
     def reset(self):
         """Reset checker state."""
         self._checks = 0
         self._consistent_checks = 0
+        self._early_stops = 0
+        self._runs_saved = 0
@@ -0,0 +1,331 @@
+"""
+SandboxPool - Pre-warmed, resource-limited pytest workers for TDD practice.
+
+Launching `python -m pytest` per attempt pays interpreter and pytest
+startup every time. The pool keeps `size` worker processes
+(sandbox_worker.py) alive with pytest already imported; a run hands
+(solution, tests) to an idle worker over a pipe and gets back structured
+per-test results.
+
+Each worker is a zygote: it forks a fresh child per run, so solutions
+never share interpreter state. A crashed or timed-out child (resource
+limit hit, segfault, os._exit, infinite loop) is reported by the worker,
+which stays warm for the next run.
+
+Workers themselves are recycled:
+- after max_runs runs (matters where fork() is unavailable and runs
+  execute inside the worker itself)
+- when they stop responding (the worker is killed)
+
+A replacement is spawned immediately and warms up in the background, so
+the next run normally still finds a warm worker.
+
+Usage:
+    pool = SandboxPool(size=4)
+    result = await pool.run(solution_code, test_code, timeout=30)
+    result["tests"]  # [{"name", "outcome", "duration", "message"}, ...]
+"""
+
+import asyncio
+import json
+import logging
+import os
+import select
+import struct
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, List, Optional
+
+logger = logging.getLogger("rsi.learning.sandbox")
+
+WORKER_SCRIPT = Path(__file__).with_name("sandbox_worker.py")
+_HEADER = struct.Struct(">I")
+
+# Extra time the pool allows over a run's timeout before killing the
+# worker; the worker enforces the run timeout on its child itself
+_TIMEOUT_GRACE = 5.0
+
+
+class SandboxError(Exception):
+    """Raised when a worker dies or times out mid-run."""
+    pass
+
+
+class SandboxTimeout(SandboxError):
+    pass
+
+
+class SandboxWorker:
+    """One warm worker process and its pipe protocol."""
+
+    def __init__(self, python: str, env: Dict[str, str]):
+        self.process = subprocess.Popen(
+            [python, str(WORKER_SCRIPT)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env,
+        )
+        self.runs = 0
+        self.ready = False
+        self.started_at = time.monotonic()
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def wait_ready(self, timeout: float) -> None:
+        if self.ready:
+            return
+        message = self._receive(time.monotonic() + timeout)
+        if not message.get("ready"):
+            raise SandboxError("Worker did not report ready")
+        self.ready = True
+
+    def request(self, message: Dict, timeout: float) -> Dict:
+        body = json.dumps(message).encode("utf-8")
+        try:
+            self.process.stdin.write(_HEADER.pack(len(body)) + body)
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise SandboxError(f"Worker pipe closed: {e}")
+        response = self._receive(time.monotonic() + timeout)
+        self.runs += 1
+        return response
+
+    def _receive(self, deadline: float) -> Dict:
+        header = self._read_exact(_HEADER.size, deadline)
+        (length,) = _HEADER.unpack(header)
+        return json.loads(self._read_exact(length, deadline).decode("utf-8"))
+
+    def _read_exact(self, n: int, deadline: float) -> bytes:
+        fd = self.process.stdout.fileno()
+        chunks = []
+        while n > 0:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise SandboxTimeout("Worker timed out")
+            readable, _, _ = select.select([fd], [], [], remaining)
+            if not readable:
+                continue
+            chunk = os.read(fd, n)
+            if not chunk:
+                code = self.process.wait()
+                raise SandboxError(f"Worker exited with code {code}")
+            chunks.append(chunk)
+            n -= len(chunk)
+        return b"".join(chunks)
+
+    def stop(self, kill: bool = False) -> None:
+        if self.process.poll() is not None:
+            return
+        if kill:
+            self.process.kill()
+        else:
+            try:
+                self.process.stdin.close()  # EOF -> worker exits
+            except OSError:
+                pass
+        try:
+            self.process.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+
+class SandboxPool:
+    """
+    Fixed-size pool of warm sandbox workers.
+
+    run_sync() blocks the calling thread; run() hands it to a thread so
+    any number of practice attempts can await concurrently (at most
+    `size` execute at once, the rest queue for a worker).
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_runs: int = 50,
+        memory_mb: Optional[int] = 1024,
+        cpu_seconds: Optional[int] = 30,
+        fsize_mb: Optional[int] = 16,
+        warmup_timeout: float = 30.0,
+        python: str = None,
+    ):
+        self.size = max(1, size)
+        self.max_runs = max(1, max_runs)
+        self.limits = {"memory_mb": memory_mb, "cpu_seconds": cpu_seconds, "fsize_mb": fsize_mb}
+        self.warmup_timeout = warmup_timeout
+        self.python = python or sys.executable
+
+        self._env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+        self._idle: Deque[SandboxWorker] = deque()
+        self._all: List[SandboxWorker] = []
+        self._cond = threading.Condition()
+        self._closed = False
+
+        # Stats
+        self._runs = 0
+        self._started = 0
+        self._recycled = 0
+        self._crashes = 0
+        self._timeouts = 0
+        self._run_seconds = 0.0
+        self._wait_seconds = 0.0
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "SandboxPool":
+        return cls(
+            size=config.get("size", 2),
+            max_runs=config.get("max_runs", 50),
+            memory_mb=config.get("memory_mb", 1024),
+            cpu_seconds=config.get("cpu_seconds", 30),
+            fsize_mb=config.get("fsize_mb", 16),
+            warmup_timeout=config.get("warmup_timeout", 30.0),
+            python=config.get("python_path") or None,
+        )
+
+    # ===== Lifecycle =====
+
+    def start(self) -> None:
+        """Spawn all workers now (they warm up in the background)."""
+        with self._cond:
+            if self._closed:
+                raise SandboxError("Pool is closed")
+            while len(self._all) < self.size:
+                self._idle.append(self._spawn())
+
+    def _spawn(self) -> SandboxWorker:
+        worker = SandboxWorker(self.python, self._env)
+        self._all.append(worker)
+        self._started += 1
+        return worker
+
+    def _retire(self, worker: SandboxWorker, kill: bool) -> None:
+        worker.stop(kill=kill)
+        with self._cond:
+            if worker in self._all:
+                self._all.remove(worker)
+            if not self._closed:
+                self._idle.append(self._spawn())
+            self._cond.notify()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            workers = list(self._all)
+            self._all.clear()
+            self._idle.clear()
+            self._cond.notify_all()
+        for worker in workers:
+            worker.stop()
+
+    # ===== Running =====
+
+    def _acquire(self) -> SandboxWorker:
+        waited = time.monotonic()
+        with self._cond:
+            if self._closed:
+                raise SandboxError("Pool is closed")
+            while len(self._all) < self.size:
+                self._idle.append(self._spawn())
+            while not self._idle:
+                self._cond.wait()
+                if self._closed:
+                    raise SandboxError("Pool is closed")
+            worker = self._idle.popleft()
+        self._wait_seconds += time.monotonic() - waited
+        return worker
+
+    def _release(self, worker: SandboxWorker) -> None:
+        if worker.runs >= self.max_runs or not worker.alive():
+            self._recycled += 1
+            self._retire(worker, kill=False)
+            return
+        with self._cond:
+            self._idle.append(worker)
+            self._cond.notify()
+
+    def run_sync(self, solution: str, tests: str, timeout: float = 30.0) -> Dict:
+        """
+        Run tests against solution in a warm worker.
+
+        Returns the TDDPractice result dict (passed, output, passed_count,
+        total_count, error) plus "tests": per-test outcomes.
+        """
+        worker = self._acquire()
+        start = time.monotonic()
+        try:
+            worker.wait_ready(self.warmup_timeout)
+            response = worker.request(
+                {"solution": solution, "tests": tests, "limits": self.limits, "timeout": timeout},
+                timeout + _TIMEOUT_GRACE
+            )
+        except SandboxTimeout:
+            self._timeouts += 1
+            self._retire(worker, kill=True)
+            return _failure("Timeout exceeded", f"Test execution timed out after {timeout}s")
+        except SandboxError as e:
+            self._crashes += 1
+            self._retire(worker, kill=True)
+            return _failure(str(e), f"Sandbox worker crashed: {e}")
+        finally:
+            self._run_seconds += time.monotonic() - start
+            self._runs += 1
+
+        self._release(worker)
+        if response.get("timed_out"):
+            self._timeouts += 1
+            return _failure("Timeout exceeded", f"Test execution timed out after {timeout}s")
+        if response.get("crashed"):
+            self._crashes += 1
+            return _failure(response["error"], f"Sandbox run crashed: {response['error']}")
+        return _normalize(response)
+
+    async def run(self, solution: str, tests: str, timeout: float = 30.0) -> Dict:
+        """Async wrapper: the blocking pipe I/O runs in a thread."""
+        return await asyncio.to_thread(self.run_sync, solution, tests, timeout)
+
+    def get_stats(self) -> Dict:
+        with self._cond:
+            workers = len(self._all)
+            idle = len(self._idle)
+        return {
+            "size": self.size,
+            "workers": workers,
+            "idle": idle,
+            "runs": self._runs,
+            "workers_started": self._started,
+            "recycled": self._recycled,
+            "crashes": self._crashes,
+            "timeouts": self._timeouts,
+            "avg_run_ms": round(self._run_seconds / max(self._runs, 1) * 1000, 2),
+            "avg_wait_ms": round(self._wait_seconds / max(self._runs, 1) * 1000, 2),
+            "limits": dict(self.limits),
+        }
+
+
+def _failure(output: str, error: str) -> Dict:
+    return {
+        "passed": False,
+        "output": output,
+        "passed_count": 0,
+        "total_count": 1,
+        "error": error,
+        "tests": [],
+    }
+
+
+def _normalize(response: Dict) -> Dict:
+    """Fill in keys a worker-side exception response lacks."""
+    if "tests" not in response:
+        error = response.get("error") or "Sandbox run failed"
+        return _failure(error, error)
+    return response
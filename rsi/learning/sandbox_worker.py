@@ -0,0 +1,264 @@
+"""
+Sandbox worker - a pre-warmed pytest process serving TDD practice runs.
+
+Started by SandboxPool as a plain script (no package imports, so it
+works without the rsi package on sys.path). A throwaway warm-up session
+at startup imports pytest and everything a session loads.
+
+The warm process is a zygote: it never runs untrusted code itself. Each
+request is run in a fork()ed child that inherits the warm interpreter,
+applies hard resource limits and exits when done, so nothing a solution
+does (patched builtins, threads, recursion limit, rlimits) reaches the
+next run. Where fork() is unavailable, runs execute in-process.
+
+Protocol (stdin/stdout, each message a 4-byte big-endian length followed
+by UTF-8 JSON):
+
+    worker -> pool   {"ready": true, "pid": ...}              once, after warm-up
+    pool -> worker   {"solution": "...", "tests": "...", "limits": {...}, "timeout": ...}
+    worker -> pool   {"passed": ..., "tests": [...], "output": "...", ...}
+                     or {"passed": false, "crashed"|"timed_out": true, "error": "..."}
+
+EOF on stdin shuts the worker down. Anything the solution prints to
+stdout is diverted to stderr so it can never corrupt the protocol stream.
+"""
+
+import contextlib
+import io
+import json
+import os
+import select
+import signal
+import struct
+import sys
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+_HEADER = struct.Struct(">I")
+HAS_FORK = hasattr(os, "fork")
+
+
+def read_message(stream):
+    header = stream.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        return None
+    (length,) = _HEADER.unpack(header)
+    return json.loads(stream.read(length).decode("utf-8"))
+
+
+def write_message(stream, message):
+    body = json.dumps(message, default=str).encode("utf-8")
+    stream.write(_HEADER.pack(len(body)) + body)
+    stream.flush()
+
+
+def apply_limits(limits):
+    """Resource limits for a run child (soft and hard: the child cannot raise them)."""
+    if resource is None:
+        return
+    memory_mb = limits.get("memory_mb")
+    if memory_mb:
+        _set_limit(resource.RLIMIT_AS, int(memory_mb) * 1024 * 1024)
+    fsize_mb = limits.get("fsize_mb")
+    if fsize_mb:
+        _set_limit(resource.RLIMIT_FSIZE, int(fsize_mb) * 1024 * 1024)
+    cpu_seconds = limits.get("cpu_seconds")
+    if cpu_seconds:
+        # CPU time restarts at zero in a forked child; SIGXCPU at the soft
+        # limit, SIGKILL one second later
+        _set_limit(resource.RLIMIT_CPU, int(cpu_seconds), extra_hard=1)
+
+
+def _set_limit(which, value, extra_hard=0):
+    _, hard = resource.getrlimit(which)
+    new_hard = value + extra_hard
+    if hard != resource.RLIM_INFINITY:
+        value = min(value, hard)
+        new_hard = min(new_hard, hard)
+    try:
+        resource.setrlimit(which, (value, new_hard))
+    except (ValueError, OSError):
+        pass
+
+
+class ResultCollector:
+    """pytest plugin recording one final outcome per test."""
+
+    def __init__(self):
+        self.tests = {}
+        self.collection_errors = []
+
+    def pytest_runtest_logreport(self, report):
+        entry = self.tests.setdefault(
+            report.nodeid,
+            {"name": report.nodeid.split("::")[-1], "outcome": "passed", "duration": 0.0, "message": None}
+        )
+        entry["duration"] += report.duration
+        if report.failed:
+            entry["outcome"] = "error" if report.when != "call" else "failed"
+            entry["message"] = str(report.longrepr)[-1000:]
+        elif report.skipped and entry["outcome"] == "passed":
+            entry["outcome"] = "skipped"
+
+    def pytest_collectreport(self, report):
+        if report.failed:
+            self.collection_errors.append(str(report.longrepr)[-1000:])
+
+
+def run_tests(request):
+    import pytest
+
+    solution = request["solution"]
+    tests = request["tests"]
+    if "from solution import" not in tests and "import solution" not in tests:
+        tests = f"from solution import *\n\n{tests}"
+
+    path_before = list(sys.path)
+    cwd_before = os.getcwd()
+    collector = ResultCollector()
+    output = io.StringIO()
+    start = time.perf_counter()
+
+    with tempfile.TemporaryDirectory(prefix="byrd_sandbox_") as tmpdir:
+        with open(os.path.join(tmpdir, "solution.py"), "w") as f:
+            f.write(solution)
+        with open(os.path.join(tmpdir, "test_solution.py"), "w") as f:
+            f.write(tests)
+        with open(os.path.join(tmpdir, "pytest.ini"), "w") as f:
+            f.write("[pytest]\n")  # Pin rootdir; never pick up an outer config
+
+        try:
+            os.chdir(tmpdir)
+            sys.path.insert(0, tmpdir)
+            with contextlib.redirect_stdout(output):
+                exit_code = pytest.main(
+                    [os.path.join(tmpdir, "test_solution.py"), "-q", "--tb=short",
+                     "-p", "no:cacheprovider"],
+                    plugins=[collector]
+                )
+        finally:
+            os.chdir(cwd_before)
+            sys.path[:] = path_before
+            # Forget the practice modules so the next run imports its own
+            for name, module in list(sys.modules.items()):
+                if (getattr(module, "__file__", None) or "").startswith(tmpdir):
+                    del sys.modules[name]
+
+    results = list(collector.tests.values())
+    passed_count = sum(1 for t in results if t["outcome"] == "passed")
+    text = output.getvalue()
+    passed = int(exit_code) == 0 and not collector.collection_errors
+    return {
+        "passed": passed,
+        "exit_code": int(exit_code),
+        "tests": results,
+        "collection_errors": collector.collection_errors,
+        "passed_count": passed_count,
+        "total_count": max(len(results), 1),
+        "output": text[:2000],
+        "error": None if passed else text[-500:],
+        "duration": time.perf_counter() - start,
+    }
+
+
+def run_forked(request, protocol_out):
+    """Run one request in a forked child and collect its response."""
+    timeout = request.get("timeout")
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        # Child: never touch the protocol stream; report through the pipe
+        os.close(read_fd)
+        protocol_out.close()
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(devnull, 0)  # A solution reading stdin must not eat requests
+        try:
+            apply_limits(request.get("limits", {}))
+            try:
+                response = run_tests(request)
+            except MemoryError:
+                response = {"passed": False, "error": "Sandbox memory limit exceeded"}
+            except Exception as e:
+                response = {"passed": False, "error": f"{type(e).__name__}: {e}"}
+            with os.fdopen(write_fd, "wb") as out:
+                out.write(json.dumps(response, default=str).encode("utf-8"))
+        finally:
+            os._exit(0)
+
+    os.close(write_fd)
+    deadline = time.monotonic() + timeout if timeout else None
+    chunks = []
+    timed_out = False
+    with os.fdopen(read_fd, "rb", buffering=0) as pipe:
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                timed_out = True
+                break
+            readable, _, _ = select.select([pipe], [], [], remaining)
+            if not readable:
+                continue
+            chunk = pipe.read(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+
+    if timed_out:
+        os.kill(pid, signal.SIGKILL)
+    _, status = os.waitpid(pid, 0)
+
+    if timed_out:
+        return {"passed": False, "timed_out": True,
+                "error": f"Test execution timed out after {timeout}s"}
+    if chunks:
+        try:
+            return json.loads(b"".join(chunks).decode("utf-8"))
+        except ValueError:
+            pass
+    if os.WIFSIGNALED(status):
+        reason = f"killed by signal {os.WTERMSIG(status)}"
+    else:
+        reason = f"exited with code {os.WEXITSTATUS(status)}"
+    return {"passed": False, "crashed": True, "error": f"run {reason}"}
+
+
+def run_in_process(request):
+    """Fallback without fork(): run in the worker itself (the pool recycles it)."""
+    try:
+        return run_tests(request)
+    except MemoryError:
+        return {"passed": False, "error": "Sandbox memory limit exceeded"}
+    except Exception as e:
+        return {"passed": False, "error": f"{type(e).__name__}: {e}"}
+
+
+def main():
+    # Keep a private handle on the real stdout, then point fd 1 at stderr
+    protocol_out = os.fdopen(os.dup(1), "wb")
+    os.dup2(2, 1)
+    protocol_in = sys.stdin.buffer
+
+    # Warm-up: pytest imports plugins and internals lazily on first use
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_tests({"solution": "", "tests": "def test_warmup():\n    pass\n"})
+
+    write_message(protocol_out, {"ready": True, "pid": os.getpid(), "forking": HAS_FORK})
+
+    while True:
+        request = read_message(protocol_in)
+        if request is None:
+            return
+        if HAS_FORK:
+            response = run_forked(request, protocol_out)
+        else:
+            response = run_in_process(request)
+        write_message(protocol_out, response)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ Generates practice problems with tests FIRST, then attempts solutions.
 This ensures we have an oracle (tests) to verify learning.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, List, Dict
 from collections import deque
 import subprocess
@@ -15,6 +15,8 @@ import logging
 import json
 from pathlib import Path
 
+from .sandbox_pool import SandboxPool
+
 logger = logging.getLogger("rsi.learning.tdd")
 
 
@@ -40,6 +42,7 @@ class PracticeResult:
     attempts: int = 1
     difficulty: str = "beginner"
     error: Optional[str] = None
+    test_results: List[Dict] = field(default_factory=list)  # Per-test outcomes
 
 
 class OracleGenerationError(Exception):
@@ -86,6 +89,13 @@ class TDDPractice:
         # Configurable timeout
         self.timeout = self.config.get("practice_timeout", self.DEFAULT_TIMEOUT)
 
+        # Warm sandbox workers for test runs (workers spawn on first use);
+        # disabled -> a fresh pytest subprocess per run
+        pool_config = self.config.get("tdd_practice", {}).get("sandbox_pool", {})
+        self._sandbox: Optional[SandboxPool] = None
+        if pool_config.get("enabled", True):
+            self._sandbox = SandboxPool.from_config(pool_config)
+
         # Stats
         self._attempts = 0
         self._successes = 0
@@ -283,7 +293,7 @@ Do NOT use markdown code blocks. Just output raw Python code."""
                 continue
 
             # Run tests
-            test_result = self._run_tests(problem.oracle, solution)
+            test_result = await self._run_tests(problem.oracle, solution)
 
             if test_result["passed"]:
                 self._successes += 1
@@ -296,7 +306,8 @@ Do NOT use markdown code blocks. Just output raw Python code."""
                     problem=problem.spec[:500],
                     approach="TDD Practice",
                     attempts=attempt + 1,
-                    difficulty=problem.difficulty
+                    difficulty=problem.difficulty,
+                    test_results=test_result.get("tests", [])
                 )
 
         # All attempts failed
@@ -310,7 +321,8 @@ Do NOT use markdown code blocks. Just output raw Python code."""
             approach="TDD Practice",
             attempts=self.MAX_SOLUTION_ATTEMPTS,
             difficulty=problem.difficulty,
-            error=test_result.get("error")
+            error=test_result.get("error"),
+            test_results=test_result.get("tests", [])
         )
 
     async def _generate_solution(self, problem: PracticeProblem) -> str:
@@ -349,8 +361,19 @@ Return ONLY the corrected Python code."""
         response = await self.llm.query(prompt, temperature=0.5, max_tokens=800)
         return self._extract_code(response)
 
-    def _run_tests(self, tests: str, solution: str) -> Dict:
-        """Run tests against solution in sandboxed subprocess."""
+    async def _run_tests(self, tests: str, solution: str) -> Dict:
+        """
+        Run tests against solution without blocking the event loop.
+
+        Uses a warm sandbox worker when the pool is enabled, so concurrent
+        practice attempts execute in parallel (up to the pool size).
+        """
+        if self._sandbox is None:
+            return await asyncio.to_thread(self._run_tests_subprocess, tests, solution)
+        return await self._sandbox.run(solution, tests, timeout=self.timeout)
+
+    def _run_tests_subprocess(self, tests: str, solution: str) -> Dict:
+        """Run tests against solution in a fresh pytest subprocess."""
         with tempfile.TemporaryDirectory() as tmpdir:
             # Write solution
             solution_path = Path(tmpdir) / "solution.py"
@@ -442,7 +465,7 @@ Return ONLY the corrected Python code."""
 
     def get_stats(self) -> Dict:
         """Get practice statistics."""
-        return {
+        stats = {
             "attempts": self._attempts,
             "successes": self._successes,
             "success_rate": self._successes / max(self._attempts, 1),
@@ -451,6 +474,14 @@ Return ONLY the corrected Python code."""
                 for k, v in self._domain_difficulty.items()
             }
         }
+        if self._sandbox is not None:
+            stats["sandbox"] = self._sandbox.get_stats()
+        return stats
+
+    def close(self):
+        """Shut down sandbox workers."""
+        if self._sandbox is not None:
+            self._sandbox.close()
 
     def reset(self):
         """Reset practice state."""
@@ -1,5 +1,6 @@
 """RSI Measurement Components - Metrics, validation, and baselines."""
 from .metrics import MetricsCollector, RSIMetrics, CycleMetrics
+from .profiling import CycleProfiler, SamplingProfiler, Histogram, PhaseTiming
 from .hypothesis_tests import (
     HypothesisValidator, TestResult as HypothesisTestResult, ValidationReport, run_validation
 )
@@ -21,6 +22,11 @@ __all__ = [
     "MetricsCollector",
     "RSIMetrics",
     "CycleMetrics",
+    # Profiling
+    "CycleProfiler",
+    "SamplingProfiler",
+    "Histogram",
+    "PhaseTiming",
     # Hypothesis testing
     "HypothesisValidator",
     "HypothesisTestResult",
@@ -6,6 +6,7 @@ Tracks:
 - Heuristic transfer (H6)
 - Direction variance (diversity)
 - Complete learning cycles
+- Per-phase wall/CPU time and token histograms
 """
 
 from dataclasses import dataclass, asdict
@@ -14,6 +15,8 @@ from datetime import datetime
 import logging
 import math
 
+from .profiling import Histogram, DURATION_BUCKETS, TOKEN_BUCKETS
+
 logger = logging.getLogger("rsi.measurement.metrics")
 
 
@@ -96,6 +99,11 @@ class MetricsCollector:
         self._domain_counts: Dict[str, int] = {}
         self._desire_descriptions: List[str] = []  # For variance calculation
 
+        # Timing histograms: phase -> {"wall_seconds"|"cpu_seconds"|"tokens": Histogram}
+        self._phase_histograms: Dict[str, Dict[str, Histogram]] = {}
+        self._cycle_duration = Histogram(DURATION_BUCKETS)
+        self._cycle_tokens = Histogram(TOKEN_BUCKETS)
+
     def record_cycle(self, result: Dict):
         """
         Record metrics from a completed RSI cycle.
@@ -142,6 +150,42 @@ class MetricsCollector:
             duration_seconds=result.get("duration_seconds", 0.0)
         ))
 
+    def record_phase_timings(self, timings: Dict[str, Dict], duration_seconds: float, tokens: int):
+        """
+        Record one cycle's per-phase timings (every cycle, including ones
+        that stop early).
+
+        Args:
+            timings: {phase: {"wall_seconds", "cpu_seconds", "tokens", ...}}
+            duration_seconds: Wall time of the whole cycle
+            tokens: LLM tokens spent by the whole cycle
+        """
+        for phase, timing in timings.items():
+            histograms = self._phase_histograms.get(phase)
+            if histograms is None:
+                histograms = self._phase_histograms[phase] = {
+                    "wall_seconds": Histogram(DURATION_BUCKETS),
+                    "cpu_seconds": Histogram(DURATION_BUCKETS),
+                    "tokens": Histogram(TOKEN_BUCKETS),
+                }
+            for key, histogram in histograms.items():
+                histogram.observe(timing.get(key, 0))
+        self._cycle_duration.observe(duration_seconds)
+        self._cycle_tokens.observe(tokens)
+
+    def get_phase_histograms(self) -> Dict:
+        """Timing histograms for /api/rsi/metrics."""
+        return {
+            "cycle": {
+                "duration_seconds": self._cycle_duration.to_dict(),
+                "tokens": self._cycle_tokens.to_dict(),
+            },
+            "phases": {
+                phase: {key: h.to_dict() for key, h in histograms.items()}
+                for phase, histograms in self._phase_histograms.items()
+            },
+        }
+
     def record_desire(self, description: str, domain: str, accepted: bool):
         """
         Record a processed desire for variance tracking.
@@ -282,3 +326,6 @@ class MetricsCollector:
         self._cycle_history.clear()
         self._domain_counts.clear()
         self._desire_descriptions.clear()
+        self._phase_histograms.clear()
+        self._cycle_duration = Histogram(DURATION_BUCKETS)
+        self._cycle_tokens = Histogram(TOKEN_BUCKETS)
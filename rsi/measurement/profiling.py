@@ -0,0 +1,257 @@
+"""
+Cycle Profiling - Per-phase wall/CPU time, token accounting and sampling.
+
+CycleProfiler follows an RSI cycle through its phases: enter(phase)
+closes the previous phase and opens the next, finish() closes the last.
+For every phase it records:
+- wall seconds (perf_counter)
+- CPU seconds (process_time; the whole process, so concurrent work
+  shows up in whichever phase is open)
+- LLM tokens, reported through record_tokens() by the LLM client's usage
+  callback. The open phase lives in a ContextVar, so tokens from tasks
+  the phase spawns are attributed to it and concurrent cycles don't mix.
+  Semantic-cache hits are counted as cache_hits, not as calls or tokens.
+
+SamplingProfiler is an optional per-phase hook: a daemon thread samples
+the event loop thread's stack every interval and aggregates collapsed
+stacks ("outer;...;inner" -> samples), which is cheap enough to leave on
+for selected phases.
+
+Histogram is a fixed-bucket histogram (cumulative `le` buckets, like
+Prometheus) used by MetricsCollector to export the timings.
+"""
+
+import contextvars
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+# Seconds
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+TOKEN_BUCKETS = (100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000)
+
+# Operation the LLM client reports for responses served from its semantic cache
+CACHED_OPERATION = "generate_cached"
+
+_current_phase: contextvars.ContextVar[Optional["PhaseTiming"]] = contextvars.ContextVar(
+    "rsi_current_phase", default=None
+)
+
+
+@dataclass
+class PhaseTiming:
+    """Resources spent in one phase of one cycle."""
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    tokens: int = 0
+    llm_calls: int = 0
+    cache_hits: int = 0
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data["wall_seconds"] = round(self.wall_seconds, 4)
+        data["cpu_seconds"] = round(self.cpu_seconds, 4)
+        return data
+
+
+def record_tokens(tokens: int, cached: bool = False) -> None:
+    """
+    Attribute LLM tokens to the phase open in the current context (if any).
+
+    A cached response cost no call: it only counts as a cache hit.
+    """
+    timing = _current_phase.get()
+    if timing is None:
+        return
+    if cached:
+        timing.cache_hits += 1
+    else:
+        timing.tokens += int(tokens or 0)
+        timing.llm_calls += 1
+
+
+def usage_tap(previous: Optional[Callable] = None) -> Callable:
+    """
+    LLM usage callback that feeds record_tokens(), then chains to any
+    previously installed callback.
+    """
+    def callback(provider: str = "", tokens: int = 0, operation: str = "", model: str = ""):
+        record_tokens(tokens, cached=operation == CACHED_OPERATION)
+        if previous is not None:
+            previous(provider=provider, tokens=tokens, operation=operation, model=model)
+    callback.byrd_usage_tap = True
+    return callback
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler for one thread (by default the calling one).
+
+    A daemon thread snapshots the target thread's stack every
+    interval_seconds via sys._current_frames(); no tracing hooks are
+    installed, so overhead is independent of how much code runs.
+    """
+
+    def __init__(self, interval_seconds: float = 0.005, max_depth: int = 40, thread_id: Optional[int] = None):
+        self.interval = interval_seconds
+        self.max_depth = max_depth
+        self.thread_id = thread_id
+        self.samples: Counter = Counter()
+        self.total_samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "SamplingProfiler":
+        if self.thread_id is None:
+            self.thread_id = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="rsi-sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None and len(stack) < self.max_depth:
+                code = frame.f_code
+                stack.append(f"{code.co_filename.rsplit('/', 1)[-1]}:{code.co_name}")
+                frame = frame.f_back
+            self.samples[";".join(reversed(stack))] += 1
+            self.total_samples += 1
+
+    def top(self, n: int = 10) -> List[Dict]:
+        """Most frequent collapsed stacks with their share of samples."""
+        total = max(self.total_samples, 1)
+        return [
+            {"stack": stack, "samples": count, "share": round(count / total, 3)}
+            for stack, count in self.samples.most_common(n)
+        ]
+
+
+class CycleProfiler:
+    """Tracks phase timings (and optional sampling profiles) for one cycle."""
+
+    def __init__(
+        self,
+        sample_phases: Iterable[str] = (),
+        sample_interval: float = 0.005,
+        top_stacks: int = 10,
+    ):
+        self.phases: Dict[str, PhaseTiming] = {}
+        self.profiles: Dict[str, List[Dict]] = {}
+        self.sample_phases = set(sample_phases)
+        self.sample_interval = sample_interval
+        self.top_stacks = top_stacks
+
+        self._started = time.perf_counter()
+        self._phase: Optional[str] = None
+        self._wall_start = 0.0
+        self._cpu_start = 0.0
+        self._token: Optional[contextvars.Token] = None
+        self._sampler: Optional[SamplingProfiler] = None
+        self.duration_seconds = 0.0
+
+    def enter(self, phase: str) -> None:
+        """Close the open phase (if any) and start timing `phase`."""
+        self._close()
+        timing = self.phases.setdefault(phase, PhaseTiming())
+        self._phase = phase
+        self._token = _current_phase.set(timing)
+        if phase in self.sample_phases:
+            self._sampler = SamplingProfiler(self.sample_interval).start()
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+
+    def _close(self) -> None:
+        if self._phase is None:
+            return
+        timing = self.phases[self._phase]
+        timing.wall_seconds += time.perf_counter() - self._wall_start
+        timing.cpu_seconds += time.process_time() - self._cpu_start
+        if self._sampler is not None:
+            self._sampler.stop()
+            self.profiles[self._phase] = self._sampler.top(self.top_stacks)
+            self._sampler = None
+        if self._token is not None:
+            try:
+                _current_phase.reset(self._token)
+            except ValueError:
+                _current_phase.set(None)  # Closed from another context
+            self._token = None
+        self._phase = None
+
+    def finish(self) -> Dict[str, Dict]:
+        """Close the open phase; returns {phase: timing dict}."""
+        self._close()
+        self.duration_seconds = time.perf_counter() - self._started
+        return self.timings()
+
+    def timings(self) -> Dict[str, Dict]:
+        return {phase: timing.to_dict() for phase, timing in self.phases.items()}
+
+    @property
+    def elapsed(self) -> float:
+        """Wall seconds since the cycle started."""
+        return time.perf_counter() - self._started
+
+    @property
+    def tokens(self) -> int:
+        return sum(t.tokens for t in self.phases.values())
+
+
+class Histogram:
+    """Fixed-bucket histogram with cumulative `le` buckets."""
+
+    def __init__(self, buckets: Sequence[float] = DURATION_BUCKETS):
+        self.bounds = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.bounds) + 1)  # Last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile (max for the +Inf bucket)."""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.bounds[i] if i < len(self.bounds) else self.max
+        return self.max
+
+    def to_dict(self) -> Dict:
+        cumulative = {}
+        running = 0
+        for bound, count in zip(list(self.bounds) + ["+Inf"], self.counts):
+            running += count
+            cumulative[str(bound)] = running
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 4),
+            "avg": round(self.sum / self.count, 4) if self.count else 0.0,
+            "max": round(self.max, 4),
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": cumulative,
+        }
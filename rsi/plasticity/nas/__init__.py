@@ -17,6 +17,7 @@ from .space import (
     SpaceConstraints,
     SearchBudget,
     ArchitectureSpace,
+    structural_hash,
 )
 
 from .evaluator import (
@@ -45,6 +46,7 @@ __all__ = [
     "SpaceConstraints",
     "SearchBudget",
     "ArchitectureSpace",
+    "structural_hash",
     # Evaluator
     "TestCase",
     "TestSuite",
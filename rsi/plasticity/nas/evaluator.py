@@ -3,18 +3,25 @@ Architecture Evaluator.
 
 Evaluates discovered architectures on test suites.
 
+Scores are memoized by the architecture's canonical structural hash
+(plus test suite and metric set), so structurally identical children
+produced under new ids are scored once. evaluate_batch() scores a whole
+generation concurrently, in a process pool when one is given.
+
 See docs/IMPLEMENTATION_PLAN_ASI.md Section 3.1 for specification.
 """
 
 from typing import Dict, List, Optional, Any, Callable, Awaitable
-from dataclasses import dataclass, field
+from concurrent.futures import Executor
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 import logging
 import asyncio
+import random
 import time
 import uuid
 
-from .space import ArchitectureSpec, NodeType, OperationType
+from .space import ArchitectureSpec, NodeType, OperationType, structural_hash
 
 logger = logging.getLogger("rsi.plasticity.nas.evaluator")
 
@@ -125,8 +132,13 @@ class ArchitectureEvaluator:
         self._metric_functions: Dict[str, Callable] = {}
         self._setup_default_metrics()
 
+        # Memoized scores: (structural hash, suite id, metrics) -> score
+        self._cache_enabled = self.config.get('cache_evaluations', True)
+        self._score_cache: Dict[tuple, ArchitectureScore] = {}
+
         # Statistics
         self._total_evaluations: int = 0
+        self._cache_hits: int = 0
 
     def _setup_default_metrics(self) -> None:
         """Set up default metric functions."""
@@ -149,8 +161,47 @@ class ArchitectureEvaluator:
     ) -> None:
         """Register a custom metric function."""
         self._metric_functions[name] = func
+        self._score_cache.clear()
         logger.info(f"Registered metric: {name}")
 
+    def _resolve(self, test_suite: Optional[TestSuite], metrics_to_compute: Optional[List[str]]):
+        suite = test_suite
+        if not suite and self._test_suites:
+            suite = next(iter(self._test_suites.values()))
+        return suite, list(metrics_to_compute or self._metric_functions.keys())
+
+    def cache_key(
+        self,
+        architecture: ArchitectureSpec,
+        test_suite: TestSuite = None,
+        metrics_to_compute: List[str] = None
+    ) -> tuple:
+        """Memoization key: structure, test suite and metric set."""
+        suite, metric_names = self._resolve(test_suite, metrics_to_compute)
+        return (structural_hash(architecture), suite.id if suite else "", tuple(metric_names))
+
+    def _cached(self, key: tuple, architecture: ArchitectureSpec) -> Optional[ArchitectureScore]:
+        if not self._cache_enabled:
+            return None
+        cached = self._score_cache.get(key)
+        if cached is None:
+            return None
+        self._cache_hits += 1
+        return replace(
+            cached,
+            architecture_id=architecture.id,
+            evaluation_time_ms=0.0,
+            evaluated_at=datetime.now(timezone.utc).isoformat(),
+            metadata={**cached.metadata, 'cached': True, 'cached_from': cached.architecture_id}
+        )
+
+    def _record(self, key: tuple, architecture: ArchitectureSpec, score: ArchitectureScore) -> None:
+        """Store a score in the history and (when freshly computed) the cache."""
+        self._total_evaluations += 1
+        self._evaluations.setdefault(architecture.id, []).append(score)
+        if self._cache_enabled and not score.metadata.get('cached'):
+            self._score_cache.setdefault(key, score)
+
     async def evaluate(
         self,
         architecture: ArchitectureSpec,
@@ -168,17 +219,84 @@ class ArchitectureEvaluator:
         Returns:
             ArchitectureScore with results
         """
-        start_time = time.time()
-        self._total_evaluations += 1
+        key = self.cache_key(architecture, test_suite, metrics_to_compute)
+        score = self._cached(key, architecture)
+        if score is None:
+            score = await self._score(architecture, test_suite, metrics_to_compute)
+        self._record(key, architecture, score)
+        return score
 
-        # Use provided or default test suite
-        suite = test_suite
-        if not suite and self._test_suites:
-            suite = next(iter(self._test_suites.values()))
+    async def evaluate_batch(
+        self,
+        architectures: List[ArchitectureSpec],
+        test_suite: TestSuite = None,
+        executor: Optional[Executor] = None
+    ) -> List[ArchitectureScore]:
+        """
+        Evaluate a batch (e.g. one generation) concurrently.
+
+        Cache hits and duplicates within the batch are scored once. The
+        remaining unique architectures run in `executor` (a process pool
+        initialized with init_worker(self.worker_snapshot())), or as
+        concurrent tasks in this process when no executor is given.
+
+        Returns:
+            Scores in the order of `architectures`
+        """
+        keys = [self.cache_key(a, test_suite) for a in architectures]
+        pending: Dict[tuple, ArchitectureSpec] = {}
+        for key, arch in zip(keys, architectures):
+            if key not in pending and not (self._cache_enabled and key in self._score_cache):
+                pending[key] = arch
+
+        if executor is not None:
+            loop = asyncio.get_running_loop()
+            computed = await asyncio.gather(*[
+                loop.run_in_executor(executor, evaluate_in_worker, arch, test_suite, list(key[2]))
+                for key, arch in pending.items()
+            ])
+        else:
+            computed = await asyncio.gather(*[
+                self._score(arch, test_suite) for arch in pending.values()
+            ])
+        fresh = dict(zip(pending.keys(), computed))
+
+        scores = []
+        for key, arch in zip(keys, architectures):
+            score = fresh.pop(key, None)
+            if score is None:
+                score = self._cached(key, arch) or await self._score(arch, test_suite)
+            self._record(key, arch, score)
+            scores.append(score)
+        return scores
+
+    def worker_snapshot(self) -> "ArchitectureEvaluator":
+        """
+        Copy for process-pool workers: same config, test suites and metric
+        functions, no history or cache (must be picklable, so custom
+        metrics have to be module-level functions).
+        """
+        snapshot = ArchitectureEvaluator({**self.config, 'cache_evaluations': False})
+        snapshot._test_suites = dict(self._test_suites)
+        # Built-in metrics are bound to self; the snapshot has its own
+        snapshot._metric_functions.update({
+            name: func for name, func in self._metric_functions.items()
+            if getattr(func, '__self__', None) is not self
+        })
+        return snapshot
+
+    async def _score(
+        self,
+        architecture: ArchitectureSpec,
+        test_suite: TestSuite = None,
+        metrics_to_compute: List[str] = None
+    ) -> ArchitectureScore:
+        """Compute a score (no cache, no history)."""
+        start_time = time.time()
+        suite, metrics_to_compute = self._resolve(test_suite, metrics_to_compute)
 
         # Compute metrics
         metrics = []
-        metrics_to_compute = metrics_to_compute or list(self._metric_functions.keys())
 
         for metric_name in metrics_to_compute:
             if metric_name in self._metric_functions:
@@ -217,11 +335,6 @@ class ArchitectureEvaluator:
             total_tests=total_tests
         )
 
-        # Store in history
-        if architecture.id not in self._evaluations:
-            self._evaluations[architecture.id] = []
-        self._evaluations[architecture.id].append(score)
-
         logger.info(
             f"Evaluated {architecture.id}: score={overall_score:.3f} "
             f"({passed_tests}/{total_tests} tests)"
@@ -253,7 +366,6 @@ class ArchitectureEvaluator:
             quality = self._estimate_architecture_quality(architecture)
 
             # Random success based on quality
-            import random
             if random.random() < quality:
                 passed += 1
 
@@ -426,6 +538,8 @@ class ArchitectureEvaluator:
         return {
             'total_evaluations': self._total_evaluations,
             'architectures_evaluated': len(self._evaluations),
+            'cache_hits': self._cache_hits,
+            'cached_structures': len(self._score_cache),
             'test_suites': len(self._test_suites),
             'metrics_available': list(self._metric_functions.keys())
         }
@@ -434,5 +548,28 @@ class ArchitectureEvaluator:
         """Reset evaluator state."""
         self._test_suites.clear()
         self._evaluations.clear()
+        self._score_cache.clear()
         self._total_evaluations = 0
+        self._cache_hits = 0
         logger.info("ArchitectureEvaluator reset")
+
+
+# ===== Process-pool workers =====
+
+_worker_evaluator: Optional[ArchitectureEvaluator] = None
+
+
+def init_worker(evaluator: ArchitectureEvaluator) -> None:
+    """ProcessPoolExecutor initializer: install the evaluator snapshot."""
+    global _worker_evaluator
+    _worker_evaluator = evaluator
+    random.seed()  # Forked workers would otherwise share the parent's RNG state
+
+
+def evaluate_in_worker(
+    architecture: ArchitectureSpec,
+    test_suite: Optional[TestSuite],
+    metrics_to_compute: List[str]
+) -> ArchitectureScore:
+    """Score one architecture inside a pool worker."""
+    return asyncio.run(_worker_evaluator._score(architecture, test_suite, metrics_to_compute))
@@ -3,15 +3,27 @@ Neural Architecture Search.
 
 Discovers new module architectures through evolutionary search.
 
+search() evolves one population, evaluating architectures one at a
+time. search_parallel() (or search() with parallel.enabled) runs an
+island model: several populations evolve independently and exchange
+their best members every migration_interval generations. Each
+generation's offspring across all islands are scored as one batch,
+concurrently, in a process pool. Structural duplicates are served from
+the evaluator's score cache and do not consume evaluation budget.
+
 See docs/IMPLEMENTATION_PLAN_ASI.md Section 3.1 for specification.
 """
 
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 import logging
 import asyncio
+import os
+import pickle
+import random
 import time
 import heapq
 
@@ -24,7 +36,8 @@ from .space import (
 from .evaluator import (
     ArchitectureEvaluator,
     ArchitectureScore,
-    TestSuite
+    TestSuite,
+    init_worker
 )
 
 logger = logging.getLogger("rsi.plasticity.nas.search")
@@ -69,6 +82,9 @@ class SearchResult:
     converged: bool
     target_reached: bool
     metadata: Dict[str, Any] = field(default_factory=dict)
+    evaluations_per_second: float = 0.0   # total_evaluations / wall clock
+    unique_evaluations: int = 0           # Evaluations actually computed
+    cache_hits: int = 0                   # Structural duplicates served from cache
 
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
@@ -83,6 +99,9 @@ class SearchResult:
             'final_generation': self.final_generation,
             'converged': self.converged,
             'target_reached': self.target_reached,
+            'evaluations_per_second': self.evaluations_per_second,
+            'unique_evaluations': self.unique_evaluations,
+            'cache_hits': self.cache_hits,
             'metadata': self.metadata
         }
 
@@ -152,8 +171,12 @@ class NeuralArchitectureSearch:
         Returns:
             SearchResult with discovered architectures
         """
+        if self.config.get('parallel', {}).get('enabled'):
+            return await self.search_parallel(goal, search_space, budget, test_suite)
+
         self._total_searches += 1
         start_time = time.time()
+        hits_before = self.evaluator._cache_hits
 
         space = search_space or self.space
         budget = budget or SearchBudget()
@@ -218,16 +241,7 @@ class NeuralArchitectureSearch:
 
             for i in range(self._population_size - self._elite_size):
                 # Crossover or mutation
-                import random
-                if len(parents) >= 2 and random.random() < self._crossover_rate:
-                    p1 = random.choice(parents).architecture
-                    p2 = random.choice(parents).architecture
-                    child_arch = space.crossover(p1, p2)
-                    parent_ids = [p1.id, p2.id]
-                else:
-                    parent = random.choice(parents).architecture
-                    child_arch = space.mutate(parent, self._mutation_rate)
-                    parent_ids = [parent.id]
+                child_arch, parent_ids = self._make_child(space, parents)
 
                 # Evaluate
                 score = await self.evaluator.evaluate(child_arch, test_suite)
@@ -281,6 +295,7 @@ class NeuralArchitectureSearch:
             converged = True
 
         total_time = time.time() - start_time
+        cache_hits = self.evaluator._cache_hits - hits_before
 
         logger.info(
             f"NAS complete: {evaluations} evaluations, "
@@ -300,9 +315,215 @@ class NeuralArchitectureSearch:
                 'goal': goal,
                 'strategy': self._strategy.value,
                 'population_size': self._population_size
-            }
+            },
+            evaluations_per_second=evaluations / total_time if total_time > 0 else 0.0,
+            unique_evaluations=evaluations - cache_hits,
+            cache_hits=cache_hits
+        )
+
+    async def search_parallel(
+        self,
+        goal: str,
+        search_space: ArchitectureSpace = None,
+        budget: SearchBudget = None,
+        test_suite: TestSuite = None
+    ) -> SearchResult:
+        """
+        Island-model search with batched, concurrent evaluation.
+
+        Config (under 'parallel'):
+            islands: Number of independent populations (default 4)
+            island_population: Members per island (default population_size // islands)
+            migration_interval: Generations between migrations (default 5)
+            migration_size: Best members copied to the next island (default 1)
+            workers: Evaluation processes (default: CPU count)
+            executor: "process" or "inline" (concurrent tasks in this process)
+
+        The evaluation budget counts computed evaluations only; cache hits
+        are free.
+        """
+        self._total_searches += 1
+        start_time = time.time()
+        hits_before = self.evaluator._cache_hits
+
+        space = search_space or self.space
+        budget = budget or SearchBudget()
+        if not test_suite and not self.evaluator._test_suites:
+            test_suite = self.evaluator.create_default_test_suite()
+
+        parallel = self.config.get('parallel', {})
+        n_islands = max(1, parallel.get('islands', 4))
+        island_size = max(2, parallel.get('island_population', self._population_size // n_islands))
+        elite_size = min(max(1, self._elite_size // n_islands), island_size - 1)
+        migration_interval = max(1, parallel.get('migration_interval', 5))
+        migration_size = min(parallel.get('migration_size', 1), island_size - 1)
+
+        executor = self._create_executor(parallel)
+        logger.info(
+            f"Starting island NAS for goal: '{goal}' "
+            f"({n_islands} islands x {island_size}, "
+            f"{'process pool' if executor else 'inline'} evaluation)"
         )
 
+        self._generation = 0
+        all_discovered: List[DiscoveredArchitecture] = []
+        evaluations = 0
+        evaluation_seconds = 0.0
+        converged = False
+        target_reached = False
+        no_improvement_count = 0
+
+        async def score_batch(plan: List[Tuple[int, ArchitectureSpec, List[str]]]) -> List[Tuple[int, DiscoveredArchitecture]]:
+            nonlocal evaluations, evaluation_seconds, target_reached
+            scores = await self.evaluator.evaluate_batch([arch for _, arch, _ in plan], test_suite, executor)
+            elapsed_ms = (time.time() - start_time) * 1000
+            placed = []
+            for (island, arch, parent_ids), score in zip(plan, scores):
+                discovered = DiscoveredArchitecture(
+                    architecture=arch,
+                    score=score,
+                    generation=self._generation,
+                    discovery_time_ms=elapsed_ms,
+                    parent_ids=parent_ids
+                )
+                placed.append((island, discovered))
+                all_discovered.append(discovered)
+                evaluation_seconds += score.evaluation_time_ms / 1000
+                if budget.target_score and score.overall_score >= budget.target_score:
+                    target_reached = True
+            evaluations += len(plan)
+            self._total_architectures_discovered += len(plan)
+            return placed
+
+        def unique_evaluations() -> int:
+            return evaluations - (self.evaluator._cache_hits - hits_before)
+
+        try:
+            # Initial random populations, scored as one batch
+            islands: List[List[DiscoveredArchitecture]] = [[] for _ in range(n_islands)]
+            plan = [
+                (i, space.sample_random(f"Island{i}_Initial_{j}"), [])
+                for i in range(n_islands) for j in range(island_size)
+            ]
+            for island, discovered in await score_batch(plan):
+                islands[island].append(discovered)
+            self._population = [d for island in islands for d in island]
+            self._update_best()
+
+            while (
+                unique_evaluations() < budget.max_evaluations and
+                (time.time() - start_time) < budget.max_time_seconds and
+                not target_reached and
+                no_improvement_count < budget.early_stopping_patience
+            ):
+                self._generation += 1
+
+                # Offspring for every island, evaluated together
+                plan = []
+                for i, population in enumerate(islands):
+                    parents = self._select_parents(population)
+                    for _ in range(island_size - elite_size):
+                        child, parent_ids = self._make_child(space, parents)
+                        plan.append((i, child, parent_ids))
+                plan = plan[:max(1, budget.max_evaluations - unique_evaluations())]
+
+                offspring: List[List[DiscoveredArchitecture]] = [[] for _ in range(n_islands)]
+                for island, discovered in await score_batch(plan):
+                    offspring[island].append(discovered)
+
+                # Survivors: island elite + offspring, topped up from the old population
+                for i, population in enumerate(islands):
+                    ranked = sorted(population, key=lambda d: d.score.overall_score, reverse=True)
+                    survivors = ranked[:elite_size] + offspring[i][:island_size - elite_size]
+                    survivors += ranked[elite_size:elite_size + island_size - len(survivors)]
+                    islands[i] = survivors
+
+                # Ring migration: each island's best replace the next island's worst
+                if n_islands > 1 and self._generation % migration_interval == 0:
+                    self._migrate(islands, migration_size)
+
+                self._population = [d for island in islands for d in island]
+                old_best = self._best_ever.score.overall_score if self._best_ever else 0
+                self._update_best()
+                new_best = self._best_ever.score.overall_score if self._best_ever else 0
+                no_improvement_count = 0 if new_best > old_best else no_improvement_count + 1
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+        converged = no_improvement_count >= budget.early_stopping_patience
+        total_time = time.time() - start_time
+        cache_hits = self.evaluator._cache_hits - hits_before
+
+        logger.info(
+            f"Island NAS complete: {evaluations} evaluations "
+            f"({cache_hits} cached), {self._generation} generations, "
+            f"{evaluations / max(total_time, 1e-9):.1f} evals/s"
+        )
+
+        return SearchResult(
+            best_architecture=self._best_ever,
+            all_discovered=all_discovered,
+            total_evaluations=evaluations,
+            total_time_seconds=total_time,
+            final_generation=self._generation,
+            converged=converged,
+            target_reached=target_reached,
+            metadata={
+                'goal': goal,
+                'strategy': self._strategy.value,
+                'population_size': island_size * n_islands,
+                'islands': n_islands,
+                'island_population': island_size,
+                'executor': 'process' if executor else 'inline',
+                'evaluation_seconds': evaluation_seconds,
+                'parallel_speedup': evaluation_seconds / total_time if total_time > 0 else 0.0
+            },
+            evaluations_per_second=evaluations / total_time if total_time > 0 else 0.0,
+            unique_evaluations=evaluations - cache_hits,
+            cache_hits=cache_hits
+        )
+
+    def _create_executor(self, parallel: Dict) -> Optional[ProcessPoolExecutor]:
+        """Process pool for evaluate_batch, or None for inline evaluation."""
+        workers = parallel.get('workers') or os.cpu_count() or 1
+        if parallel.get('executor', 'process') != 'process' or workers < 2:
+            return None
+        snapshot = self.evaluator.worker_snapshot()
+        try:
+            pickle.dumps(snapshot)
+        except Exception as e:
+            logger.warning(f"Evaluator not picklable ({e}); evaluating inline")
+            return None
+        return ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(snapshot,))
+
+    @staticmethod
+    def _migrate(islands: List[List[DiscoveredArchitecture]], migration_size: int) -> None:
+        """Copy each island's best members over the next island's worst."""
+        emigrants = [
+            sorted(island, key=lambda d: d.score.overall_score, reverse=True)[:migration_size]
+            for island in islands
+        ]
+        for i, migrants in enumerate(emigrants):
+            target = sorted(
+                islands[(i + 1) % len(islands)],
+                key=lambda d: d.score.overall_score, reverse=True
+            )
+            islands[(i + 1) % len(islands)] = target[:len(target) - len(migrants)] + migrants
+
+    def _make_child(
+        self,
+        space: ArchitectureSpace,
+        parents: List[DiscoveredArchitecture]
+    ) -> Tuple[ArchitectureSpec, List[str]]:
+        """Crossover (crossover_rate) or mutation of randomly chosen parents."""
+        if len(parents) >= 2 and random.random() < self._crossover_rate:
+            p1 = random.choice(parents).architecture
+            p2 = random.choice(parents).architecture
+            return space.crossover(p1, p2), [p1.id, p2.id]
+        parent = random.choice(parents).architecture
+        return space.mutate(parent, self._mutation_rate), [parent.id]
+
     async def evaluate_architecture(
         self,
         architecture: ArchitectureSpec,
@@ -320,18 +541,20 @@ class NeuralArchitectureSearch:
         """
         return await self.evaluator.evaluate(architecture, test_suite)
 
-    def _select_parents(self) -> List[DiscoveredArchitecture]:
+    def _select_parents(
+        self,
+        population: List[DiscoveredArchitecture] = None
+    ) -> List[DiscoveredArchitecture]:
         """Select parents for next generation using tournament selection."""
-        import random
-
+        population = population if population is not None else self._population
         parents = []
         tournament_size = 3
 
-        for _ in range(self._population_size):
+        for _ in range(len(population)):
             # Tournament selection
             tournament = random.sample(
-                self._population,
-                min(tournament_size, len(self._population))
+                population,
+                min(tournament_size, len(population))
             )
             winner = max(tournament, key=lambda d: d.score.overall_score)
             parents.append(winner)
@@ -10,6 +10,8 @@ from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timezone
+import hashlib
+import json
 import uuid
 import logging
 import random
@@ -140,6 +142,51 @@ class ArchitectureSpec:
                 return node
         return None
 
+    def structural_hash(self) -> str:
+        """Canonical hash of the structure (see structural_hash())."""
+        return structural_hash(self)
+
+
+def structural_hash(architecture: ArchitectureSpec) -> str:
+    """
+    Canonical structural hash of an architecture.
+
+    Ignores everything that isn't structure: architecture/node/connection
+    ids, names, timestamps and metadata. Nodes are relabelled by a stable
+    sort on their attributes, and connections are expressed between those
+    labels. Equal hashes therefore mean the two specs are the same
+    labelled graph up to renaming. They always score the same, so one
+    evaluation can serve both.
+    """
+    order = sorted(
+        range(len(architecture.nodes)),
+        key=lambda i: _node_signature(architecture.nodes[i])
+    )
+    label = {architecture.nodes[i].id: rank for rank, i in enumerate(order)}
+
+    canonical = {
+        'nodes': [_node_signature(architecture.nodes[i]) for i in order],
+        'connections': sorted(
+            (label.get(c.source_id, -1), label.get(c.target_id, -1),
+             c.connection_type.value, round(c.weight, 6))
+            for c in architecture.connections
+        ),
+        'inputs': sorted(label.get(n, -1) for n in architecture.input_nodes),
+        'outputs': sorted(label.get(n, -1) for n in architecture.output_nodes),
+    }
+    payload = json.dumps(canonical, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:24]
+
+
+def _node_signature(node: NodeSpec) -> Tuple:
+    return (
+        node.node_type.value,
+        node.operation.value,
+        node.input_dim,
+        node.output_dim,
+        json.dumps(node.parameters, sort_keys=True, default=str),
+    )
+
 
 @dataclass
 class SpaceConstraints:
@@ -5,7 +5,7 @@ Manages LLM clients per cognitive tier.
 Routes requests to appropriate providers based on tier.
 
 Design principle:
-- Tier 0 (REFLEX): No LLM - cache/pattern matching
+- Tier 0 (REFLEX): No LLM - templates, cache, crystallized heuristics
 - Tier 1 (GLM_4_7): ZAI GLM 4.7 - FREE, UNLIMITED, DEFAULT
 - Tier 2 (PREMIUM): Claude/GPT-4 via OpenRouter
 - Tier 3 (EXTENDED): Extended thinking models
@@ -21,6 +21,8 @@ import logging
 import os
 
 from rsi.cognition.tiers import CognitiveTier, get_tier_config, TIER_CONFIGS
+from rsi.cognition.reflex import ReflexEngine
+from rsi.cognition.router import RoutingContext
 from rsi.substrate.provider_registry import (
     ProviderRegistry,
     ProviderStatus
@@ -112,7 +114,8 @@ class TierProvider:
     def __init__(
         self,
         config: TierProviderConfig = None,
-        registry: Optional[ProviderRegistry] = None
+        registry: Optional[ProviderRegistry] = None,
+        reflex_engine: Optional[ReflexEngine] = None
     ):
         """
         Initialize tier provider.
@@ -120,9 +123,11 @@ class TierProvider:
         Args:
             config: Provider configuration
             registry: Optional provider registry for health tracking
+            reflex_engine: Engine answering REFLEX calls (share the router's)
         """
         self.config = config or TierProviderConfig.from_env()
         self._registry = registry or ProviderRegistry()
+        self._reflex = reflex_engine
 
         # LLM clients per tier (lazy initialized)
         self._clients: Dict[CognitiveTier, Any] = {}
@@ -232,13 +237,7 @@ class TierProvider:
 
         # Handle reflex tier (no LLM)
         if tier == CognitiveTier.REFLEX:
-            # Reflex tier uses cache or pattern matching, not LLM
-            return TierCallResult(
-                success=False,
-                tier=tier,
-                text="",
-                error="REFLEX tier requires cache hit - no LLM call"
-            )
+            return self._call_reflex(prompt, max_tokens, temperature, start_time, **kwargs)
 
         # Check tier availability
         if tier not in self._clients:
@@ -325,6 +324,51 @@ class TierProvider:
                 error=str(e)
             )
 
+    def _call_reflex(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        start_time: float,
+        task_type: str = "general",
+        **kwargs
+    ) -> TierCallResult:
+        """Answer on the reflex tier; fails unless the confidence gate passes."""
+        import time
+
+        self._call_counts[CognitiveTier.REFLEX] += 1
+        answer = None
+        if self._reflex is not None:
+            context = RoutingContext(
+                task_type=task_type,
+                prompt=prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                metadata=kwargs
+            )
+            answer = self._reflex.lookup(context)
+
+        if answer is None:
+            return TierCallResult(
+                success=False,
+                tier=CognitiveTier.REFLEX,
+                text="",
+                error="REFLEX tier requires a confident reflex answer - no LLM call"
+            )
+
+        self._reflex.record_served(answer)
+        self._success_counts[CognitiveTier.REFLEX] += 1
+        return TierCallResult(
+            success=True,
+            tier=CognitiveTier.REFLEX,
+            text=answer.text,
+            raw={'reflex': answer.to_dict()},
+            model="reflex",
+            provider=answer.source,
+            latency_ms=(time.time() - start_time) * 1000,
+            cached=answer.source == 'cache'
+        )
+
     def _get_provider_id_for_tier(self, tier: CognitiveTier) -> Optional[str]:
         """Map tier to provider ID for registry."""
         mapping = {
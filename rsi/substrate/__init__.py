@@ -65,7 +65,7 @@ __all__ = [
     "SubstrateLevelInfo",
     "SUBSTRATE_LEVELS",
     "ComputeAbstractionLayer",
-    # Self-Hosted (Future)
+    # Self-Hosted
     "ModelFormat",
     "InferenceBackend",
     "LocalModelConfig",
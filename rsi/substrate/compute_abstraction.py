@@ -4,6 +4,10 @@ Compute Abstraction Layer.
 Unified interface for compute regardless of provider.
 Enables multi-provider failover and eventual self-hosting.
 
+Requests marked background (bulk, latency-insensitive) are offloaded
+to zero-marginal-cost providers first, such as a local server run by
+SelfHostedManager, and are never hedged onto remote APIs.
+
 See docs/IMPLEMENTATION_PLAN_ASI.md Section 2.3 for specification.
 """
 
@@ -51,6 +55,7 @@ class GenerationConfig:
     timeout_seconds: float = 60.0
     required_capability: Optional[str] = None
     preferred_provider: Optional[str] = None
+    background: bool = False  # Bulk work: zero-cost providers first, no hedging
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
@@ -168,7 +173,8 @@ class ComputeAbstractionLayer:
     def __init__(
         self,
         provider_registry: ProviderRegistry = None,
-        config: Dict = None
+        config: Dict = None,
+        self_hosted: Any = None
     ):
         """
         Initialize compute abstraction layer.
@@ -176,11 +182,13 @@ class ComputeAbstractionLayer:
         Args:
             provider_registry: Provider registry (created if None)
             config: Configuration options
+            self_hosted: SelfHostedManager serving SELF_HOSTED providers
         """
         self.config = config or {}
 
         # Provider registry
         self.registry = provider_registry or ProviderRegistry(config)
+        self._self_hosted = self_hosted
 
         # Failover manager
         self.failover = FailoverManager(self.registry, config)
@@ -196,6 +204,7 @@ class ComputeAbstractionLayer:
         self._total_tokens_in: int = 0
         self._total_tokens_out: int = 0
         self._total_cost: float = 0.0
+        self._offloaded_requests: int = 0
 
     @property
     def current_level(self) -> SubstrateLevel:
@@ -208,7 +217,7 @@ class ComputeAbstractionLayer:
 
         # Check for local inference
         has_local = any(
-            p.provider_type == ProviderType.LOCAL_INFERENCE
+            p.provider_type in (ProviderType.LOCAL_INFERENCE, ProviderType.SELF_HOSTED)
             for p in available
         )
 
@@ -249,17 +258,25 @@ class ComputeAbstractionLayer:
             # In reality, this would call the actual provider API
             return await self._generate_with_provider(prompt, config, provider)
 
+        preferred = [config.preferred_provider] if config.preferred_provider else []
+        if config.background:
+            preferred.extend(p.id for p in self._zero_cost_providers(config))
+
         # Execute with failover
         result = await self.failover.execute_with_failover(
             do_generate,
             required_capability=config.required_capability,
-            model=config.model
+            model=config.model,
+            preferred=preferred,
+            hedge=not config.background
         )
 
         if not result.success:
             raise RuntimeError(f"Generation failed: {result.error}")
 
         gen_result = result.result
+        if config.background and gen_result.cost_estimate == 0.0:
+            self._offloaded_requests += 1
 
         # Track stats
         self._total_tokens_in += gen_result.input_tokens
@@ -268,6 +285,18 @@ class ComputeAbstractionLayer:
 
         return gen_result
 
+    def _zero_cost_providers(self, config: GenerationConfig) -> List[ProviderConfig]:
+        """Healthy providers with no marginal cost, by priority."""
+        providers = self.registry.get_available_providers(
+            required_capability=config.required_capability,
+            model=config.model
+        )
+        return [
+            p for p in providers
+            if p.cost_per_1k_input == 0.0 and p.cost_per_1k_output == 0.0
+            and self.registry.get_health(p.id).status == ProviderStatus.AVAILABLE
+        ]
+
     async def _generate_with_provider(
         self,
         prompt: str,
@@ -277,11 +306,34 @@ class ComputeAbstractionLayer:
         """
         Generate with a specific provider.
 
-        This is a stub implementation. Real implementation would
-        call the actual provider APIs.
+        Self-hosted servers are called for real through the
+        SelfHostedManager. Other providers are still a stub
+        implementation; a real one would call their APIs.
         """
         start_time = time.time()
 
+        server_id = provider.metadata.get('server_id')
+        if server_id and self._self_hosted is not None:
+            completion = await self._self_hosted.chat_completion(
+                server_id,
+                prompt,
+                max_tokens=config.max_tokens,
+                temperature=config.temperature
+            )
+            return GenerationResult(
+                text=completion['text'],
+                provider_id=provider.id,
+                model=provider.metadata.get('model_id', provider.id),
+                input_tokens=completion['input_tokens'],
+                output_tokens=completion['output_tokens'],
+                latency_ms=completion['latency_ms'],
+                cost_estimate=0.0,
+                metadata={
+                    'provider_type': provider.provider_type.value,
+                    'endpoint': provider.endpoint
+                }
+            )
+
         # Estimate tokens (rough approximation)
         input_tokens = len(prompt.split()) * 1.3
         output_tokens = config.max_tokens // 2  # Estimate half of max
@@ -366,7 +418,14 @@ class ComputeAbstractionLayer:
                 total_cost=input_cost + output_cost
             ))
 
-        return sorted(estimates, key=lambda e: e.total_cost)
+        # Ties (e.g. several zero-cost local providers) go to healthy, higher-priority ones
+        def rank(estimate: CostEstimate) -> tuple:
+            provider = self.registry.get_provider(estimate.provider_id)
+            health = self.registry.get_health(estimate.provider_id)
+            verified = health is not None and health.status == ProviderStatus.AVAILABLE
+            return (estimate.total_cost, not verified, provider.priority)
+
+        return sorted(estimates, key=rank)
 
     async def get_cheapest_provider(
         self,
@@ -449,7 +508,7 @@ class ComputeAbstractionLayer:
 
             elif req == "local_inference":
                 has_local = any(
-                    p.provider_type == ProviderType.LOCAL_INFERENCE
+                    p.provider_type in (ProviderType.LOCAL_INFERENCE, ProviderType.SELF_HOSTED)
                     for p in providers
                 )
                 if not has_local:
@@ -473,6 +532,7 @@ class ComputeAbstractionLayer:
             'total_tokens_in': self._total_tokens_in,
             'total_tokens_out': self._total_tokens_out,
             'total_cost': self._total_cost,
+            'offloaded_requests': self._offloaded_requests,
             'registry': registry_stats,
             'failover': failover_stats
         }
@@ -485,5 +545,6 @@ class ComputeAbstractionLayer:
         self._total_tokens_in = 0
         self._total_tokens_out = 0
         self._total_cost = 0.0
+        self._offloaded_requests = 0
         self._update_substrate_level()
         logger.info("ComputeAbstractionLayer reset")
@@ -1,12 +1,14 @@
 """
 Failover Manager.
 
-Handles provider failover with circuit breaker pattern.
+Handles provider failover with circuit breaker pattern, hedged
+requests against tail latency, and latency/error-aware provider
+ordering (the "adaptive" strategy).
 
 See docs/IMPLEMENTATION_PLAN_ASI.md Section 2.3 for specification.
 """
 
-from typing import Dict, List, Optional, Any, Callable, Awaitable
+from typing import Dict, List, Optional, Any, Callable, Awaitable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timezone
@@ -114,6 +116,7 @@ class FailoverResult:
     latency_ms: float = 0.0
     attempts: int = 1
     failover_path: List[str] = field(default_factory=list)
+    hedged: bool = False  # A hedge request was fired
 
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
@@ -123,7 +126,8 @@ class FailoverResult:
             'error': self.error,
             'latency_ms': self.latency_ms,
             'attempts': self.attempts,
-            'failover_path': self.failover_path
+            'failover_path': self.failover_path,
+            'hedged': self.hedged
         }
 
 
@@ -134,6 +138,7 @@ class FailoverStrategy(Enum):
     CHEAPEST = "cheapest"  # Use cheapest provider
     FASTEST = "fastest"  # Use fastest (lowest latency)
     RANDOM = "random"  # Random selection
+    ADAPTIVE = "adaptive"  # Live EWMA latency / success rate
 
 
 class FailoverManager:
@@ -142,6 +147,14 @@ class FailoverManager:
 
     Implements automatic failover between providers with
     exponential backoff and circuit breaker pattern.
+
+    Hedging config (under 'hedging'):
+        enabled: Fire hedge requests (default True)
+        quantile: Latency quantile of the running provider to wait
+            before hedging (default 0.95)
+        default_delay_ms: Delay while a provider has no samples (2000)
+        min_delay_ms: Lower bound on the delay (50)
+        max_hedges: Extra concurrent requests per round (default 1)
     """
 
     def __init__(
@@ -170,6 +183,13 @@ class FailoverManager:
             self.config.get('strategy', 'priority')
         )
 
+        # Hedged requests
+        hedging = self.config.get('hedging', {})
+        self._max_hedges = hedging.get('max_hedges', 1) if hedging.get('enabled', True) else 0
+        self._hedge_quantile = hedging.get('quantile', 0.95)
+        self._hedge_default_delay_ms = hedging.get('default_delay_ms', 2000.0)
+        self._hedge_min_delay_ms = hedging.get('min_delay_ms', 50.0)
+
         # Round-robin state
         self._rr_index = 0
 
@@ -177,6 +197,9 @@ class FailoverManager:
         self._total_requests: int = 0
         self._total_failovers: int = 0
         self._successful_failovers: int = 0
+        self._hedges_fired: int = 0
+        self._hedge_wins: int = 0
+        self._cancelled_attempts: int = 0
 
     def get_circuit_breaker(self, provider_id: str) -> CircuitBreaker:
         """Get or create circuit breaker for provider."""
@@ -237,11 +260,17 @@ class FailoverManager:
         elif self._strategy == FailoverStrategy.FASTEST:
             def latency(p: ProviderConfig) -> float:
                 health = self.registry.get_health(p.id)
+                if health and health.ewma_latency_ms is not None:
+                    return health.ewma_latency_ms
                 if health and health.latency_ms:
                     return health.latency_ms
                 return float('inf')
             return sorted(allowed, key=latency)
 
+        elif self._strategy == FailoverStrategy.ADAPTIVE:
+            # Expected time to a success; priority breaks ties
+            return sorted(allowed, key=lambda p: (self.registry.routing_score(p.id), p.priority))
+
         elif self._strategy == FailoverStrategy.RANDOM:
             import random
             random.shuffle(allowed)
@@ -253,15 +282,26 @@ class FailoverManager:
         self,
         func: Callable[[ProviderConfig], Awaitable[Any]],
         required_capability: str = None,
-        model: str = None
+        model: str = None,
+        preferred: Optional[List[str]] = None,
+        hedge: bool = True
     ) -> FailoverResult:
         """
         Execute function with automatic failover.
 
+        Providers are tried in failover order. A failure moves on to the
+        next provider at once. With hedging enabled, a request still
+        running after its provider's hedge delay (the `hedging.quantile`
+        latency, p95 by default) is raced against the next provider: the
+        first success wins and the loser is cancelled. A full pass
+        without success backs off exponentially and retries.
+
         Args:
             func: Async function to execute (takes provider config)
             required_capability: Required capability
             model: Required model
+            preferred: Provider IDs to try first, in this order
+            hedge: Allow hedge requests (off for latency-insensitive work)
 
         Returns:
             FailoverResult with outcome
@@ -271,6 +311,10 @@ class FailoverManager:
         failover_path = []
 
         providers = self._get_provider_order(required_capability, model)
+        if preferred:
+            rank = {provider_id: i for i, provider_id in enumerate(preferred)}
+            providers.sort(key=lambda p: rank.get(p.id, len(rank)))
+        max_hedges = self._max_hedges if hedge else 0
 
         if not providers:
             return FailoverResult(
@@ -282,55 +326,93 @@ class FailoverManager:
 
         last_error = None
         attempts = 0
+        hedged = False
 
         for retry in range(self._max_retries):
-            for provider in providers:
+            queue = [p for p in providers if self.get_circuit_breaker(p.id).should_allow_request()]
+            # task -> (provider, launch time, launched as a hedge)
+            in_flight: Dict[asyncio.Task, Tuple[ProviderConfig, float, bool]] = {}
+            hedges = 0
+
+            def launch(provider: ProviderConfig, hedge: bool = False) -> None:
+                nonlocal attempts
                 attempts += 1
                 failover_path.append(provider.id)
+                task = asyncio.ensure_future(func(provider))
+                in_flight[task] = (provider, time.time(), hedge)
 
-                cb = self.get_circuit_breaker(provider.id)
-
-                if not cb.should_allow_request():
-                    continue
-
-                try:
-                    # Execute with this provider
-                    result = await func(provider)
+            if queue:
+                launch(queue.pop(0))
 
-                    # Success
-                    cb.record_success()
-                    self.registry.record_request(
-                        provider.id,
-                        success=True,
-                        latency_ms=(time.time() - start_time) * 1000
-                    )
-
-                    if attempts > 1:
-                        self._total_failovers += 1
-                        self._successful_failovers += 1
-
-                    return FailoverResult(
-                        success=True,
-                        provider_id=provider.id,
-                        result=result,
-                        latency_ms=(time.time() - start_time) * 1000,
-                        attempts=attempts,
-                        failover_path=failover_path
-                    )
-
-                except Exception as e:
-                    last_error = str(e)
-                    cb.record_failure()
-                    self.registry.record_request(provider.id, success=False)
-                    self.registry.update_health(
-                        provider.id,
-                        ProviderStatus.DEGRADED,
-                        error=last_error
+            try:
+                while in_flight:
+                    timeout = None
+                    if queue and hedges < max_hedges:
+                        newest, launched_at, _ = max(in_flight.values(), key=lambda v: v[1])
+                        timeout = max(0.0, launched_at + self._hedge_delay(newest) - time.time())
+
+                    done, _ = await asyncio.wait(
+                        in_flight, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
                     )
 
-                    logger.warning(
-                        f"Provider {provider.id} failed: {last_error}"
-                    )
+                    if not done:
+                        # Hedge: the newest attempt is slower than its usual tail
+                        hedges += 1
+                        hedged = True
+                        self._hedges_fired += 1
+                        launch(queue.pop(0), hedge=True)
+                        continue
+
+                    for task in done:
+                        provider, launched_at, was_hedge = in_flight.pop(task)
+                        attempt_ms = (time.time() - launched_at) * 1000
+                        cb = self.get_circuit_breaker(provider.id)
+                        error = task.exception()
+
+                        if error is None:
+                            # Success
+                            cb.record_success()
+                            self.registry.record_request(provider.id, success=True, latency_ms=attempt_ms)
+
+                            if attempts > 1:
+                                self._total_failovers += 1
+                                self._successful_failovers += 1
+                            if was_hedge:
+                                self._hedge_wins += 1
+
+                            return FailoverResult(
+                                success=True,
+                                provider_id=provider.id,
+                                result=task.result(),
+                                latency_ms=(time.time() - start_time) * 1000,
+                                attempts=attempts,
+                                failover_path=failover_path,
+                                hedged=hedged
+                            )
+
+                        last_error = str(error)
+                        cb.record_failure()
+                        self.registry.record_request(provider.id, success=False, latency_ms=attempt_ms)
+                        self.registry.update_health(
+                            provider.id,
+                            ProviderStatus.DEGRADED,
+                            error=last_error
+                        )
+
+                        logger.warning(
+                            f"Provider {provider.id} failed: {last_error}"
+                        )
+
+                        # Fail over immediately (unless a hedge is still running)
+                        if queue and not in_flight:
+                            launch(queue.pop(0))
+            finally:
+                # Cancel losers; their latency is censored, so nothing is recorded
+                for task in in_flight:
+                    task.cancel()
+                if in_flight:
+                    self._cancelled_attempts += len(in_flight)
+                    await asyncio.gather(*in_flight, return_exceptions=True)
 
             # Exponential backoff before retry
             if retry < self._max_retries - 1:
@@ -349,9 +431,16 @@ class FailoverManager:
             error=last_error or "All providers failed",
             latency_ms=(time.time() - start_time) * 1000,
             attempts=attempts,
-            failover_path=failover_path
+            failover_path=failover_path,
+            hedged=hedged
         )
 
+    def _hedge_delay(self, provider: ProviderConfig) -> float:
+        """Seconds to wait on `provider` before hedging to the next one."""
+        observed = self.registry.latency_percentile(provider.id, self._hedge_quantile)
+        delay_ms = observed if observed is not None else self._hedge_default_delay_ms
+        return max(delay_ms, self._hedge_min_delay_ms) / 1000
+
     async def health_check_all(self) -> Dict[str, ProviderHealth]:
         """
         Run health check on all providers.
@@ -422,6 +511,9 @@ class FailoverManager:
             ),
             'strategy': self._strategy.value,
             'max_retries': self._max_retries,
+            'hedges_fired': self._hedges_fired,
+            'hedge_wins': self._hedge_wins,
+            'cancelled_attempts': self._cancelled_attempts,
             'circuit_breakers': len(self._circuit_breakers),
             'circuit_states': {
                 state.value: sum(
@@ -439,4 +531,7 @@ class FailoverManager:
         self._total_requests = 0
         self._total_failovers = 0
         self._successful_failovers = 0
+        self._hedges_fired = 0
+        self._hedge_wins = 0
+        self._cancelled_attempts = 0
         logger.info("FailoverManager reset")
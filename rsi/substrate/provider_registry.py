@@ -3,14 +3,26 @@ Provider Registry.
 
 Registry of available LLM providers with capability tracking.
 
+Every request attempt is recorded with its own latency: a fixed-bucket
+histogram per provider for export, a sliding window of successful
+latencies for percentiles (the FailoverManager's hedging delay), and
+EWMAs of latency and error rate that drive adaptive provider ordering.
+
 See docs/IMPLEMENTATION_PLAN_ASI.md Section 2.3 for specification.
 """
 
-from typing import Dict, List, Optional, Any, Set
+from typing import Deque, Dict, List, Optional, Any, Set
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timezone
 import logging
+import math
+
+from ..measurement.profiling import Histogram
+
+# Per-attempt latency histogram buckets (milliseconds)
+LATENCY_BUCKETS_MS = (25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 120000)
 
 logger = logging.getLogger("rsi.substrate.provider_registry")
 
@@ -71,6 +83,8 @@ class ProviderHealth:
     error_rate: float = 0.0
     rate_limit_remaining: Optional[int] = None
     last_error: Optional[str] = None
+    ewma_latency_ms: Optional[float] = None  # Smoothed per-attempt latency (successes)
+    ewma_error_rate: float = 0.0             # Smoothed failure rate
 
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
@@ -81,7 +95,9 @@ class ProviderHealth:
             'latency_ms': self.latency_ms,
             'error_rate': self.error_rate,
             'rate_limit_remaining': self.rate_limit_remaining,
-            'last_error': self.last_error
+            'last_error': self.last_error,
+            'ewma_latency_ms': self.ewma_latency_ms,
+            'ewma_error_rate': self.ewma_error_rate
         }
 
 
@@ -111,6 +127,13 @@ class ProviderRegistry:
         self._request_counts: Dict[str, int] = {}
         self._success_counts: Dict[str, int] = {}
 
+        # Per-attempt latency tracking
+        self._ewma_alpha = self.config.get('ewma_alpha', 0.2)
+        self._latency_window = self.config.get('latency_window', 200)
+        self._default_latency_ms = self.config.get('default_latency_ms', 1000.0)
+        self._latency_histograms: Dict[str, Histogram] = {}
+        self._recent_latencies: Dict[str, Deque[float]] = {}
+
         # Tags for filtering
         self._provider_tags: Dict[str, Set[str]] = {}
 
@@ -222,6 +245,8 @@ class ProviderRegistry:
         self._request_counts[provider_config.id] = 0
         self._success_counts[provider_config.id] = 0
         self._provider_tags[provider_config.id] = tags or set()
+        self._latency_histograms[provider_config.id] = Histogram(LATENCY_BUCKETS_MS)
+        self._recent_latencies[provider_config.id] = deque(maxlen=self._latency_window)
 
         logger.info(f"Registered provider: {provider_config.id}")
 
@@ -243,6 +268,8 @@ class ProviderRegistry:
         self._request_counts.pop(provider_id, None)
         self._success_counts.pop(provider_id, None)
         self._provider_tags.pop(provider_id, None)
+        self._latency_histograms.pop(provider_id, None)
+        self._recent_latencies.pop(provider_id, None)
 
         logger.info(f"Unregistered provider: {provider_id}")
         return True
@@ -384,12 +411,12 @@ class ProviderRegistry:
         latency_ms: float = None
     ) -> None:
         """
-        Record a request for tracking.
+        Record a request attempt for tracking.
 
         Args:
             provider_id: Provider ID
             success: Whether request succeeded
-            latency_ms: Request latency
+            latency_ms: Latency of this attempt alone
         """
         if provider_id not in self._providers:
             return
@@ -413,6 +440,18 @@ class ProviderRegistry:
             if latency_ms:
                 health.latency_ms = latency_ms
 
+            alpha = self._ewma_alpha
+            health.ewma_error_rate = (1 - alpha) * health.ewma_error_rate + alpha * (0.0 if success else 1.0)
+            if latency_ms is not None:
+                self._latency_histograms[provider_id].observe(latency_ms)
+                if success:
+                    # Failures are often fast (or timeouts); percentiles describe good responses
+                    self._recent_latencies[provider_id].append(latency_ms)
+                    if health.ewma_latency_ms is None:
+                        health.ewma_latency_ms = latency_ms
+                    else:
+                        health.ewma_latency_ms = (1 - alpha) * health.ewma_latency_ms + alpha * latency_ms
+
             # Update status based on error rate
             if health.error_rate > 0.5:
                 health.status = ProviderStatus.DEGRADED
@@ -421,6 +460,41 @@ class ProviderRegistry:
             elif success:
                 health.status = ProviderStatus.AVAILABLE
 
+    def latency_percentile(self, provider_id: str, q: float) -> Optional[float]:
+        """
+        q-quantile (0-1) of recent successful attempt latencies in ms, or
+        None without samples.
+        """
+        samples = sorted(self._recent_latencies.get(provider_id, ()))
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, max(0, math.ceil(q * len(samples)) - 1))]
+
+    def routing_score(self, provider_id: str) -> float:
+        """
+        Expected milliseconds to a successful response from this provider:
+        EWMA latency divided by EWMA success rate. Providers without
+        latency samples use default_latency_ms, so they still get tried.
+        """
+        health = self._health.get(provider_id)
+        if health is None:
+            return float('inf')
+        latency = health.ewma_latency_ms if health.ewma_latency_ms is not None else self._default_latency_ms
+        return latency / max(1.0 - health.ewma_error_rate, 0.01)
+
+    def get_latency_histograms(self) -> Dict[str, Dict]:
+        """Per-provider attempt latency histograms (ms) with p50/p95/p99."""
+        histograms = {}
+        for provider_id, histogram in self._latency_histograms.items():
+            data = histogram.to_dict()
+            for name, q in (('p50', 0.5), ('p95', 0.95), ('p99', 0.99)):
+                # Window percentiles are exact; the bucket ones are upper bounds
+                value = self.latency_percentile(provider_id, q)
+                if value is not None:
+                    data[name] = value
+            histograms[provider_id] = data
+        return histograms
+
     def get_health(self, provider_id: str) -> Optional[ProviderHealth]:
         """Get health status for a provider."""
         return self._health.get(provider_id)
@@ -554,5 +628,7 @@ class ProviderRegistry:
             )
             self._request_counts[provider_id] = 0
             self._success_counts[provider_id] = 0
+            self._latency_histograms[provider_id] = Histogram(LATENCY_BUCKETS_MS)
+            self._recent_latencies[provider_id] = deque(maxlen=self._latency_window)
 
         logger.info("ProviderRegistry reset")
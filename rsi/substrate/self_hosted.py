@@ -1,8 +1,35 @@
 """
-Self-Hosted Inference (Future).
-
-Placeholder for self-hosted model inference capabilities.
-This will be implemented in later phases for full substrate independence.
+Self-Hosted Inference.
+
+Runs a local, OpenAI-compatible inference server process (llama.cpp's
+llama-server over a GGUF file by default) and exposes it to the rest of
+the substrate layer:
+
+- Lifecycle: start, health checks, warm-up, graceful stop and restart
+  (automatic restart when the process dies, up to max_restarts)
+- Registration in the ProviderRegistry as a zero-marginal-cost
+  SELF_HOSTED provider, so ComputeAbstractionLayer.get_cheapest_provider
+  and FailoverManager can offload bulk background prompts from
+  rate-limited remote APIs
+- Generation over /v1/chat/completions with a per-server concurrency
+  limit matching the server's parallel slots
+
+Config:
+    models_dir: Where downloaded models are stored (default "models")
+    host: Bind address for servers (default "127.0.0.1")
+    threads: CPU threads per server (default os.cpu_count())
+    parallel_slots: Concurrent sequences per server (default 2)
+    server_command: Command template overriding the backend default;
+        placeholders {model_path} {host} {port} {context_length}
+        {threads} {gpu_layers} {slots}
+    startup_timeout: Seconds to wait for /health after launch (120)
+    request_timeout: Seconds per completion request (300)
+    stop_grace_seconds: SIGTERM grace before SIGKILL (10)
+    warmup: Send one tiny completion before registering (True)
+    health_interval: Seconds between background health checks; 0 disables (30)
+    max_restarts: Automatic restarts per server (3)
+    provider_priority: Registry priority of local servers (50)
+    log_dir: Directory for server stdout/stderr logs (None = discard)
 
 See docs/IMPLEMENTATION_PLAN_ASI.md Section 2.3 for specification.
 """
@@ -11,7 +38,22 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timezone
+from pathlib import Path
+import asyncio
 import logging
+import os
+import socket
+import time
+
+import httpx
+
+from .provider_registry import (
+    ProviderRegistry,
+    ProviderConfig,
+    ProviderCapabilities,
+    ProviderType,
+    ProviderStatus
+)
 
 logger = logging.getLogger("rsi.substrate.self_hosted")
 
@@ -33,6 +75,24 @@ class InferenceBackend(Enum):
     TRANSFORMERS = "transformers"
 
 
+# Default launch commands for backends that serve an OpenAI-compatible API
+DEFAULT_SERVER_COMMANDS: Dict[InferenceBackend, List[str]] = {
+    InferenceBackend.LLAMA_CPP: [
+        "llama-server", "-m", "{model_path}", "--host", "{host}", "--port", "{port}",
+        "-c", "{context_length}", "-t", "{threads}", "-ngl", "{gpu_layers}",
+        "--parallel", "{slots}",
+    ],
+}
+
+_FORMAT_SUFFIXES = {
+    ".gguf": ModelFormat.GGUF,
+    ".safetensors": ModelFormat.SAFETENSORS,
+    ".bin": ModelFormat.PYTORCH,
+    ".pt": ModelFormat.PYTORCH,
+    ".onnx": ModelFormat.ONNX,
+}
+
+
 @dataclass
 class LocalModelConfig:
     """Configuration for a locally hosted model."""
@@ -59,41 +119,99 @@ class InferenceServer:
     started_at: Optional[str] = None
     memory_usage_mb: float = 0.0
     gpu_memory_mb: float = 0.0
+    pid: Optional[int] = None
+    restarts: int = 0
+    last_health_check: Optional[str] = None
+    warmup_ms: Optional[float] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary."""
+        return {
+            'id': self.id,
+            'backend': self.backend.value,
+            'base_url': self.base_url,
+            'model_id': self.model_id,
+            'is_running': self.is_running,
+            'started_at': self.started_at,
+            'pid': self.pid,
+            'restarts': self.restarts,
+            'last_health_check': self.last_health_check,
+            'warmup_ms': self.warmup_ms
+        }
+
+
+def _free_port(host: str) -> int:
+    """Ask the OS for an unused TCP port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
 
 
 class SelfHostedManager:
     """
     Manager for self-hosted inference.
 
-    Future capabilities:
-    - Model downloading and management
-    - Local inference server deployment
-    - GPU resource allocation
-    - Model switching and optimization
-    - Custom model training integration
+    Usage:
+        manager = SelfHostedManager(config, registry=compute.registry)
+        await manager.download_model("qwen-0.5b", "/models/qwen2.5-0.5b-q4_k_m.gguf")
+        server = await manager.start_inference_server("qwen-0.5b", port=0)
+        text = await manager.generate(server.id, "Summarize: ...")
+        await manager.shutdown()
     """
 
-    def __init__(self, config: Dict = None):
+    def __init__(self, config: Dict = None, registry: Optional[ProviderRegistry] = None):
         """
         Initialize self-hosted manager.
 
         Args:
             config: Configuration options
+            registry: Provider registry to register running servers in
         """
         self.config = config or {}
+        self.registry = registry
+
+        self._models_dir = Path(self.config.get('models_dir', 'models'))
+        self._host = self.config.get('host', '127.0.0.1')
+        self._threads = self.config.get('threads', os.cpu_count() or 1)
+        self._slots = self.config.get('parallel_slots', 2)
+        self._startup_timeout = self.config.get('startup_timeout', 120.0)
+        self._request_timeout = self.config.get('request_timeout', 300.0)
+        self._stop_grace = self.config.get('stop_grace_seconds', 10.0)
+        self._warmup = self.config.get('warmup', True)
+        self._health_interval = self.config.get('health_interval', 30.0)
+        self._max_restarts = self.config.get('max_restarts', 3)
+        self._provider_priority = self.config.get('provider_priority', 50)
 
         # Model registry (local models)
         self._models: Dict[str, LocalModelConfig] = {}
 
-        # Inference servers
+        # Inference servers and their processes / HTTP clients
         self._servers: Dict[str, InferenceServer] = {}
+        self._processes: Dict[str, asyncio.subprocess.Process] = {}
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._slots_sem: Dict[str, asyncio.Semaphore] = {}
+        self._monitor_task: Optional[asyncio.Task] = None
 
         # Statistics
         self._total_inferences: int = 0
+        self._failed_inferences: int = 0
+        self._total_tokens_in: int = 0
+        self._total_tokens_out: int = 0
 
-        logger.info(
-            "SelfHostedManager initialized (stub - full implementation in Phase 3+)"
-        )
+        logger.info("SelfHostedManager initialized")
+
+    # ------------------------------------------------------------------
+    # Models
+    # ------------------------------------------------------------------
+
+    def register_model(self, model: LocalModelConfig) -> None:
+        """Register a model that is already on disk."""
+        self._models[model.id] = model
+        logger.info(f"Registered local model: {model.id} ({model.path})")
 
     async def download_model(
         self,
@@ -106,16 +224,71 @@ class SelfHostedManager:
 
         Args:
             model_id: Model identifier
-            source: Download source (HuggingFace, etc.)
-            format: Model format
+            source: An http(s) URL (e.g. a HuggingFace resolve/ link) or a
+                local file path, which is registered in place
+            format: Model format (inferred from the file suffix if known)
 
         Returns:
             LocalModelConfig or None
-
-        Note: Stub implementation for future use.
         """
-        logger.warning("download_model: Not implemented (Phase 3+)")
-        return None
+        if source.startswith(("http://", "https://")):
+            filename = source.rstrip("/").rsplit("/", 1)[-1].split("?", 1)[0] or f"{model_id}.{format.value}"
+            path = self._models_dir / filename
+            try:
+                await self._download(source, path)
+            except Exception as e:
+                logger.warning(f"download_model: {source} failed: {e}")
+                return None
+        else:
+            path = Path(source).expanduser()
+            if not path.is_file():
+                logger.warning(f"download_model: {source} is not a file or URL")
+                return None
+
+        model = LocalModelConfig(
+            id=model_id,
+            name=model_id,
+            path=str(path.resolve()),
+            format=_FORMAT_SUFFIXES.get(path.suffix.lower(), format),
+            backend=InferenceBackend.LLAMA_CPP,
+            context_length=self.config.get('context_length', 4096),
+            gpu_layers=self.config.get('gpu_layers', 0),
+            metadata={'source': source, 'size_bytes': path.stat().st_size}
+        )
+        self.register_model(model)
+        return model
+
+    async def _download(self, url: str, path: Path) -> None:
+        """Stream a URL to disk, renaming into place once complete."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(path.name + ".part")
+        async with httpx.AsyncClient(follow_redirects=True, timeout=None) as client:
+            async with client.stream("GET", url) as response:
+                response.raise_for_status()
+                with open(partial, "wb") as f:
+                    async for chunk in response.aiter_bytes(1 << 20):
+                        f.write(chunk)
+        partial.replace(path)
+        logger.info(f"Downloaded {url} -> {path}")
+
+    # ------------------------------------------------------------------
+    # Server lifecycle
+    # ------------------------------------------------------------------
+
+    def _build_command(self, model: LocalModelConfig, server: InferenceServer) -> Optional[List[str]]:
+        template = self.config.get('server_command') or DEFAULT_SERVER_COMMANDS.get(server.backend)
+        if template is None:
+            return None
+        values = {
+            'model_path': model.path,
+            'host': server.host,
+            'port': server.port,
+            'context_length': model.context_length,
+            'threads': self._threads,
+            'gpu_layers': model.gpu_layers,
+            'slots': self._slots,
+        }
+        return [str(part).format(**values) for part in template]
 
     async def start_inference_server(
         self,
@@ -126,18 +299,197 @@ class SelfHostedManager:
         """
         Start a local inference server.
 
+        Launches the server process, waits for /health, warms it up and
+        registers it as a zero-cost provider.
+
         Args:
             model_id: Model to serve
             backend: Inference backend
-            port: Server port
+            port: Server port (0 picks a free port)
 
         Returns:
             InferenceServer or None
+        """
+        model = self._models.get(model_id)
+        if model is None:
+            logger.warning(f"start_inference_server: unknown model {model_id}")
+            return None
+        if backend == InferenceBackend.LLAMA_CPP and model.format != ModelFormat.GGUF \
+                and not self.config.get('server_command'):
+            logger.warning(f"start_inference_server: llama.cpp needs GGUF, {model_id} is {model.format.value}")
+            return None
+
+        server_id = f"local-{model_id}"
+        if server_id in self._servers and self._servers[server_id].is_running:
+            return self._servers[server_id]
+
+        server = InferenceServer(
+            id=server_id,
+            backend=backend,
+            host=self._host,
+            port=port or _free_port(self._host),
+            model_id=model_id
+        )
+        if not await self._launch(server, model):
+            return None
+
+        self._servers[server_id] = server
+        self._register_provider(server, model)
+        if self._health_interval and self._monitor_task is None:
+            self._monitor_task = asyncio.create_task(self._monitor_loop())
+        return server
+
+    async def _launch(self, server: InferenceServer, model: LocalModelConfig) -> bool:
+        """Start the process, wait until healthy and warm up."""
+        command = self._build_command(model, server)
+        if command is None:
+            logger.warning(f"No launch command for backend {server.backend.value}; set server_command")
+            return False
+
+        output = asyncio.subprocess.DEVNULL
+        log_dir = self.config.get('log_dir')
+        if log_dir:
+            Path(log_dir).mkdir(parents=True, exist_ok=True)
+            output = open(Path(log_dir) / f"{server.id}.log", "ab")
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command, stdout=output, stderr=output
+            )
+        except OSError as e:
+            logger.warning(f"Could not start {server.id} ({command[0]}): {e}")
+            return False
+        finally:
+            if output is not asyncio.subprocess.DEVNULL:
+                output.close()
+
+        self._processes[server.id] = process
+        self._clients[server.id] = httpx.AsyncClient(
+            base_url=server.base_url, timeout=self._request_timeout
+        )
+        self._slots_sem[server.id] = asyncio.Semaphore(self._slots)
+        server.pid = process.pid
+
+        if not await self._wait_healthy(server):
+            logger.warning(f"{server.id} did not become healthy within {self._startup_timeout}s")
+            await self._terminate(server.id)
+            return False
+
+        server.is_running = True
+        server.started_at = datetime.now(timezone.utc).isoformat()
+
+        if self._warmup:
+            start = time.perf_counter()
+            try:
+                await self.chat_completion(server.id, self.config.get('warmup_prompt', 'Hello'), max_tokens=1)
+                server.warmup_ms = (time.perf_counter() - start) * 1000
+            except Exception as e:
+                logger.warning(f"{server.id} warm-up failed: {e}")
+
+        logger.info(f"Started {server.id} on {server.base_url} (pid {server.pid})")
+        return True
+
+    async def _wait_healthy(self, server: InferenceServer) -> bool:
+        deadline = time.monotonic() + self._startup_timeout
+        process = self._processes[server.id]
+        while time.monotonic() < deadline:
+            if process.returncode is not None:
+                logger.warning(f"{server.id} exited during startup (code {process.returncode})")
+                return False
+            if await self._probe(server):
+                return True
+            await asyncio.sleep(0.1)
+        return False
 
-        Note: Stub implementation for future use.
+    async def _probe(self, server: InferenceServer) -> bool:
+        """GET /health; llama.cpp answers 503 while the model loads."""
+        client = self._clients.get(server.id)
+        if client is None:
+            return False
+        try:
+            response = await client.get("/health", timeout=5.0)
+            return response.status_code == 200
+        except httpx.HTTPError:
+            return False
+
+    async def check_health(self, server_id: str) -> bool:
         """
-        logger.warning("start_inference_server: Not implemented (Phase 3+)")
-        return None
+        Check a server and update its registry health.
+
+        A server whose process has died is restarted (up to max_restarts).
+
+        Returns:
+            True if the server is healthy
+        """
+        server = self._servers.get(server_id)
+        if server is None:
+            return False
+
+        process = self._processes.get(server_id)
+        alive = process is not None and process.returncode is None
+        healthy = alive and await self._probe(server)
+        server.last_health_check = datetime.now(timezone.utc).isoformat()
+
+        if not healthy and not alive and server.restarts < self._max_restarts:
+            logger.warning(f"{server_id} process died; restarting")
+            healthy = await self.restart_inference_server(server_id)
+
+        server.is_running = healthy
+        if self.registry is not None and self.registry.get_provider(server_id):
+            self.registry.update_health(
+                server_id,
+                ProviderStatus.AVAILABLE if healthy else ProviderStatus.UNAVAILABLE,
+                error=None if healthy else "Health check failed"
+            )
+        return healthy
+
+    async def _monitor_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._health_interval)
+            for server_id in list(self._servers):
+                try:
+                    await self.check_health(server_id)
+                except Exception as e:
+                    logger.warning(f"Health check for {server_id} failed: {e}")
+
+    async def restart_inference_server(self, server_id: str) -> bool:
+        """
+        Gracefully restart a server on the same port.
+
+        Returns:
+            True if the server is back up
+        """
+        server = self._servers.get(server_id)
+        if server is None:
+            return False
+        model = self._models[server.model_id]
+
+        await self._terminate(server_id)
+        server.is_running = False
+        server.restarts += 1
+        ok = await self._launch(server, model)
+        if self.registry is not None and self.registry.get_provider(server_id):
+            self.registry.update_health(
+                server_id, ProviderStatus.AVAILABLE if ok else ProviderStatus.UNAVAILABLE
+            )
+        logger.info(f"Restarted {server_id} ({'ok' if ok else 'failed'})")
+        return ok
+
+    async def _terminate(self, server_id: str) -> None:
+        """SIGTERM, then SIGKILL after the grace period."""
+        process = self._processes.pop(server_id, None)
+        client = self._clients.pop(server_id, None)
+        if client is not None:
+            await client.aclose()
+        if process is None or process.returncode is not None:
+            return
+        process.terminate()
+        try:
+            await asyncio.wait_for(process.wait(), self._stop_grace)
+        except asyncio.TimeoutError:
+            logger.warning(f"{server_id} ignored SIGTERM; killing")
+            process.kill()
+            await process.wait()
 
     async def stop_inference_server(self, server_id: str) -> bool:
         """
@@ -148,11 +500,110 @@ class SelfHostedManager:
 
         Returns:
             True if stopped
+        """
+        server = self._servers.pop(server_id, None)
+        if server is None:
+            return False
+        await self._terminate(server_id)
+        self._slots_sem.pop(server_id, None)
+        server.is_running = False
+        if self.registry is not None:
+            self.registry.unregister_provider(server_id)
+        logger.info(f"Stopped {server_id}")
+        return True
+
+    async def shutdown(self) -> None:
+        """Stop all servers and the health monitor."""
+        if self._monitor_task is not None:
+            self._monitor_task.cancel()
+            self._monitor_task = None
+        for server_id in list(self._servers):
+            await self.stop_inference_server(server_id)
+
+    def _register_provider(self, server: InferenceServer, model: LocalModelConfig) -> None:
+        if self.registry is None:
+            return
+        self.registry.register_provider(
+            ProviderConfig(
+                id=server.id,
+                name=f"Self-hosted {model.name}",
+                provider_type=ProviderType.SELF_HOSTED,
+                endpoint=f"{server.base_url}/v1/chat/completions",
+                capabilities=ProviderCapabilities(
+                    max_context_length=model.context_length,
+                    max_output_tokens=model.context_length // 2,
+                    supported_models=[model.id]
+                ),
+                priority=self._provider_priority,
+                cost_per_1k_input=0.0,  # Zero marginal cost
+                cost_per_1k_output=0.0,
+                metadata={
+                    'server_id': server.id,
+                    'model_id': model.id,
+                    'backend': server.backend.value,
+                    'zero_marginal_cost': True
+                }
+            ),
+            tags={'self_hosted', 'bulk'}
+        )
+        self.registry.update_health(server.id, ProviderStatus.AVAILABLE)
+
+    # ------------------------------------------------------------------
+    # Inference
+    # ------------------------------------------------------------------
 
-        Note: Stub implementation for future use.
+    async def chat_completion(
+        self,
+        server_id: str,
+        prompt: str,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        system_message: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
-        logger.warning("stop_inference_server: Not implemented (Phase 3+)")
-        return False
+        Run one chat completion; raises on failure (for failover).
+
+        Registry latency is not recorded here; FailoverManager records
+        its own attempts and generate() records direct calls.
+
+        Returns:
+            Dict with text, input_tokens, output_tokens, latency_ms
+        """
+        client = self._clients.get(server_id)
+        if client is None:
+            raise RuntimeError(f"Inference server {server_id} is not running")
+
+        messages = []
+        if system_message:
+            messages.append({'role': 'system', 'content': system_message})
+        messages.append({'role': 'user', 'content': prompt})
+
+        try:
+            async with self._slots_sem[server_id]:
+                start = time.perf_counter()
+                response = await client.post("/v1/chat/completions", json={
+                    'messages': messages,
+                    'max_tokens': max_tokens,
+                    'temperature': temperature,
+                })
+                latency_ms = (time.perf_counter() - start) * 1000
+            response.raise_for_status()
+            data = response.json()
+            text = data['choices'][0]['message']['content']
+        except Exception:
+            self._failed_inferences += 1
+            raise
+
+        usage = data.get('usage') or {}
+        self._total_inferences += 1
+        self._total_tokens_in += usage.get('prompt_tokens', 0)
+        self._total_tokens_out += usage.get('completion_tokens', 0)
+        return {
+            'text': text,
+            'input_tokens': usage.get('prompt_tokens', 0),
+            'output_tokens': usage.get('completion_tokens', 0),
+            'latency_ms': latency_ms
+        }
 
     async def generate(
         self,
@@ -172,11 +623,25 @@ class SelfHostedManager:
 
         Returns:
             Generated text or None
-
-        Note: Stub implementation for future use.
         """
-        logger.warning("generate: Not implemented (Phase 3+)")
-        return None
+        if server_id not in self._clients:
+            logger.warning(f"generate: server {server_id} is not running")
+            return None
+
+        start = time.perf_counter()
+        try:
+            result = await self.chat_completion(server_id, prompt, max_tokens, temperature)
+        except Exception as e:
+            logger.warning(f"generate on {server_id} failed: {e}")
+            result = None
+
+        if self.registry is not None and self.registry.get_provider(server_id):
+            self.registry.record_request(
+                server_id,
+                success=result is not None,
+                latency_ms=(time.perf_counter() - start) * 1000
+            )
+        return result['text'] if result is not None else None
 
     def list_models(self) -> List[LocalModelConfig]:
         """List registered local models."""
@@ -195,12 +660,18 @@ class SelfHostedManager:
                 1 for s in self._servers.values() if s.is_running
             ),
             'total_inferences': self._total_inferences,
-            'implementation_status': 'stub'
+            'failed_inferences': self._failed_inferences,
+            'total_tokens_in': self._total_tokens_in,
+            'total_tokens_out': self._total_tokens_out,
+            'servers': [s.to_dict() for s in self._servers.values()]
         }
 
     def reset(self) -> None:
-        """Reset manager state."""
+        """Reset manager state (running servers are left to shutdown())."""
         self._models.clear()
         self._servers.clear()
         self._total_inferences = 0
+        self._failed_inferences = 0
+        self._total_tokens_in = 0
+        self._total_tokens_out = 0
         logger.info("SelfHostedManager reset")
@@ -40,6 +40,7 @@ from .human_anchoring import (
 from .lattice import (
     VerifierType,
     VerificationOutcome,
+    VerifierCost,
     VerifierResult,
     LatticeResult,
     Improvement,
@@ -90,6 +91,7 @@ __all__ = [
     # Verification Lattice
     "VerifierType",
     "VerificationOutcome",
+    "VerifierCost",
     "VerifierResult",
     "LatticeResult",
     "Improvement",
@@ -5,6 +5,14 @@ Multi-verifier composition that exceeds single-verifier ceiling.
 Based on DeepMind research showing multi-verifier systems outperform
 single LLM-as-judge approaches.
 
+Execution is staged by default: verifiers run in order of their cost
+class (cheap deterministic checks first, LLM and human review last) and
+the lattice stops as soon as the consensus outcome can no longer change,
+whatever the remaining verifiers would say. Verifiers with veto power
+(property checks by default) decide FAIL on their own. Skipped and
+cancelled verifiers are reported as SKIPPED, and the result records the
+estimated tokens and milliseconds saved.
+
 See docs/IMPLEMENTATION_PLAN.md Phase 1.1 for specification.
 """
 
@@ -14,6 +22,7 @@ from enum import Enum
 from datetime import datetime, timezone
 import logging
 import asyncio
+import time
 
 logger = logging.getLogger("rsi.verification.lattice")
 
@@ -36,6 +45,25 @@ class VerificationOutcome(Enum):
     SKIPPED = "skipped"
 
 
+class VerifierCost(Enum):
+    """Cost class of a verifier; staged execution runs cheaper classes first."""
+    CHEAP = "cheap"           # Deterministic, local, sub-millisecond
+    MODERATE = "moderate"     # Local but non-trivial (execution, analysis)
+    EXPENSIVE = "expensive"   # LLM calls, human review
+
+    @property
+    def rank(self) -> int:
+        return list(VerifierCost).index(self)
+
+
+# Expected duration before a verifier has been observed
+DEFAULT_COST_MS = {
+    VerifierCost.CHEAP: 1.0,
+    VerifierCost.MODERATE: 100.0,
+    VerifierCost.EXPENSIVE: 2000.0,
+}
+
+
 @dataclass
 class VerifierResult:
     """Result from a single verifier."""
@@ -73,6 +101,9 @@ class LatticeResult:
     meets_threshold: bool
     details: str
     metadata: Dict[str, Any] = field(default_factory=dict)
+    short_circuited: bool = False   # Stopped before running every verifier
+    tokens_saved: int = 0           # Estimated LLM tokens not spent
+    ms_saved: float = 0.0           # Estimated verifier time not spent
 
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
@@ -86,7 +117,10 @@ class LatticeResult:
             'agreement_ratio': self.agreement_ratio,
             'meets_threshold': self.meets_threshold,
             'details': self.details,
-            'metadata': self.metadata
+            'metadata': self.metadata,
+            'short_circuited': self.short_circuited,
+            'tokens_saved': self.tokens_saved,
+            'ms_saved': self.ms_saved
         }
 
 
@@ -113,20 +147,54 @@ class Improvement:
 
 
 class BaseVerifier:
-    """Base class for verifiers."""
+    """
+    Base class for verifiers.
+
+    Subclasses declare a cost class (staged execution order) and whether
+    a FAIL from them vetoes the improvement; both can be overridden per
+    verifier in config ('cost_class', 'veto').
+    """
+
+    verifier_type: Optional[VerifierType] = None
+    cost_class: VerifierCost = VerifierCost.CHEAP
+    veto: bool = False
 
     def __init__(self, config: Dict = None):
         self.config = config or {}
         self.weight = self.config.get('weight', 1.0)
+        if 'cost_class' in self.config:
+            self.cost_class = VerifierCost(self.config['cost_class'])
+        self.veto = self.config.get('veto', self.veto)
+        self._avg_duration_ms: Optional[float] = None
 
     async def verify(self, improvement: Improvement) -> VerifierResult:
         """Override in subclass."""
         raise NotImplementedError
 
+    def estimate_tokens(self, improvement: Improvement) -> int:
+        """LLM tokens a verify() call would spend (0 for local verifiers)."""
+        return 0
+
+    @property
+    def expected_ms(self) -> float:
+        """Observed average duration, else config 'estimated_ms', else the cost class default."""
+        if self._avg_duration_ms is not None:
+            return self._avg_duration_ms
+        return self.config.get('estimated_ms', DEFAULT_COST_MS[self.cost_class])
+
+    def observe_duration(self, duration_ms: float) -> None:
+        """Fold a completed run into the expected duration (EMA)."""
+        if self._avg_duration_ms is None:
+            self._avg_duration_ms = duration_ms
+        else:
+            self._avg_duration_ms = 0.8 * self._avg_duration_ms + 0.2 * duration_ms
+
 
 class ExecutionTestsVerifier(BaseVerifier):
     """Verifies improvements via execution tests (ground truth)."""
 
+    verifier_type = VerifierType.EXECUTION
+
     async def verify(self, improvement: Improvement) -> VerifierResult:
         """Verify via test execution results."""
         import time
@@ -170,7 +238,10 @@ class ExecutionTestsVerifier(BaseVerifier):
 
 
 class PropertyChecksVerifier(BaseVerifier):
-    """Verifies improvements maintain invariants."""
+    """Verifies improvements maintain invariants. A violation vetoes."""
+
+    verifier_type = VerifierType.PROPERTY
+    veto = True
 
     def __init__(self, config: Dict = None):
         super().__init__(config)
@@ -242,25 +313,22 @@ class PropertyChecksVerifier(BaseVerifier):
 class LLMCritiqueVerifier(BaseVerifier):
     """Verifies improvements via LLM semantic review."""
 
+    verifier_type = VerifierType.LLM_CRITIQUE
+    cost_class = VerifierCost.EXPENSIVE
+
     def __init__(self, config: Dict = None, llm_client=None):
         super().__init__(config)
         self.llm_client = llm_client
+        self.max_tokens = self.config.get('max_tokens', 500)
 
-    async def verify(self, improvement: Improvement) -> VerifierResult:
-        """Verify via LLM critique."""
-        import time
-        start = time.time()
-
+    def estimate_tokens(self, improvement: Improvement) -> int:
+        """Prompt (~4 chars per token) plus the response budget."""
         if not self.llm_client:
-            return VerifierResult(
-                verifier_type=VerifierType.LLM_CRITIQUE,
-                outcome=VerificationOutcome.SKIPPED,
-                confidence=0.0,
-                details="No LLM client configured",
-                duration_ms=(time.time() - start) * 1000
-            )
+            return 0
+        return len(self._build_prompt(improvement)) // 4 + self.max_tokens
 
-        prompt = f"""Review this improvement for quality and safety:
+    def _build_prompt(self, improvement: Improvement) -> str:
+        return f"""Review this improvement for quality and safety:
 
 Improvement: {improvement.description}
 Capability: {improvement.capability}
@@ -274,8 +342,24 @@ Evaluate:
 Respond with JSON:
 {{"approved": true/false, "confidence": 0.0-1.0, "concerns": ["..."]}}"""
 
+    async def verify(self, improvement: Improvement) -> VerifierResult:
+        """Verify via LLM critique."""
+        import time
+        start = time.time()
+
+        if not self.llm_client:
+            return VerifierResult(
+                verifier_type=VerifierType.LLM_CRITIQUE,
+                outcome=VerificationOutcome.SKIPPED,
+                confidence=0.0,
+                details="No LLM client configured",
+                duration_ms=(time.time() - start) * 1000
+            )
+
+        prompt = self._build_prompt(improvement)
+
         try:
-            response = await self.llm_client.query(prompt, max_tokens=500)
+            response = await self.llm_client.query(prompt, max_tokens=self.max_tokens)
             # Parse response
             import json
             text = response.strip()
@@ -314,6 +398,8 @@ Respond with JSON:
 class AdversarialProbesVerifier(BaseVerifier):
     """Verifies improvements via adversarial testing."""
 
+    verifier_type = VerifierType.ADVERSARIAL
+
     async def verify(self, improvement: Improvement) -> VerifierResult:
         """Verify via adversarial probes."""
         import time
@@ -357,6 +443,9 @@ class AdversarialProbesVerifier(BaseVerifier):
 class HumanSpotCheckVerifier(BaseVerifier):
     """Verifies improvements via human spot checks for calibration."""
 
+    verifier_type = VerifierType.HUMAN_SPOT
+    cost_class = VerifierCost.EXPENSIVE
+
     def __init__(self, config: Dict = None, anchoring_system=None):
         super().__init__(config)
         self.anchoring_system = anchoring_system
@@ -414,6 +503,11 @@ class VerificationLattice:
     Composes multiple verification strategies to exceed the ceiling
     of any single verifier. Based on research showing that LLM-as-judge
     approaches plateau, but multi-verifier systems can exceed this.
+
+    With staged execution (config 'staged', default True) verifiers run
+    one cost class at a time, cheapest first, and anything still pending
+    once the consensus outcome is decided is cancelled or skipped. The
+    outcome is the same as running every verifier.
     """
 
     def __init__(
@@ -428,6 +522,9 @@ class VerificationLattice:
         # Agreement threshold (60% required by default)
         self.threshold = self.config.get('threshold', 0.6)
 
+        # Cheapest-first with short-circuit, or everything concurrently
+        self.staged = self.config.get('staged', True)
+
         # Initialize verifiers
         self.verifiers: List[BaseVerifier] = [
             ExecutionTestsVerifier(self.config.get('execution', {})),
@@ -441,6 +538,9 @@ class VerificationLattice:
         self._verifications: int = 0
         self._passes: int = 0
         self._failures: int = 0
+        self._short_circuits: int = 0
+        self._tokens_saved: int = 0
+        self._ms_saved: float = 0.0
 
         logger.info(f"VerificationLattice initialized with {len(self.verifiers)} verifiers")
 
@@ -456,34 +556,19 @@ class VerificationLattice:
         """
         self._verifications += 1
         timestamp = datetime.now(timezone.utc).isoformat()
+        start = time.time()
 
-        # Run all verifiers concurrently
-        results = await asyncio.gather(*[
-            v.verify(improvement) for v in self.verifiers
-        ], return_exceptions=True)
-
-        # Process results
-        verifier_results: List[VerifierResult] = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.warning(f"Verifier {i} failed: {result}")
-                verifier_results.append(VerifierResult(
-                    verifier_type=self.verifiers[i].__class__.__name__,
-                    outcome=VerificationOutcome.ERROR,
-                    confidence=0.0,
-                    details=f"Verifier error: {str(result)}"
-                ))
-            else:
-                verifier_results.append(result)
+        if self.staged:
+            verifier_results = await self._run_staged(improvement)
+        else:
+            # Run all verifiers concurrently
+            verifier_results = list(await asyncio.gather(*[
+                self._run_verifier(i, improvement) for i in range(len(self.verifiers))
+            ]))
 
         # Calculate consensus
-        pass_count = sum(1 for r in verifier_results
-                        if r.outcome == VerificationOutcome.PASS)
-        fail_count = sum(1 for r in verifier_results
-                        if r.outcome == VerificationOutcome.FAIL)
-        active_count = sum(1 for r in verifier_results
-                          if r.outcome in [VerificationOutcome.PASS,
-                                          VerificationOutcome.FAIL])
+        pass_count, fail_count, vetoed_by = self._tally(verifier_results)
+        active_count = pass_count + fail_count
 
         # Calculate ratios
         if active_count > 0:
@@ -492,14 +577,11 @@ class VerificationLattice:
             pass_ratio = 0.0
 
         # Determine consensus outcome
-        if pass_ratio >= self.threshold:
-            consensus = VerificationOutcome.PASS
+        consensus = self._consensus(pass_count, fail_count, bool(vetoed_by))
+        if consensus == VerificationOutcome.PASS:
             self._passes += 1
-        elif pass_ratio <= (1 - self.threshold):
-            consensus = VerificationOutcome.FAIL
+        elif consensus == VerificationOutcome.FAIL:
             self._failures += 1
-        else:
-            consensus = VerificationOutcome.INCONCLUSIVE
 
         # Calculate agreement ratio
         if active_count > 0:
@@ -518,7 +600,22 @@ class VerificationLattice:
         else:
             consensus_confidence = 0.0
 
-        meets_threshold = pass_ratio >= self.threshold
+        meets_threshold = pass_ratio >= self.threshold and not vetoed_by
+
+        # Savings from short-circuiting
+        short_circuited = [r for r in verifier_results if r.metadata.get('short_circuited')]
+        tokens_saved = sum(r.metadata.get('tokens_saved', 0) for r in short_circuited)
+        ms_saved = sum(r.metadata.get('ms_saved', 0.0) for r in short_circuited)
+        if short_circuited:
+            self._short_circuits += 1
+            self._tokens_saved += tokens_saved
+            self._ms_saved += ms_saved
+
+        details = f"Lattice: {pass_count}/{active_count} passed ({pass_ratio:.1%})"
+        if vetoed_by:
+            details += f", vetoed by {', '.join(vetoed_by)}"
+        if short_circuited:
+            details += f", {len(short_circuited)} skipped after decision"
 
         return LatticeResult(
             improvement_id=improvement.id,
@@ -529,14 +626,147 @@ class VerificationLattice:
             pass_ratio=pass_ratio,
             agreement_ratio=agreement_ratio,
             meets_threshold=meets_threshold,
-            details=f"Lattice: {pass_count}/{active_count} passed ({pass_ratio:.1%})",
+            details=details,
             metadata={
                 'threshold': self.threshold,
                 'active_verifiers': active_count,
-                'skipped_verifiers': len(verifier_results) - active_count
+                'skipped_verifiers': len(verifier_results) - active_count,
+                'vetoed_by': vetoed_by,
+                'staged': self.staged,
+                'duration_ms': (time.time() - start) * 1000
+            },
+            short_circuited=bool(short_circuited),
+            tokens_saved=tokens_saved,
+            ms_saved=ms_saved
+        )
+
+    async def _run_verifier(self, index: int, improvement: Improvement) -> VerifierResult:
+        """Run one verifier, turning exceptions into ERROR results."""
+        verifier = self.verifiers[index]
+        try:
+            result = await verifier.verify(improvement)
+        except Exception as e:
+            logger.warning(f"Verifier {index} failed: {e}")
+            return VerifierResult(
+                verifier_type=verifier.__class__.__name__,
+                outcome=VerificationOutcome.ERROR,
+                confidence=0.0,
+                details=f"Verifier error: {str(e)}"
+            )
+        verifier.observe_duration(result.duration_ms)
+        return result
+
+    async def _run_staged(self, improvement: Improvement) -> List[VerifierResult]:
+        """
+        Run cost classes cheapest first; stop once the outcome is decided.
+
+        Verifiers within a class run concurrently and are checked as each
+        one finishes, so a decision cancels its still-running peers.
+        """
+        results: List[Optional[VerifierResult]] = [None] * len(self.verifiers)
+        decided = False
+
+        for rank in sorted({v.cost_class.rank for v in self.verifiers}):
+            stage = [i for i, v in enumerate(self.verifiers) if v.cost_class.rank == rank]
+            if decided:
+                for i in stage:
+                    results[i] = self._short_circuit(
+                        i, self.verifiers[i].estimate_tokens(improvement), self.verifiers[i].expected_ms
+                    )
+                continue
+
+            stage_start = time.time()
+            tasks = {asyncio.ensure_future(self._run_verifier(i, improvement)): i for i in stage}
+            pending = set(tasks)
+            while pending and not decided:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    results[tasks[task]] = task.result()
+                decided = self._decided(results) is not None
+
+            if pending:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                elapsed_ms = (time.time() - stage_start) * 1000
+                for task in pending:
+                    i = tasks[task]
+                    # An aborted LLM request may still be billed: only time is saved
+                    results[i] = self._short_circuit(
+                        i, 0, max(0.0, self.verifiers[i].expected_ms - elapsed_ms), cancelled=True
+                    )
+
+        return results
+
+    def _short_circuit(self, index: int, tokens_saved: int, ms_saved: float,
+                       cancelled: bool = False) -> VerifierResult:
+        verifier = self.verifiers[index]
+        return VerifierResult(
+            verifier_type=verifier.verifier_type or verifier.__class__.__name__,
+            outcome=VerificationOutcome.SKIPPED,
+            confidence=0.0,
+            details=f"{'Cancelled' if cancelled else 'Skipped'}: consensus already decided",
+            metadata={
+                'short_circuited': True,
+                'cancelled': cancelled,
+                'tokens_saved': tokens_saved,
+                'ms_saved': ms_saved
             }
         )
 
+    def _tally(self, results: List[Optional[VerifierResult]]):
+        """Pass count, fail count and the names of vetoing verifiers (None entries ignored)."""
+        pass_count = fail_count = 0
+        vetoed_by = []
+        for verifier, result in zip(self.verifiers, results):
+            if result is None:
+                continue
+            if result.outcome == VerificationOutcome.PASS:
+                pass_count += 1
+            elif result.outcome == VerificationOutcome.FAIL:
+                fail_count += 1
+                if verifier.veto:
+                    vetoed_by.append(verifier.__class__.__name__)
+        return pass_count, fail_count, vetoed_by
+
+    def _consensus(self, pass_count: int, fail_count: int, vetoed: bool) -> VerificationOutcome:
+        """Consensus outcome for the given tally."""
+        if vetoed:
+            return VerificationOutcome.FAIL
+        active_count = pass_count + fail_count
+        pass_ratio = pass_count / active_count if active_count > 0 else 0.0
+        if pass_ratio >= self.threshold:
+            return VerificationOutcome.PASS
+        if pass_ratio <= (1 - self.threshold):
+            return VerificationOutcome.FAIL
+        return VerificationOutcome.INCONCLUSIVE
+
+    def _decided(self, results: List[Optional[VerifierResult]]) -> Optional[VerificationOutcome]:
+        """
+        The consensus outcome if every way the pending (None) verifiers
+        could finish (pass, fail or abstain; a vetoing verifier failing)
+        leads to it, else None.
+        """
+        pass_count, fail_count, vetoed_by = self._tally(results)
+        if vetoed_by:
+            return VerificationOutcome.FAIL
+
+        pending = [self.verifiers[i] for i, r in enumerate(results) if r is None]
+        n_veto = sum(1 for v in pending if v.veto)
+        n_plain = len(pending) - n_veto
+
+        outcomes = set()
+        for passes in range(len(pending) + 1):
+            for fails in range(len(pending) - passes + 1):
+                if fails > 0 and n_veto > 0:
+                    outcomes.add(VerificationOutcome.FAIL)
+                # Failures without a veto need enough non-veto verifiers
+                if fails <= n_plain:
+                    outcomes.add(self._consensus(pass_count + passes, fail_count + fails, False))
+                if len(outcomes) > 1:
+                    return None
+        return outcomes.pop()
+
     def add_verifier(self, verifier: BaseVerifier) -> None:
         """Add a custom verifier to the lattice."""
         self.verifiers.append(verifier)
@@ -558,7 +788,11 @@ class VerificationLattice:
             'pass_rate': self._passes / total if total > 0 else 0.0,
             'verifier_count': len(self.verifiers),
             'threshold': self.threshold,
-            'verifiers': [v.__class__.__name__ for v in self.verifiers]
+            'verifiers': [v.__class__.__name__ for v in self.verifiers],
+            'staged': self.staged,
+            'short_circuits': self._short_circuits,
+            'tokens_saved': self._tokens_saved,
+            'ms_saved': round(self._ms_saved, 1)
         }
 
     def reset(self) -> None:
@@ -566,4 +800,7 @@ class VerificationLattice:
         self._verifications = 0
         self._passes = 0
         self._failures = 0
+        self._short_circuits = 0
+        self._tokens_saved = 0
+        self._ms_saved = 0.0
         logger.info("VerificationLattice reset")
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+BYRD Belief Index Accuracy Report
+
+Compares the MinHash LSH belief index (core.minhash_index) with the exact
+Jaccard scan that find_similar_beliefs_for_experience(exact=True) runs,
+using the same link-on-acquisition settings (threshold 0.05, top 2).
+
+Beliefs and experiences come from a JSON dump of node contents when one
+is given, otherwise from a synthetic topic-structured corpus.
+
+Usage:
+    python scripts/benchmark_belief_index.py                         # Synthetic, 1k/10k/50k
+    python scripts/benchmark_belief_index.py --sizes 5000 --bands 128 # Override derived banding
+    python scripts/benchmark_belief_index.py --dump beliefs.json     # ["text", ...] or [{"content": ...}]
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.minhash_index import MinHashLSHIndex, bands_for_recall, text_shingles, jaccard
+
+
+def synthetic_corpus(n: int, rng: random.Random) -> list:
+    """Sentences drawn from overlapping topic vocabularies."""
+    vocab = [f"term{i}" for i in range(5000)]
+    topics = [rng.sample(vocab, 40) for _ in range(max(10, n // 50))]
+    common = ["the", "and", "that", "with", "about", "system", "memory"]
+    corpus = []
+    for _ in range(n):
+        topic = rng.choice(topics)
+        words = rng.sample(topic, rng.randint(5, 12)) + rng.sample(common, 2)
+        rng.shuffle(words)
+        corpus.append(" ".join(words))
+    return corpus
+
+
+def load_dump(path: str) -> list:
+    with open(path) as f:
+        data = json.load(f)
+    return [d if isinstance(d, str) else d.get("content", "") for d in data]
+
+
+def exact_top(query: str, beliefs: list, threshold: float, k: int) -> list:
+    shingles = text_shingles(query)
+    scored = [
+        (i, jaccard(shingles, text_shingles(b)))
+        for i, b in enumerate(beliefs)
+    ]
+    scored = [s for s in scored if s[1] >= threshold]
+    scored.sort(key=lambda x: x[1], reverse=True)
+    return scored[:k]
+
+
+def run(beliefs: list, experiences: list, args) -> None:
+    bands = args.bands or bands_for_recall(args.num_perm, args.design_similarity, args.target_recall,
+                                           min_rows=args.min_rows)
+    index = MinHashLSHIndex(num_perm=args.num_perm, bands=bands)
+    start = time.perf_counter()
+    for i, text in enumerate(beliefs):
+        index.add(str(i), text)
+    build_s = time.perf_counter() - start
+
+    exact_ms, lsh_ms = [], []
+    hits, expected, top1_hits, top1_expected = 0, 0, 0, 0
+    for exp in experiences:
+        t0 = time.perf_counter()
+        exact = exact_top(exp, beliefs, args.threshold, args.k)
+        exact_ms.append((time.perf_counter() - t0) * 1000)
+
+        t0 = time.perf_counter()
+        approx = index.query(exp, threshold=args.threshold, limit=args.k)
+        lsh_ms.append((time.perf_counter() - t0) * 1000)
+
+        exact_ids = {str(i) for i, _ in exact}
+        approx_ids = {doc_id for doc_id, _, _ in approx}
+        hits += len(exact_ids & approx_ids)
+        expected += len(exact_ids)
+        if exact:
+            top1_expected += 1
+            top1_hits += bool(approx) and approx[0][1] == exact[0][1]
+
+    stats = index.get_stats()
+    print(f"\n=== {len(beliefs):,} beliefs, {len(experiences)} experiences ===")
+    print(f"  bands={index.bands} rows={index.rows}  build {build_s:.2f}s")
+    print(f"  P(candidate) at J=0.05/0.1/0.2/0.3: " + " / ".join(
+        f"{index.candidate_probability(j):.2f}" for j in (0.05, 0.1, 0.2, 0.3)
+    ))
+    print(f"  exact scan   mean {sum(exact_ms) / len(exact_ms):8.2f} ms")
+    print(f"  lsh query    mean {sum(lsh_ms) / len(lsh_ms):8.2f} ms")
+    print(f"  candidates/query: {stats['avg_candidates_per_query']} "
+          f"({stats['avg_candidates_per_query'] / max(len(beliefs), 1):.1%} of beliefs)")
+    print(f"  recall@{args.k}: {hits / max(expected, 1):.3f}   "
+          f"top-1 score match: {top1_hits / max(top1_expected, 1):.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Belief LSH index accuracy report")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--dump", help="JSON list of belief texts to use instead of synthetic data")
+    parser.add_argument("--experiences", type=int, default=100)
+    parser.add_argument("--num-perm", type=int, default=128)
+    parser.add_argument("--bands", type=int, default=None,
+                        help="Default: derived from --target-recall at --design-similarity, as Memory does")
+    parser.add_argument("--design-similarity", type=float, default=0.2)
+    parser.add_argument("--target-recall", type=float, default=0.9)
+    parser.add_argument("--min-rows", type=int, default=2)
+    parser.add_argument("--threshold", type=float, default=0.05)
+    parser.add_argument("--k", type=int, default=2)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    if args.dump:
+        texts = load_dump(args.dump)
+        rng.shuffle(texts)
+        split = max(1, len(texts) - args.experiences)
+        run(texts[:split], texts[split:], args)
+        return
+
+    for size in args.sizes:
+        corpus = synthetic_corpus(size + args.experiences, rng)
+        run(corpus[:size], corpus[size:], args)
+
+
+if __name__ == "__main__":
+    main()
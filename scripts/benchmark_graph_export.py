@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+BYRD Graph Export Benchmark
+
+Compares the single-body /api/graph path (all nodes as dicts, validated
+through Pydantic GraphNode/GraphRelationship, one JSON body) against the
+paged export (/api/graph/export, /api/graph/stream) in json, columnar and
+msgpack encodings, on a synthetic graph.
+
+Reports per mode:
+- time to first node: until the first bytes containing nodes are ready
+- total time: until the whole graph is encoded
+- bytes: total encoded size
+- peak RSS: max resident set of a fresh process running only that mode
+
+Neo4j is not involved: rows are synthesized page by page, the way the
+driver yields them, so this isolates server-side materialization and
+encoding cost.
+
+Usage:
+    python scripts/benchmark_graph_export.py                   # 10k and 100k nodes
+    python scripts/benchmark_graph_export.py --sizes 50000 --page-size 1000
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.graph_export import DEFAULT_FIELDS, HAS_MSGPACK, encode_cursor, encode_page
+
+MODES = ["full", "paged-json", "paged-columnar", "paged-msgpack"]
+
+
+# Same shape as the response models in server.py
+class GraphNode(BaseModel):
+    id: str
+    type: str
+    content: str
+    subtype: Optional[str] = None
+    confidence: Optional[float] = None
+    intensity: Optional[float] = None
+    status: Optional[str] = None
+    created_at: Optional[str] = None
+    access_count: int = 0
+    last_accessed: Optional[str] = None
+
+
+class GraphRelationship(BaseModel):
+    id: str
+    type: str
+    source_id: str
+    target_id: str
+
+
+class GraphResponse(BaseModel):
+    nodes: List[GraphNode]
+    relationships: List[GraphRelationship]
+
+
+TYPES = ["experience", "belief", "desire", "reflection", "capability"]
+
+
+def make_node(i: int) -> dict:
+    return {
+        "id": f"node_{i:08d}",
+        "type": TYPES[i % len(TYPES)],
+        "content": f"Synthetic memory {i} " + "lorem ipsum " * 8,
+        "subtype": "observation" if i % 3 else None,
+        "confidence": (i % 100) / 100,
+        "intensity": None,
+        "status": "active",
+        "created_at": "2025-01-01T00:00:00",
+        "access_count": i % 7,
+        "last_accessed": None,
+        "quantum_seed": None,
+        "absorbed": False,
+    }
+
+
+def make_rels(i: int, total: int) -> List[dict]:
+    """Two outgoing relationships per node."""
+    return [
+        {"id": str(i * 2 + k), "type": "RELATES_TO", "source_id": f"node_{i:08d}",
+         "target_id": f"node_{(i * 7 + k + 1) % total:08d}"}
+        for k in range(2)
+    ]
+
+
+def run_full(total: int, page_size: int) -> dict:
+    start = time.perf_counter()
+    nodes = [make_node(i) for i in range(total)]
+    rels = [r for i in range(total) for r in make_rels(i, total)]
+    response = GraphResponse(
+        nodes=[GraphNode(**n) for n in nodes],
+        relationships=[GraphRelationship(**r) for r in rels],
+    )
+    body = response.model_dump_json().encode("utf-8")
+    elapsed = time.perf_counter() - start
+    return {"first_node_s": elapsed, "total_s": elapsed, "bytes": len(body)}
+
+
+def run_paged(total: int, page_size: int, fmt: str) -> dict:
+    start = time.perf_counter()
+    first = None
+    size = 0
+    fields = list(DEFAULT_FIELDS)
+    for offset in range(0, total, page_size):
+        ids = range(offset, min(offset + page_size, total))
+        rows = [make_node(i) for i in ids]
+        page = {
+            "nodes": [{f: row[f] for f in fields} for row in rows],
+            "relationships": [r for i in ids for r in make_rels(i, total)],
+            "fields": fields,
+            "next_cursor": encode_cursor(("Belief", rows[-1]["id"])) if len(rows) == page_size else None,
+        }
+        body, _ = encode_page(page, fmt)
+        size += len(body)
+        if first is None:
+            first = time.perf_counter() - start
+    return {"first_node_s": first, "total_s": time.perf_counter() - start, "bytes": size}
+
+
+def child(mode: str, total: int, page_size: int) -> None:
+    if mode == "full":
+        result = run_full(total, page_size)
+    else:
+        result = run_paged(total, page_size, mode.split("-", 1)[1])
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    result["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 1e6
+    print(json.dumps(result))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark graph export paths")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.sizes[0], args.page_size)
+        return
+
+    modes = [m for m in MODES if m != "paged-msgpack" or HAS_MSGPACK]
+    if not HAS_MSGPACK:
+        print("(msgpack not installed: skipping paged-msgpack)")
+
+    for total in args.sizes:
+        print(f"\n=== {total:,} nodes, {total * 2:,} relationships, page size {args.page_size} ===")
+        print(f"{'mode':<16}{'first node':>12}{'total':>10}{'size':>10}{'peak RSS':>11}")
+        for mode in modes:
+            out = subprocess.run(
+                [sys.executable, __file__, "--child", mode, "--sizes", str(total),
+                 "--page-size", str(args.page_size)],
+                capture_output=True, text=True, check=True
+            )
+            r = json.loads(out.stdout.strip().splitlines()[-1])
+            print(f"{mode:<16}{r['first_node_s'] * 1000:>10.1f}ms{r['total_s']:>9.2f}s"
+                  f"{r['bytes'] / 1e6:>8.1f}MB{r['peak_rss_mb']:>9.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+BYRD Neural Architecture Search Benchmark
+
+Measures NAS throughput (evaluations/second) with a CPU-bound custom
+metric standing in for a real training/inference probe:
+
+- sequential:  search(), one architecture at a time
+- islands:     search_parallel(), each generation scored as one batch
+               in a process pool (--workers processes)
+
+Both modes report how many evaluations were structural duplicates served
+from the evaluator's cache. Process-pool speedup is bounded by the number
+of CPUs on the machine.
+
+Usage:
+    python scripts/benchmark_nas.py
+    python scripts/benchmark_nas.py --evaluations 200 --workers 4 --work 200000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rsi.plasticity.nas import NeuralArchitectureSearch, SearchBudget
+
+WORK = 100_000
+
+
+def probe_metric(architecture) -> float:
+    """CPU-bound stand-in for a real evaluation (module-level, so picklable)."""
+    acc = 0
+    for i in range(WORK):
+        acc = (acc * 31 + i + architecture.node_count) % 1_000_003
+    return min(1.0, architecture.connection_count / 20)
+
+
+async def run_mode(mode: str, evaluations: int, workers: int, islands: int) -> dict:
+    config = {'population_size': 16}
+    if mode == "islands":
+        config['parallel'] = {'enabled': True, 'islands': islands, 'workers': workers}
+    nas = NeuralArchitectureSearch(config=config)
+    nas.evaluator.register_metric("probe", probe_metric)
+
+    budget = SearchBudget(max_evaluations=evaluations, max_time_seconds=600.0, early_stopping_patience=1000)
+    result = await nas.search("benchmark", budget=budget)
+    return result.to_dict()
+
+
+async def main() -> None:
+    global WORK
+    parser = argparse.ArgumentParser(description="Benchmark NAS evaluation throughput")
+    parser.add_argument("--evaluations", type=int, default=96)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--islands", type=int, default=4)
+    parser.add_argument("--work", type=int, default=WORK, help="probe loop iterations per evaluation")
+    args = parser.parse_args()
+    WORK = args.work
+
+    print(f"=== {args.evaluations} evaluations, {args.workers} workers, {os.cpu_count()} CPUs ===")
+    print(f"{'mode':<12}{'total':>9}{'evals/s':>10}{'unique':>8}{'cached':>8}{'best':>8}")
+    baseline = None
+    for mode in ["sequential", "islands"]:
+        r = await run_mode(mode, args.evaluations, args.workers, args.islands)
+        rate = r['evaluations_per_second']
+        baseline = baseline or rate
+        print(f"{mode:<12}{r['total_time_seconds']:>8.2f}s{rate:>10.1f}"
+              f"{r['unique_evaluations']:>8}{r['cache_hits']:>8}"
+              f"{r['best_architecture']['score']['overall_score']:>8.3f}   x{rate / baseline:.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+BYRD Self-Hosted Inference Benchmark
+
+Starts a local inference server through SelfHostedManager (llama.cpp's
+llama-server over a GGUF file by default) and measures throughput of
+bulk prompts at increasing client concurrency:
+
+- requests/second and generated tokens/second
+- p50/p95 request latency
+- startup (to healthy) and warm-up time
+
+Throughput stops scaling once concurrency exceeds the server's parallel
+slots (--slots) or the CPU is saturated.
+
+Usage:
+    python scripts/benchmark_self_hosted.py --model models/qwen2.5-0.5b-instruct-q4_k_m.gguf
+    python scripts/benchmark_self_hosted.py --model m.gguf --slots 4 --concurrency 1,2,4,8
+    python scripts/benchmark_self_hosted.py --model m.gguf \\
+        --server-command "llama-server -m {model_path} --port {port} -t {threads} --parallel {slots}"
+"""
+
+import argparse
+import asyncio
+import shlex
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rsi.substrate import SelfHostedManager
+
+PROMPTS = [
+    "Classify the sentiment of: 'The build finally passes.' Answer in one word.",
+    "Summarize in one sentence: caching parsed configs avoids re-reading YAML on every request.",
+    "List three risks of running inference on a shared CPU.",
+    "Rewrite as a commit subject: fixed the bug where retries never backed off.",
+]
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def run_level(manager, server_id, requests, concurrency, max_tokens):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    tokens = 0
+
+    async def one(i):
+        nonlocal tokens
+        async with semaphore:
+            result = await manager.chat_completion(
+                server_id, PROMPTS[i % len(PROMPTS)], max_tokens=max_tokens, temperature=0.0
+            )
+            latencies.append(result['latency_ms'])
+            tokens += result['output_tokens']
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    elapsed = time.perf_counter() - start
+    return {
+        'rps': requests / elapsed,
+        'tokens_per_second': tokens / elapsed,
+        'p50_ms': percentile(latencies, 0.5),
+        'p95_ms': percentile(latencies, 0.95),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark self-hosted inference throughput")
+    parser.add_argument("--model", required=True, help="Path to a local GGUF model")
+    parser.add_argument("--server-command", help="Launch command template (default: llama-server)")
+    parser.add_argument("--requests", type=int, default=32)
+    parser.add_argument("--concurrency", default="1,2,4")
+    parser.add_argument("--max-tokens", type=int, default=64)
+    parser.add_argument("--slots", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=None)
+    args = parser.parse_args()
+
+    config = {'parallel_slots': args.slots, 'health_interval': 0, 'startup_timeout': 300.0}
+    if args.server_command:
+        config['server_command'] = shlex.split(args.server_command)
+    if args.threads:
+        config['threads'] = args.threads
+
+    manager = SelfHostedManager(config)
+    if await manager.download_model("bench", args.model) is None:
+        sys.exit(f"Model not found: {args.model}")
+
+    start = time.perf_counter()
+    server = await manager.start_inference_server("bench", port=0)
+    if server is None:
+        sys.exit("Server failed to start (is llama-server on PATH? see --server-command)")
+    startup = time.perf_counter() - start
+
+    try:
+        print(f"=== {args.model} | {args.slots} slots | startup {startup:.2f}s "
+              f"(warm-up {server.warmup_ms or 0:.0f}ms) ===")
+        print(f"{'concurrency':<13}{'req/s':>8}{'tok/s':>9}{'p50 ms':>9}{'p95 ms':>9}")
+        for level in [int(c) for c in args.concurrency.split(",")]:
+            r = await run_level(manager, server.id, args.requests, level, args.max_tokens)
+            print(f"{level:<13}{r['rps']:>8.2f}{r['tokens_per_second']:>9.1f}"
+                  f"{r['p50_ms']:>9.0f}{r['p95_ms']:>9.0f}")
+    finally:
+        await manager.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
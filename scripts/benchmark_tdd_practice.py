@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+BYRD TDD Practice Benchmark
+
+Measures practice throughput (attempts/second) of TDDPractice.attempt_solution
+with a scripted LLM, so only test execution is timed:
+
+- subprocess:  a fresh `python -m pytest` per attempt, attempts in sequence
+               (the behaviour before the sandbox pool)
+- pool:        warm sandbox workers, attempts in sequence
+- pool-concurrent: warm sandbox workers, attempts gathered concurrently
+
+Pool numbers exclude the one-off worker warm-up (reported separately).
+
+Usage:
+    python scripts/benchmark_tdd_practice.py
+    python scripts/benchmark_tdd_practice.py --attempts 40 --workers 4
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rsi.learning.tdd_practice import TDDPractice, PracticeProblem
+
+SOLUTION = '''
+def fizzbuzz(n):
+    out = []
+    for i in range(1, n + 1):
+        if i % 15 == 0:
+            out.append("FizzBuzz")
+        elif i % 3 == 0:
+            out.append("Fizz")
+        elif i % 5 == 0:
+            out.append("Buzz")
+        else:
+            out.append(str(i))
+    return out
+'''
+
+TESTS = '''
+import pytest
+
+def test_empty():
+    assert fizzbuzz(0) == []
+
+def test_first_five():
+    assert fizzbuzz(5) == ["1", "2", "Fizz", "4", "Buzz"]
+
+def test_fifteen():
+    assert fizzbuzz(15)[-1] == "FizzBuzz"
+
+@pytest.mark.parametrize("n", [3, 6, 9])
+def test_fizz(n):
+    assert fizzbuzz(n)[n - 1] == "Fizz"
+'''
+
+
+class ScriptedLLM:
+    async def query(self, prompt, **kwargs):
+        return SOLUTION
+
+
+def problem() -> PracticeProblem:
+    return PracticeProblem(spec="fizzbuzz", oracle=TESTS, domain="code", difficulty="beginner")
+
+
+async def run_mode(mode: str, attempts: int, workers: int) -> dict:
+    pool_config = {"enabled": mode != "subprocess", "size": workers}
+    practice = TDDPractice(ScriptedLLM(), config={"tdd_practice": {"sandbox_pool": pool_config}})
+    warmup = 0.0
+    try:
+        if practice._sandbox is not None:
+            start = time.perf_counter()
+            practice._sandbox.start()
+            await asyncio.gather(*[practice._run_tests(TESTS, SOLUTION) for _ in range(workers)])
+            warmup = time.perf_counter() - start
+
+        start = time.perf_counter()
+        if mode == "pool-concurrent":
+            results = await asyncio.gather(*[practice.attempt_solution(problem()) for _ in range(attempts)])
+        else:
+            results = [await practice.attempt_solution(problem()) for _ in range(attempts)]
+        elapsed = time.perf_counter() - start
+    finally:
+        practice.close()
+
+    assert all(r.success for r in results), "benchmark solution should pass"
+    return {"elapsed": elapsed, "rate": attempts / elapsed, "warmup": warmup}
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark TDD practice throughput")
+    parser.add_argument("--attempts", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    print(f"=== {args.attempts} practice attempts, {args.workers} sandbox workers ===")
+    print(f"{'mode':<18}{'total':>9}{'attempts/s':>12}{'per attempt':>13}{'warm-up':>10}")
+    baseline = None
+    for mode in ["subprocess", "pool", "pool-concurrent"]:
+        r = await run_mode(mode, args.attempts, args.workers)
+        baseline = baseline or r["rate"]
+        print(f"{mode:<18}{r['elapsed']:>8.2f}s{r['rate']:>12.1f}"
+              f"{r['elapsed'] / args.attempts * 1000:>11.0f}ms{r['warmup']:>9.2f}s"
+              f"   x{r['rate'] / baseline:.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
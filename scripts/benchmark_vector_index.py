@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+BYRD Vector Index Benchmark
+
+Measures recall@k and query latency of core.vector_index.VectorIndex on
+synthetic embeddings, comparing exact (flat) search, IVF search and the
+old per-node Python cosine loop that find_similar_nodes used to run.
+
+Usage:
+    python scripts/benchmark_vector_index.py                       # 10k, 100k, 1M
+    python scripts/benchmark_vector_index.py --sizes 10000 100000  # Custom sizes
+    python scripts/benchmark_vector_index.py --dim 768 --queries 200
+"""
+
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.vector_index import VectorIndex
+
+
+def clustered_vectors(n: int, dim: int, clusters: int, rng) -> np.ndarray:
+    """Embeddings drawn around topic centers, closer to real text than pure noise."""
+    centers = rng.normal(size=(clusters, dim)).astype(np.float32)
+    labels = rng.integers(0, clusters, size=n)
+    noise = rng.normal(scale=0.6, size=(n, dim)).astype(np.float32)
+    return centers[labels] + noise
+
+
+def python_loop_search(vectors: np.ndarray, query: np.ndarray, k: int) -> list:
+    """The pre-index approach: cosine per node in a Python loop."""
+    q = query.tolist()
+    qn = math.sqrt(sum(x * x for x in q))
+    scored = []
+    for i, row in enumerate(vectors.tolist()):
+        dot = sum(a * b for a, b in zip(q, row))
+        rn = math.sqrt(sum(x * x for x in row))
+        scored.append((dot / (qn * rn), i))
+    scored.sort(reverse=True)
+    return scored[:k]
+
+
+def percentile(samples: list, pct: float) -> float:
+    return float(np.percentile(samples, pct)) if samples else 0.0
+
+
+def time_queries(index: VectorIndex, queries: np.ndarray, k: int, exact: bool):
+    latencies = []
+    results = []
+    for q in queries:
+        start = time.perf_counter()
+        hits = index.search(q, k=k, exact=exact, min_similarity=-1.0)
+        latencies.append((time.perf_counter() - start) * 1000)
+        results.append([h.node_id for h in hits])
+    return latencies, results
+
+
+def run(size: int, dim: int, n_queries: int, k: int, nprobe: int, loop_limit: int) -> None:
+    rng = np.random.default_rng(42)
+    vectors = clustered_vectors(size, dim, clusters=max(8, size // 1000), rng=rng)
+    queries = vectors[rng.choice(size, n_queries, replace=False)] + \
+        rng.normal(scale=0.1, size=(n_queries, dim)).astype(np.float32)
+
+    index = VectorIndex(ivf_threshold=min(size, 50000), nprobe=nprobe)
+    start = time.perf_counter()
+    for i in range(size):
+        index.upsert("Experience", f"e{i}", vectors[i])
+    build_s = time.perf_counter() - start
+
+    exact_lat, exact_res = time_queries(index, queries, k, exact=True)
+    ivf_lat, ivf_res = time_queries(index, queries, k, exact=False)
+
+    recall = np.mean([
+        len(set(a) & set(b)) / max(len(a), 1)
+        for a, b in zip(exact_res, ivf_res)
+    ])
+
+    batch_start = time.perf_counter()
+    index.search_batch(list(queries), k=k, exact=True, min_similarity=-1.0)
+    batch_ms = (time.perf_counter() - batch_start) * 1000 / n_queries
+
+    stats = index.get_stats()["labels"]["Experience"]
+    print(f"\n=== {size:,} vectors x {dim} dims ===")
+    print(f"  build: {build_s:.1f}s  ivf_lists: {stats['ivf_lists']}  nprobe: {nprobe}")
+    print(f"  exact  p50 {percentile(exact_lat, 50):8.2f} ms   p95 {percentile(exact_lat, 95):8.2f} ms")
+    print(f"  exact batched        {batch_ms:8.2f} ms/query")
+    print(f"  ivf    p50 {percentile(ivf_lat, 50):8.2f} ms   p95 {percentile(ivf_lat, 95):8.2f} ms")
+    print(f"  ivf recall@{k}: {recall:.3f}")
+
+    if size <= loop_limit:
+        loop_lat = []
+        for q in queries[:5]:
+            start = time.perf_counter()
+            python_loop_search(vectors, q, k)
+            loop_lat.append((time.perf_counter() - start) * 1000)
+        print(f"  python loop p50 {percentile(loop_lat, 50):8.2f} ms (old find_similar_nodes path)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark VectorIndex recall and latency")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--dim", type=int, default=384, help="Embedding dimension (MiniLM: 384)")
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--nprobe", type=int, default=8)
+    parser.add_argument("--loop-limit", type=int, default=10_000,
+                        help="Largest size to time the Python-loop baseline on")
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        run(size, args.dim, args.queries, args.k, args.nprobe, args.loop_limit)
+
+
+if __name__ == "__main__":
+    main()
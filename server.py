@@ -18,15 +18,17 @@ import asyncio
 import json
 import subprocess
 import sys
+import time
 from contextlib import asynccontextmanager
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import httpx
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, File, Form, UploadFile, Depends, Header
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, Response
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from pydantic import BaseModel
 import yaml
 
@@ -208,8 +210,12 @@ def restart_server():
     os.execv(sys.executable, [sys.executable, str(BYRD_DIR / "server.py")])
 
 
-from core.event_bus import EventBus, Event, EventType, event_bus
-from core.llm_client import create_llm_client, LLMError
+from core.event_bus import EventBus, Event, EventType, event_bus, SubscriberQueue, DROP_OLDEST, coalesce_key
+from core.llm_client import create_llm_client, LLMError, get_coalescing_stats
+from core.http_pool import get_http_pool, close_http_pool
+from core.graph_export import parse_fields, decode_cursor, encode_page, etag_for, etag_matches
+from core.topology_engine import TopologyEngine, get_topology_engine, configure_topology_engine, consolidate_by_day
+from core.rate_limiter import get_rate_limiter
 
 
 # =============================================================================
@@ -217,36 +223,122 @@ from core.llm_client import create_llm_client, LLMError
 # =============================================================================
 
 class ConnectionManager:
-    """Manages WebSocket connections for event streaming."""
+    """
+    Manages WebSocket connections for event streaming.
 
-    def __init__(self):
-        self.active_connections: Set[WebSocket] = set()
+    Each connection has its own bounded send queue and sender task, so a
+    slow browser tab only falls behind itself instead of stalling the
+    broadcast for everyone. Events are serialized once per broadcast.
+    When a queue overflows the client gets a `stream_gap` message ahead of
+    the next event, so it can resume from its last seq (`?since=`).
+    """
 
-    async def connect(self, websocket: WebSocket):
+    def __init__(self, queue_size: int = 256, overflow_policy: str = DROP_OLDEST, replay_limit: int = 5000):
+        self.active_connections: Set[WebSocket] = set()
+        self.queue_size = queue_size
+        self.overflow_policy = overflow_policy
+        self.replay_limit = replay_limit
+        self._queues: Dict[WebSocket, SubscriberQueue] = {}
+        # Per-connection replay high-water mark: (seq, emitted_at)
+        self._watermarks: Dict[WebSocket, Tuple[Optional[int], float]] = {}
+
+    def configure(self, config: Optional[Dict] = None):
+        """Apply the `event_bus.websocket` config section."""
+        config = config or {}
+        self.queue_size = int(config.get("queue_size", self.queue_size))
+        self.overflow_policy = config.get("overflow_policy", self.overflow_policy)
+        self.replay_limit = int(config.get("replay_limit", self.replay_limit))
+
+    async def connect(self, websocket: WebSocket, backlog: Optional[Callable[[], List[str]]] = None):
+        """
+        Accept a client and start its send queue.
+
+        backlog() is evaluated after accept() with no await before the
+        connection joins broadcasts, so nothing falls into a gap. Events
+        already recorded at that point may still sit in the broadcast
+        subscriber's queue; the connection's high-water mark (last logged
+        seq, or emit time without a durable log) drops those broadcasts
+        so replay and live delivery do not overlap.
+        """
         await websocket.accept()
+        queue = SubscriberQueue(
+            websocket.send_text,
+            name=f"ws:{id(websocket):x}",
+            max_size=self.queue_size,
+            policy=self.overflow_policy,
+            on_error=lambda _queue, _error, ws=websocket: self.disconnect(ws),
+            gap_notice=_stream_gap_message,
+        )
+        if backlog is not None:
+            queue.prime(backlog())
+            log = event_bus.log
+            self._watermarks[websocket] = (log.last_seq if log is not None else None, time.monotonic())
+        self._queues[websocket] = queue
         self.active_connections.add(websocket)
         print(f"WebSocket connected. Total: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket):
+        if websocket not in self.active_connections and websocket not in self._queues:
+            return
         self.active_connections.discard(websocket)
+        self._watermarks.pop(websocket, None)
+        queue = self._queues.pop(websocket, None)
+        if queue is not None:
+            queue.close()
         print(f"WebSocket disconnected. Total: {len(self.active_connections)}")
 
-    async def broadcast(self, message: str):
-        """Send message to all connected clients."""
-        disconnected = set()
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except Exception:
-                disconnected.add(connection)
+    def send(self, websocket: WebSocket, message: str, key=None, emitted_at: Optional[float] = None):
+        """Queue a message for one client (keeps ordering with broadcasts)."""
+        queue = self._queues.get(websocket)
+        if queue is not None:
+            queue.put(message, key=key, emitted_at=emitted_at)
 
-        # Clean up disconnected
-        for conn in disconnected:
-            self.active_connections.discard(conn)
+    async def broadcast(self, message: str, key=None, emitted_at: Optional[float] = None):
+        """Queue a message for all connected clients without waiting on any of them."""
+        for connection in list(self.active_connections):
+            self.send(connection, message, key=key, emitted_at=emitted_at)
 
     async def broadcast_event(self, event: Event):
-        """Broadcast an event to all clients."""
-        await self.broadcast(event.to_json())
+        """Broadcast an event to all clients, skipping ones whose replay already had it."""
+        message = event.to_json()
+        for connection in list(self.active_connections):
+            if self._covered_by_replay(connection, event):
+                continue
+            self.send(connection, message, key=coalesce_key(event), emitted_at=event.emitted_at or None)
+
+    def _covered_by_replay(self, websocket: WebSocket, event: Event) -> bool:
+        watermark = self._watermarks.get(websocket)
+        if watermark is None:
+            return False
+        seq, primed_at = watermark
+        if seq is not None and event.seq is not None:
+            covered = event.seq <= seq
+        else:
+            covered = event.emitted_at is not None and event.emitted_at <= primed_at
+        if not covered:
+            # Broadcasts arrive in emit order: everything after this is live
+            del self._watermarks[websocket]
+        return covered
+
+    def get_stats(self) -> Dict:
+        """Per-connection send queue metrics."""
+        connections = [q.get_stats() for q in self._queues.values()]
+        return {
+            "connections": len(self.active_connections),
+            "queue_size": self.queue_size,
+            "overflow_policy": self.overflow_policy,
+            "total_dropped": sum(c["dropped"] for c in connections),
+            "per_connection": connections,
+        }
+
+
+def _stream_gap_message(dropped: int) -> str:
+    """Sent in place of events a slow client's send queue had to drop."""
+    return json.dumps({
+        "type": "stream_gap",
+        "data": {"dropped": dropped},
+        "timestamp": datetime.now().isoformat(),
+    })
 
 
 manager = ConnectionManager()
@@ -295,6 +387,12 @@ async def lifespan(app: FastAPI):
         config_content = re.sub(r'\$\{([^:}]+):-([^}]*)\}', expand_env_vars, config_content)
         config = yaml.safe_load(config_content)
 
+    event_bus_config = config.get("event_bus", {})
+    event_bus.configure(event_bus_config)
+    manager.configure(event_bus_config.get("websocket", {}))
+    configure_topology_engine(config.get("graph_algorithms", {}).get("topology", {}))
+    event_bus.subscribe(get_topology_engine().on_event)
+
     byrd_instance = BYRD(config)
 
     # Connect to Neo4j immediately to avoid "Driver closed" on first request
@@ -346,6 +444,8 @@ async def lifespan(app: FastAPI):
         byrd_task.cancel()
     if byrd_instance:
         await byrd_instance.memory.close()
+    await close_http_pool()
+    event_bus.close()
 
 
 # =============================================================================
@@ -1063,8 +1163,13 @@ async def run_corrigibility_check():
 
 
 @app.get("/api/history", response_model=HistoryResponse)
-async def get_history(limit: int = 100, event_type: Optional[str] = None):
-    """Get event history from the event bus."""
+async def get_history(
+    limit: int = 100,
+    event_type: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None
+):
+    """Get event history from the event bus (since/until are ISO timestamps)."""
     event_types = None
     if event_type:
         try:
@@ -1072,7 +1177,13 @@ async def get_history(limit: int = 100, event_type: Optional[str] = None):
         except ValueError:
             raise HTTPException(status_code=400, detail=f"Invalid event type: {event_type}")
 
-    events = event_bus.get_history(limit=limit, event_types=event_types)
+    try:
+        since_dt = datetime.fromisoformat(since) if since else None
+        until_dt = datetime.fromisoformat(until) if until else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="since/until must be ISO timestamps")
+
+    events = event_bus.get_history(limit=limit, event_types=event_types, since=since_dt, until=until_dt)
 
     return HistoryResponse(
         events=[e.to_dict() for e in events],
@@ -1954,6 +2065,41 @@ async def get_belief(belief_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/beliefs/dedup")
+async def start_belief_dedup():
+    """Start a background duplicate/contradiction scan over all beliefs."""
+    global byrd_instance
+
+    if not byrd_instance:
+        raise HTTPException(status_code=503, detail="BYRD not initialized")
+
+    try:
+        await byrd_instance.memory.connect()
+        started = byrd_instance.memory.start_belief_dedup_job()
+        return {
+            "started": started,
+            "status": byrd_instance.memory.get_belief_dedup_status()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/beliefs/dedup")
+async def get_belief_dedup():
+    """Progress of the dedup scan plus merge plans and contradiction marks."""
+    global byrd_instance
+
+    if not byrd_instance:
+        raise HTTPException(status_code=503, detail="BYRD not initialized")
+
+    memory = byrd_instance.memory
+    return {
+        "status": memory.get_belief_dedup_status(),
+        "merge_plans": memory.get_belief_merge_plans(),
+        "contradictions": memory.get_belief_contradiction_marks()
+    }
+
+
 @app.get("/api/desires")
 async def get_desires(limit: int = 20):
     """Get unfulfilled desires from memory."""
@@ -2139,6 +2285,13 @@ async def get_llm_debug():
         "env_zai_api_key_set": "ZAI_API_KEY" in os.environ,
         "env_zai_api_key_length": len(os.environ.get("ZAI_API_KEY", "")),
         "timeout": getattr(llm, 'timeout', None),
+        "cache": llm._cache.get_stats() if getattr(llm, '_cache', None) is not None else None,
+        "http_pool": get_http_pool().get_stats(),
+        "rate_limits": get_rate_limiter().get_stats(),
+        "coalescing": {
+            "client": llm.get_coalescing_stats() if hasattr(llm, 'get_coalescing_stats') else None,
+            "rate_limited_wrappers": get_coalescing_stats(),
+        },
         "dream_count": byrd_instance.dream_count if hasattr(byrd_instance, 'dream_count') else "N/A"
     }
 
@@ -2422,8 +2575,12 @@ async def get_service_stats():
                 "rsi_cycles_completed": 0,
                 "rsi_interruptions": 0,
                 "current_task": None,
+                "active_tasks": [],
+                "workers": 0,
                 "queue_size": 0,
-                "is_idle": True
+                "is_idle": True,
+                "queue_latency_ms": {"count": 0, "p50": 0.0, "p95": 0.0, "max": 0.0},
+                "scheduler": {}
             }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -3707,6 +3864,145 @@ async def get_graph(limit: int = 10000):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/graph/export")
+async def export_graph_page(
+    cursor: Optional[str] = None,
+    page_size: int = 500,
+    fields: Optional[str] = None,
+    format: str = "json",
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match")
+):
+    """
+    Paged graph export for progressive loading.
+
+    Args:
+        cursor: next_cursor from the previous page (omit for the first page)
+        page_size: Nodes per page (1-5000)
+        fields: Comma-separated node fields (default: id,type,content,subtype,confidence,created_at)
+        format: json | columnar | msgpack
+
+    The next cursor is also sent as the X-Next-Cursor header. Pages carry
+    an ETag; a matching If-None-Match gets 304 Not Modified.
+    """
+    global byrd_instance
+
+    if not byrd_instance:
+        raise HTTPException(status_code=503, detail="BYRD not initialized")
+
+    try:
+        after = decode_cursor(cursor)
+        projection = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    page_size = max(1, min(page_size, 5000))
+
+    try:
+        await byrd_instance.memory.connect()
+        page = await byrd_instance.memory.get_graph_page(after=after, page_size=page_size, fields=projection)
+        body, media_type = encode_page(page, format)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    etag = etag_for(body)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if page["next_cursor"]:
+        headers["X-Next-Cursor"] = page["next_cursor"]
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+@app.get("/api/graph/stream")
+async def stream_graph(page_size: int = 500, fields: Optional[str] = None, format: str = "json"):
+    """
+    Stream the whole graph as NDJSON, one page per line.
+
+    The first nodes reach the client after one page query instead of after
+    the full graph is built; server memory is bounded by the page size.
+    format: json | columnar
+    """
+    global byrd_instance
+
+    if not byrd_instance:
+        raise HTTPException(status_code=503, detail="BYRD not initialized")
+    if format not in ("json", "columnar"):
+        raise HTTPException(status_code=400, detail="stream format must be json or columnar")
+    try:
+        projection = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    page_size = max(1, min(page_size, 5000))
+
+    await byrd_instance.memory.connect()
+
+    async def pages():
+        after = None
+        while True:
+            page = await byrd_instance.memory.get_graph_page(after=after, page_size=page_size, fields=projection)
+            body, _ = encode_page(page, format)
+            yield body + b"\n"
+            if not page["next_cursor"]:
+                break
+            after = decode_cursor(page["next_cursor"])
+
+    return StreamingResponse(pages(), media_type="application/x-ndjson")
+
+
+def _build_topology_response(
+    engine: TopologyEngine,
+    limit: int,
+    consolidation_level: int,
+    compute_cliques: bool
+) -> TopologyResponse:
+    """Assemble the topology response from the engine's resident graph."""
+    nodes, relationships = engine.subgraph(limit * 2)
+    original_count = len(nodes)
+
+    # Consolidation for large graphs
+    meta_nodes = []
+    consolidation_applied = 0
+    if len(nodes) > limit and consolidation_level > 0:
+        nodes, meta = consolidate_by_day(nodes, limit)
+        meta_nodes = [MetaNode(**m) for m in meta]
+        consolidation_applied = 1 if meta_nodes else 0
+
+    # Topology structures are maintained incrementally; only restrict them
+    # to the nodes actually returned
+    triangles, tetrahedra, higher_cliques, chains = [], [], [], []
+    if compute_cliques and len(nodes) <= 5000:
+        node_ids = set(n["id"] for n in nodes)
+        triangles, tetrahedra = engine.cliques(node_ids)
+        chains = engine.chains(node_ids)
+
+    topology = {
+        "triangles": triangles[:500],  # Limit for performance
+        "tetrahedra": tetrahedra[:200],
+        "higher": [list(h) for h in higher_cliques[:50]],
+        "chains": chains[:100]
+    }
+
+    stats = TopologyStats(
+        original_node_count=original_count,
+        consolidated_node_count=len(nodes),
+        consolidation_level=consolidation_applied,
+        triangle_count=len(triangles),
+        tetrahedron_count=len(tetrahedra),
+        higher_clique_count=len(higher_cliques),
+        chain_count=len(chains),
+        meta_node_count=len(meta_nodes)
+    )
+
+    return TopologyResponse(
+        nodes=[GraphNode(**node) for node in nodes],
+        relationships=[GraphRelationship(**rel) for rel in relationships if rel.get("source_id") or rel.get("source")],
+        topology=topology,
+        meta_nodes=meta_nodes,
+        stats=stats
+    )
+
+
 @app.get("/api/graph/topology", response_model=TopologyResponse)
 async def get_graph_topology(
     limit: int = 2000,
@@ -3738,198 +4034,23 @@ async def get_graph_topology(
 
     try:
         await byrd_instance.memory.connect()
-        graph = await byrd_instance.memory.get_full_graph(limit=limit * 2)  # Get extra for consolidation
-
-        nodes = graph["nodes"]
-        relationships = graph["relationships"]
-        original_count = len(nodes)
-
-        # Build adjacency map for topology computation
-        adjacency = {}
-        directed_adjacency = {}
-        for rel in relationships:
-            src, tgt = rel.get("source_id") or rel.get("source"), rel.get("target_id") or rel.get("target")
-            if src and tgt:
-                # Undirected adjacency for clique detection
-                if src not in adjacency:
-                    adjacency[src] = set()
-                if tgt not in adjacency:
-                    adjacency[tgt] = set()
-                adjacency[src].add(tgt)
-                adjacency[tgt].add(src)
-
-                # Directed adjacency for chain detection
-                if src not in directed_adjacency:
-                    directed_adjacency[src] = []
-                directed_adjacency[src].append({"target": tgt, "type": rel.get("type", "RELATES_TO")})
-
-        # Consolidation for large graphs
-        meta_nodes = []
-        consolidation_applied = 0
-
-        if len(nodes) > limit and consolidation_level > 0:
-            # Simple temporal consolidation: group nodes by day
-            from collections import defaultdict
-            from datetime import datetime
-
-            now = datetime.now()
-            week_ms = 7 * 24 * 60 * 60 * 1000
-
-            recent = []
-            day_buckets = defaultdict(list)
-
-            for node in nodes:
-                timestamp = node.get("created_at") or node.get("timestamp")
-                if timestamp:
-                    try:
-                        if isinstance(timestamp, str):
-                            ts = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                        else:
-                            ts = timestamp
-                        age_days = (now - ts.replace(tzinfo=None)).days
-                        if age_days < 7:
-                            recent.append(node)
-                        else:
-                            day_key = ts.strftime("%Y-%m-%d")
-                            day_buckets[day_key].append(node)
-                    except (ValueError, TypeError, AttributeError):
-                        recent.append(node)
-                else:
-                    recent.append(node)
-
-            # Create meta-nodes for day buckets
-            for day_key, day_nodes in day_buckets.items():
-                if len(day_nodes) >= 3:  # Only consolidate if 3+ nodes
-                    # Find dominant type
-                    type_counts = defaultdict(int)
-                    for n in day_nodes:
-                        type_counts[n.get("type", "unknown")] += 1
-                    dominant_type = max(type_counts, key=type_counts.get)
-
-                    meta_node = MetaNode(
-                        id=f"meta_{day_key}",
-                        label=f"{day_key} ({len(day_nodes)} memories)",
-                        constituent_ids=[n["id"] for n in day_nodes],
-                        constituent_count=len(day_nodes),
-                        timestamp_range={"start": day_key, "end": day_key},
-                        dominant_type=dominant_type
-                    )
-                    meta_nodes.append(meta_node)
-                else:
-                    recent.extend(day_nodes)
-
-            # Limit to requested count
-            if len(recent) > limit:
-                # Sort by importance/recency and take top
-                recent.sort(key=lambda n: (n.get("importance", 0.5), n.get("created_at", "")), reverse=True)
-                recent = recent[:limit]
-
-            nodes = recent
-            consolidation_applied = 1 if meta_nodes else 0
-
-        # Compute topology structures
-        triangles = []
-        tetrahedra = []
-        higher_cliques = []
-        chains = []
-
-        if compute_cliques and len(nodes) <= 5000:
-            node_ids = set(n["id"] for n in nodes)
-
-            # Find triangles using adjacency
-            found_triangles = set()
-            for node_id in node_ids:
-                if node_id not in adjacency:
-                    continue
-                neighbors = adjacency[node_id] & node_ids
-                neighbor_list = list(neighbors)
-                for i, n1 in enumerate(neighbor_list):
-                    for n2 in neighbor_list[i+1:]:
-                        if n2 in adjacency.get(n1, set()):
-                            tri = tuple(sorted([node_id, n1, n2]))
-                            if tri not in found_triangles:
-                                found_triangles.add(tri)
-                                triangles.append(list(tri))
-
-            # Find tetrahedra (extend triangles)
-            found_tetrahedra = set()
-            for tri in triangles:
-                common_neighbors = adjacency.get(tri[0], set()) & adjacency.get(tri[1], set()) & adjacency.get(tri[2], set())
-                common_neighbors = common_neighbors & node_ids
-                for n4 in common_neighbors:
-                    if n4 not in tri:
-                        tetra = tuple(sorted([*tri, n4]))
-                        if tetra not in found_tetrahedra:
-                            found_tetrahedra.add(tetra)
-                            tetrahedra.append(list(tetra))
-
-            # Find chains (directed paths of length 4+)
-            in_degree = defaultdict(int)
-            out_degree = defaultdict(int)
-            for src, targets in directed_adjacency.items():
-                out_degree[src] += len(targets)
-                for t in targets:
-                    in_degree[t["target"]] += 1
-
-            # Start from nodes with low in-degree
-            potential_starts = [n for n in node_ids if in_degree[n] <= 1 and out_degree[n] >= 1]
-
-            visited_chains = set()
-            for start in potential_starts[:100]:  # Limit chain search
-                chain = [start]
-                current = start
-                chain_types = []
-
-                while current in directed_adjacency and len(chain) < 10:
-                    targets = directed_adjacency[current]
-                    # Pick first unvisited target
-                    next_node = None
-                    for t in targets:
-                        if t["target"] in node_ids and t["target"] not in chain:
-                            next_node = t["target"]
-                            chain_types.append(t["type"])
-                            break
-                    if next_node:
-                        chain.append(next_node)
-                        current = next_node
-                    else:
-                        break
-
-                if len(chain) >= 4:
-                    chain_key = tuple(chain)
-                    if chain_key not in visited_chains:
-                        visited_chains.add(chain_key)
-                        chains.append({
-                            "node_ids": chain,
-                            "relationship_types": chain_types,
-                            "length": len(chain)
-                        })
-
-        # Build response
-        topology = {
-            "triangles": triangles[:500],  # Limit for performance
-            "tetrahedra": tetrahedra[:200],
-            "higher": [list(h) for h in higher_cliques[:50]],
-            "chains": chains[:100]
-        }
-
-        stats = TopologyStats(
-            original_node_count=original_count,
-            consolidated_node_count=len(nodes),
-            consolidation_level=consolidation_applied,
-            triangle_count=len(triangles),
-            tetrahedron_count=len(tetrahedra),
-            higher_clique_count=len(higher_cliques),
-            chain_count=len(chains),
-            meta_node_count=len(meta_nodes)
-        )
 
-        return TopologyResponse(
-            nodes=[GraphNode(**node) for node in nodes],
-            relationships=[GraphRelationship(**rel) for rel in relationships if rel.get("source_id") or rel.get("source")],
-            topology=topology,
-            meta_nodes=meta_nodes,
-            stats=stats
+        # Refresh the resident graph only when memory changed; the engine
+        # applies just the delta and memoizes responses per graph version.
+        # It is fetched at the largest limit requested so far, so mixed
+        # limits share one resident graph
+        engine = get_topology_engine()
+        source_version = byrd_instance.memory.graph_version()
+        if engine.needs_sync(source_version, limit * 2):  # Get extra for consolidation
+            fetch_limit = engine.fetch_limit(limit * 2)
+            graph = await byrd_instance.memory.get_full_graph(limit=fetch_limit)
+            if "error" not in graph:
+                engine.sync(graph["nodes"], graph["relationships"],
+                            source_version=source_version, fetch_limit=fetch_limit)
+
+        return engine.memo(
+            ("response", limit, consolidation_level, compute_cliques),
+            lambda: _build_topology_response(engine, limit, consolidation_level, compute_cliques)
         )
 
     except Exception as e:
@@ -5517,6 +5638,11 @@ async def get_system_status():
         "running": byrd_instance is not None,
         "initialized": byrd_instance is not None,
         "uptime": 0,  # Would calculate real uptime
+        "query_cache": byrd_instance.memory.get_query_cache_stats() if byrd_instance else None,
+        "ingestion": byrd_instance.memory.get_ingestion_stats() if byrd_instance else None,
+        "event_bus": event_bus.get_stats(),
+        "websockets": manager.get_stats(),
+        "topology": get_topology_engine().get_stats(),
     }
 
 
@@ -5651,17 +5777,37 @@ async def get_marketplace_listings():
 # =============================================================================
 
 @app.websocket("/ws/events")
-async def websocket_endpoint(websocket: WebSocket):
-    """WebSocket endpoint for real-time event streaming."""
-    await manager.connect(websocket)
+async def websocket_endpoint(websocket: WebSocket, since: Optional[int] = None):
+    """
+    WebSocket endpoint for real-time event streaming.
+
+    Every event carries a `seq`. A reconnecting client passes the last one
+    it saw (`/ws/events?since=N`) and gets everything after it replayed
+    before the live stream. If the log no longer reaches back that far, a
+    `replay_gap` message tells the client to resync from the REST API.
+    A `stream_gap` message means the client fell behind and live events
+    were dropped; reconnecting with `since` replays them.
+    """
+    def backlog() -> List[str]:
+        if since is None:
+            # Fresh client: recent history
+            return [event.to_json() for event in event_bus.get_history(limit=50)]
+        messages, complete = event_bus.replay(since, limit=manager.replay_limit)
+        if not complete:
+            log = event_bus.log
+            gap = {
+                "type": "replay_gap",
+                "data": {
+                    "requested_since": since,
+                    "oldest_available": log.first_seq if log else None,
+                    "latest": log.last_seq if log else None,
+                },
+                "timestamp": datetime.now().isoformat(),
+            }
+            messages.insert(0, json.dumps(gap))
+        return messages
 
-    # Send recent history on connect
-    history = event_bus.get_history(limit=50)
-    for event in history:
-        try:
-            await websocket.send_text(event.to_json())
-        except Exception:
-            break
+    await manager.connect(websocket, backlog=backlog)
 
     try:
         while True:
@@ -5670,7 +5816,7 @@ async def websocket_endpoint(websocket: WebSocket):
 
             # Handle ping/pong or commands
             if data == "ping":
-                await websocket.send_text("pong")
+                manager.send(websocket, "pong")
 
     except WebSocketDisconnect:
         manager.disconnect(websocket)
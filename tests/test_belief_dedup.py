@@ -0,0 +1,187 @@
+"""
+Tests for the BeliefDedupEngine (APOC-free duplicate/contradiction detection).
+"""
+
+import asyncio
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.belief_dedup import (
+    BeliefDedupEngine, strip_negation, is_negated, sorensen_dice
+)
+from core.minhash_index import char_bigrams
+
+
+BELIEFS = [
+    {"id": "a", "content": "Curiosity is the engine of growth", "confidence": 0.9},
+    {"id": "b", "content": "Curiosity is the engine of growth.", "confidence": 0.5},
+    {"id": "c", "content": "Curiosity is not the engine of growth", "confidence": 0.6},
+    {"id": "d", "content": "Bitcoin transactions settle on a public ledger", "confidence": 0.7},
+]
+
+
+class TestHelpers:
+
+    def test_strip_negation(self):
+        assert strip_negation("I cannot fly") == "i can fly"
+        assert strip_negation("It is not true") == "it is true"
+
+    def test_is_negated(self):
+        assert is_negated("This doesn't work")
+        assert not is_negated("Knowledge compounds")
+
+    def test_sorensen_dice_identical(self):
+        bigrams = char_bigrams("memory")
+        assert sorensen_dice(bigrams, bigrams) == pytest.approx(1.0)
+
+
+class TestBeliefDedupEngine:
+
+    @pytest.mark.asyncio
+    async def test_finds_duplicates_and_contradictions(self):
+        engine = BeliefDedupEngine()
+        summary = await engine.scan(BELIEFS)
+
+        assert summary["beliefs"] == 4
+        assert [(p.id1, p.id2) for p in engine.duplicates()] == [("a", "b")]
+        assert {(p.id1, p.id2) for p in engine.contradictions()} == {("a", "c"), ("b", "c")}
+
+    @pytest.mark.asyncio
+    async def test_merge_plans_target_highest_confidence(self):
+        engine = BeliefDedupEngine()
+        await engine.scan(BELIEFS)
+
+        plans = engine.merge_plans()
+
+        assert plans == [{
+            "source_ids": ["b"],
+            "target_id": "a",
+            "reason": plans[0]["reason"],
+        }]
+
+    @pytest.mark.asyncio
+    async def test_contradiction_marks_match_mark_contradiction_signature(self):
+        engine = BeliefDedupEngine()
+        await engine.scan(BELIEFS)
+
+        mark = engine.contradiction_marks()[0]
+
+        assert set(mark) == {"belief1_id", "belief2_id", "detection_method", "confidence"}
+
+    @pytest.mark.asyncio
+    async def test_rescan_only_scores_changed_beliefs(self):
+        engine = BeliefDedupEngine()
+        await engine.scan(BELIEFS)
+
+        unchanged = await engine.scan(BELIEFS)
+        assert unchanged["rescored"] == 0
+
+        edited = [dict(b) for b in BELIEFS]
+        edited[1]["content"] = "Money is a shared fiction"
+        summary = await engine.scan(edited)
+
+        assert summary["rescored"] == 1
+        assert engine.duplicates() == []
+
+    @pytest.mark.asyncio
+    async def test_removed_beliefs_drop_pairs(self):
+        engine = BeliefDedupEngine()
+        await engine.scan(BELIEFS)
+
+        await engine.scan([b for b in BELIEFS if b["id"] != "c"])
+
+        assert engine.contradictions() == []
+
+    @pytest.mark.asyncio
+    async def test_progress_callback(self):
+        engine = BeliefDedupEngine(batch_size=2)
+        updates = []
+
+        async def progress(status):
+            updates.append(status["processed"])
+
+        await engine.scan(BELIEFS, progress_callback=progress)
+
+        assert updates == [2, 4]
+
+
+class _BeliefRows:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def data(self):
+        return self.rows
+
+
+class _BeliefSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def run(self, query, last_id="", batch=2000, **kwargs):
+        self.driver.reads += 1
+        return _BeliefRows([b for b in BELIEFS if b["id"] > last_id][:batch])
+
+
+class _BeliefDriver:
+    def __init__(self):
+        self.reads = 0
+
+    def session(self):
+        return _BeliefSession(self)
+
+
+class TestMemoryBeliefDedup:
+
+    def _memory(self):
+        from core.memory import Memory
+        memory = Memory({})
+        memory.driver = _BeliefDriver()
+        scans = []
+        scan = memory._belief_dedup.scan
+
+        async def counting_scan(beliefs, progress_callback=None):
+            scans.append(memory._belief_dedup.score_floor)
+            await asyncio.sleep(0.01)  # Keep the job in flight
+            return await scan(beliefs, progress_callback=progress_callback)
+
+        memory._belief_dedup.scan = counting_scan
+        return memory, scans
+
+    @pytest.mark.asyncio
+    async def test_callers_share_the_running_job(self):
+        memory, scans = self._memory()
+        assert memory.start_belief_dedup_job()
+        duplicates, conflicts = await asyncio.gather(
+            memory.find_duplicate_beliefs(), memory.find_conflicting_beliefs()
+        )
+        assert len(scans) == 1
+        assert {(d["id1"], d["id2"]) for d in duplicates} == {("a", "b")}
+        assert conflicts
+
+        # Nothing written since: served from the cached pairs, no Neo4j reads
+        reads = memory.driver.reads
+        await memory.find_duplicate_beliefs()
+        assert memory.driver.reads == reads and len(scans) == 1
+
+        memory._query_cache.invalidate("Belief")
+        await memory.find_conflicting_beliefs()
+        assert len(scans) == 2
+
+    @pytest.mark.asyncio
+    async def test_lower_threshold_waits_for_running_job_before_reset(self):
+        memory, scans = self._memory()
+        assert memory.start_belief_dedup_job()
+        await memory.find_duplicate_beliefs(threshold=0.5)
+        # The running job finished at the default floor; the reset came after it
+        assert scans == [0.7, 0.5]
+        assert memory._belief_dedup.score_floor == 0.5
@@ -13,6 +13,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from rsi.consciousness.stream import ConsciousnessStream
+from rsi.consciousness.frame_store import FrameStoreError
 from rsi.consciousness.frame import ConsciousnessFrame
 from rsi.engine import CycleResult, CyclePhase
 
@@ -299,3 +300,127 @@ class TestConsciousnessStream:
 
         assert consciousness.get_stats()['total_frames'] == 0
         assert len(consciousness._frames) == 0
+
+
+@pytest.fixture
+def stored_consciousness(tmp_path):
+    """Consciousness stream backed by the local frame store."""
+    stream = ConsciousnessStream(use_memvid=False, store_path=str(tmp_path), cache_frames=4)
+    yield stream
+    stream.close()
+
+
+class TestFrameStoreBackend:
+    """Tests for the persistent, hash-chained frame store backend."""
+
+    @pytest.mark.asyncio
+    async def test_frames_survive_reopen(self, tmp_path, mock_cycle_result):
+        stream = ConsciousnessStream(use_memvid=False, store_path=str(tmp_path))
+        for i in range(5):
+            await stream.write_frame(mock_cycle_result(cycle_id=f"cycle_{i}"))
+        stream.close()
+
+        reopened = ConsciousnessStream(use_memvid=False, store_path=str(tmp_path))
+        assert reopened.get_stats()['total_frames'] == 5
+        frame = await reopened.write_frame(mock_cycle_result(cycle_id="cycle_5"))
+        assert frame.sequence_number == 6
+        assert frame.parent_hash == (await reopened.time_travel(1)).content_hash
+        assert reopened._store.verify_chain()
+        reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_time_travel_beyond_cache(self, stored_consciousness, mock_cycle_result):
+        for i in range(20):
+            await stored_consciousness.write_frame(mock_cycle_result(cycle_id=f"cycle_{i}"))
+
+        frame = await stored_consciousness.time_travel(15)
+        assert frame.cycle_id == "cycle_4"
+        assert await stored_consciousness.time_travel(20) is None
+        assert stored_consciousness.get_stats()['in_memory_frames'] <= 4
+
+    @pytest.mark.asyncio
+    async def test_indexed_search_and_range(self, stored_consciousness, mock_cycle_result):
+        for i in range(10):
+            desc = 'improve python tests' if i % 2 else f'explore topic {i}'
+            await stored_consciousness.write_frame(
+                mock_cycle_result(cycle_id=f"cycle_{i}", selected_desire={'description': desc})
+            )
+
+        matches = await stored_consciousness.search_semantic("Python TEST", limit=3)
+        assert [m.cycle_id for m in matches] == ["cycle_9", "cycle_7", "cycle_5"]
+        assert await stored_consciousness.search_semantic("nonexistent") == []
+
+        now = datetime.now()
+        frames = await stored_consciousness.get_temporal_range(now - timedelta(minutes=1), now + timedelta(minutes=1))
+        assert len(frames) == 10
+        assert await stored_consciousness.get_temporal_range(now - timedelta(days=2), now - timedelta(days=1)) == []
+
+    @pytest.mark.asyncio
+    async def test_emergence_analysis_on_store(self, stored_consciousness, mock_cycle_result):
+        for i in range(12):
+            await stored_consciousness.write_frame(
+                mock_cycle_result(cycle_id=f"cycle_{i}", selected_desire={'description': f'repeat {i % 3}'})
+            )
+
+        result = await stored_consciousness.detect_circular_patterns(window=12)
+        assert result['pattern_count'] == 3
+        assert await stored_consciousness.compute_entropy_delta(window=10) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_tampered_record_opens_read_only(self, tmp_path, mock_cycle_result):
+        stream = ConsciousnessStream(use_memvid=False, store_path=str(tmp_path))
+        for i in range(4):
+            await stream.write_frame(mock_cycle_result(cycle_id=f"cycle_{i}"))
+        stream.close()
+
+        log = tmp_path / "frames.log"
+        lines = log.read_bytes().splitlines(keepends=True)
+        lines[2] = lines[2].replace(b"cycle_2", b"cycle_X")
+        tampered = b"".join(lines)
+        log.write_bytes(tampered)
+
+        reopened = ConsciousnessStream(use_memvid=False, store_path=str(tmp_path))
+        assert reopened.get_stats()['total_frames'] == 2
+        assert reopened._store.read_only
+        assert reopened._store.corruption['frame'] == 3
+        # Frames after the break are kept on disk and in the quarantine copy
+        assert log.read_bytes() == tampered
+        quarantined = list(tmp_path.glob("frames.log.*.corrupt"))
+        assert len(quarantined) == 1 and quarantined[0].read_bytes() == tampered
+        assert not reopened._store.verify_chain()
+
+        with pytest.raises(FrameStoreError):
+            await reopened.write_frame(mock_cycle_result(cycle_id="cycle_4"))
+        assert reopened.get_stats()['total_frames'] == 2
+        assert log.read_bytes() == tampered
+        reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_torn_final_write_is_truncated(self, tmp_path, mock_cycle_result):
+        stream = ConsciousnessStream(use_memvid=False, store_path=str(tmp_path))
+        for i in range(3):
+            await stream.write_frame(mock_cycle_result(cycle_id=f"cycle_{i}"))
+        stream.close()
+
+        log = tmp_path / "frames.log"
+        intact = log.read_bytes()
+        log.write_bytes(intact + b"deadbeef\t0\t{\"frame_id\": ")
+
+        reopened = ConsciousnessStream(use_memvid=False, store_path=str(tmp_path))
+        assert reopened.get_stats()['total_frames'] == 3
+        assert not reopened._store.read_only
+        assert log.read_bytes() == intact
+        assert not list(tmp_path.glob("*.corrupt"))
+        await reopened.write_frame(mock_cycle_result(cycle_id="cycle_3"))
+        assert reopened._store.verify_chain()
+        reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_verify_chain_rejects_malformed_line(self, tmp_path, mock_cycle_result):
+        stream = ConsciousnessStream(use_memvid=False, store_path=str(tmp_path))
+        for i in range(2):
+            await stream.write_frame(mock_cycle_result(cycle_id=f"cycle_{i}"))
+        with open(tmp_path / "frames.log", "ab") as f:
+            f.write(b"not a record\n")
+        assert stream._store.verify_chain() is False
+        stream.close()
@@ -0,0 +1,119 @@
+"""
+Tests for concurrent ConsistencyCheck runs with early majority stop.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rsi.learning.consistency_check import ConsistencyCheck
+
+
+class ScriptedLLM:
+    """Returns scripted conclusions in call order after a fixed latency."""
+
+    def __init__(self, conclusions, latency=0.05):
+        self.conclusions = list(conclusions)
+        self.latency = latency
+        self.calls = 0
+        self.completed = 0
+        self.concurrent = 0
+        self.max_concurrent = 0
+
+    async def query(self, prompt, **kwargs):
+        conclusion = self.conclusions[self.calls % len(self.conclusions)]
+        self.calls += 1
+        self.concurrent += 1
+        self.max_concurrent = max(self.max_concurrent, self.concurrent)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.concurrent -= 1
+        if conclusion is None:
+            raise RuntimeError("provider error")
+        self.completed += 1
+        return f"Step 1. Step 2.\nCONCLUSION: {conclusion}."
+
+
+DESIRE = {"description": "All men are mortal; Socrates is a man."}
+
+
+@pytest.mark.asyncio
+async def test_runs_concurrently():
+    llm = ScriptedLLM(["A", "B", "A", "B", "C"], latency=0.1)
+    check = ConsistencyCheck(llm, {"n_runs": 5, "early_stop": False})
+
+    start = time.monotonic()
+    result = await check.run(DESIRE)
+    assert time.monotonic() - start < 0.3
+    assert llm.max_concurrent == 5
+    assert not result.is_consistent
+    assert len(result.responses) == 5
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap():
+    llm = ScriptedLLM(["A"], latency=0.02)
+    check = ConsistencyCheck(llm, {"n_runs": 6, "max_concurrency": 2, "early_stop": False})
+    result = await check.run(DESIRE)
+    assert llm.max_concurrent == 2
+    assert result.is_consistent
+    assert result.consistency_score == 1.0
+
+
+@pytest.mark.asyncio
+async def test_early_stop_on_majority():
+    llm = ScriptedLLM(["A"], latency=0.02)
+    check = ConsistencyCheck(llm, {"n_runs": 5, "max_concurrency": 1, "agreement_threshold": 0.6})
+    result = await check.run(DESIRE)
+
+    # 3 of 5 agreeing already clears 0.6 whatever the last two say
+    assert result.is_consistent
+    assert result.stopped_early
+    assert llm.completed == 3
+    assert "A" in result.reasoning
+    assert check.get_stats()["runs_saved"] == 2
+
+
+@pytest.mark.asyncio
+async def test_early_stop_when_unreachable():
+    llm = ScriptedLLM(["A", "B", "C"], latency=0.02)
+    check = ConsistencyCheck(llm, {"n_runs": 5, "max_concurrency": 1, "agreement_threshold": 0.8})
+    result = await check.run(DESIRE)
+
+    # After A, B the best case is still 4/5; after C it is 3/5 < 0.8
+    assert not result.is_consistent
+    assert result.stopped_early
+    assert llm.completed == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_runs_do_not_count():
+    llm = ScriptedLLM([None, "A", "A", "A", "A"], latency=0.01)
+    check = ConsistencyCheck(llm, {"n_runs": 5, "max_concurrency": 1, "early_stop": False})
+    result = await check.run(DESIRE)
+    assert result.is_consistent
+    assert result.responses.count("") == 1
+    assert result.reasoning.endswith("A.")
+
+
+@pytest.mark.asyncio
+async def test_early_stop_matches_full_verdict():
+    scripts = [
+        ["A", "A", "B", "A", "A"],
+        ["A", "B", "A", "B", "A"],
+        [None, None, "A", "A", "B"],
+        ["A", None, "A", None, "A"],
+        ["B", "A", "A", "A", "A"],
+    ]
+    for script in scripts:
+        full = await ConsistencyCheck(ScriptedLLM(script, 0.001),
+                                      {"max_concurrency": 1, "early_stop": False}).run(DESIRE)
+        early = await ConsistencyCheck(ScriptedLLM(script, 0.001),
+                                       {"max_concurrency": 1}).run(DESIRE)
+        assert early.is_consistent == full.is_consistent, script
@@ -0,0 +1,152 @@
+"""
+Tests for RSI cycle profiling: phase timings, token attribution,
+sampling profiles and the histograms exported by MetricsCollector.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rsi.measurement.metrics import MetricsCollector
+from rsi.measurement.profiling import (
+    CycleProfiler, Histogram, SamplingProfiler, record_tokens, usage_tap
+)
+
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_phase_wall_and_cpu_time():
+    profiler = CycleProfiler()
+    profiler.enter("reflect")
+    time.sleep(0.05)
+    profiler.enter("practice")
+    _busy(0.05)
+    timings = profiler.finish()
+
+    assert list(timings) == ["reflect", "practice"]
+    assert timings["reflect"]["wall_seconds"] >= 0.045
+    assert timings["reflect"]["cpu_seconds"] < 0.03  # Sleeping costs no CPU
+    assert timings["practice"]["cpu_seconds"] >= 0.03
+    assert profiler.duration_seconds >= 0.095
+
+
+@pytest.mark.asyncio
+async def test_tokens_follow_the_open_phase_into_tasks():
+    profiler = CycleProfiler()
+    tap = usage_tap()
+
+    async def llm_call(tokens):
+        await asyncio.sleep(0)
+        tap(provider="zai", tokens=tokens, operation="generate", model="glm")
+
+    profiler.enter("verify")
+    await asyncio.gather(llm_call(100), llm_call(50))
+    profiler.enter("practice")
+    await llm_call(7)
+    profiler.finish()
+
+    record_tokens(1000)  # No phase open: ignored
+    assert profiler.phases["verify"].tokens == 150
+    assert profiler.phases["verify"].llm_calls == 2
+    assert profiler.phases["practice"].tokens == 7
+    assert profiler.tokens == 157
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cycles_do_not_mix_tokens():
+    async def cycle(tokens):
+        profiler = CycleProfiler()
+        profiler.enter("reflect")
+        for _ in range(3):
+            await asyncio.sleep(0.001)
+            record_tokens(tokens)
+        profiler.finish()
+        return profiler.tokens
+
+    assert await asyncio.gather(cycle(1), cycle(10)) == [3, 30]
+
+
+def test_cached_responses_are_not_llm_calls():
+    profiler = CycleProfiler()
+    tap = usage_tap()
+    profiler.enter("reflect")
+    tap(provider="zai", tokens=300, operation="generate", model="glm")
+    tap(provider="zai", tokens=300, operation="generate_cached", model="glm")
+    profiler.finish()
+
+    timing = profiler.phases["reflect"]
+    assert (timing.tokens, timing.llm_calls, timing.cache_hits) == (300, 1, 1)
+
+
+def test_usage_tap_chains_previous_callback():
+    seen = []
+    tap = usage_tap(lambda **kw: seen.append(kw["tokens"]))
+    tap(provider="openrouter", tokens=42, operation="generate", model="m")
+    assert seen == [42]
+    assert tap.byrd_usage_tap
+
+
+def test_sampling_profiler_finds_hot_function():
+    def hot_loop():
+        _busy(0.2)
+
+    profiler = SamplingProfiler(interval_seconds=0.002).start()
+    hot_loop()
+    profiler.stop()
+
+    assert profiler.total_samples > 10
+    top = profiler.top(3)
+    assert "hot_loop" in top[0]["stack"]
+    assert top[0]["share"] > 0.5
+
+
+def test_cycle_profiler_samples_selected_phases():
+    profiler = CycleProfiler(sample_phases=["practice"], sample_interval=0.002)
+    profiler.enter("verify")
+    _busy(0.02)
+    profiler.enter("practice")
+    _busy(0.1)
+    profiler.finish()
+    assert list(profiler.profiles) == ["practice"]
+    assert profiler.profiles["practice"][0]["samples"] > 0
+
+
+def test_histogram():
+    h = Histogram((0.1, 1.0, 10.0))
+    for v in (0.05, 0.5, 0.5, 5.0, 50.0):
+        h.observe(v)
+    data = h.to_dict()
+    assert data["buckets"] == {"0.1": 1, "1.0": 3, "10.0": 4, "+Inf": 5}
+    assert data["count"] == 5
+    assert data["p50"] == 1.0
+    assert data["p95"] == 50.0  # +Inf bucket reports the max
+
+
+def test_metrics_collector_exports_phase_histograms():
+    metrics = MetricsCollector(memory=None)
+    metrics.record_phase_timings(
+        {"verify": {"wall_seconds": 0.2, "cpu_seconds": 0.01, "tokens": 300}},
+        duration_seconds=1.5, tokens=300
+    )
+    metrics.record_phase_timings(
+        {"verify": {"wall_seconds": 0.4, "cpu_seconds": 0.02, "tokens": 0},
+         "practice": {"wall_seconds": 3.0, "cpu_seconds": 1.0, "tokens": 900}},
+        duration_seconds=4.0, tokens=900
+    )
+    timing = metrics.get_phase_histograms()
+    assert timing["cycle"]["duration_seconds"]["count"] == 2
+    assert timing["phases"]["verify"]["wall_seconds"]["count"] == 2
+    assert timing["phases"]["verify"]["wall_seconds"]["sum"] == 0.6
+    assert timing["phases"]["practice"]["tokens"]["buckets"]["1000"] == 1
+
+    metrics.reset()
+    assert metrics.get_phase_histograms()["phases"] == {}
@@ -0,0 +1,218 @@
+"""
+Tests for EventBus fan-out: per-subscriber queues, overflow policies,
+history ring and delivery metrics.
+"""
+
+import asyncio
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.event_bus import (
+    COALESCE, DROP_NEWEST, DROP_OLDEST, Event, EventBus, EventType, SubscriberQueue, coalesce_key
+)
+
+
+def _event(n: int, event_type: EventType = EventType.EXPERIENCE_CREATED) -> Event:
+    return Event(type=event_type, data={"n": n}, narration="")
+
+
+@pytest.fixture
+def bus():
+    bus = EventBus()
+    bus.clear_history()
+    yield bus
+    for callback in list(bus._async_subscribers):
+        bus.unsubscribe(callback)
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_does_not_block_others(bus):
+    fast, slow = [], []
+    release = asyncio.Event()
+
+    async def fast_sub(event):
+        fast.append(event.data["n"])
+
+    async def slow_sub(event):
+        await release.wait()
+        slow.append(event.data["n"])
+
+    bus.subscribe_async(fast_sub)
+    bus.subscribe_async(slow_sub)
+
+    for i in range(5):
+        await asyncio.wait_for(bus.emit(_event(i)), timeout=0.5)
+    await bus._queues[fast_sub].join(timeout=1.0)
+
+    assert fast == [0, 1, 2, 3, 4]
+    assert slow == []
+
+    release.set()
+    await bus.drain(timeout=1.0)
+    assert slow == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_subscriber_error_is_isolated(bus):
+    received = []
+
+    async def broken(event):
+        raise RuntimeError("boom")
+
+    async def healthy(event):
+        received.append(event.data["n"])
+
+    bus.subscribe_async(broken)
+    bus.subscribe_async(healthy)
+    await bus.emit(_event(1))
+    await bus.emit(_event(2))
+    await bus.drain(timeout=1.0)
+
+    assert received == [1, 2]
+    assert bus._queues[broken].get_stats()["errors"] == 2
+
+
+@pytest.mark.asyncio
+async def test_history_ring_is_bounded(bus):
+    bus.configure({"max_history": 10})
+    try:
+        for i in range(25):
+            await bus.emit(_event(i))
+        history = bus.get_history(limit=100)
+        assert len(history) == 10
+        assert history[0].data["n"] == 15
+        assert [e.data["n"] for e in bus.get_history(limit=3)] == [22, 23, 24]
+    finally:
+        bus.configure({"max_history": 1000})
+
+
+def test_json_serialized_once():
+    event = _event(1)
+    first = event.to_json()
+    assert event.to_json() is first
+    assert '"n": 1' in first
+
+
+class TestOverflowPolicies:
+    """Queue behaviour when the consumer falls behind."""
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest(self):
+        gate = asyncio.Event()
+        got = []
+
+        async def consumer(item):
+            await gate.wait()
+            got.append(item)
+
+        queue = SubscriberQueue(consumer, max_size=3, policy=DROP_OLDEST)
+        queue.put(0)
+        await asyncio.sleep(0)  # consumer picks up item 0 and blocks
+        for i in range(1, 6):
+            queue.put(i)
+        gate.set()
+        await queue.join(timeout=1.0)
+        queue.close()
+
+        assert got == [0, 3, 4, 5]
+        assert queue.get_stats()["dropped"] == 2
+
+    @pytest.mark.asyncio
+    async def test_drop_newest(self):
+        gate = asyncio.Event()
+        got = []
+
+        async def consumer(item):
+            await gate.wait()
+            got.append(item)
+
+        queue = SubscriberQueue(consumer, max_size=2, policy=DROP_NEWEST)
+        queue.put(0)
+        await asyncio.sleep(0)
+        results = [queue.put(i) for i in range(1, 5)]
+        gate.set()
+        await queue.join(timeout=1.0)
+        queue.close()
+
+        assert results == [True, True, False, False]
+        assert got == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_coalesce_keeps_latest_per_key(self):
+        gate = asyncio.Event()
+        got = []
+
+        async def consumer(item):
+            await gate.wait()
+            got.append(item)
+
+        queue = SubscriberQueue(consumer, max_size=2, policy=COALESCE)
+        queue.put("start", key="x")
+        await asyncio.sleep(0)
+        queue.put("status-1", key="status")
+        queue.put("belief-1", key="belief")
+        queue.put("status-2", key="status")   # full: replaces status-1
+        queue.put("other", key="other")       # full, no match: drops oldest
+        gate.set()
+        await queue.join(timeout=1.0)
+        queue.close()
+
+        stats = queue.get_stats()
+        assert got == ["start", "status-2", "other"]
+        assert stats["coalesced"] == 1
+        assert stats["dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_gap_notice_precedes_next_item(self):
+        gate = asyncio.Event()
+        got = []
+
+        async def consumer(item):
+            await gate.wait()
+            got.append(item)
+
+        queue = SubscriberQueue(consumer, max_size=2, policy=DROP_OLDEST,
+                                gap_notice=lambda dropped: f"gap:{dropped}")
+        queue.put(0)
+        await asyncio.sleep(0)
+        for i in range(1, 6):
+            queue.put(i)
+        gate.set()
+        await queue.join(timeout=1.0)
+        queue.close()
+
+        assert got == [0, "gap:3", 4, 5]
+        assert queue.get_stats()["gap_notices"] == 1
+
+    def test_coalesce_key_is_per_entity(self):
+        first = Event(type=EventType.BELIEF_CREATED, data={"id": "b1"})
+        assert coalesce_key(first) == coalesce_key(Event(type=EventType.BELIEF_CREATED, data={"id": "b1"}))
+        assert coalesce_key(first) != coalesce_key(Event(type=EventType.BELIEF_CREATED, data={"id": "b2"}))
+        # Distinct events of one type without an id are never merged
+        assert coalesce_key(_event(1)) is None
+
+    def test_unknown_policy_rejected(self):
+        with pytest.raises(ValueError):
+            SubscriberQueue(lambda item: None, policy="block")
+
+
+@pytest.mark.asyncio
+async def test_latency_and_depth_metrics(bus):
+    async def sub(event):
+        await asyncio.sleep(0.01)
+
+    bus.subscribe_async(sub, queue_size=4, overflow_policy=DROP_OLDEST)
+    for i in range(6):
+        await bus.emit(_event(i))
+    await bus.drain(timeout=1.0)
+
+    stats = bus.get_stats()
+    sub_stats = stats["async_subscribers"][0]
+    assert sub_stats["max_depth_seen"] == 4
+    assert sub_stats["delivered"] + sub_stats["dropped"] == 6
+    assert sub_stats["latency_ms"]["max"] >= 10
+    assert stats["total_dropped"] == sub_stats["dropped"]
@@ -0,0 +1,184 @@
+"""
+Tests for the durable event log and EventBus replay.
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.event_bus import Event, EventBus, EventType
+from core.event_log import EventLog
+
+
+def _append(log: EventLog, event_type: str, ts: float, n: int) -> int:
+    return log.append(event_type, ts, json.dumps({"type": event_type, "n": n}))
+
+
+def test_sequence_numbers_are_monotonic(tmp_path):
+    log = EventLog(str(tmp_path))
+    seqs = [_append(log, "a", 1000.0 + i, i) for i in range(5)]
+    assert seqs == [1, 2, 3, 4, 5]
+    assert log.last_seq == 5
+    assert [json.loads(p)["n"] for _, p in log.read_from(2)] == [2, 3, 4]
+    log.close()
+
+
+def test_recovers_index_after_restart(tmp_path):
+    log = EventLog(str(tmp_path))
+    for i in range(10):
+        _append(log, "even" if i % 2 == 0 else "odd", 1000.0 + i, i)
+    log.close()
+
+    reopened = EventLog(str(tmp_path))
+    assert reopened.next_seq == 11
+    assert [json.loads(p)["n"] for _, p in reopened.query(event_types=["odd"], limit=10)] == [1, 3, 5, 7, 9]
+    assert _append(reopened, "even", 2000.0, 10) == 11
+    reopened.close()
+
+
+def test_torn_final_record_is_truncated(tmp_path):
+    log = EventLog(str(tmp_path))
+    for i in range(3):
+        _append(log, "a", 1000.0 + i, i)
+    log.close()
+
+    segment = next(tmp_path.glob("*.log"))
+    with open(segment, "ab") as f:
+        f.write(b"4\ta\t1003.0\t{\"partial")
+
+    reopened = EventLog(str(tmp_path))
+    assert reopened.last_seq == 3
+    assert _append(reopened, "a", 1004.0, 3) == 4
+    assert json.loads(reopened.read_from(3)[0][1])["n"] == 3
+    reopened.close()
+
+
+def test_segments_rotate_and_expire(tmp_path):
+    log = EventLog(str(tmp_path), segment_max_bytes=1024, max_segments=3)
+    for i in range(200):
+        _append(log, "a", 1000.0 + i, i)
+
+    assert len(list(tmp_path.glob("*.log"))) == 3
+    assert log.first_seq > 1
+    records = log.read_from(0)
+    assert records[0][0] == log.first_seq
+    assert records[-1][0] == 200
+    assert len(records) == len(log)
+    log.close()
+
+
+def test_query_by_type_and_time_range(tmp_path):
+    log = EventLog(str(tmp_path))
+    for i in range(100):
+        _append(log, ["a", "b", "c"][i % 3], 1000.0 + i, i)
+
+    in_range = log.query(since=1010.0, until=1019.0, limit=100)
+    assert [json.loads(p)["n"] for _, p in in_range] == list(range(10, 20))
+
+    typed = log.query(event_types=["a", "b"], since=1010.0, until=1019.0, limit=3)
+    assert [json.loads(p)["n"] for _, p in typed] == [16, 18, 19]
+
+    assert [json.loads(p)["n"] for _, p in log.query(limit=2)] == [98, 99]
+    log.close()
+
+
+def test_reset_hides_old_records_across_restart(tmp_path):
+    log = EventLog(str(tmp_path))
+    for i in range(3):
+        _append(log, "a", 1000.0 + i, i)
+    log.reset()
+
+    assert log.read_from(0) == [] and log.query(limit=10) == []
+    assert _append(log, "a", 1003.0, 3) == 4  # Numbering continues
+    log.close()
+
+    reopened = EventLog(str(tmp_path))
+    assert reopened.reset_seq == 3
+    assert [seq for seq, _ in reopened.read_from(0)] == [4]
+    reopened.close()
+
+
+def test_reset_watermark_survives_interrupted_cleanup(tmp_path):
+    log = EventLog(str(tmp_path))
+    for i in range(3):
+        _append(log, "a", 1000.0 + i, i)
+    log.close()
+    (tmp_path / "reset.seq").write_text("3")  # Crash after the marker was written
+
+    reopened = EventLog(str(tmp_path))
+    assert len(reopened) == 0
+    assert reopened.next_seq == 4
+    assert list(tmp_path.glob("*.log")) == []
+    reopened.close()
+
+
+class TestEventBusLog:
+    """EventBus integration: seq on events, indexed history, replay."""
+
+    @pytest.fixture
+    def bus(self, tmp_path):
+        bus = EventBus()
+        bus.clear_history()
+        bus.configure({"log": {"enabled": True, "directory": str(tmp_path)}})
+        yield bus
+        bus.configure({"log": {"enabled": False}})
+
+    @pytest.mark.asyncio
+    async def test_emit_assigns_seq_and_persists(self, bus):
+        event = Event(type=EventType.BELIEF_CREATED, data={"content": "x"}, narration="")
+        await bus.emit(event)
+
+        assert event.seq == bus.log.last_seq
+        assert json.loads(event.to_json())["seq"] == event.seq
+        assert bus.log.read_from(event.seq - 1)[0][1] == event.to_json()
+
+    @pytest.mark.asyncio
+    async def test_history_survives_restart(self, bus, tmp_path):
+        for i in range(3):
+            await bus.emit(Event(type=EventType.DESIRE_CREATED, data={"n": i}, narration=""))
+        await bus.emit(Event(type=EventType.BELIEF_CREATED, data={"n": 99}, narration=""))
+
+        bus.configure({"log": {"enabled": True, "directory": str(tmp_path)}})
+        bus._history.clear()  # A restarted process starts with an empty ring
+
+        desires = bus.get_history(limit=10, event_types=[EventType.DESIRE_CREATED])
+        assert [e.data["n"] for e in desires] == [0, 1, 2]
+        assert all(isinstance(e.timestamp, datetime) for e in desires)
+
+    @pytest.mark.asyncio
+    async def test_history_time_range(self, bus):
+        old = Event(type=EventType.DESIRE_CREATED, data={"n": 0}, narration="",
+                    timestamp=datetime.now() - timedelta(hours=2))
+        await bus.emit(old)
+        await bus.emit(Event(type=EventType.DESIRE_CREATED, data={"n": 1}, narration=""))
+
+        recent = bus.get_history(since=datetime.now() - timedelta(minutes=5))
+        assert [e.data["n"] for e in recent] == [1]
+
+    @pytest.mark.asyncio
+    async def test_replay_from_cursor(self, bus):
+        for i in range(5):
+            await bus.emit(Event(type=EventType.DESIRE_CREATED, data={"n": i}, narration=""))
+        cursor = bus.log.last_seq - 2
+
+        messages, complete = bus.replay(cursor)
+        assert complete
+        assert [json.loads(m)["data"]["n"] for m in messages] == [3, 4]
+
+        _, complete = bus.replay(cursor, limit=1)
+        assert not complete
+
+    @pytest.mark.asyncio
+    async def test_clear_history_clears_durable_log(self, bus):
+        await bus.emit(Event(type=EventType.DESIRE_CREATED, data={"n": 0}, narration=""))
+        bus.clear_history()
+
+        assert bus.get_history(limit=10) == []
+        assert bus.replay(0)[0] == []
+        await bus.emit(Event(type=EventType.SYSTEM_RESET, data={}, narration=""))
+        assert [e.type for e in bus.get_history(limit=10)] == [EventType.SYSTEM_RESET]
@@ -0,0 +1,150 @@
+"""
+Tests for hedged requests, per-attempt latency tracking and adaptive
+provider ordering in the substrate failover layer.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rsi.substrate import FailoverManager, ProviderRegistry
+
+
+def seed(registry, provider_id, latency_ms, n=20):
+    for _ in range(n):
+        registry.record_request(provider_id, success=True, latency_ms=latency_ms)
+
+
+def scripted(delays, failures=()):
+    """Provider call that sleeps per provider and fails for some."""
+    calls = []
+    finished = []
+
+    async def call(provider):
+        calls.append(provider.id)
+        await asyncio.sleep(delays.get(provider.id, 0.0))
+        if provider.id in failures:
+            raise RuntimeError(f"{provider.id} down")
+        finished.append(provider.id)
+        return provider.id
+
+    call.calls = calls
+    call.finished = finished
+    return call
+
+
+@pytest.fixture
+def registry():
+    return ProviderRegistry({})
+
+
+@pytest.mark.asyncio
+async def test_hedge_after_p95_beats_slow_primary(registry):
+    seed(registry, "ollama", 40)
+    manager = FailoverManager(registry)  # Priority: ollama, then zai
+    call = scripted({"ollama": 2.0, "zai": 0.01})
+
+    start = time.monotonic()
+    result = await manager.execute_with_failover(call)
+    elapsed = time.monotonic() - start
+
+    assert result.success and result.result == "zai"
+    assert result.hedged
+    assert result.failover_path == ["ollama", "zai"]
+    assert 0.04 <= elapsed < 0.5
+    assert call.finished == ["zai"]  # The primary was cancelled
+
+    stats = manager.get_stats()
+    assert stats["hedges_fired"] == 1
+    assert stats["hedge_wins"] == 1
+    assert stats["cancelled_attempts"] == 1
+    # The cancelled attempt is neither a success nor a failure
+    assert registry.get_health("ollama").error_rate == 0.0
+
+
+@pytest.mark.asyncio
+async def test_primary_wins_race_against_hedge(registry):
+    seed(registry, "ollama", 20)
+    manager = FailoverManager(registry, {'hedging': {'min_delay_ms': 10}})
+    call = scripted({"ollama": 0.08, "zai": 0.5})
+
+    result = await manager.execute_with_failover(call)
+    assert result.result == "ollama"
+    assert result.hedged
+    assert manager.get_stats()["hedge_wins"] == 0
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_within_delay(registry):
+    seed(registry, "ollama", 200)
+    manager = FailoverManager(registry)
+    call = scripted({"ollama": 0.02})
+
+    result = await manager.execute_with_failover(call)
+    assert result.result == "ollama"
+    assert not result.hedged
+    assert call.calls == ["ollama"]
+
+
+@pytest.mark.asyncio
+async def test_hedging_disabled_waits_for_primary(registry):
+    seed(registry, "ollama", 10)
+    manager = FailoverManager(registry, {'hedging': {'enabled': False}})
+    call = scripted({"ollama": 0.2, "zai": 0.01})
+
+    result = await manager.execute_with_failover(call)
+    assert result.result == "ollama"
+    assert call.calls == ["ollama"]
+
+
+@pytest.mark.asyncio
+async def test_failure_fails_over_immediately_with_attempt_latency(registry):
+    manager = FailoverManager(registry, {'hedging': {'enabled': False}})
+    call = scripted({"ollama": 0.1, "zai": 0.02}, failures={"ollama"})
+
+    result = await manager.execute_with_failover(call)
+    assert result.result == "zai"
+    assert result.attempts == 2
+    assert result.latency_ms >= 120
+
+    # zai's latency is its own attempt, not the whole failover
+    zai = registry.get_latency_histograms()["zai"]
+    assert zai["count"] == 1
+    assert 15 <= zai["p50"] < 80
+    assert registry.get_latency_histograms()["ollama"]["count"] == 1
+    assert registry.get_health("ollama").ewma_error_rate > 0
+
+
+@pytest.mark.asyncio
+async def test_adaptive_order_follows_latency_and_errors(registry):
+    manager = FailoverManager(registry, {'strategy': 'adaptive'})
+    seed(registry, "ollama", 900)
+    seed(registry, "zai", 300)
+    seed(registry, "openrouter", 100)
+    for _ in range(15):
+        registry.record_request("openrouter", success=False, latency_ms=50)
+
+    order = [p.id for p in manager._get_provider_order()]
+    # openrouter is fastest but now fails almost every time;
+    # anthropic has no samples and is scored at default_latency_ms
+    assert order == ["zai", "ollama", "anthropic", "openrouter"]
+
+
+def test_latency_percentile(registry):
+    for ms in range(1, 101):
+        registry.record_request("zai", success=True, latency_ms=float(ms))
+    assert registry.latency_percentile("zai", 0.95) == 95.0
+    assert registry.latency_percentile("zai", 0.5) == 50.0
+    assert registry.latency_percentile("anthropic", 0.95) is None
+
+    histogram = registry.get_latency_histograms()["zai"]
+    assert histogram["buckets"]["100"] == 100
+    assert histogram["p99"] == 99.0
+
+    registry.reset()
+    assert registry.latency_percentile("zai", 0.95) is None
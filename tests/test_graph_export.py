@@ -0,0 +1,165 @@
+"""
+Tests for the paged graph export encodings, cursors and ETags.
+"""
+
+import json
+import re
+from types import SimpleNamespace
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.graph_export import (
+    DEFAULT_FIELDS, HAS_MSGPACK, decode_cursor, encode_cursor, encode_page,
+    etag_for, etag_matches, parse_fields
+)
+
+
+def _page(next_cursor=None):
+    return {
+        "nodes": [
+            {"id": "a", "type": "belief", "content": "x"},
+            {"id": "b", "type": "desire", "content": "y"},
+        ],
+        "relationships": [{"id": "1", "type": "SUPPORTS", "source_id": "a", "target_id": "b"}],
+        "fields": ["id", "type", "content"],
+        "next_cursor": next_cursor,
+    }
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor(("Belief", "belief_123"))
+    assert decode_cursor(cursor) == ("Belief", "belief_123")
+    assert encode_cursor(None) is None
+    assert decode_cursor(None) is None
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_parse_fields():
+    assert parse_fields(None) == DEFAULT_FIELDS
+    assert parse_fields("type,content") == ("id", "type", "content")
+    assert parse_fields("id,type,type") == ("id", "type")
+    with pytest.raises(ValueError):
+        parse_fields("id,password")
+
+
+def test_json_encoding():
+    body, media_type = encode_page(_page(encode_cursor(("Desire", "b"))))
+    decoded = json.loads(body)
+    assert media_type == "application/json"
+    assert decoded["nodes"][1]["id"] == "b"
+    assert decode_cursor(decoded["next_cursor"]) == ("Desire", "b")
+
+
+def test_columnar_encoding_is_smaller():
+    page = _page()
+    page["nodes"] = [{"id": f"n{i}", "type": "belief", "content": "c"} for i in range(200)]
+    rows, _ = encode_page(page, "json")
+    columns, _ = encode_page(page, "columnar")
+
+    decoded = json.loads(columns)
+    assert decoded["count"] == 200
+    assert decoded["nodes"]["id"][5] == "n5"
+    assert decoded["relationships"]["target_id"] == ["b"]
+    assert len(columns) < len(rows)
+
+
+@pytest.mark.skipif(not HAS_MSGPACK, reason="msgpack not installed")
+def test_msgpack_encoding():
+    import msgpack
+    body, media_type = encode_page(_page(), "msgpack")
+    decoded = msgpack.unpackb(body, raw=False)
+    assert media_type == "application/x-msgpack"
+    assert decoded["nodes"]["type"] == ["belief", "desire"]
+
+
+@pytest.mark.skipif(HAS_MSGPACK, reason="msgpack installed")
+def test_msgpack_unavailable_is_a_value_error():
+    with pytest.raises(ValueError):
+        encode_page(_page(), "msgpack")
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        encode_page(_page(), "xml")
+
+
+def test_etag():
+    body, _ = encode_page(_page())
+    etag = etag_for(body)
+    assert etag == etag_for(encode_page(_page())[0])
+    assert etag != etag_for(encode_page(_page(encode_cursor(("Desire", "b"))))[0])
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {etag}', etag)
+    assert etag_matches(f"W/{etag}", etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"other"', etag)
+
+
+class _LabelIndexSession:
+    """Serves `MATCH (n:Label) ... ORDER BY n.id LIMIT` from per-label sorted ids."""
+
+    def __init__(self, graph, log):
+        self.graph = graph
+        self.log = log
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def run(self, query, after=None, limit=None, node_ids=None):
+        self.log.append(query)
+        label = re.search(r"MATCH \(n:(\w+)\)", query).group(1)
+        if node_ids is not None:
+            rows = []  # Relationship query
+        else:
+            ids = [i for i in sorted(self.graph.get(label, ())) if after is None or i > after]
+            rows = [{"id": i, "type": label.lower()} for i in ids[:limit]]
+        return _Rows(rows)
+
+
+class _Rows:
+    def __init__(self, rows):
+        self.rows = iter(rows)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self.rows)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+@pytest.mark.asyncio
+async def test_graph_pages_seek_per_label():
+    from core.memory import Memory
+
+    graph = {"Experience": ["e3", "e1", "e2"], "Belief": ["b1"], "Document": ["d2", "d1"]}
+    queries = []
+    memory = Memory({})
+    memory.driver = SimpleNamespace(session=lambda: _LabelIndexSession(graph, queries))
+
+    seen, cursor = [], None
+    while True:
+        page = await memory.get_graph_page(after=decode_cursor(cursor), page_size=2, fields=("id", "type"))
+        seen += [n["id"] for n in page["nodes"]]
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert seen == ["e1", "e2", "e3", "b1", "d1", "d2"]
+    # Every node query is anchored on a label (id index seek), never a bare MATCH (n)
+    assert all(re.search(r"MATCH \(n:\w+\)", q) for q in queries)
+
+    with pytest.raises(ValueError):
+        await memory.get_graph_page(after=("Secret", "x"))
@@ -0,0 +1,120 @@
+"""
+Tests for the shared keep-alive HTTP pool used by LLM clients.
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.http_pool import HTTPClientPool
+
+
+async def _handle(reader, writer):
+    """Minimal HTTP/1.1 keep-alive server: answers every request with 'ok'."""
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.decode().split("\r\n"):
+                if line.lower().startswith("content-length:"):
+                    length = int(line.split(":", 1)[1])
+            if length:
+                await reader.readexactly(length)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n"
+                b"Connection: keep-alive\r\n\r\nok"
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+@pytest_asyncio.fixture
+async def server_url():
+    server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}/"
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_connection_reused_across_requests(server_url):
+    pool = HTTPClientPool(http2=False)
+    client = pool.client("test")
+
+    for _ in range(3):
+        response = await client.post(server_url, json={"x": 1}, extensions=pool.trace("test"))
+        assert response.text == "ok"
+
+    stats = pool.get_stats()["providers"]["test"]
+    assert stats["requests"] == 3
+    assert stats["new_connections"] == 1
+    assert stats["reused_connections"] == 2
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_same_client_per_provider():
+    pool = HTTPClientPool()
+    assert pool.client("zai") is pool.client("zai")
+    assert pool.client("zai") is not pool.client("openrouter")
+    await pool.close()
+    assert pool.get_stats()["open_clients"] == 0
+
+
+@pytest.mark.asyncio
+async def test_closed_client_recreated():
+    pool = HTTPClientPool()
+    first = pool.client("zai")
+    await pool.close()
+    second = pool.client("zai")
+    assert second is not first
+    assert not second.is_closed
+    await pool.close()
+
+
+def test_configure_limits():
+    pool = HTTPClientPool()
+    pool.configure({"max_connections": 5, "max_keepalive_connections": 2})
+    stats = pool.get_stats()
+    assert stats["max_connections"] == 5
+    assert stats["max_keepalive_connections"] == 2
+
+
+def test_client_from_finished_loop_is_closed():
+    pool = HTTPClientPool()
+
+    async def get_client():
+        return pool.client("zai")
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())  # New loop: the first client is replaced
+    assert second is not first
+    assert first.is_closed
+    asyncio.run(pool.close())
+    assert second.is_closed
+
+
+@pytest.mark.asyncio
+async def test_client_replaced_on_running_loop_is_closed_there():
+    pool = HTTPClientPool()
+    first = pool.client("zai")
+
+    # Another thread with its own loop takes over the provider entry
+    second = await asyncio.to_thread(lambda: asyncio.run(_get(pool, "zai")))
+    assert second is not first
+    await asyncio.sleep(0.01)  # Close runs on this (the owning) loop
+    assert first.is_closed
+    await pool.close()
+
+
+async def _get(pool, provider):
+    return pool.client(provider)
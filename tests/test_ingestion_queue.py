@@ -0,0 +1,187 @@
+"""
+Tests for the write-behind queue behind batched experience ingestion.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.ingestion_queue import WriteBehindQueue
+from core.memory import Memory
+
+
+class RecordingSink:
+    """flush_fn that records batches and echoes items back as results."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.batches = []
+        self.delay = delay
+        self.fail = fail
+
+    async def __call__(self, items):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("write failed")
+        self.batches.append(list(items))
+        return [f"id-{item}" for item in items]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_waiters_share_a_batch():
+    sink = RecordingSink()
+    queue = WriteBehindQueue(sink, max_batch=100, flush_interval=10.0)
+
+    results = await asyncio.gather(*[queue.submit(i) for i in range(20)])
+
+    assert results == [f"id-{i}" for i in range(20)]
+    assert len(sink.batches) == 1
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_flush_on_size():
+    sink = RecordingSink()
+    queue = WriteBehindQueue(sink, max_batch=5, flush_interval=10.0)
+
+    for i in range(12):
+        await queue.submit(i, wait=False)
+    await asyncio.sleep(0.05)
+
+    # Size-triggered without any waiter or interval expiring
+    assert sum(len(b) for b in sink.batches) == 12
+    assert all(len(b) <= 5 for b in sink.batches)
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_flush_on_interval():
+    sink = RecordingSink()
+    queue = WriteBehindQueue(sink, max_batch=100, flush_interval=0.05)
+
+    await queue.submit("a", wait=False)
+    assert sink.batches == []
+    await asyncio.sleep(0.15)
+
+    assert sink.batches == [["a"]]
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_explicit_flush_is_barrier():
+    sink = RecordingSink()
+    queue = WriteBehindQueue(sink, max_batch=100, flush_interval=10.0)
+
+    for i in range(3):
+        await queue.submit(i, wait=False)
+    await queue.flush()
+
+    assert sink.batches == [[0, 1, 2]]
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_backpressure_bounds_pending():
+    sink = RecordingSink(delay=0.02)
+    queue = WriteBehindQueue(sink, max_batch=2, flush_interval=10.0, max_pending=4)
+
+    for i in range(20):
+        await queue.submit(i, wait=False)
+        assert len(queue) <= 4
+    await queue.close()
+
+    assert sum(len(b) for b in sink.batches) == 20
+    assert queue.get_stats()["backpressure_waits"] > 0
+
+
+@pytest.mark.asyncio
+async def test_failure_propagates_to_waiters():
+    queue = WriteBehindQueue(RecordingSink(fail=True), flush_interval=10.0)
+
+    with pytest.raises(RuntimeError):
+        await queue.submit("x")
+    assert queue.get_stats()["failed"] == 1
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_bad_item_isolated_from_batch():
+    written = []
+
+    async def sink(items):
+        if "bad" in items:
+            raise ValueError("bad row")
+        written.extend(items)
+        return items
+
+    queue = WriteBehindQueue(sink, max_batch=100, flush_interval=10.0)
+    for item in ["a", "b", "bad", "c", "d"]:
+        await queue.submit(item, wait=False)
+    await queue.flush()
+
+    assert sorted(written) == ["a", "b", "c", "d"]
+    stats = queue.get_stats()
+    assert stats["failed"] == 1
+    assert stats["dropped"] == 1
+    assert stats["split_retries"] > 0
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_flush_from_inside_flush_fn_does_not_deadlock():
+    queue = None
+    batches = []
+
+    async def sink(items):
+        batches.append(list(items))
+        await queue.flush()  # e.g. create_connection -> flush_experiences
+        return items
+
+    queue = WriteBehindQueue(sink, max_batch=100, flush_interval=10.0)
+    await queue.submit(1, wait=False)
+    await queue.submit(2, wait=False)
+    await asyncio.wait_for(queue.flush(), timeout=1.0)
+
+    assert batches == [[1, 2]]
+    assert len(queue) == 0
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_closed_queue_rejects_submit():
+    queue = WriteBehindQueue(RecordingSink())
+    await queue.close()
+    with pytest.raises(RuntimeError):
+        await queue.submit("x")
+
+
+class TestExperienceDedup:
+    """O(1) amortized dedup window in Memory."""
+
+    def test_duplicate_within_window(self):
+        memory = Memory({})
+        assert not memory._is_duplicate_experience("Saw a bird at 2025-01-01T10:00:00", "obs")
+        assert memory._is_duplicate_experience("saw a  bird at 2025-02-02T11:11:11", "obs")
+
+    def test_expired_entries_pruned(self):
+        memory = Memory({"experience_dedup": {"window_seconds": 60}})
+        memory._recent_experiences["old"] = time.time() - 120
+        memory._is_duplicate_experience("fresh content", "obs")
+        assert "old" not in memory._recent_experiences
+
+    def test_cache_size_bounded(self):
+        memory = Memory({"experience_dedup": {"cache_size": 3}})
+        for i in range(10):
+            memory._is_duplicate_experience(f"experience number {i}", "obs")
+        assert list(memory._recent_experiences) == [
+            "experience number 7", "experience number 8", "experience number 9"
+        ]
+
+    def test_batching_disabled_by_default(self):
+        assert Memory({}).get_ingestion_stats() == {"enabled": False}
+        assert Memory({"ingestion": {"enabled": True}}).get_ingestion_stats()["enabled"]
@@ -0,0 +1,172 @@
+"""
+Tests for staged, short-circuiting execution in the VerificationLattice.
+"""
+
+import asyncio
+import itertools
+import time
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rsi.verification.lattice import (
+    BaseVerifier,
+    Improvement,
+    LLMCritiqueVerifier,
+    VerificationLattice,
+    VerificationOutcome,
+    VerifierCost,
+    VerifierResult,
+    VerifierType,
+)
+
+PASS = VerificationOutcome.PASS
+FAIL = VerificationOutcome.FAIL
+ABSTAIN = VerificationOutcome.INCONCLUSIVE
+
+
+class ScriptedVerifier(BaseVerifier):
+    def __init__(self, outcome, cost=VerifierCost.CHEAP, veto=False, delay=0.0):
+        super().__init__({'cost_class': cost.value, 'veto': veto})
+        self.outcome = outcome
+        self.delay = delay
+        self.calls = 0
+        self.finished = 0
+
+    async def verify(self, improvement):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        self.finished += 1
+        return VerifierResult(
+            verifier_type=VerifierType.ADVERSARIAL,
+            outcome=self.outcome,
+            confidence=0.9,
+            details="scripted",
+            duration_ms=self.delay * 1000
+        )
+
+
+class CountingLLM:
+    def __init__(self):
+        self.calls = 0
+
+    async def query(self, prompt, **kwargs):
+        self.calls += 1
+        return '{"approved": true, "confidence": 0.9, "concerns": []}'
+
+
+def improvement(**overrides):
+    fields = dict(
+        id="imp",
+        description="Cache parsed configs",
+        capability="code",
+        code_changes=[{"file": "rsi/cache.py", "content": "x = 1"}],
+        test_results={"passed": 10, "failed": 0},
+        context={"originating_desire_id": "d1"},
+    )
+    fields.update(overrides)
+    return Improvement(**fields)
+
+
+@pytest.mark.asyncio
+async def test_property_veto_skips_llm_critique():
+    llm = CountingLLM()
+    lattice = VerificationLattice({'human': {'spot_check_rate': 1.0}}, llm_client=llm)
+    bad = improvement(code_changes=[{"file": "rsi/safety_monitor.py", "content": "x = 1"}])
+
+    result = await lattice.verify(bad)
+
+    assert result.consensus_outcome == FAIL
+    assert not result.meets_threshold
+    assert result.metadata["vetoed_by"] == ["PropertyChecksVerifier"]
+    assert llm.calls == 0
+    assert len(result.verifier_results) == len(lattice.verifiers)
+    skipped = {r.verifier_type for r in result.verifier_results if r.metadata.get('short_circuited')}
+    assert skipped == {VerifierType.LLM_CRITIQUE, VerifierType.HUMAN_SPOT}
+    assert result.short_circuited
+    assert result.tokens_saved == LLMCritiqueVerifier({}, llm).estimate_tokens(bad) > 500
+    assert result.ms_saved > 0
+
+
+@pytest.mark.asyncio
+async def test_cheap_majority_decides_pass():
+    llm = CountingLLM()
+    lattice = VerificationLattice(llm_client=llm)
+
+    # Execution, property and adversarial pass: 3/5 meets 0.6 whatever the rest say
+    result = await lattice.verify(improvement())
+    assert result.consensus_outcome == PASS
+    assert llm.calls == 0
+
+    lattice.set_threshold(0.8)
+    result = await lattice.verify(improvement())
+    assert llm.calls == 1
+    assert not result.short_circuited
+
+
+@pytest.mark.asyncio
+async def test_concurrent_mode_runs_everything():
+    llm = CountingLLM()
+    lattice = VerificationLattice({'staged': False}, llm_client=llm)
+    bad = improvement(code_changes=[{"file": "x.py", "content": "eval(data)"}])
+
+    result = await lattice.verify(bad)
+    assert result.consensus_outcome == FAIL
+    assert llm.calls == 1
+    assert result.tokens_saved == 0
+
+
+@pytest.mark.asyncio
+async def test_decision_cancels_running_peers():
+    lattice = VerificationLattice()
+    slow = ScriptedVerifier(PASS, VerifierCost.EXPENSIVE, delay=2.0)
+    lattice.verifiers = [
+        ScriptedVerifier(PASS),
+        ScriptedVerifier(FAIL, VerifierCost.EXPENSIVE, veto=True, delay=0.01),
+        slow,
+    ]
+
+    start = time.monotonic()
+    result = await lattice.verify(improvement())
+    assert time.monotonic() - start < 1.0
+    assert result.consensus_outcome == FAIL
+    assert slow.calls == 1 and slow.finished == 0
+    assert result.verifier_results[2].metadata["cancelled"]
+    assert result.verifier_results[2].metadata["tokens_saved"] == 0
+    assert result.ms_saved > 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("threshold", [0.4, 0.6, 0.75])
+async def test_staged_verdict_matches_full_run(threshold):
+    costs = [VerifierCost.CHEAP, VerifierCost.CHEAP, VerifierCost.MODERATE,
+             VerifierCost.EXPENSIVE, VerifierCost.EXPENSIVE]
+    vetoes = [False, True, False, False, False]
+
+    for outcomes in itertools.product([PASS, FAIL, ABSTAIN], repeat=len(costs)):
+        verdicts = []
+        for staged in (False, True):
+            lattice = VerificationLattice({'threshold': threshold, 'staged': staged})
+            lattice.verifiers = [
+                ScriptedVerifier(o, c, v) for o, c, v in zip(outcomes, costs, vetoes)
+            ]
+            result = await lattice.verify(improvement())
+            verdicts.append((result.consensus_outcome, result.meets_threshold))
+        assert verdicts[0] == verdicts[1], outcomes
+
+
+@pytest.mark.asyncio
+async def test_stats_accumulate_savings():
+    lattice = VerificationLattice(llm_client=CountingLLM())
+    await lattice.verify(improvement(context={}))  # Missing provenance vetoes
+    await lattice.verify(improvement(context={}))
+    stats = lattice.get_stats()
+    assert stats["short_circuits"] == 2
+    assert stats["tokens_saved"] > 1000
+    assert stats["failures"] == 2
+
+    lattice.reset()
+    assert lattice.get_stats()["tokens_saved"] == 0
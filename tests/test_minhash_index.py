@@ -0,0 +1,108 @@
+"""
+Tests for the MinHash LSH index used for belief link-on-acquisition.
+"""
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.minhash_index import MinHashLSHIndex, bands_for_recall, text_shingles, jaccard
+from core.memory import Memory
+
+
+class TestShingles:
+    """Shingling must match Memory._compute_text_similarity."""
+
+    def test_unigrams_and_bigrams(self):
+        assert text_shingles("The cat sat") == frozenset({"the", "cat", "sat", "the_cat", "cat_sat"})
+
+    def test_short_words_dropped(self):
+        assert text_shingles("a is of") == frozenset()
+
+    def test_matches_memory_similarity(self):
+        a = "Curiosity drives exploration of new ideas"
+        b = "Exploration of ideas is driven by curiosity"
+        assert Memory._compute_text_similarity(a, b) == pytest.approx(
+            jaccard(text_shingles(a), text_shingles(b))
+        )
+
+
+class TestMinHashLSHIndex:
+    """Candidate generation and exact rescoring."""
+
+    def test_identical_text_found_with_exact_score(self):
+        index = MinHashLSHIndex()
+        index.add("b1", "consciousness emerges from recursive self reflection")
+        index.add("b2", "bitcoin transactions settle on a public ledger")
+
+        matches = index.query("consciousness emerges from recursive self reflection")
+
+        assert matches[0][0] == "b1"
+        assert matches[0][1] == pytest.approx(1.0)
+        assert all(doc_id != "b2" for doc_id, _, _ in matches)
+
+    def test_threshold_and_limit(self):
+        index = MinHashLSHIndex()
+        for i in range(5):
+            index.add(f"b{i}", "memory graph stores beliefs and desires")
+
+        matches = index.query("memory graph stores beliefs and desires", threshold=0.5, limit=2)
+
+        assert len(matches) == 2
+        assert all(score >= 0.5 for _, score, _ in matches)
+
+    def test_remove_and_readd(self):
+        index = MinHashLSHIndex()
+        index.add("b1", "entropy measures surprise in information")
+        assert index.remove("b1")
+        assert not index.remove("b1")
+        assert index.query("entropy measures surprise in information") == []
+
+        index.add("b1", "a completely different belief about gardens")
+        assert "b1" in index
+        assert index.query("entropy measures surprise in information") == []
+
+    def test_empty_text_not_indexed(self):
+        index = MinHashLSHIndex()
+        assert not index.add("b1", "")
+        assert len(index) == 0
+
+    def test_bands_must_divide_num_perm(self):
+        with pytest.raises(ValueError):
+            MinHashLSHIndex(num_perm=64, bands=10)
+
+    def test_candidate_probability_monotonic(self):
+        index = MinHashLSHIndex(num_perm=128, bands=64)
+        assert index.candidate_probability(0.1) < index.candidate_probability(0.3)
+        assert index.candidate_probability(1.0) == pytest.approx(1.0)
+
+    def test_bands_for_recall(self):
+        # At the 0.05 link threshold only one row per band keeps recall high
+        assert bands_for_recall(128, 0.05, 0.99) == 128
+        # min_rows bounds the candidate rate even when the target is out of reach
+        assert bands_for_recall(128, 0.05, 0.99, min_rows=2) == 64
+        bands = bands_for_recall(128, 0.3, 0.99)
+        index = MinHashLSHIndex(num_perm=128, bands=bands)
+        assert index.rows > 1
+        assert index.candidate_probability(0.3) >= 0.99
+
+    def test_memory_banding_bounds_candidates(self):
+        memory = Memory({})
+        index = memory._belief_index
+        assert index.rows >= 2
+        assert index.candidate_probability(0.2) >= 0.9
+        assert index.candidate_probability(0.02) < 0.05
+        assert Memory({"belief_index": {"bands": 32}})._belief_index.bands == 32
+
+    def test_unrelated_beliefs_are_rarely_candidates(self):
+        import random
+        rng = random.Random(7)
+        vocab = [f"word{i}" for i in range(3000)]
+        common = ["the", "and", "with", "system", "memory"]
+        index = Memory({})._belief_index
+        for i in range(500):
+            index.add(f"b{i}", " ".join(rng.sample(vocab, 8) + rng.sample(common, 2)))
+        query = " ".join(rng.sample(vocab, 8) + rng.sample(common, 2))
+        assert len(index.candidates(text_shingles(query))) < 50
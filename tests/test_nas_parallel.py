@@ -0,0 +1,166 @@
+"""
+Tests for parallel island-model NAS and memoized architecture evaluation.
+"""
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rsi.plasticity.nas import (
+    ArchitectureEvaluator,
+    ArchitectureSpace,
+    NeuralArchitectureSearch,
+    SearchBudget,
+    structural_hash,
+)
+from rsi.plasticity.nas.evaluator import init_worker
+
+
+def node_count_metric(architecture):
+    """Module-level (picklable) custom metric."""
+    return min(1.0, architecture.node_count / 10)
+
+
+def relabelled(arch):
+    """Same structure, fresh ids and reversed node/connection order."""
+    copy = pickle.loads(pickle.dumps(arch))
+    mapping = {n.id: f"renamed_{i}" for i, n in enumerate(copy.nodes)}
+    copy.id = "other"
+    copy.name = "Other"
+    for node in copy.nodes:
+        node.id = mapping[node.id]
+    for i, conn in enumerate(copy.connections):
+        conn.id = f"c{i}"
+        conn.source_id = mapping[conn.source_id]
+        conn.target_id = mapping[conn.target_id]
+    copy.nodes.reverse()
+    copy.connections.reverse()
+    copy.input_nodes = [mapping[n] for n in copy.input_nodes]
+    copy.output_nodes = [mapping[n] for n in copy.output_nodes]
+    return copy
+
+
+@pytest.fixture
+def space():
+    return ArchitectureSpace()
+
+
+def test_structural_hash_ignores_ids_and_order(space):
+    arch = space.sample_random("A")
+    twin = relabelled(arch)
+    assert structural_hash(arch) == structural_hash(twin) == twin.structural_hash()
+
+
+def test_structural_hash_detects_changes(space):
+    arch = space.sample_random("A")
+    changed = relabelled(arch)
+    changed.connections[0].weight += 0.5
+    assert structural_hash(arch) != structural_hash(changed)
+
+    changed = relabelled(arch)
+    changed.nodes[0].output_dim += 1
+    assert structural_hash(arch) != structural_hash(changed)
+
+
+@pytest.mark.asyncio
+async def test_duplicate_structure_is_served_from_cache(space):
+    evaluator = ArchitectureEvaluator()
+    suite = evaluator.create_default_test_suite()
+    arch = space.sample_random("A")
+
+    first = await evaluator.evaluate(arch, suite)
+    second = await evaluator.evaluate(relabelled(arch), suite)
+
+    assert second.overall_score == first.overall_score
+    assert second.architecture_id == "other"
+    assert second.metadata["cached_from"] == arch.id
+    assert evaluator.get_stats()["cache_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_register_metric_invalidates_cache(space):
+    evaluator = ArchitectureEvaluator()
+    arch = space.sample_random("A")
+    await evaluator.evaluate(arch)
+    evaluator.register_metric("nodes", node_count_metric)
+    score = await evaluator.evaluate(arch)
+    assert "cached" not in score.metadata
+    assert evaluator.get_stats()["cache_hits"] == 0
+
+
+@pytest.mark.asyncio
+async def test_evaluate_batch_dedupes(space):
+    evaluator = ArchitectureEvaluator()
+    a, b = space.sample_random("A"), space.sample_random("B")
+    batch = [a, relabelled(a), b, a]
+
+    scores = await evaluator.evaluate_batch(batch)
+
+    assert [s.architecture_id for s in scores] == [x.id for x in batch]
+    assert scores[0].overall_score == scores[1].overall_score == scores[3].overall_score
+    stats = evaluator.get_stats()
+    assert stats["cache_hits"] == 2
+    assert stats["cached_structures"] == 2
+
+
+@pytest.mark.asyncio
+async def test_evaluate_batch_in_process_pool(space):
+    evaluator = ArchitectureEvaluator()
+    evaluator.register_metric("nodes", node_count_metric)
+    archs = [space.sample_random(f"A{i}") for i in range(4)]
+
+    with ProcessPoolExecutor(2, initializer=init_worker, initargs=(evaluator.worker_snapshot(),)) as pool:
+        scores = await evaluator.evaluate_batch(archs, executor=pool)
+
+    for arch, score in zip(archs, scores):
+        names = {m.name: m.value for m in score.metrics}
+        assert score.architecture_id == arch.id
+        assert names["nodes"] == min(1.0, arch.node_count / 10)
+    assert evaluator.get_stats()["total_evaluations"] == 4
+
+
+@pytest.mark.asyncio
+async def test_island_search_reports_throughput():
+    nas = NeuralArchitectureSearch(config={
+        'population_size': 12,
+        'parallel': {'enabled': True, 'islands': 3, 'migration_interval': 2, 'executor': 'inline'},
+    })
+    budget = SearchBudget(max_evaluations=40, max_time_seconds=30.0, early_stopping_patience=100)
+
+    result = await nas.search("Find efficient architecture", budget=budget)
+
+    assert result.metadata["islands"] == 3
+    assert result.metadata["island_population"] == 4
+    assert result.unique_evaluations + result.cache_hits == result.total_evaluations
+    assert 40 <= result.unique_evaluations <= 40 + 12
+    assert result.evaluations_per_second > 0
+    assert result.final_generation >= 2
+    assert result.best_architecture.score.overall_score == max(
+        d.score.overall_score for d in result.all_discovered
+    )
+    assert result.to_dict()["cache_hits"] == result.cache_hits
+
+
+@pytest.mark.asyncio
+async def test_island_search_with_process_pool():
+    nas = NeuralArchitectureSearch(config={
+        'population_size': 8,
+        'parallel': {'enabled': True, 'islands': 2, 'workers': 2},
+    })
+    result = await nas.search("goal", budget=SearchBudget(max_evaluations=16, max_time_seconds=60.0))
+    assert result.metadata["executor"] == "process"
+    assert result.total_evaluations >= 8
+    assert result.best_architecture is not None
+
+
+@pytest.mark.asyncio
+async def test_sequential_search_reports_throughput():
+    nas = NeuralArchitectureSearch(config={'population_size': 6})
+    result = await nas.search("goal", budget=SearchBudget(max_evaluations=12))
+    assert result.evaluations_per_second > 0
+    assert result.unique_evaluations + result.cache_hits == result.total_evaluations
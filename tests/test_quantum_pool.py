@@ -0,0 +1,182 @@
+"""
+Tests for the quantum entropy ring buffer: wraparound, non-blocking
+draws with background prefetch, classical fallback and pool metrics.
+
+A local HTTP server stands in for the ANU QRNG API.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.quantum_randomness import EntropySource, QuantumRandomnessProvider
+
+
+class EntropyStandIn:
+    """ANU-compatible JSON endpoint with a configurable delay and failure mode."""
+
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.requests = 0
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                stand_in.requests += 1
+                time.sleep(stand_in.delay)
+                length = int(self.path.split("length=")[1].split("&")[0])
+                if stand_in.fail:
+                    body, status = {"success": False, "message": "down"}, 200
+                else:
+                    body, status = {"success": True, "data": [7] * length}, 200
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/API/jsonI.php"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def make_provider(url, **overrides):
+    """A fresh provider (own singleton slot) pointed at the stand-in."""
+    attrs = {"_instance": None, "ANU_API_URL": url, "MIN_FETCH_INTERVAL": 0.0,
+             "PREFETCH_INTERVAL": 0.05, "POOL_SIZE": 64, "LOW_WATERMARK": 16}
+    attrs.update(overrides)
+    return type("StandInProvider", (QuantumRandomnessProvider,), attrs)()
+
+
+@pytest.fixture
+def stand_in():
+    server = EntropyStandIn()
+    yield server
+    server.close()
+
+
+async def wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+def test_ring_wraparound_keeps_order_and_sources():
+    provider = make_provider("http://unused", POOL_SIZE=8)
+    assert provider._put(b"abcdef", quantum=True) == 6
+    assert provider._take(4) == (b"abcd", True)
+    assert provider._put(b"WXYZ!", quantum=False) == 5  # Wraps; one byte dropped
+    assert provider._fill == 7
+
+    assert provider._take(3) == (b"efW", False)  # Mixed draw is not quantum
+    assert provider._take(4) == (b"XYZ!", False)
+    assert provider._take(1) is None
+
+
+@pytest.mark.asyncio
+async def test_draws_never_wait_on_slow_source():
+    slow = EntropyStandIn(delay=0.5)
+    provider = make_provider(slow.url)
+    try:
+        start = time.perf_counter()
+        value, source = await provider.get_float()
+        assert time.perf_counter() - start < 0.05
+        assert 0.0 <= value < 1.0
+        assert source == EntropySource.CLASSICAL  # Empty ring: served instantly
+        assert not provider.get_pool_status()["in_fallback_mode"]
+
+        # Draws during the in-flight prefetch stay instant
+        for _ in range(20):
+            start = time.perf_counter()
+            await provider.get_float()
+            assert time.perf_counter() - start < 0.05
+
+        await wait_for(lambda: provider._fill > 0)
+        _, source = await provider.get_float()
+        assert source == EntropySource.QUANTUM
+    finally:
+        await provider.shutdown()
+        slow.close()
+
+
+@pytest.mark.asyncio
+async def test_prefetch_refills_below_low_watermark(stand_in):
+    provider = make_provider(stand_in.url)
+    try:
+        await provider.initialize()
+        assert provider.get_pool_status()["pool_size"] == 64
+
+        for _ in range(6):  # 48 bytes: crosses the watermark of 16
+            _, source = await provider.get_float()
+            assert source == EntropySource.QUANTUM
+        assert provider._fill == 16
+        await provider.get_float()
+
+        await wait_for(lambda: provider._fill == 64)
+        assert stand_in.requests == 2
+        status = provider.get_pool_status()
+        assert status["pool_misses"] == 0
+        assert status["quantum_ratio"] == 1.0
+        assert status["min_fill"] == 8
+    finally:
+        await provider.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_failed_source_falls_back_to_classical():
+    failing = EntropyStandIn(fail=True)
+    provider = make_provider(failing.url)
+    fallbacks = []
+    provider.set_callbacks(on_fallback=fallbacks.append)
+    try:
+        await provider.initialize()
+        _, source = await provider.get_float()
+
+        status = provider.get_pool_status()
+        assert source == EntropySource.CLASSICAL
+        assert status["in_fallback_mode"]
+        assert status["pool_misses"] == 0  # Classical bytes prefilled the ring
+        assert status["quantum_ratio"] == 0.0
+        assert fallbacks == ["API error: down"]
+    finally:
+        await provider.shutdown()
+        failing.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics(stand_in):
+    provider = make_provider(stand_in.url)
+    try:
+        await provider.initialize()
+        for _ in range(3):
+            await provider.select_index(10)
+
+        status = provider.get_pool_status()
+        assert status["fill_ratio"] == (64 - 24) / 64
+        assert status["quantum_bytes_drawn"] == 24
+        assert status["draw_latency_us"]["count"] == 3
+        assert status["draw_latency_us"]["p95"] < 5000
+        assert status["prefetch_running"]
+
+        provider.reset()
+        assert provider.get_pool_status()["draw_latency_us"]["count"] == 0
+    finally:
+        await provider.shutdown()
+    assert not provider.get_pool_status()["prefetch_running"]
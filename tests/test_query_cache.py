@@ -0,0 +1,260 @@
+"""
+Tests for the label-versioned Memory read cache.
+"""
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.query_cache import (
+    QueryCache, InvalidatingDriver, cached_query, invalidates, invalidates_on_write,
+    is_write_query, write_labels, ALL_LABELS
+)
+
+
+class FakeMemory:
+    """Minimal Memory stand-in with counted reads."""
+
+    def __init__(self, ttl_seconds: float = 30.0):
+        self._query_cache = QueryCache(ttl_seconds=ttl_seconds)
+        self.reads = 0
+        self.beliefs = ["b1"]
+        self.desires = ["d1"]
+
+    @cached_query("Belief")
+    async def get_beliefs(self, limit: int = 10):
+        self.reads += 1
+        return list(self.beliefs[:limit])
+
+    @cached_query("Desire")
+    async def get_desires(self):
+        self.reads += 1
+        return list(self.desires)
+
+    @cached_query(ALL_LABELS)
+    async def stats(self):
+        self.reads += 1
+        return {"Belief": len(self.beliefs), "Desire": len(self.desires)}
+
+    @invalidates("Belief")
+    async def create_belief(self, content):
+        self.beliefs.append(content)
+
+    @invalidates(ALL_LABELS)
+    async def update_node(self, node_id):
+        pass
+
+    @invalidates_on_write
+    async def run_query(self, query):
+        return []
+
+
+@pytest.mark.asyncio
+async def test_repeat_reads_hit():
+    memory = FakeMemory()
+    assert await memory.get_beliefs() == ["b1"]
+    assert await memory.get_beliefs() == ["b1"]
+    assert memory.reads == 1
+    assert memory._query_cache.get_stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_arguments_are_part_of_key():
+    memory = FakeMemory()
+    await memory.get_beliefs(limit=1)
+    await memory.get_beliefs(limit=2)
+    assert memory.reads == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidation_is_label_scoped():
+    memory = FakeMemory()
+    await memory.get_beliefs()
+    await memory.get_desires()
+    await memory.create_belief("b2")
+
+    assert await memory.get_beliefs() == ["b1", "b2"]
+    await memory.get_desires()
+    assert memory.reads == 3  # desires stayed cached
+
+
+@pytest.mark.asyncio
+async def test_all_labels_dependency_and_wildcard_writes():
+    memory = FakeMemory()
+    await memory.stats()
+    await memory.get_desires()
+
+    await memory.create_belief("b2")
+    assert (await memory.stats())["Belief"] == 2  # any write invalidates stats
+
+    await memory.update_node("x")
+    await memory.get_desires()                    # wildcard write invalidates all
+    assert memory.reads == 4
+
+
+@pytest.mark.asyncio
+async def test_returned_values_are_copies():
+    memory = FakeMemory()
+    first = await memory.get_beliefs()
+    first.append("mutated")
+    assert await memory.get_beliefs() == ["b1"]
+
+
+@pytest.mark.asyncio
+async def test_ttl_expiry():
+    memory = FakeMemory(ttl_seconds=0.0)
+    await memory.get_beliefs()
+    await memory.get_beliefs()
+    assert memory.reads == 2
+
+
+@pytest.mark.asyncio
+async def test_raw_query_invalidates_only_on_write():
+    memory = FakeMemory()
+    await memory.get_desires()
+    await memory.run_query("MATCH (n) RETURN n.created_at")
+    await memory.get_desires()
+    assert memory.reads == 1
+
+    await memory.run_query("MATCH (d:Desire) SET d.intensity = 0.5")
+    await memory.get_desires()
+    assert memory.reads == 2
+
+
+def test_is_write_query():
+    assert is_write_query("MERGE (a)-[:R]->(b)")
+    assert is_write_query("match (n) detach delete n")
+    assert not is_write_query("MATCH (n) RETURN n SKIP 5 LIMIT 10")
+
+
+def test_lru_bound():
+    cache = QueryCache(max_entries=2)
+    for i in range(3):
+        cache.put(("m", i), i, cache.begin(("Belief",)))
+    assert cache.get_stats()["entries"] == 2
+    assert cache.get(("m", 0)) == (False, None)
+
+
+def test_write_labels():
+    assert write_labels("CREATE (e:Experience {id: $id, at: datetime()})") == ("Experience",)
+    assert write_labels(
+        "MATCH (e:Experience {id: $a}), (b:Belief {id: $b}) MERGE (e)-[r:SUPPORTS]->(b)"
+    ) == ("Belief", "Experience")
+    assert write_labels("MATCH (b:Belief) SET b:Archived") == ("Archived", "Belief")
+    # Unlabeled nodes could be anything
+    assert write_labels("MATCH (n {id: $id}) DETACH DELETE n") == (ALL_LABELS,)
+    assert write_labels("MATCH (d:Desire)-[:X]->() SET d.x = 1") == (ALL_LABELS,)
+
+
+class _FakeResult:
+    async def single(self):
+        return None
+
+    async def data(self):
+        return []
+
+    async def values(self):
+        return []
+
+    async def consume(self):
+        return None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        raise StopAsyncIteration
+
+
+class _FakeSession:
+    def __init__(self, log):
+        self.log = log
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def run(self, query, *args, **kwargs):
+        self.log.append(query)
+        return _FakeResult()
+
+
+class _FakeDriver:
+    def __init__(self):
+        self.queries = []
+
+    def session(self, *args, **kwargs):
+        return _FakeSession(self.queries)
+
+    async def close(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_raw_session_writes_invalidate():
+    cache = QueryCache()
+    driver = InvalidatingDriver(_FakeDriver(), cache)
+    deps = cache.begin(("Task",))
+    cache.put(("get_tasks",), ["t1"], deps)
+    cache.put(("stats",), {}, cache.begin((ALL_LABELS,)))
+    cache.put(("get_beliefs",), ["b1"], cache.begin(("Belief",)))
+
+    async with driver.session() as session:
+        await session.run("MATCH (t:Task {id: $id}) RETURN t")
+    assert cache.get(("get_tasks",))[0]
+
+    async with driver.session() as session:
+        await session.run("MATCH (t:Task {id: $id}) SET t.status = 'done'")
+    assert not cache.get(("get_tasks",))[0]
+    assert not cache.get(("stats",))[0]
+    assert cache.get(("get_beliefs",))[0]  # Label-scoped: beliefs untouched
+
+
+_SAMPLE_ARGS = {str: "sample text for a write", int: 1, float: 0.5, bool: True, list: [], dict: {}}
+
+
+def _sample_args(method):
+    import inspect
+    import typing
+
+    args = {}
+    for name, param in inspect.signature(method).parameters.items():
+        if name == "self" or param.default is not inspect.Parameter.empty:
+            continue
+        if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            continue
+        annotation = param.annotation
+        origin = typing.get_origin(annotation) or annotation
+        if origin is typing.Union:
+            origin = typing.get_args(annotation)[0]
+            origin = typing.get_origin(origin) or origin
+        args[name] = _SAMPLE_ARGS.get(origin, "sample")
+    return args
+
+
+@pytest.mark.asyncio
+async def test_every_public_memory_write_bumps_graph_version():
+    """Walk Memory's public async methods: any that writes must move graph_version."""
+    import asyncio
+    import inspect
+    from core.memory import Memory
+
+    missed = []
+    for name, method in inspect.getmembers(Memory, inspect.iscoroutinefunction):
+        if name.startswith("_") or name in ("connect", "close"):
+            continue
+        memory = Memory({})
+        fake = _FakeDriver()
+        memory.driver = InvalidatingDriver(fake, memory._query_cache)
+        before = memory.graph_version()
+        try:
+            await asyncio.wait_for(getattr(memory, name)(**_sample_args(method)), timeout=2.0)
+        except Exception:
+            pass  # Fake results are empty; only the queries sent matter
+        if any(is_write_query(q) for q in fake.queries) and memory.graph_version() == before:
+            missed.append(name)
+    assert missed == []
@@ -0,0 +1,218 @@
+"""
+Tests for the adaptive LLM rate limiter, driven by a simulated provider.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.rate_limiter import (
+    AdaptiveRateLimiter, Priority, ProviderRateLimiter, RateBudget, parse_retry_after
+)
+
+
+class SimulatedProvider:
+    """
+    Fake LLM endpoint with a hidden sliding-window limit.
+
+    Returns 429 with a Retry-After once more than `limit` requests arrive
+    within `window` seconds.
+    """
+
+    def __init__(self, limit: int, window: float, latency: float = 0.005):
+        self.limit = limit
+        self.window = window
+        self.latency = latency
+        self.accepted = []
+        self.rejected = 0
+        self.concurrent = 0
+        self.max_concurrent = 0
+
+    async def call(self):
+        self.concurrent += 1
+        self.max_concurrent = max(self.max_concurrent, self.concurrent)
+        try:
+            await asyncio.sleep(self.latency)
+            now = time.monotonic()
+            self.accepted = [t for t in self.accepted if now - t < self.window]
+            if len(self.accepted) >= self.limit:
+                self.rejected += 1
+                retry_after = self.window - (now - self.accepted[0])
+                return 429, {"retry-after": f"{retry_after:.3f}"}
+            self.accepted.append(now)
+            return 200, {}
+        finally:
+            self.concurrent -= 1
+
+
+async def _call_with_retry(limiter, provider, priority=Priority.NORMAL, attempts=20):
+    for _ in range(attempts):
+        permit = await limiter.acquire(priority)
+        status, headers = await provider.call()
+        limiter.release(permit, status_code=status, retry_after=headers.get("retry-after"))
+        if status == 200:
+            return True
+    return False
+
+
+@pytest.mark.asyncio
+async def test_priority_preempts_background():
+    limiter = ProviderRateLimiter("sim", RateBudget(requests_per_minute=1200, burst=1, max_concurrency=1))
+    order = []
+
+    async def worker(name, priority):
+        permit = await limiter.acquire(priority)
+        order.append(name)
+        await asyncio.sleep(0.001)
+        limiter.release(permit, status_code=200)
+
+    tasks = [asyncio.create_task(worker(f"bg{i}", Priority.BACKGROUND)) for i in range(4)]
+    await asyncio.sleep(0.01)
+    tasks.append(asyncio.create_task(worker("voice", Priority.INTERACTIVE)))
+    await asyncio.gather(*tasks)
+
+    # bg0 was already admitted; voice jumps every other queued background call
+    assert order.index("voice") <= 2
+    assert order[-1].startswith("bg")
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap():
+    limiter = ProviderRateLimiter("sim", RateBudget(requests_per_minute=60000, max_concurrency=3))
+    provider = SimulatedProvider(limit=1000, window=1.0, latency=0.02)
+
+    results = await asyncio.gather(*[_call_with_retry(limiter, provider) for _ in range(12)])
+
+    assert all(results)
+    assert provider.max_concurrent <= 3
+    assert limiter.get_stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_adaptive_backoff_on_429():
+    # Limiter starts at 50 req/s; the provider only allows 10 per 0.5s
+    limiter = ProviderRateLimiter("sim", RateBudget(requests_per_minute=3000, max_concurrency=4))
+    provider = SimulatedProvider(limit=10, window=0.5)
+
+    results = await asyncio.gather(*[_call_with_retry(limiter, provider) for _ in range(30)])
+
+    stats = limiter.get_stats()
+    assert all(results)
+    assert stats["throttled"] > 0
+    assert stats["effective_requests_per_minute"] < 3000
+    assert stats["queue_depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_retry_after_honoured():
+    limiter = ProviderRateLimiter("sim", RateBudget(requests_per_minute=60000))
+    permit = await limiter.acquire()
+    limiter.release(permit, status_code=429, retry_after="0.2")
+
+    start = time.monotonic()
+    permit = await limiter.acquire()
+    limiter.release(permit, status_code=200)
+
+    assert time.monotonic() - start >= 0.18
+
+
+@pytest.mark.asyncio
+async def test_token_budget_delays_large_requests():
+    limiter = ProviderRateLimiter("sim", RateBudget(requests_per_minute=60000, tokens_per_minute=12000))
+    permit = await limiter.acquire(tokens=12000)
+    limiter.release(permit, status_code=200, tokens_used=12000)
+
+    # 12000 tokens/min refills 200 tokens per second
+    assert limiter._delay_until_ready(200) == pytest.approx(1.0, abs=0.05)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue():
+    limiter = ProviderRateLimiter("sim", RateBudget(requests_per_minute=60000, max_concurrency=1))
+    permit = await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0.01)
+    assert limiter.get_stats()["queue_depth"] == 1
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert limiter.get_stats()["queue_depth"] == 0
+    limiter.release(permit, status_code=200)
+
+
+class TestRegistry:
+    """Budget resolution and component priorities."""
+
+    def test_budget_resolution(self):
+        registry = AdaptiveRateLimiter({
+            "default": {"requests_per_minute": 30},
+            "zai": {"max_concurrency": 1},
+            "zai/glm-4.7": {"requests_per_minute": 5},
+        })
+        budget = registry.budget_for("zai", "glm-4.7")
+        assert budget.requests_per_minute == 5
+        assert budget.max_concurrency == 1
+        assert registry.budget_for("openrouter").requests_per_minute == 30
+
+    def test_limiter_per_model(self):
+        registry = AdaptiveRateLimiter()
+        assert registry.for_model("zai", "a") is registry.for_model("zai", "a")
+        assert registry.for_model("zai", "a") is not registry.for_model("zai", "b")
+
+    def test_priorities(self):
+        registry = AdaptiveRateLimiter({"priorities": {"seeker": "background"}})
+        assert registry.priority_for("voice") == Priority.INTERACTIVE
+        assert registry.priority_for("seeker") == Priority.BACKGROUND
+        assert registry.priority_for("unknown") == Priority.NORMAL
+        assert registry.priority_for("dreamer", "interactive") == Priority.INTERACTIVE
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after("1.5") == 1.5
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") is None
+
+    def test_reconfigure_keeps_limiter_state(self):
+        config = {"zai": {"requests_per_minute": 600}}
+        registry = AdaptiveRateLimiter(config)
+        limiter = registry.for_model("zai", "glm-4.7")
+        limiter._on_throttled(30.0)
+        scale, blocked_until = limiter._scale, limiter._blocked_until
+
+        registry.configure(config)  # create_llm_client on a model switch
+        assert registry.for_model("zai", "glm-4.7") is limiter
+        assert (limiter._scale, limiter._blocked_until) == (scale, blocked_until)
+
+        registry.configure({"zai": {"requests_per_minute": 120, "max_concurrency": 1}})
+        assert registry.for_model("zai", "glm-4.7") is limiter
+        assert limiter.budget.requests_per_minute == 120
+        assert limiter.budget.max_concurrency == 1
+        assert (limiter._scale, limiter._blocked_until) == (scale, blocked_until)
+        assert limiter.get_stats()["blocked_for_seconds"] > 0
+
+    def test_model_names_with_slashes_resolve_on_reconfigure(self):
+        registry = AdaptiveRateLimiter()
+        limiter = registry.for_model("openrouter", "anthropic/claude-3.5-sonnet")
+        registry.configure({"openrouter/anthropic/claude-3.5-sonnet": {"requests_per_minute": 7}})
+        assert limiter.budget.requests_per_minute == 7
+
+
+@pytest.mark.asyncio
+async def test_reconfigure_keeps_queued_waiters():
+    registry = AdaptiveRateLimiter({"sim": {"requests_per_minute": 60000, "max_concurrency": 1}})
+    limiter = registry.for_model("sim")
+    permit = await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0.01)
+
+    # Raising the concurrency cap admits the queued waiter without a release
+    registry.configure({"sim": {"requests_per_minute": 60000, "max_concurrency": 2}})
+    second = await asyncio.wait_for(waiter, timeout=1.0)
+    assert limiter.get_stats()["in_flight"] == 2
+    limiter.release(permit, status_code=200)
+    limiter.release(second, status_code=200)
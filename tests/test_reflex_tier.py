@@ -0,0 +1,250 @@
+"""
+Tests for the REFLEX cognitive tier: no-LLM answers from learned
+templates, the semantic cache and crystallized heuristics.
+"""
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.semantic_cache import SemanticCache
+from rsi.cognition.reflex import ReflexEngine, canonical_response, prompt_skeleton
+from rsi.cognition.router import CognitiveRouter, RoutingContext
+from rsi.cognition.tiers import CognitiveTier
+from rsi.providers.tier_provider import TierProvider, TierProviderConfig
+
+
+class CountingLLM:
+    def __init__(self, answer=lambda prompt: '{"label": "bug"}'):
+        self.answer = answer
+        self.calls = 0
+
+    async def __call__(self, tier, prompt, kwargs):
+        self.calls += 1
+        return {'text': self.answer(prompt)}
+
+
+class FakeSystemPrompt:
+    def __init__(self, heuristics):
+        self.heuristics = heuristics
+        self.used = []
+
+    def get_heuristics(self, domain=None):
+        return [h for h in self.heuristics if domain is None or h['domain'] == domain]
+
+    def record_heuristic_usage(self, domain, content):
+        self.used.append((domain, content))
+
+
+def classify(issue_id, title):
+    return RoutingContext(
+        task_type="classify",
+        prompt=f'Classify issue #{issue_id} titled "{title}". Answer as JSON with a label.',
+        temperature=0.0
+    )
+
+
+def make_router(llm, **reflex_config):
+    reflex_config.setdefault('audit_rate', 0.0)
+    engine = ReflexEngine(reflex_config, semantic_cache=SemanticCache(max_entries=100))
+    return CognitiveRouter(llm_call_fn=llm, reflex_engine=engine), engine
+
+
+def test_prompt_skeleton_masks_volatile_tokens():
+    a = prompt_skeleton("Summarize run 3f2a9c1e-0b4d-4e8a-9c1f-2d3e4f5a6b7c at 2026-01-02T10:00:00Z")
+    b = prompt_skeleton("summarize  run 0a1b2c3d-4e5f-4a6b-8c7d-9e0f1a2b3c4d at 2026-03-04 11:22")
+    assert a == b == "summarize run <id> at <ts>"
+    # Numbers and quoted strings are the question's inputs: kept by default
+    assert prompt_skeleton("Is 15 a prime number?") == "is 15 a prime number?"
+
+
+def test_prompt_skeleton_masks_literals_when_enabled():
+    a = prompt_skeleton('Classify issue #12 titled "Crash on start"', mask_literals=True)
+    b = prompt_skeleton("classify  issue #9071 titled 'Slow query'", mask_literals=True)
+    assert a == b == "classify issue #<num> titled <str>"
+    assert canonical_response('{"b": 1,\n "a": 2}') == canonical_response('{"a":2,"b":1}')
+
+
+@pytest.mark.asyncio
+async def test_repeated_classifications_crystallize_into_template():
+    llm = CountingLLM()
+    router, engine = make_router(llm, mask_literals=True)
+
+    for i in range(5):
+        result = await router.route(classify(i, f"title {i}"))
+        assert result.tier_used == CognitiveTier.GLM_4_7
+    assert llm.calls == 5
+
+    result = await router.route(classify(99, "never seen before"))
+    assert result.tier_used == CognitiveTier.REFLEX
+    assert result.response_text == '{"label": "bug"}'
+    assert result.actual_cost == 0.0
+    assert result.raw_response["reflex"]["source"] == "template"
+    assert llm.calls == 5
+
+    stats = router.get_stats()["reflex"]
+    assert stats["by_task_type"]["classify"] == {
+        'requests': 6, 'reflex_served': 1, 'llm_requests': 5, 'llm_call_reduction': 1 / 6
+    }
+    assert router.get_stats()["tier_usage"][CognitiveTier.REFLEX.value] == 1
+
+
+@pytest.mark.asyncio
+async def test_inconsistent_answers_stay_below_gate():
+    answers = iter(['{"label": "bug"}', '{"label": "feature"}'] * 10)
+    llm = CountingLLM(lambda prompt: next(answers))
+    router, engine = make_router(llm, mask_literals=True)
+
+    for i in range(8):
+        await router.route(classify(i, f"t{i}"))
+    result = await router.route(classify(100, "new"))
+
+    assert result.tier_used == CognitiveTier.GLM_4_7
+    assert engine.get_stats()["gate_rejections"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_exact_repeat_served_from_cache():
+    llm = CountingLLM(lambda prompt: "The loop is O(n^2) because of the nested scan.")
+    router, _ = make_router(llm)
+    context = RoutingContext(task_type="think", prompt="Why is analyze() slow?")
+
+    await router.route(context)
+    result = await router.route(context)
+    assert result.tier_used == CognitiveTier.REFLEX
+    assert result.raw_response["reflex"]["source"] == "cache"
+    assert llm.calls == 1
+
+    # Same prompt, different task type: not served from the cache
+    other = await router.route(RoutingContext(task_type="reason", prompt="Why is analyze() slow?"))
+    assert other.tier_used == CognitiveTier.GLM_4_7
+    assert llm.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_ineligible_requests_always_reach_llm():
+    llm = CountingLLM()
+    router, _ = make_router(llm)
+    context = RoutingContext(task_type="evaluate", prompt="Score this", is_critical=True)
+
+    await router.route(context)
+    await router.route(context)
+    assert llm.calls == 2
+
+    creative = RoutingContext(task_type="create", prompt="Write a haiku")
+    await router.route(creative)
+    await router.route(creative)
+    assert llm.calls == 4
+    assert router.get_stats()["reflex"]["reflex_served"] == 0
+
+
+@pytest.mark.asyncio
+async def test_low_quality_reflex_answer_falls_through_and_is_penalized():
+    llm = CountingLLM()
+    router, engine = make_router(llm, mask_literals=True)
+    for i in range(5):
+        await router.route(classify(i, "x"))
+
+    router.set_quality_evaluator(lambda text, context: 0.2 if context.metadata.get('strict') else 0.9)
+    strict = classify(50, "y")
+    strict.metadata['strict'] = True
+    result = await router.route(strict)
+
+    # The LLM answer scores low too, so the usual quality escalation follows
+    assert result.tier_used == CognitiveTier.PREMIUM
+    assert llm.calls > 6
+    assert engine.get_stats()["rejected_answers"] == 1
+    assert router.get_stats()["reflex"]["by_task_type"]["classify"]["reflex_served"] == 0
+
+
+@pytest.mark.asyncio
+async def test_template_inputs_are_not_masked_by_default():
+    llm = CountingLLM(lambda prompt: "yes" if any(f" {p} " in prompt for p in (2, 3, 5, 7, 11)) else "no")
+    router, _ = make_router(llm)
+
+    for p in (2, 3, 5, 7, 11):
+        await router.route(RoutingContext(task_type="think", prompt=f"Is {p} a prime number?"))
+    result = await router.route(RoutingContext(task_type="think", prompt="Is 15 a prime number?"))
+
+    assert result.tier_used == CognitiveTier.GLM_4_7
+    assert result.response_text == "no"
+
+
+def test_template_needs_distinct_masked_values():
+    engine = ReflexEngine({'mask_literals': True, 'use_cache': False})
+
+    # Same masked values every time: only the exact-prompt cache may answer
+    for _ in range(5):
+        engine.learn(classify(1, "same"), '{"label": "bug"}')
+    assert engine._from_template(classify(2, "other")) is None
+
+    for i in range(2, 4):
+        engine.learn(classify(i, f"title {i}"), '{"label": "bug"}')
+    assert engine._from_template(classify(9, "other")).metadata["distinct_values"] == 3
+
+
+@pytest.mark.asyncio
+async def test_audited_template_demoted_on_disagreement():
+    labels = iter(['{"label": "bug"}'] * 5 + ['{"label": "feature"}'] * 10)
+    llm = CountingLLM(lambda prompt: next(labels))
+    router, engine = make_router(llm, mask_literals=True, audit_rate=1.0)
+
+    for i in range(5):
+        await router.route(classify(i, f"title {i}"))
+    result = await router.route(classify(99, "new"))
+
+    # Audited hit goes to the LLM, which disagrees: the template is demoted
+    assert result.tier_used == CognitiveTier.GLM_4_7
+    assert result.response_text == '{"label": "feature"}'
+    stats = engine.get_stats()
+    assert stats["audits"] == 1 and stats["audit_failures"] == 1
+
+    engine._audit_rate = 0.0
+    assert engine.lookup(classify(100, "newer")) is None
+
+
+def test_heuristic_answer_needs_domain_coverage_and_support():
+    system_prompt = FakeSystemPrompt([
+        {'domain': 'logic', 'content': 'Decompose arguments into premises and verify each inference independently.',
+         'trajectory_count': 12},
+        {'domain': 'logic', 'content': 'Decompose arguments into premises and verify each inference.',
+         'trajectory_count': 1},
+    ])
+    engine = ReflexEngine({'use_cache': False}, system_prompt=system_prompt)
+
+    context = RoutingContext(
+        task_type="heuristic",
+        prompt="How to verify premises of arguments?",
+        metadata={'domain': 'logic'}
+    )
+    answer = engine.lookup(context)
+    assert answer.source == "heuristic"
+    assert answer.metadata["trajectory_count"] == 12
+
+    off_topic = RoutingContext(task_type="heuristic", prompt="How to bake sourdough bread?",
+                               metadata={'domain': 'logic'})
+    assert engine.lookup(off_topic) is None
+    assert engine.lookup(RoutingContext(task_type="heuristic", prompt=context.prompt)) is None
+
+
+@pytest.mark.asyncio
+async def test_tier_provider_serves_reflex_calls():
+    engine = ReflexEngine({}, semantic_cache=SemanticCache(max_entries=10))
+    provider = TierProvider(TierProviderConfig(), reflex_engine=engine)
+
+    miss = await provider.call(CognitiveTier.REFLEX, "ping", task_type="think")
+    assert not miss.success and "REFLEX" in miss.error
+
+    engine.learn(RoutingContext(task_type="think", prompt="ping"), "pong")
+    hit = await provider.call(CognitiveTier.REFLEX, "ping", task_type="think")
+    assert hit.success and hit.text == "pong" and hit.cached
+    assert provider.get_stats()["success_counts"]["REFLEX"] == 1
+
+
+def test_reflex_can_be_disabled():
+    router = CognitiveRouter(config={'reflex': {'enabled': False}})
+    decision = router.decide_tier(RoutingContext(task_type="think", prompt="hi"))
+    assert decision.tier == CognitiveTier.GLM_4_7
+    assert router.get_stats()["reflex"]["enabled"] is False
@@ -0,0 +1,144 @@
+"""
+Tests for the warm sandbox worker pool behind TDDPractice.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rsi.learning.sandbox_pool import SandboxPool
+from rsi.learning.tdd_practice import TDDPractice, PracticeProblem
+
+
+SOLUTION = "def add(a, b):\n    print('noise on stdout')\n    return a + b\n"
+TESTS = (
+    "def test_small():\n    assert add(1, 2) == 3\n\n"
+    "def test_wrong():\n    assert add(1, 1) == 3\n"
+)
+
+
+@pytest.fixture
+def pool():
+    pool = SandboxPool(size=2, max_runs=3)
+    yield pool
+    pool.close()
+
+
+def test_structured_results(pool):
+    result = pool.run_sync(SOLUTION, TESTS, timeout=30)
+    assert not result["passed"]
+    assert result["passed_count"] == 1
+    assert result["total_count"] == 2
+    outcomes = {t["name"]: t["outcome"] for t in result["tests"]}
+    assert outcomes == {"test_small": "passed", "test_wrong": "failed"}
+    assert "assert 2 == 3" in result["error"]
+
+
+def test_runs_are_isolated(pool):
+    pool.size = 1
+    first = pool.run_sync("def f():\n    return 1\n", "def test_f():\n    assert f() == 1\n")
+    second = pool.run_sync("def f():\n    return 2\n", "def test_f():\n    assert f() == 2\n")
+    assert first["passed"] and second["passed"]
+
+
+def test_solution_state_does_not_leak(pool):
+    pool.size = 1
+    poisoned = pool.run_sync(
+        "import builtins, math\n"
+        "builtins.sorted = lambda xs, **kw: list(xs)\n"
+        "math.pi = 3\n",
+        "def test_x():\n    pass\n"
+    )
+    assert poisoned["passed"]
+
+    clean = pool.run_sync(
+        "def order(xs):\n    return sorted(xs)\n",
+        "import math\n\ndef test_order():\n    assert order([3, 1, 2]) == [1, 2, 3]\n"
+        "    assert math.pi > 3.14\n"
+    )
+    assert clean["passed"], clean["error"]
+
+
+def test_recycles_after_max_runs(pool):
+    pool.size = 1
+    for _ in range(4):
+        assert pool.run_sync(SOLUTION, "def test_ok():\n    assert add(2, 2) == 4\n")["passed"]
+    stats = pool.get_stats()
+    assert stats["recycled"] == 1
+    assert stats["workers_started"] == 2
+
+
+def test_crash_and_timeout_recycle_worker(pool):
+    crashed = pool.run_sync("import os\nos._exit(3)\n", "def test_x():\n    pass\n")
+    assert not crashed["passed"]
+    assert "crashed" in crashed["error"]
+
+    timed_out = pool.run_sync("", "def test_spin():\n    while True:\n        pass\n", timeout=1)
+    assert not timed_out["passed"]
+    assert "timed out" in timed_out["error"]
+
+    # Replacements are warm and usable
+    assert pool.run_sync(SOLUTION, "def test_ok():\n    assert add(2, 2) == 4\n")["passed"]
+    stats = pool.get_stats()
+    assert stats["crashes"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["workers"] == 2
+
+
+def test_collection_error(pool):
+    result = pool.run_sync(SOLUTION, "def test_broken(:\n    pass\n")
+    assert not result["passed"]
+    assert result["tests"] == []
+    assert "SyntaxError" in result["output"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_runs(pool):
+    pool.start()
+    slow = "import time\n\ndef test_sleep():\n    time.sleep(0.5)\n"
+    # Let both workers finish warming up
+    await asyncio.gather(pool.run(SOLUTION, TESTS), pool.run(SOLUTION, TESTS))
+
+    start = time.monotonic()
+    results = await asyncio.gather(pool.run("", slow), pool.run("", slow))
+    assert all(r["passed"] for r in results)
+    assert time.monotonic() - start < 0.95
+
+
+class _ScriptedLLM:
+    def __init__(self, solution):
+        self.solution = solution
+
+    async def query(self, prompt, **kwargs):
+        return self.solution
+
+
+@pytest.mark.asyncio
+async def test_tdd_practice_uses_pool():
+    practice = TDDPractice(_ScriptedLLM("def add(a, b):\n    return a + b\n"),
+                           config={"tdd_practice": {"sandbox_pool": {"size": 1}}})
+    oracle = "def test_a():\n    assert add(1, 2) == 3\n\ndef test_b():\n    assert add(0, 0) == 0\n"
+    problem = PracticeProblem(spec="add", oracle=oracle, domain="code", difficulty="beginner")
+    try:
+        result = await practice.attempt_solution(problem)
+        assert result.success
+        assert result.tests_passed == 2
+        assert [t["outcome"] for t in result.test_results] == ["passed", "passed"]
+        assert practice.get_stats()["sandbox"]["runs"] == 1
+    finally:
+        practice.close()
+
+
+@pytest.mark.asyncio
+async def test_tdd_practice_subprocess_fallback():
+    practice = TDDPractice(_ScriptedLLM(SOLUTION),
+                           config={"tdd_practice": {"sandbox_pool": {"enabled": False}}})
+    result = await practice._run_tests(TESTS, SOLUTION)
+    assert not result["passed"]
+    assert result["passed_count"] == 1
+    assert "sandbox" not in practice.get_stats()
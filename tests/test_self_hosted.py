@@ -0,0 +1,181 @@
+"""
+Tests for self-hosted inference: server lifecycle, health checks and
+restart, registry registration and offloading background prompts.
+
+The server under test is a tiny OpenAI-compatible stand-in started via
+the `server_command` config, exactly as a llama.cpp server would be.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rsi.substrate import (
+    ComputeAbstractionLayer,
+    GenerationConfig,
+    ModelFormat,
+    ProviderRegistry,
+    ProviderStatus,
+    ProviderType,
+    SelfHostedManager,
+)
+
+FAKE_SERVER = '''
+import json, sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+port = int(sys.argv[1])
+loading = {"probes": 2}  # /health answers 503 while "loading"
+
+
+class Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def reply(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if loading["probes"] > 0:
+            loading["probes"] -= 1
+            self.reply(503, {"status": "loading model"})
+        else:
+            self.reply(200, {"status": "ok"})
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        prompt = body["messages"][-1]["content"]
+        self.reply(200, {
+            "choices": [{"message": {"role": "assistant", "content": "local: " + prompt}}],
+            "usage": {"prompt_tokens": len(prompt.split()), "completion_tokens": 2},
+        })
+
+
+ThreadingHTTPServer(("127.0.0.1", port), Handler).serve_forever()
+'''
+
+
+@pytest.fixture
+def model_file(tmp_path):
+    path = tmp_path / "tiny-q4.gguf"
+    path.write_bytes(b"GGUF")
+    return path
+
+
+@pytest.fixture
+def server_config(tmp_path):
+    script = tmp_path / "fake_server.py"
+    script.write_text(FAKE_SERVER)
+    return {
+        'server_command': [sys.executable, str(script), "{port}"],
+        'startup_timeout': 10.0,
+        'stop_grace_seconds': 2.0,
+        'health_interval': 0,
+    }
+
+
+@pytest.fixture
+def registry():
+    return ProviderRegistry({})
+
+
+@pytest.mark.asyncio
+async def test_download_model_registers_local_file(model_file):
+    manager = SelfHostedManager({})
+    model = await manager.download_model("tiny", str(model_file))
+    assert model.format == ModelFormat.GGUF
+    assert model.metadata["size_bytes"] == 4
+    assert manager.list_models() == [model]
+
+
+@pytest.mark.asyncio
+async def test_server_lifecycle_and_registration(server_config, model_file, registry):
+    manager = SelfHostedManager(server_config, registry=registry)
+    await manager.download_model("tiny", str(model_file))
+
+    server = await manager.start_inference_server("tiny", port=0)
+    try:
+        assert server.is_running and server.pid
+        assert server.warmup_ms is not None
+
+        provider = registry.get_provider(server.id)
+        assert provider.provider_type == ProviderType.SELF_HOSTED
+        assert provider.cost_per_1k_input == provider.cost_per_1k_output == 0.0
+        assert registry.get_health(server.id).status == ProviderStatus.AVAILABLE
+
+        assert await manager.generate(server.id, "hello there") == "local: hello there"
+        assert registry.get_latency_histograms()[server.id]["count"] == 1
+        stats = manager.get_stats()
+        assert stats["total_inferences"] == 2  # Warm-up included
+        assert stats["total_tokens_in"] == 3
+    finally:
+        assert await manager.stop_inference_server(server.id)
+
+    assert registry.get_provider(server.id) is None
+    assert manager._processes == {}
+    assert await manager.generate(server.id, "hello") is None
+
+
+@pytest.mark.asyncio
+async def test_dead_server_is_restarted_by_health_check(server_config, model_file, registry):
+    manager = SelfHostedManager(server_config, registry=registry)
+    await manager.download_model("tiny", str(model_file))
+    server = await manager.start_inference_server("tiny", port=0)
+    try:
+        first_pid = server.pid
+        process = manager._processes[server.id]
+        process.kill()
+        await process.wait()
+
+        assert await manager.check_health(server.id)
+        assert server.restarts == 1
+        assert server.pid != first_pid
+        assert await manager.generate(server.id, "again") == "local: again"
+    finally:
+        await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_failed_startup_is_not_registered(tmp_path, model_file, registry):
+    config = {'server_command': [sys.executable, "-c", "raise SystemExit(3)"], 'startup_timeout': 5.0}
+    manager = SelfHostedManager(config, registry=registry)
+    await manager.download_model("tiny", str(model_file))
+
+    assert await manager.start_inference_server("tiny", port=0) is None
+    assert registry.get_provider("local-tiny") is None
+
+
+@pytest.mark.asyncio
+async def test_background_prompts_offload_to_local_server(server_config, model_file, registry, monkeypatch):
+    monkeypatch.setenv("ZAI_API_KEY", "test")
+    manager = SelfHostedManager(server_config, registry=registry)
+    compute = ComputeAbstractionLayer(registry, {}, self_hosted=manager)
+    await manager.download_model("tiny", str(model_file))
+    server = await manager.start_inference_server("tiny", port=0)
+    try:
+        # Zero cost, and unlike the default ollama entry, known healthy
+        cheapest = await compute.get_cheapest_provider("summarize this")
+        assert cheapest.id == server.id
+
+        result = await compute.generate("summarize this", GenerationConfig(background=True, max_tokens=16))
+        assert result.provider_id == server.id
+        assert result.text == "local: summarize this"
+        assert result.cost_estimate == 0.0
+
+        # Interactive requests keep the normal priority order
+        interactive = await compute.generate("hi", GenerationConfig(max_tokens=16))
+        assert interactive.provider_id != server.id
+
+        stats = compute.get_stats()
+        assert stats["offloaded_requests"] == 1
+        assert stats["failover"]["hedges_fired"] == 0
+    finally:
+        await manager.shutdown()
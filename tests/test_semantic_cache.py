@@ -0,0 +1,155 @@
+"""
+Tests for the LLM SemanticCache: vectorized lookup, eviction and persistence.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.semantic_cache import SemanticCache
+
+
+class FakeEmbedder:
+    """Deterministic embedder: bag of words over a fixed vocabulary."""
+
+    VOCAB = ["memory", "belief", "desire", "graph", "dream", "code", "test", "cache"]
+
+    def encode(self, text):
+        words = text.lower().split()
+        return np.array([words.count(w) for w in self.VOCAB], dtype=np.float32)
+
+
+class TestLookup:
+    """Exact and semantic tiers."""
+
+    def test_exact_hit(self):
+        cache = SemanticCache()
+        cache.set("hello", "world")
+        assert cache.get("hello") == "world"
+        assert cache.get_with_info("hello") == ("world", False)
+
+    def test_semantic_hit(self):
+        cache = SemanticCache(embedder=FakeEmbedder(), similarity_threshold=0.9)
+        cache.set("memory graph belief", "answer")
+        assert cache.get_with_info("belief graph memory") == ("answer", True)
+        assert cache.get("dream code test") is None
+
+    def test_expired_entries_ignored(self):
+        cache = SemanticCache(ttl_seconds=0.05, embedder=FakeEmbedder())
+        cache.set("memory graph", "old")
+        time.sleep(0.1)
+        assert cache.get("memory graph") is None
+        assert cache.get("graph memory") is None
+
+    def test_overwrite_reuses_entry(self):
+        cache = SemanticCache(max_entries=2, embedder=FakeEmbedder())
+        cache.set("memory", "a")
+        cache.set("memory", "b")
+        assert len(cache) == 1
+        assert cache.get("memory") == "b"
+
+
+class TestEviction:
+    """O(1) LRU and LFU policies."""
+
+    def test_lru_evicts_least_recent(self):
+        cache = SemanticCache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_lfu_evicts_least_frequent(self):
+        cache = SemanticCache(max_entries=2, eviction_policy="lfu")
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("b")
+        cache.get("b")
+        cache.get("a")
+        cache.set("c", "3")
+        assert cache.get("a") is None
+        assert cache.get("b") == "2"
+
+    def test_evicted_slot_reused_for_semantic_tier(self):
+        cache = SemanticCache(max_entries=2, embedder=FakeEmbedder())
+        cache.set("memory graph", "1")
+        cache.set("dream code", "2")
+        cache.set("belief desire", "3")
+        assert cache.get("graph memory") is None
+        assert cache.get_with_info("desire belief") == ("3", True)
+
+    def test_unknown_policy_rejected(self):
+        with pytest.raises(ValueError):
+            SemanticCache(eviction_policy="fifo")
+
+
+class TestPersistence:
+    """SQLite write-through survives a new instance."""
+
+    def test_entries_restored(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        cache = SemanticCache(embedder=FakeEmbedder(), persist_path=path)
+        cache.set("memory graph", "kept")
+        cache.close()
+
+        restored = SemanticCache(embedder=FakeEmbedder(), persist_path=path)
+        assert restored.get("memory graph") == "kept"
+        assert restored.get_with_info("graph memory") == ("kept", True)
+
+    def test_evicted_entries_not_restored(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        cache = SemanticCache(max_entries=1, persist_path=path)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.close()
+
+        restored = SemanticCache(persist_path=path)
+        assert restored.get("a") is None
+        assert restored.get("b") == "2"
+
+
+class TestClientConfig:
+    """create_llm_client picks up the cache section of the shipped config."""
+
+    def test_cache_settings_from_config_yaml(self, tmp_path, monkeypatch):
+        import yaml
+        from core.llm_client import create_llm_client
+
+        monkeypatch.setenv("ZAI_API_KEY", "test-key")
+        with open(Path(__file__).parent.parent / "config.yaml") as f:
+            config = yaml.safe_load(f)
+        cache_section = config["local_llm"]["cache"]
+        assert cache_section.get("persist_path")
+        cache_section["persist_path"] = str(tmp_path / "llm_cache.sqlite")
+        cache_section["eviction_policy"] = "lfu"
+
+        client = create_llm_client(config)
+        assert client._cache.persist_path == cache_section["persist_path"]
+        assert client._cache.eviction_policy == "lfu"
+        assert client._cache.max_entries == cache_section["max_entries"]
+        client._cache.close()
+
+
+class TestComponentStats:
+    """Per-component metrics."""
+
+    def test_component_counters(self):
+        cache = SemanticCache()
+        cache.set("q", "r")
+        cache.get("q", component="dreamer")
+        cache.get("other", component="dreamer")
+        cache.get("q", component="seeker")
+
+        components = cache.get_stats()["components"]
+        assert components["dreamer"]["queries"] == 2
+        assert components["dreamer"]["exact_hits"] == 1
+        assert components["dreamer"]["misses"] == 1
+        assert components["seeker"]["hit_rate_percent"] == 100.0
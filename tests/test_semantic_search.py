@@ -0,0 +1,166 @@
+"""
+Tests for Memory.semantic_search (full-text index path and CONTAINS scan fallback).
+"""
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.memory import Memory
+
+
+class _Rows:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def data(self):
+        return self.rows
+
+
+class _Session:
+    def __init__(self, driver):
+        self.driver = driver
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def run(self, query, **params):
+        self.driver.queries.append((query, params))
+        if "queryNodes" in query:
+            if self.driver.fulltext_error:
+                raise self.driver.fulltext_error
+            return _Rows(self.driver.fulltext_rows)
+        label = query.split("MATCH (n:", 1)[1].split(")", 1)[0]
+        return _Rows(self.driver.scan_rows.get(label, []))
+
+
+class _Driver:
+    def __init__(self, fulltext_rows=(), scan_rows=None, fulltext_error=None):
+        self.fulltext_rows = list(fulltext_rows)
+        self.scan_rows = scan_rows or {}
+        self.fulltext_error = fulltext_error
+        self.queries = []
+
+    def session(self):
+        return _Session(self)
+
+    def fulltext_calls(self):
+        return [p for q, p in self.queries if "queryNodes" in q]
+
+    def scanned_labels(self):
+        return [q.split("MATCH (n:", 1)[1].split(")", 1)[0] for q, _ in self.queries if "MATCH (n:" in q]
+
+
+def _memory(driver, fulltext=True):
+    memory = Memory({})
+    memory.driver = driver
+    memory._fulltext_available = fulltext
+    return memory
+
+
+class TestBuildFulltextQuery:
+
+    def test_words_are_prefix_terms_and_phrases_are_quoted(self):
+        memory = Memory({})
+        assert memory._build_fulltext_query(["learn", "deep work"]) == 'learn* OR "deep work"'
+
+    def test_lucene_special_characters_are_escaped(self):
+        memory = Memory({})
+        query = memory._build_fulltext_query(["c++", "a:b", "(x)", 'say "hi"', "path/to"])
+        assert query == (
+            r'c\+\+* OR a\:b* OR \(x\)* OR "say \"hi\"" OR path\/to*'
+        )
+
+    def test_keywords_without_letters_are_dropped(self):
+        memory = Memory({})
+        assert memory._build_fulltext_query(["?", "--", "  "]) == ""
+        assert memory._build_fulltext_query(["*", "growth"]) == "growth*"
+
+    def test_stopwords_are_kept(self):
+        # The index uses standard-no-stop-words, so "the" still matches
+        memory = Memory({})
+        assert memory._build_fulltext_query(["the", "of"]) == "the* OR of*"
+
+    def test_no_leading_wildcard(self):
+        # Word-start semantics: "learn" finds "learning" but not "unlearned"
+        memory = Memory({})
+        assert memory._build_fulltext_query(["learn"]) == "learn*"
+
+
+class TestSemanticSearch:
+
+    @pytest.mark.asyncio
+    async def test_empty_keywords_query_nothing(self):
+        driver = _Driver()
+        memory = _memory(driver)
+        assert await memory.semantic_search([]) == []
+        assert await memory.semantic_search(["  ", ""]) == []
+        assert driver.queries == []
+
+    @pytest.mark.asyncio
+    async def test_fulltext_query_uses_searched_label(self):
+        driver = _Driver(fulltext_rows=[
+            {"n": {"id": "b1", "content": "Learning compounds"}, "match_score": 1.0, "node_type": "Belief"},
+        ])
+        memory = _memory(driver)
+        results = await memory.semantic_search(["Learning"], node_types=["Belief"])
+
+        assert [(r["id"], r["_node_type"], r["_relevance_score"]) for r in results] == [("b1", "Belief", 1.0)]
+        (params,) = driver.fulltext_calls()
+        assert params["search"] == "learning*"
+        assert params["node_types"] == ["Belief"]
+        query = driver.queries[0][0]
+        assert "labels(node)[0]" not in query
+        assert "WHERE l IN $node_types" in query
+        assert driver.scanned_labels() == []
+
+    @pytest.mark.asyncio
+    async def test_missing_index_scans_each_label(self):
+        driver = _Driver(scan_rows={
+            "Belief": [{"n": {"id": "b1", "content": "unlearned habits"}, "match_score": 1.0}],
+        })
+        memory = _memory(driver, fulltext=False)
+        results = await memory.semantic_search(["learn"], node_types=["Belief", "Desire"])
+
+        assert driver.fulltext_calls() == []
+        assert driver.scanned_labels() == ["Belief", "Desire"]
+        assert [(r["id"], r["_node_type"]) for r in results] == [("b1", "Belief")]
+
+    @pytest.mark.asyncio
+    async def test_fulltext_error_falls_back_to_scan(self):
+        driver = _Driver(
+            scan_rows={"Belief": [{"n": {"id": "b1", "content": "x"}, "match_score": 1.0}]},
+            fulltext_error=RuntimeError("There is no such fulltext schema index: memory_text"),
+        )
+        memory = _memory(driver)
+        results = await memory.semantic_search(["x1"], node_types=["Belief"])
+
+        assert len(driver.fulltext_calls()) == 1
+        assert driver.scanned_labels() == ["Belief"]
+        assert [r["id"] for r in results] == ["b1"]
+
+    @pytest.mark.asyncio
+    async def test_unsearchable_keywords_scan_instead(self):
+        driver = _Driver()
+        memory = _memory(driver)
+        await memory.semantic_search(["?!"], node_types=["Belief"])
+
+        assert driver.fulltext_calls() == []
+        assert driver.scanned_labels() == ["Belief"]
+
+    @pytest.mark.asyncio
+    async def test_custom_labels_are_scanned_with_their_label(self):
+        driver = _Driver(
+            fulltext_rows=[{"n": {"id": "b1"}, "match_score": 1.0, "node_type": "Belief"}],
+            scan_rows={"Goal": [{"n": {"id": "g1", "content": "learn"}, "match_score": 1.0}]},
+        )
+        memory = _memory(driver)
+        results = await memory.semantic_search(["learn"], node_types=["Belief", "Goal"])
+
+        assert driver.scanned_labels() == ["Goal"]
+        assert {(r["id"], r["_node_type"]) for r in results} == {("b1", "Belief"), ("g1", "Goal")}
@@ -0,0 +1,185 @@
+"""
+Tests for the BYRDService task scheduler: priority order with aging,
+O(1) dedup, event-driven intake, concurrent workers and queue-latency
+metrics.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.byrd_service import BYRDService, QueuedTask, TaskScheduler
+from core.event_bus import Event, EventType, event_bus
+
+
+def make_task(task_id, priority=0.5):
+    return QueuedTask(task_id=task_id, description=task_id, objective="done", priority=priority)
+
+
+def make_memory(pending=None):
+    memory = Mock()
+    memory.get_pending_tasks = AsyncMock(return_value=pending or [])
+    memory.update_task_status = AsyncMock()
+    memory.complete_task = AsyncMock()
+    memory.fail_task = AsyncMock()
+    return memory
+
+
+async def created(task_id, priority=0.5):
+    """What memory.create_task emits."""
+    await event_bus.emit(Event(type=EventType.TASK_CREATED, data={
+        "id": task_id, "description": task_id, "objective": "done",
+        "priority": priority, "source": "external"
+    }))
+
+
+async def wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+def test_scheduler_orders_by_priority_and_rejects_duplicates():
+    scheduler = TaskScheduler(aging_rate=0.0)
+    for task_id, priority in [("low", 0.2), ("high", 0.8), ("normal", 0.5), ("high2", 0.8)]:
+        assert scheduler.push(make_task(task_id, priority))
+    assert not scheduler.push(make_task("normal", 0.9))
+
+    order = [scheduler.pop().task_id for _ in range(4)]
+    assert order == ["high", "high2", "normal", "low"]  # FIFO within a priority
+    assert scheduler.pop() is None
+
+    # Running and recently finished tasks are not queued again
+    assert "high" in scheduler
+    assert not scheduler.push(make_task("high"))
+    scheduler.done("high")
+    assert "high" not in scheduler
+    assert not scheduler.push(make_task("high"))
+    assert scheduler.get_stats()["duplicates_rejected"] == 3
+
+
+def test_aging_prevents_starvation():
+    scheduler = TaskScheduler(aging_rate=10.0)
+    scheduler.push(make_task("old-low", 0.2))
+    time.sleep(0.08)  # Gains ~0.8 priority while waiting
+    scheduler.push(make_task("fresh-high", 0.8))
+
+    assert scheduler.effective_priority("old-low") > scheduler.effective_priority("fresh-high")
+    assert scheduler.pop().task_id == "old-low"
+
+
+def test_queue_latency_metrics():
+    scheduler = TaskScheduler()
+    scheduler.push(make_task("a", 0.9))
+    scheduler.push(make_task("b", 0.2))
+    time.sleep(0.02)
+    scheduler.pop()
+    scheduler.pop()
+
+    stats = scheduler.get_stats()
+    assert stats["dispatched"] == 2 and stats["depth"] == 0 and stats["max_depth"] == 2
+    assert stats["queue_latency_ms"]["count"] == 2
+    assert stats["queue_latency_ms"]["p50"] >= 20
+    assert stats["queue_latency_by_priority_ms"]["high"]["count"] == 1
+    assert stats["queue_latency_by_priority_ms"]["low"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_tasks_arrive_by_event_and_run_concurrently():
+    memory = make_memory(pending=[{"id": "backlog", "priority": 0.5}])
+    service = BYRDService(memory, config={
+        'workers': 3, 'task_poll_interval': 0.05, 'idle_threshold_seconds': 60
+    })
+    running, peak, done = set(), [0], []
+
+    async def handler(task):
+        running.add(task.task_id)
+        peak[0] = max(peak[0], len(running))
+        await asyncio.sleep(0.1)
+        running.discard(task.task_id)
+        done.append(task.task_id)
+        return {'outcome': 'ok'}
+
+    service.set_task_handler(handler)
+    await service.start()
+    try:
+        start = time.perf_counter()
+        for i in range(3):
+            await created(f"t{i}")
+        await created("backlog")  # Also backfilled from memory: runs once
+
+        await wait_for(lambda: len(done) == 4)
+        assert time.perf_counter() - start < 0.35  # Not 4 x 0.1s in sequence
+        assert peak[0] == 3
+        assert sorted(done) == ["backlog", "t0", "t1", "t2"]
+
+        # One backfill at start; no polling per loop iteration
+        assert memory.get_pending_tasks.await_count == 1
+        assert memory.complete_task.await_count == 4
+
+        stats = await service.get_stats()
+        assert stats.workers == 3
+        assert stats.tasks_completed == 4
+        assert stats.scheduler["queue_latency_ms"]["count"] == 4
+        assert stats.scheduler["duplicates_rejected"] == 1
+        assert stats.active_tasks == [] and stats.queue_size == 0
+    finally:
+        await service.stop()
+
+    # Unsubscribed: later tasks are left for the next start
+    await created("after-stop")
+    assert service.get_queue_size() == 0
+
+
+@pytest.mark.asyncio
+async def test_single_worker_processes_highest_priority_first():
+    service = BYRDService(make_memory(), config={'task_poll_interval': 0.05})
+    order = []
+    gate = asyncio.Event()
+
+    async def handler(task):
+        order.append(task.task_id)
+        await gate.wait()
+        return {'outcome': 'ok'}
+
+    service.set_task_handler(handler)
+    await service.start()
+    try:
+        await created("first", 0.5)
+        await wait_for(lambda: order == ["first"])
+        for task_id, priority in [("low", 0.2), ("critical", 1.0), ("normal", 0.5)]:
+            await created(task_id, priority)
+        assert service.get_queue_size() == 3
+
+        gate.set()
+        await wait_for(lambda: len(order) == 4)
+        assert order == ["first", "critical", "normal", "low"]
+    finally:
+        await service.stop()
+
+
+@pytest.mark.asyncio
+async def test_high_priority_event_interrupts_rsi():
+    from core.byrd_service import ServiceMode
+
+    ralph = Mock()
+    ralph.interrupt = AsyncMock()
+    service = BYRDService(make_memory(), ralph_loop=ralph, config={
+        'task_poll_interval': 0.05, 'auto_resume_rsi': False
+    })
+    service.set_task_handler(AsyncMock(return_value={'outcome': 'ok'}))
+    await service.start()
+    try:
+        assert service._mode == ServiceMode.IDLE_RSI
+        await created("urgent", 0.9)
+        await wait_for(lambda: ralph.interrupt.await_count == 1)
+        ralph.interrupt.assert_awaited_with(reason="high_priority_task:urgent")
+    finally:
+        await service.stop()
@@ -0,0 +1,122 @@
+"""
+Tests for single-flight coalescing of identical in-flight LLM prompts.
+"""
+
+import asyncio
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.single_flight import SingleFlight
+from core.llm_client import ZAIClient, LLMResponse
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_request():
+    flight = SingleFlight()
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "result"
+
+    results = await asyncio.gather(*[flight.run("k", work) for _ in range(5)])
+
+    assert results == ["result"] * 5
+    assert calls == 1
+    assert flight.get_stats()["coalesced"] == 4
+    assert flight.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_sequential_calls_not_coalesced():
+    flight = SingleFlight()
+
+    async def work():
+        return 1
+
+    await flight.run("k", work)
+    await flight.run("k", work)
+    assert flight.get_stats()["coalesced"] == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_shared_with_followers():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        flight.run("k", fail), flight.run("k", fail), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelling_leader_does_not_cancel_followers():
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.02)
+        return "ok"
+
+    leader = asyncio.create_task(flight.run("k", work))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.run("k", work))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "ok"
+
+
+class TestClientCoalescing:
+    """LLMClient.generate shares upstream calls for identical keys."""
+
+    def _client(self, monkeypatch):
+        client = ZAIClient(model="glm-4.7", api_key="test", enable_cache=False)
+        upstream = []
+
+        async def fake_uncached(prompt, *args, **kwargs):
+            upstream.append(prompt)
+            await asyncio.sleep(0.01)
+            return LLMResponse(text=f"re: {prompt}", raw={}, model="glm-4.7", provider="zai")
+
+        monkeypatch.setattr(client, "_generate_uncached", fake_uncached)
+        return client, upstream
+
+    @pytest.mark.asyncio
+    async def test_identical_prompts_coalesced(self, monkeypatch):
+        client, upstream = self._client(monkeypatch)
+
+        responses = await asyncio.gather(*[client.generate("same prompt") for _ in range(3)])
+
+        assert [r.text for r in responses] == ["re: same prompt"] * 3
+        assert upstream == ["same prompt"]
+        assert client.get_coalescing_stats()["coalesced"] == 2
+
+    @pytest.mark.asyncio
+    async def test_different_temperature_not_coalesced(self, monkeypatch):
+        client, upstream = self._client(monkeypatch)
+
+        await asyncio.gather(
+            client.generate("p", temperature=0.2),
+            client.generate("p", temperature=0.9)
+        )
+        assert len(upstream) == 2
+
+    @pytest.mark.asyncio
+    async def test_opt_out(self, monkeypatch):
+        client, upstream = self._client(monkeypatch)
+
+        await asyncio.gather(
+            client.generate("p", coalesce=False),
+            client.generate("p", coalesce=False)
+        )
+        assert len(upstream) == 2
@@ -0,0 +1,211 @@
+"""
+Tests for the incremental topology engine behind /api/graph/topology.
+"""
+
+import itertools
+import random
+from types import SimpleNamespace
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.topology_engine import TopologyEngine, consolidate_by_day
+
+
+def _nodes(n):
+    return [{"id": f"n{i}", "type": "belief", "content": str(i)} for i in range(n)]
+
+
+def _rel(src, tgt, rel_type="RELATES_TO", rel_id=None):
+    return {"id": rel_id or f"{src}-{tgt}", "type": rel_type, "source_id": src, "target_id": tgt}
+
+
+def _brute_force_cliques(rels):
+    adjacency = {}
+    for r in rels:
+        if r["source_id"] != r["target_id"]:
+            adjacency.setdefault(r["source_id"], set()).add(r["target_id"])
+            adjacency.setdefault(r["target_id"], set()).add(r["source_id"])
+    nodes = sorted(adjacency)
+    triangles = {
+        c for c in itertools.combinations(nodes, 3)
+        if all(b in adjacency[a] for a, b in itertools.combinations(c, 2))
+    }
+    tetrahedra = {
+        c for c in itertools.combinations(nodes, 4)
+        if all(b in adjacency[a] for a, b in itertools.combinations(c, 2))
+    }
+    return triangles, tetrahedra
+
+
+def _engine_cliques(engine):
+    triangles, tetrahedra = engine.cliques()
+    return {tuple(t) for t in triangles}, {tuple(t) for t in tetrahedra}
+
+
+def test_k4_cliques():
+    engine = TopologyEngine()
+    nodes = _nodes(4)
+    rels = [_rel(a["id"], b["id"]) for a, b in itertools.combinations(nodes, 2)]
+    engine.sync(nodes, rels)
+
+    triangles, tetrahedra = _engine_cliques(engine)
+    assert len(triangles) == 4
+    assert tetrahedra == {("n0", "n1", "n2", "n3")}
+
+
+def test_incremental_matches_full_recompute():
+    rng = random.Random(7)
+    engine = TopologyEngine()
+    nodes = _nodes(14)
+    ids = [n["id"] for n in nodes]
+    rels = {}
+
+    for _ in range(40):
+        # Random edits, then resync with the new full graph
+        for _ in range(rng.randint(1, 6)):
+            a, b = rng.sample(ids, 2)
+            key = (a, b)
+            if key in rels and rng.random() < 0.4:
+                del rels[key]
+            else:
+                rels[key] = _rel(a, b, rng.choice(["RELATES_TO", "SUPPORTS"]))
+        engine.sync(nodes, list(rels.values()))
+        assert _engine_cliques(engine) == _brute_force_cliques(list(rels.values()))
+
+
+def test_parallel_edges_keep_adjacency():
+    engine = TopologyEngine()
+    nodes = _nodes(3)
+    rels = [_rel("n0", "n1"), _rel("n1", "n2"), _rel("n2", "n0"), _rel("n1", "n0", "SUPPORTS")]
+    engine.sync(nodes, rels)
+    assert engine.remove_edge("n0", "n1")
+    assert len(engine.cliques()[0]) == 1  # n1->n0 still connects the pair
+    assert engine.remove_edge("n1", "n0", "SUPPORTS")
+    assert engine.cliques()[0] == []
+
+
+def test_node_removal_drops_its_cliques():
+    engine = TopologyEngine()
+    nodes = _nodes(4)
+    rels = [_rel(a["id"], b["id"]) for a, b in itertools.combinations(nodes, 2)]
+    engine.sync(nodes, rels)
+
+    remaining = nodes[:3]
+    engine.sync(remaining, [r for r in rels if r["target_id"] != "n3" and r["source_id"] != "n3"])
+    triangles, tetrahedra = _engine_cliques(engine)
+    assert triangles == {("n0", "n1", "n2")}
+    assert tetrahedra == set()
+    assert engine.get_stats()["nodes"] == 3
+
+
+def test_unchanged_sync_keeps_version_and_memo():
+    engine = TopologyEngine()
+    nodes = _nodes(5)
+    rels = [_rel("n0", "n1"), _rel("n1", "n2")]
+    engine.sync(nodes, rels)
+    version = engine.version
+
+    calls = []
+    engine.memo("k", lambda: calls.append(1) or "built")
+    assert engine.sync([dict(n) for n in nodes], [dict(r) for r in rels]) == 0
+    assert engine.version == version
+    assert engine.memo("k", lambda: calls.append(1) or "rebuilt") == "built"
+    assert len(calls) == 1
+
+    engine.sync(nodes, rels + [_rel("n2", "n0")])
+    assert engine.last_sync_delta == 1
+    assert engine.memo("k", lambda: "rebuilt") == "rebuilt"
+
+
+def test_needs_sync():
+    engine = TopologyEngine(min_resync_seconds=0.0, max_staleness_seconds=3600)
+    assert engine.needs_sync(1, 100)
+    engine.sync(_nodes(2), [], source_version=1, fetch_limit=100)
+    assert not engine.needs_sync(1, 100)
+    assert engine.needs_sync(2, 100)
+    assert engine.needs_sync(1, 200)
+
+    engine.min_resync_seconds = 3600
+    assert not engine.needs_sync(2, 100)
+
+
+def test_sync_keyed_on_largest_fetch_limit():
+    engine = TopologyEngine(min_resync_seconds=3600, max_staleness_seconds=3600)
+    engine.sync(_nodes(6), [_rel("n0", "n1"), _rel("n4", "n5")], source_version=1,
+                fetch_limit=engine.fetch_limit(200))
+
+    # Smaller limits are served from the resident prefix without refetching
+    assert not engine.needs_sync(1, 100)
+    assert engine.fetch_limit(100) == 200
+    nodes, rels = engine.subgraph(4)
+    assert [n["id"] for n in nodes] == ["n0", "n1", "n2", "n3"]
+    assert rels == [_rel("n0", "n1")]
+    assert engine.needs_sync(1, 400)
+
+
+def _event(event_type, **data):
+    return SimpleNamespace(type=SimpleNamespace(value=event_type), data=data)
+
+
+def test_node_events_applied_incrementally():
+    engine = TopologyEngine()
+    engine.sync(_nodes(2), [_rel("n0", "n1")])
+    version = engine.version
+
+    engine.on_event(_event("belief_created", id="b1", content="sky is blue", confidence=0.7))
+    engine.on_event(_event("node_created", id="d1", node_type="Document", path="a.md"))
+    engine.on_event(_event("node_created", id="w1", node_type="WebDocument"))  # Not visualized
+    assert [n["id"] for n in engine.nodes] == ["n0", "n1", "b1", "d1"]
+    assert engine.nodes[2]["type"] == "belief" and engine.nodes[2]["confidence"] == 0.7
+
+    engine.on_event(_event("connection_created", from_id="b1", to_id="n0"))
+    engine.on_event(_event("connection_created", from_id="b1", to_id="n1"))
+    assert engine.cliques()[0] == [["b1", "n0", "n1"]]
+
+    engine.on_event(_event("belief_updated", id="b1", confidence=0.9))
+    assert engine.nodes[2]["confidence"] == 0.9
+    engine.on_event(_event("memory_forgotten", node_id="b1"))
+    assert "b1" not in {n["id"] for n in engine.nodes}
+    assert engine.cliques()[0] == [] and engine.get_stats()["edges"] == 1
+
+    assert engine.get_stats()["event_deltas"] == 6
+    assert engine.version == version + 6
+
+
+def test_connection_event_adds_edge():
+    engine = TopologyEngine()
+    engine.sync(_nodes(3), [_rel("n0", "n1"), _rel("n1", "n2")])
+
+    event = SimpleNamespace(
+        type=SimpleNamespace(value="connection_created"),
+        data={"from_id": "n2", "to_id": "n0", "relationship": "SUPPORTS"}
+    )
+    engine.on_event(event)
+    assert engine.cliques()[0] == [["n0", "n1", "n2"]]
+    assert engine.get_stats()["event_deltas"] == 1
+
+    # Unknown endpoints are left for the next resync
+    engine.on_event(SimpleNamespace(type=event.type, data={"from_id": "n0", "to_id": "zzz"}))
+    assert engine.get_stats()["edges"] == 3
+
+
+def test_chains():
+    engine = TopologyEngine()
+    nodes = _nodes(5)
+    rels = [_rel(f"n{i}", f"n{i + 1}", "LEADS_TO") for i in range(4)]
+    engine.sync(nodes, rels)
+
+    chains = engine.chains({n["id"] for n in nodes})
+    assert chains[0]["node_ids"] == ["n0", "n1", "n2", "n3", "n4"]
+    assert chains[0]["relationship_types"] == ["LEADS_TO"] * 4
+
+
+def test_consolidate_by_day():
+    old = [{"id": f"o{i}", "type": "experience", "created_at": "2020-01-01T10:00:00"} for i in range(3)]
+    fresh = [{"id": "f", "type": "belief", "created_at": None}]
+    kept, meta = consolidate_by_day(old + fresh, limit=10)
+    assert [n["id"] for n in kept] == ["f"]
+    assert meta[0]["id"] == "meta_2020-01-01"
+    assert meta[0]["constituent_count"] == 3
@@ -0,0 +1,125 @@
+"""
+Tests for the in-process VectorIndex backing Memory.find_similar_nodes.
+"""
+
+import numpy as np
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.vector_index import VectorIndex
+
+
+def _random_vectors(n: int, dim: int = 32, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=(n, dim)).astype(np.float32)
+
+
+class TestVectorIndexFlat:
+    """Exact search behaviour."""
+
+    def test_search_returns_best_match_first(self):
+        index = VectorIndex()
+        vectors = _random_vectors(50)
+        for i, v in enumerate(vectors):
+            index.upsert("Belief", f"b{i}", v, content=f"belief {i}")
+
+        hits = index.search(vectors[7], k=3)
+
+        assert hits[0].node_id == "b7"
+        assert hits[0].similarity == pytest.approx(1.0, abs=1e-5)
+        assert hits[0].content == "belief 7"
+        assert len(hits) == 3
+
+    def test_no_cap_on_label_size(self):
+        """Matches beyond the old LIMIT 200 window are still found."""
+        index = VectorIndex()
+        vectors = _random_vectors(1000)
+        for i, v in enumerate(vectors):
+            index.upsert("Experience", f"e{i}", v)
+
+        assert index.search(vectors[999], k=1)[0].node_id == "e999"
+
+    def test_min_similarity_filters(self):
+        index = VectorIndex()
+        index.upsert("Belief", "a", [1.0, 0.0])
+        index.upsert("Belief", "b", [0.0, 1.0])
+
+        hits = index.search([1.0, 0.0], k=10, min_similarity=0.5)
+
+        assert [h.node_id for h in hits] == ["a"]
+
+    def test_label_filter_and_merge(self):
+        index = VectorIndex()
+        index.upsert("Belief", "b", [1.0, 0.0])
+        index.upsert("Experience", "e", [0.9, 0.1])
+
+        assert [h.node_id for h in index.search([1.0, 0.0], k=5)] == ["b", "e"]
+        assert [h.node_id for h in index.search([1.0, 0.0], k=5, labels=["Experience"])] == ["e"]
+
+    def test_remove_swaps_rows_consistently(self):
+        index = VectorIndex()
+        vectors = _random_vectors(10)
+        for i, v in enumerate(vectors):
+            index.upsert("Belief", f"b{i}", v)
+
+        assert index.remove("b3")
+        assert not index.remove("b3")
+        assert len(index) == 9
+        # The row moved into b3's slot must still resolve to its own id
+        assert index.search(vectors[9], k=1)[0].node_id == "b9"
+        assert all(h.node_id != "b3" for h in index.search(vectors[3], k=10))
+
+    def test_upsert_none_removes(self):
+        index = VectorIndex()
+        index.upsert("Belief", "b", [1.0, 0.0])
+        index.upsert("Belief", "b", None)
+
+        assert not index.contains("b")
+
+    def test_mismatched_dimensions_skipped(self):
+        index = VectorIndex()
+        index.upsert("Belief", "a", [1.0, 0.0])
+
+        assert not index.upsert("Belief", "b", [1.0, 0.0, 0.0])
+        assert index.search([1.0, 0.0, 0.0], k=5) == []
+
+    def test_batch_search(self):
+        index = VectorIndex()
+        vectors = _random_vectors(100)
+        for i, v in enumerate(vectors):
+            index.upsert("Belief", f"b{i}", v)
+
+        results = index.search_batch([vectors[1], vectors[50]], k=1)
+
+        assert [r[0].node_id for r in results] == ["b1", "b50"]
+
+
+class TestVectorIndexIVF:
+    """Approximate search once a label crosses the IVF threshold."""
+
+    def test_ivf_trains_and_keeps_recall(self):
+        index = VectorIndex(ivf_threshold=500, nprobe=8)
+        vectors = _random_vectors(2000, dim=16, seed=1)
+        for i, v in enumerate(vectors):
+            index.upsert("Belief", f"b{i}", v)
+
+        stats = index.get_stats()
+        assert stats["labels"]["Belief"]["ivf_lists"] > 0
+
+        found = sum(
+            index.search(vectors[i], k=1)[0].node_id == f"b{i}"
+            for i in range(0, 2000, 20)
+        )
+        assert found >= 95
+
+    def test_exact_flag_bypasses_ivf(self):
+        index = VectorIndex(ivf_threshold=100, nprobe=1)
+        vectors = _random_vectors(400, dim=16, seed=2)
+        for i, v in enumerate(vectors):
+            index.upsert("Belief", f"b{i}", v)
+
+        for i in range(0, 400, 40):
+            assert index.search(vectors[i], k=1, exact=True)[0].node_id == f"b{i}"